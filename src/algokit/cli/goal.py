@@ -1,20 +1,80 @@
 import logging
+import shlex
+from pathlib import Path
+from typing import TextIO
 
 import click
 
 from algokit.core import proc
 from algokit.core.config_commands.container_engine import get_container_engine
+from algokit.core.container_api import get_container_api_client
 from algokit.core.goal import (
+    build_batch_script,
     get_volume_mount_path_docker,
     get_volume_mount_path_local,
+    parse_batch_commands,
+    parse_batch_output,
     post_process,
     preprocess_command_args,
+    snapshot_volume_mount,
 )
+from algokit.core.localnet_state import invalidate_localnet_state_cache
 from algokit.core.sandbox import SANDBOX_BASE_NAME, ComposeFileStatus, ComposeSandbox
 
 logger = logging.getLogger(__name__)
 
 
+def _run_goal_batch(
+    commands: list[list[str]],
+    *,
+    container_engine: str,
+    container_name: str,
+    volume_mount_path_local: Path,
+    volume_mount_path_docker: Path,
+) -> int:
+    if not commands:
+        logger.warning("The batch doesn't contain any goal commands")
+        return 0
+    input_files: list[Path] = []
+    output_files: list[Path] = []
+    container_commands = []
+    staged_files: dict[str, Path] = {}
+    try:
+        for args in commands:
+            command_input_files, command_output_files, container_args = preprocess_command_args(
+                list(args), volume_mount_path_local, volume_mount_path_docker, staged_files
+            )
+            input_files.extend(command_input_files)
+            output_files.extend(command_output_files)
+            container_commands.append(container_args)
+    except Exception:
+        post_process(input_files, [], volume_mount_path_local)
+        raise
+
+    snapshot = snapshot_volume_mount(volume_mount_path_local)
+    try:
+        session = proc.run(
+            [container_engine, "exec", "--interactive", "--workdir", "/root", container_name, "sh"],
+            input_text=build_batch_script(container_commands),
+        )
+    finally:
+        post_process(input_files, output_files, volume_mount_path_local, snapshot)
+
+    failed = 0
+    for args, result in zip(commands, parse_batch_output(container_commands, session.output), strict=True):
+        logger.info(click.style(f"$ goal {shlex.join(args)}", bold=True))
+        if result.output.strip():
+            logger.info(result.output.rstrip())
+        if result.exit_code is None:
+            logger.error("Command didn't run, the goal session ended early")
+        elif result.exit_code != 0:
+            logger.error(f"Command failed with exit code {result.exit_code}")
+        if result.exit_code != 0:
+            failed += 1
+    logger.info(f"Ran {len(commands)} goal commands, {failed} failed")
+    return 1 if failed or session.exit_code != 0 else 0
+
+
 @click.command(
     "goal",
     short_help="Run the Algorand goal CLI against the AlgoKit LocalNet.",
@@ -34,20 +94,33 @@ logger = logging.getLogger(__name__)
     help="Force running the goal command in interactive mode.",
     default=False,
 )
+@click.option(
+    "--batch",
+    type=click.File("r", encoding="utf-8"),
+    default=None,
+    help="Run the goal commands in this file (or '-' for stdin), one per line, in a single session on the algod "
+    "container, reporting the output and exit code of each command.",
+)
 @click.argument("goal_args", nargs=-1, type=click.UNPROCESSED)
-def goal_command(*, console: bool, interactive: bool, goal_args: list[str]) -> None:  # noqa: C901, PLR0912
+def goal_command(  # noqa: C901, PLR0912, PLR0915
+    *, console: bool, interactive: bool, batch: TextIO | None, goal_args: list[str]
+) -> None:
     """
     Run the Algorand goal CLI against the AlgoKit LocalNet.
 
     Look at https://dev.algorand.co/algokit/algokit-cli/goal for more information.
     """
     goal_args = list(goal_args)
+    if batch is not None and (console or interactive or goal_args):
+        raise click.UsageError("--batch can't be combined with --console, --interactive or goal arguments")
     container_engine = get_container_engine()
     try:
-        proc.run(
-            [container_engine, "version"],
-            bad_return_code_error_message=f"{container_engine} engine isn't running; please start it.",
-        )
+        api = get_container_api_client()
+        if api is None or not api.ping():
+            proc.run(
+                [container_engine, "version"],
+                bad_return_code_error_message=f"{container_engine} engine isn't running; please start it.",
+            )
     except OSError as ex:
         # an IOError (such as PermissionError or FileNotFoundError) will only occur if "docker"
         # isn't an executable in the user's path, which means docker isn't installed
@@ -72,7 +145,8 @@ def goal_command(*, console: bool, interactive: bool, goal_args: list[str]) -> N
     compose_file_status = sandbox.compose_file_status()
     if compose_file_status is not ComposeFileStatus.UP_TO_DATE and sandbox.name == SANDBOX_BASE_NAME:
         raise click.ClickException("LocalNet definition is out of date; please run `algokit localnet reset` first!")
-    ps_result = sandbox.ps("algod")
+    # the cached state may predate the container being stopped outside of AlgoKit, which goal would then fail on
+    ps_result = sandbox.ps("algod", cached=False)
     match ps_result:
         case [{"State": "running"}]:
             pass
@@ -80,6 +154,19 @@ def goal_command(*, console: bool, interactive: bool, goal_args: list[str]) -> N
             logger.info("LocalNet isn't running")
             sandbox.up()
 
+    if batch is not None:
+        exit_code = _run_goal_batch(
+            parse_batch_commands(batch.read()),
+            container_engine=container_engine,
+            container_name=f"algokit_{sandbox.name}_algod",
+            volume_mount_path_local=volume_mount_path_local,
+            volume_mount_path_docker=volume_mount_path_docker,
+        )
+        if exit_code != 0:
+            invalidate_localnet_state_cache()
+            raise click.exceptions.Exit(exit_code)
+        return
+
     if console:
         if goal_args:
             logger.warning("--console opens an interactive shell, remaining arguments are being ignored")
@@ -92,23 +179,29 @@ def goal_command(*, console: bool, interactive: bool, goal_args: list[str]) -> N
         )
         cmd = cmd + goal_args
 
-        if interactive:
-            result = proc.run_interactive(cmd)
-        else:
-            # Try non-interactive first, fallback to interactive if it fails with input-related error
-            result = proc.run(
-                cmd,
-                stdout_log_level=logging.INFO,
-                prefix_process=False,
-                pass_stdin=True,
-            )
-            if result.exit_code != 0 and "inappropriate ioctl" in (result.output or ""):
-                # Fallback to interactive mode if we detect TTY-related errors
-                logger.debug("Command failed with TTY error, retrying in interactive mode")
-                cmd.insert(2, "--tty")
+        # outputs are the files goal writes, so compare against the volume mount as it was before running it
+        snapshot = snapshot_volume_mount(volume_mount_path_local)
+        try:
+            if interactive:
                 result = proc.run_interactive(cmd)
-
-        post_process(input_files, output_files, volume_mount_path_local)
+            else:
+                # Try non-interactive first, fallback to interactive if it fails with input-related error
+                result = proc.run(
+                    cmd,
+                    stdout_log_level=logging.INFO,
+                    prefix_process=False,
+                    pass_stdin=True,
+                )
+                if result.exit_code != 0 and "inappropriate ioctl" in (result.output or ""):
+                    # Fallback to interactive mode if we detect TTY-related errors
+                    logger.debug("Command failed with TTY error, retrying in interactive mode")
+                    cmd.insert(2, "--tty")
+                    result = proc.run_interactive(cmd)
+        finally:
+            # the staged files are removed even if running goal fails
+            post_process(input_files, output_files, volume_mount_path_local, snapshot)
 
     if result.exit_code != 0:
+        # the cached LocalNet state may be stale, e.g. if the containers were stopped outside of AlgoKit
+        invalidate_localnet_state_cache()
         raise click.exceptions.Exit(result.exit_code)
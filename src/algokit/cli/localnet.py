@@ -1,6 +1,10 @@
+import dataclasses
+import json
 import logging
 import os
+import time
 from pathlib import Path
+from typing import Any
 
 import click
 import questionary
@@ -9,18 +13,41 @@ from algokit.cli.codespace import codespace_command
 from algokit.cli.explore import explore_command
 from algokit.cli.goal import goal_command
 from algokit.core import proc
+from algokit.core.conf import ALGOKIT_CONFIG, get_algokit_config
 from algokit.core.config_commands.container_engine import get_container_engine, save_container_engine
+from algokit.core.container_api import get_container_api_client
+from algokit.core.localnet_accounts import derive_accounts, export_accounts, fund_accounts
+from algokit.core.localnet_advance import advance_rounds
+from algokit.core.localnet_images import export_image_bundle, import_image_bundle
+from algokit.core.localnet_loadtest import (
+    MAX_GROUP_SIZE,
+    LoadTestConfig,
+    LoadTestTransactionType,
+    format_load_test_report,
+    prepare_signing_context,
+    presign_groups,
+    run_load_test,
+)
+from algokit.core.localnet_metrics import summarise_metrics, take_metrics_snapshot
+from algokit.core.localnet_timings import record_timings, set_timed_instance, timed_phase
 from algokit.core.sandbox import (
     COMPOSE_VERSION_COMMAND,
+    DEFAULT_ACCOUNTS_SEED,
     SANDBOX_BASE_NAME,
+    TMPFS_SIZE_PATTERN,
     ComposeFileStatus,
     ComposeSandbox,
     ContainerEngine,
+    SandboxPorts,
+    SandboxProfile,
+    SandboxServices,
+    SandboxStorage,
+    allocate_sandbox_ports,
     fetch_algod_status_data,
     fetch_indexer_status_data,
     get_min_compose_version,
 )
-from algokit.core.utils import extract_version_triple, is_minimum_version
+from algokit.core.utils import extract_version_triple, get_algorand_client_for_sandbox, is_minimum_version
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +59,23 @@ check_option = click.option(
     help="Force check the Docker registry for new LocalNet image versions, ignoring the version check cache.",
 )
 
+timings_option = click.option(
+    "timings",
+    "--timings",
+    is_flag=True,
+    default=False,
+    help="Report how long each phase takes, and append the report to the LocalNet timings log in the AlgoKit "
+    "state directory.",
+)
+
+name_option = click.option(
+    "name",
+    "--name",
+    "-n",
+    default=None,
+    help="Target a specific running LocalNet instance by name. Defaults to the first running instance.",
+)
+
 
 @click.group("localnet", short_help="Manage the AlgoKit LocalNet.")
 @click.pass_context
@@ -74,10 +118,12 @@ def localnet_group(ctx: click.Context) -> None:
     if ctx.invoked_subcommand and ctx.invoked_subcommand == "config":
         return
 
-    proc.run(
-        [get_container_engine(), "version"],
-        bad_return_code_error_message="Container engine isn't running; please start it.",
-    )
+    api = get_container_api_client()
+    if api is None or not api.ping():
+        proc.run(
+            [get_container_engine(), "version"],
+            bad_return_code_error_message="Container engine isn't running; please start it.",
+        )
 
 
 @localnet_group.command("config", short_help="Configure the container engine for AlgoKit LocalNet.")
@@ -126,6 +172,89 @@ def config_command(*, engine: str | None, force: bool) -> None:
 localnet_group.add_command(config_command)
 
 
+def _validate_tmpfs_size(_: click.Context, __: click.Parameter, value: str | None) -> str | None:
+    if value is not None and not TMPFS_SIZE_PATTERN.match(value):
+        raise click.BadParameter(
+            f"'{value}' is not a valid size, expected a number of bytes with an optional k/m/g unit"
+        )
+    return value
+
+
+def _get_configured_profile() -> SandboxProfile | None:
+    config = get_algokit_config() or {}
+    profile = config.get("localnet", {}).get("profile")
+    if profile is None:
+        return None
+    try:
+        return SandboxProfile(profile)
+    except ValueError as ex:
+        raise click.ClickException(
+            f"Invalid LocalNet profile '{profile}' in {ALGOKIT_CONFIG}, "
+            f"expected one of: {', '.join(option.value for option in SandboxProfile)}"
+        ) from ex
+
+
+@timed_phase("prepare")
+def _prepare_sandbox_for_start(
+    *, name: str | None, config_path: Path | None, auto_ports: bool, settings_changes: dict[str, Any]
+) -> ComposeSandbox:
+    running_sandboxes = ComposeSandbox.list_from_environment(cached=False)
+    sandbox = ComposeSandbox(name or SANDBOX_BASE_NAME, config_path)
+    settings = sandbox.settings
+    if auto_ports and name is None:
+        raise click.UsageError(
+            "--auto-ports requires --name, the default LocalNet instance always uses the default ports"
+        )
+    if auto_ports and settings.ports == SandboxPorts():
+        settings = allocate_sandbox_ports(sandbox.settings_file_path, settings)
+        logger.info(f"Allocated ports for LocalNet instance {sandbox.name}: {settings.ports}")
+    settings_changes = {key: value for key, value in settings_changes.items() if value is not None}
+    settings = dataclasses.replace(settings, **settings_changes)
+    if settings != sandbox.settings:
+        logger.info(f"Updating the settings of LocalNet instance {sandbox.name}")
+        # prefunded accounts are funded once the instance is running, so changing them doesn't need new containers
+        containers_changed = (
+            dataclasses.replace(
+                settings,
+                prefunded_accounts=sandbox.settings.prefunded_accounts,
+                accounts_seed=sandbox.settings.accounts_seed,
+            )
+            != sandbox.settings
+        )
+        if containers_changed and sandbox.compose_file_path.exists():
+            # settings are baked into the containers and the algod network when they are created,
+            # so remove the existing containers to ensure the new settings are fully applied
+            sandbox.down()
+        sandbox = ComposeSandbox(name or SANDBOX_BASE_NAME, config_path, settings)
+        if sandbox.compose_file_path.exists():
+            sandbox.write_compose_file()
+    for running_sandbox in running_sandboxes:
+        # instances with distinct ports can run side by side, anything else needs to be stopped first
+        if running_sandbox.name != sandbox.name and not running_sandbox.ports.values().isdisjoint(
+            sandbox.ports.values()
+        ):
+            logger.debug("LocalNet is already running.")
+            if click.confirm("This will stop any running AlgoKit LocalNet instance. Are you sure?", default=True):
+                running_sandbox.stop()
+            else:
+                raise click.ClickException("LocalNet is already running. Please stop it first")
+    return sandbox
+
+
+@timed_phase("fund accounts")
+def _fund_prefunded_accounts(sandbox: ComposeSandbox) -> None:
+    if not sandbox.settings.prefunded_accounts:
+        return
+    accounts = derive_accounts(sandbox.settings.accounts_seed, sandbox.settings.prefunded_accounts)
+    try:
+        funded = fund_accounts(get_algorand_client_for_sandbox(sandbox), accounts)
+    except Exception as ex:
+        logger.debug("Failed to fund the prefunded accounts", exc_info=True)
+        raise click.ClickException(f"Failed to fund the prefunded LocalNet accounts: {ex}") from ex
+    if funded:
+        logger.info(f"Funded {funded} prefunded accounts; execute `algokit localnet accounts` to export them")
+
+
 @localnet_group.command("start", short_help="Start the AlgoKit LocalNet.")
 @click.option(
     "name",
@@ -165,56 +294,154 @@ localnet_group.add_command(config_command)
     default=False,
     help="Ignore the prompt to stop the LocalNet if it's already running.",
 )
+@click.option(
+    "auto_ports",
+    "--auto-ports",
+    is_flag=True,
+    default=False,
+    help="Allocate a free set of host ports for this named LocalNet instance so it can run alongside other instances. "
+    "Requires --name. The allocation is persisted with the instance configuration and reused on subsequent starts.",
+)
+@click.option(
+    "services",
+    "--services",
+    type=click.Choice([services.value for services in SandboxServices]),
+    default=None,
+    help="Select the services to run: 'all' runs algod, conduit, postgres and indexer, 'algod' runs algod alone "
+    "for faster startup and lower memory usage. The selection is persisted with the instance configuration.",
+)
+@click.option(
+    "storage",
+    "--storage",
+    type=click.Choice([storage.value for storage in SandboxStorage]),
+    default=None,
+    help="Select where algod and postgres keep their data: 'disk' uses container storage, 'tmpfs' keeps it in "
+    "memory with relaxed postgres durability, so it's lost when the containers stop. "
+    "The selection is persisted with the instance configuration.",
+)
+@click.option(
+    "algod_tmpfs_size",
+    "--algod-tmpfs-size",
+    default=None,
+    callback=_validate_tmpfs_size,
+    help="Size limit of each algod node tmpfs mount when using '--storage tmpfs', e.g. '2g'.",
+)
+@click.option(
+    "postgres_tmpfs_size",
+    "--postgres-tmpfs-size",
+    default=None,
+    callback=_validate_tmpfs_size,
+    help="Size limit of the postgres tmpfs mount when using '--storage tmpfs', e.g. '1g'.",
+)
+@click.option(
+    "profile",
+    "--profile",
+    type=click.Choice([profile.value for profile in SandboxProfile]),
+    default=None,
+    help="Select the performance tuning profile of algod, conduit and postgres. "
+    f"Defaults to the 'profile' in the [localnet] section of {ALGOKIT_CONFIG} if present. "
+    "The selection is persisted with the instance configuration.",
+)
+@click.option(
+    "--metrics/--no-metrics",
+    "metrics",
+    default=None,
+    help="Enable or disable the conduit Prometheus metrics endpoint used by `algokit localnet metrics`. "
+    "The selection is persisted with the instance configuration.",
+)
+@click.option(
+    "prefunded_accounts",
+    "--prefunded-accounts",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Number of deterministic test accounts, derived from '--accounts-seed', to fund from the dispenser once "
+    "LocalNet has started. Export them with `algokit localnet accounts`. "
+    "The selection is persisted with the instance configuration.",
+)
+@click.option(
+    "accounts_seed",
+    "--accounts-seed",
+    default=None,
+    help=f"Seed the prefunded accounts are derived from. Defaults to '{DEFAULT_ACCOUNTS_SEED}'. "
+    "The selection is persisted with the instance configuration.",
+)
 @check_option
-def start_localnet(
-    *, name: str | None, config_path: Path | None, algod_dev_mode: bool, force: bool, check: bool
+@timings_option
+def start_localnet(  # noqa: PLR0913
+    *,
+    name: str | None,
+    config_path: Path | None,
+    algod_dev_mode: bool,
+    force: bool,
+    check: bool,
+    auto_ports: bool,
+    services: str | None,
+    storage: str | None,
+    algod_tmpfs_size: str | None,
+    postgres_tmpfs_size: str | None,
+    profile: str | None,
+    metrics: bool | None,
+    prefunded_accounts: int | None,
+    accounts_seed: str | None,
+    timings: bool,
 ) -> None:
-    sandbox = ComposeSandbox.from_environment()
-    full_name = f"{SANDBOX_BASE_NAME}_{name}" if name is not None else SANDBOX_BASE_NAME
-    if sandbox is not None and full_name != sandbox.name:
-        logger.debug("LocalNet is already running.")
-        if click.confirm("This will stop any running AlgoKit LocalNet instance. Are you sure?", default=True):
-            sandbox.stop()
-        else:
-            raise click.ClickException("LocalNet is already running. Please stop it first")
-    sandbox = ComposeSandbox(SANDBOX_BASE_NAME, config_path) if name is None else ComposeSandbox(name, config_path)
-    compose_file_status = sandbox.compose_file_status()
-    sandbox.check_docker_compose_for_new_image_versions(force=check)
-    if compose_file_status is ComposeFileStatus.MISSING:
-        logger.debug("LocalNet compose file does not exist yet; writing it out for the first time")
-        sandbox.write_compose_file()
+    with record_timings("start", enabled=timings):
+        sandbox = _prepare_sandbox_for_start(
+            name=name,
+            config_path=config_path,
+            auto_ports=auto_ports,
+            settings_changes={
+                "services": None if services is None else SandboxServices(services),
+                "storage": None if storage is None else SandboxStorage(storage),
+                "algod_tmpfs_size": algod_tmpfs_size,
+                "postgres_tmpfs_size": postgres_tmpfs_size,
+                "profile": _get_configured_profile() if profile is None else SandboxProfile(profile),
+                "metrics": metrics,
+                "prefunded_accounts": prefunded_accounts,
+                "accounts_seed": accounts_seed,
+            },
+        )
+        set_timed_instance(sandbox.name)
+        compose_file_status = sandbox.compose_file_status()
+        sandbox.check_docker_compose_for_new_image_versions(force=check)
+        if compose_file_status is ComposeFileStatus.MISSING:
+            logger.debug("LocalNet compose file does not exist yet; writing it out for the first time")
+            sandbox.write_compose_file()
+            if name is not None:
+                logger.info(
+                    f"The named LocalNet configuration has been created in {sandbox.directory}. \n"
+                    f"You can edit the configuration by changing those files. "
+                    f"Running `algokit localnet reset` will ensure the configuration is applied"
+                )
+        elif compose_file_status is ComposeFileStatus.UP_TO_DATE:
+            logger.debug("LocalNet compose file does not require updating")
+        elif compose_file_status is ComposeFileStatus.OUT_OF_DATE and name is None:
+            logger.warning("LocalNet definition is out of date; please run `algokit localnet reset`")
         if name is not None:
             logger.info(
-                f"The named LocalNet configuration has been created in {sandbox.directory}. \n"
-                f"You can edit the configuration by changing those files. "
-                f"Running `algokit localnet reset` will ensure the configuration is applied"
+                "A named LocalNet is running, update checks are disabled. If you wish to synchronize with the latest "
+                "version, run `algokit localnet reset --update`"
             )
-    elif compose_file_status is ComposeFileStatus.UP_TO_DATE:
-        logger.debug("LocalNet compose file does not require updating")
-    elif compose_file_status is ComposeFileStatus.OUT_OF_DATE and name is None:
-        logger.warning("LocalNet definition is out of date; please run `algokit localnet reset`")
-    if name is not None:
-        logger.info(
-            "A named LocalNet is running, update checks are disabled. If you wish to synchronize with the latest "
-            "version, run `algokit localnet reset --update`"
-        )
-    if sandbox.is_algod_dev_mode() != algod_dev_mode:
-        sandbox.set_algod_dev_mode(dev_mode=algod_dev_mode)
-        logger.info(f"Refreshed 'DevMode' flag to '{algod_dev_mode}'")
-        if not force and click.confirm(
-            f"Would you like to restart 'LocalNet' to apply 'DevMode' flag set to '{algod_dev_mode}'? "
-            "Otherwise, the next `algokit localnet reset` will restart with the new flag",
-            default=True,
-        ):
-            sandbox.down()
+        if sandbox.is_algod_dev_mode() != algod_dev_mode:
+            sandbox.set_algod_dev_mode(dev_mode=algod_dev_mode)
+            logger.info(f"Refreshed 'DevMode' flag to '{algod_dev_mode}'")
+            if not force and click.confirm(
+                f"Would you like to restart 'LocalNet' to apply 'DevMode' flag set to '{algod_dev_mode}'? "
+                "Otherwise, the next `algokit localnet reset` will restart with the new flag",
+                default=True,
+            ):
+                sandbox.down()
+                sandbox.up()
+                _fund_prefunded_accounts(sandbox)
+        else:
             sandbox.up()
-    else:
-        sandbox.up()
+            _fund_prefunded_accounts(sandbox)
 
 
 @localnet_group.command("stop", short_help="Stop the AlgoKit LocalNet.")
-def stop_localnet() -> None:
-    sandbox = ComposeSandbox.from_environment()
+@name_option
+def stop_localnet(*, name: str | None) -> None:
+    sandbox = ComposeSandbox.from_environment(name, cached=False)
     if sandbox is not None:
         compose_file_status = sandbox.compose_file_status()
         if compose_file_status is not ComposeFileStatus.MISSING:
@@ -224,6 +451,7 @@ def stop_localnet() -> None:
 
 
 @localnet_group.command("reset", short_help="Reset the AlgoKit LocalNet.")
+@name_option
 @click.option(
     "--update/--no-update",
     default=False,
@@ -239,49 +467,52 @@ def stop_localnet() -> None:
     help="Specify the custom localnet configuration directory.",
 )
 @check_option
-def reset_localnet(*, update: bool, config_path: Path | None, check: bool) -> None:
-    sandbox = ComposeSandbox.from_environment()
-    if sandbox is None:
-        sandbox = ComposeSandbox(config_path=config_path)
-    compose_file_status = sandbox.compose_file_status()
-    if compose_file_status is ComposeFileStatus.MISSING:
-        logger.debug("Existing LocalNet not found; creating from scratch...")
-        sandbox.write_compose_file()
-    elif sandbox.name == SANDBOX_BASE_NAME:
-        sandbox.down()
-        if compose_file_status is not ComposeFileStatus.UP_TO_DATE:
-            logger.info("Syncing LocalNet configuration")
+@timings_option
+def reset_localnet(*, name: str | None, update: bool, config_path: Path | None, check: bool, timings: bool) -> None:
+    with record_timings("reset", enabled=timings):
+        sandbox = ComposeSandbox.from_environment(name, cached=False)
+        if sandbox is None:
+            sandbox = ComposeSandbox(name or SANDBOX_BASE_NAME, config_path)
+        set_timed_instance(sandbox.name)
+        compose_file_status = sandbox.compose_file_status()
+        if compose_file_status is ComposeFileStatus.MISSING:
+            logger.debug("Existing LocalNet not found; creating from scratch...")
             sandbox.write_compose_file()
-        if update:
-            sandbox.pull()
-        else:
-            sandbox.check_docker_compose_for_new_image_versions(force=check)
-    elif update:
-        if click.confirm(
-            f"A named LocalNet is running, are you sure you want to reset the LocalNet configuration "
-            f"in {sandbox.directory}?\nThis will stop the running LocalNet and overwrite any changes "
-            "you've made to the configuration",
-            default=True,
-        ):
+        elif sandbox.name == SANDBOX_BASE_NAME:
             sandbox.down()
-            sandbox.write_compose_file()
-            sandbox.pull()
+            if compose_file_status is not ComposeFileStatus.UP_TO_DATE:
+                logger.info("Syncing LocalNet configuration")
+                sandbox.write_compose_file()
+            if update:
+                sandbox.pull()
+            else:
+                sandbox.check_docker_compose_for_new_image_versions(force=check)
+        elif update:
+            if click.confirm(
+                f"A named LocalNet is running, are you sure you want to reset the LocalNet configuration "
+                f"in {sandbox.directory}?\nThis will stop the running LocalNet and overwrite any changes "
+                "you've made to the configuration",
+                default=True,
+            ):
+                sandbox.down()
+                sandbox.write_compose_file()
+                sandbox.pull()
+            else:
+                raise click.ClickException("LocalNet configuration has not been reset")
         else:
-            raise click.ClickException("LocalNet configuration has not been reset")
-    else:
-        sandbox.down()
-    sandbox.up()
-
-
-SERVICE_NAMES = ("algod", "conduit", "indexer-db", "indexer")
+            sandbox.down()
+        sandbox.up()
+        _fund_prefunded_accounts(sandbox)
 
 
 @localnet_group.command("status", short_help="Check the status of the AlgoKit LocalNet.")
+@name_option
 @check_option
-def localnet_status(*, check: bool) -> None:
-    sandbox = ComposeSandbox.from_environment()
+def localnet_status(*, name: str | None, check: bool) -> None:
+    # status reports what the containers are doing right now, so it always probes the container engine
+    sandbox = ComposeSandbox.from_environment(name, cached=False)
     if sandbox is None:
-        sandbox = ComposeSandbox()
+        sandbox = ComposeSandbox(name or SANDBOX_BASE_NAME)
 
     sandbox.check_docker_compose_for_new_image_versions(force=check)
 
@@ -290,23 +521,23 @@ def localnet_status(*, check: bool) -> None:
         "Name: " + click.style(get_container_engine(), bold=True) + " (change with `algokit config container-engine`)"
     )
 
-    ps = sandbox.ps()
+    ps = sandbox.ps(cached=False)
     ps_by_name = {stats["Service"]: stats for stats in ps}
     # if any of the required containers does not exist (ie it's not just stopped but hasn't even been created),
     # then they will be missing from the output dictionary
-    if set(SERVICE_NAMES) != ps_by_name.keys():
+    if set(sandbox.service_names) != ps_by_name.keys():
         raise click.ClickException("LocalNet has not been initialized yet, please run 'algokit localnet start'")
     # initialise output dict by setting status
     output_by_name = {
         name: {"Status": "Running" if ps_by_name[name]["State"] == "running" else "Not running"}
-        for name in SERVICE_NAMES
+        for name in sandbox.service_names
     }
     # fill out remaining output_by_name["algod"] values
     if output_by_name["algod"]["Status"] == "Running":
-        output_by_name["algod"].update(fetch_algod_status_data(ps_by_name["algod"]))
+        output_by_name["algod"].update(fetch_algod_status_data(ps_by_name["algod"], sandbox.ports.algod))
     # fill out remaining output_by_name["indexer"] values
-    if output_by_name["indexer"]["Status"] == "Running":
-        output_by_name["indexer"].update(fetch_indexer_status_data(ps_by_name["indexer"]))
+    if "indexer" in output_by_name and output_by_name["indexer"]["Status"] == "Running":
+        output_by_name["indexer"].update(fetch_indexer_status_data(ps_by_name["indexer"], sandbox.ports.indexer))
 
     # Print the status details
     for service_name, service_info in output_by_name.items():
@@ -321,6 +552,311 @@ def localnet_status(*, check: bool) -> None:
         )
 
 
+@localnet_group.command("metrics", short_help="Summarise the algod and conduit metrics of the AlgoKit LocalNet.")
+@name_option
+@click.option(
+    "--interval",
+    "-i",
+    type=click.FloatRange(min=0.1),
+    default=5.0,
+    show_default=True,
+    help="Number of seconds between the metrics scrapes used to calculate rates.",
+)
+@click.option(
+    "--watch",
+    "-w",
+    is_flag=True,
+    default=False,
+    help="Keep scraping and printing a summary every interval until interrupted.",
+)
+def localnet_metrics(*, name: str | None, interval: float, watch: bool) -> None:
+    """
+    Scrape the Prometheus metrics of algod and conduit and summarise block production, indexer ingestion
+    (blocks/sec imported and rounds behind algod) and the time spent in each conduit pipeline stage.
+
+    Conduit metrics require the LocalNet to be started with `algokit localnet start --metrics`.
+    """
+    # requests are sent to the instance, so it has to be running right now rather than when the state was cached
+    sandbox = ComposeSandbox.from_environment(name, cached=False)
+    if sandbox is None:
+        raise click.ClickException("LocalNet isn't running; execute `algokit localnet start` to start it")
+    if not sandbox.has_indexer:
+        logger.info("LocalNet is running algod only, conduit metrics aren't available")
+    elif not sandbox.settings.metrics:
+        logger.warning("Conduit metrics are disabled; execute `algokit localnet start --metrics` to enable them")
+
+    previous = take_metrics_snapshot(sandbox)
+    while True:
+        time.sleep(interval)
+        current = take_metrics_snapshot(sandbox)
+        for service_name, service_summary in summarise_metrics(previous, current).items():
+            logger.info(click.style(f"# {service_name} metrics", bold=True))
+            for key, value in service_summary.items():
+                logger.info(click.style(f"{key}:", bold=True) + f" {value}")
+        if not watch:
+            break
+        previous = current
+
+
+@localnet_group.command("loadtest", short_help="Generate transaction load against the AlgoKit LocalNet.")
+@name_option
+@click.option("--tps", type=click.FloatRange(min=0, min_open=True), default=100, show_default=True, help="Target TPS.")
+@click.option(
+    "--duration",
+    "-d",
+    type=click.FloatRange(min=0, min_open=True),
+    default=30,
+    show_default=True,
+    help="Number of seconds to generate load for at the target TPS.",
+)
+@click.option(
+    "transaction_types",
+    "--type",
+    "-t",
+    type=click.Choice([transaction_type.value for transaction_type in LoadTestTransactionType]),
+    multiple=True,
+    help="Transaction types to generate, rotated through in order. Defaults to all types.",
+)
+@click.option(
+    "--group-size",
+    "-g",
+    type=click.IntRange(1, MAX_GROUP_SIZE),
+    default=1,
+    show_default=True,
+    help="Number of transactions in each atomic group.",
+)
+@click.option(
+    "--in-flight",
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help="Maximum number of concurrent submission requests.",
+)
+@click.option(
+    "--accounts",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Number of accounts, funded from the LocalNet dispenser, to send transactions from.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of processes used to pre-sign transactions. Defaults to the number of CPUs.",
+)
+def localnet_loadtest(  # noqa: PLR0913
+    *,
+    name: str | None,
+    tps: float,
+    duration: float,
+    transaction_types: tuple[str, ...],
+    group_size: int,
+    in_flight: int,
+    accounts: int,
+    workers: int | None,
+) -> None:
+    """
+    Generate payment, asset transfer and app call load against the LocalNet and report the confirmed TPS,
+    confirmation latency percentiles and rejection reasons.
+
+    Transaction groups are built and signed ahead of submission in worker processes, one validity window at a time,
+    then submitted at the target TPS with a bounded number of in-flight requests.
+    """
+    sandbox = ComposeSandbox.from_environment(name, cached=False)
+    if sandbox is None:
+        raise click.ClickException("LocalNet isn't running; execute `algokit localnet start` to start it")
+    config = LoadTestConfig(
+        tps=tps,
+        duration=duration,
+        transaction_types=tuple(LoadTestTransactionType(value) for value in transaction_types)
+        or tuple(LoadTestTransactionType),
+        group_size=group_size,
+        in_flight=in_flight,
+        accounts=accounts,
+        workers=workers,
+    )
+    algorand = get_algorand_client_for_sandbox(sandbox)
+
+    logger.info(f"Preparing {config.accounts} load test accounts...")
+    context = prepare_signing_context(algorand, config)
+    logger.info(f"Signing and submitting {config.group_count} transaction groups at {tps:g} TPS for {duration:g}s...")
+    groups = presign_groups(algorand.client.algod, context, config)
+    report = run_load_test(algorand.client.algod, groups, config)
+
+    logger.info(click.style("# load test results", bold=True))
+    for key, value in format_load_test_report(report).items():
+        logger.info(click.style(f"{key}:", bold=True) + f" {value}")
+    if report.rejections:
+        logger.info(click.style("# rejection reasons", bold=True))
+        for reason, count in report.rejections.most_common():
+            logger.info(click.style(f"{count}:", bold=True) + f" {reason}")
+
+
+@localnet_group.command("advance", short_help="Advance the rounds of a DevMode AlgoKit LocalNet.")
+@name_option
+@click.option(
+    "--rounds",
+    "-r",
+    type=click.IntRange(min=1),
+    required=True,
+    help="Number of rounds to advance by.",
+)
+@click.option(
+    "--timestamp-offset",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Offset each new block's timestamp by this many seconds from the previous block, "
+    "so the chain time moves forward by rounds * offset seconds.",
+)
+@click.option(
+    "--keep-offset",
+    is_flag=True,
+    default=False,
+    help="Keep the `--timestamp-offset` in effect for later blocks, rather than resetting it once the rounds have "
+    "been advanced.",
+)
+def localnet_advance(*, name: str | None, rounds: int, timestamp_offset: int | None, keep_offset: bool) -> None:
+    """
+    Advance the rounds of a LocalNet running in DevMode, where rounds only advance when transactions are sent,
+    e.g. to test round or time gated logic.
+
+    Zero value self-payments from the dispenser are signed locally and submitted several at a time,
+    each of which creates a new block.
+    """
+    sandbox = ComposeSandbox.from_environment(name, cached=False)
+    if sandbox is None:
+        raise click.ClickException("LocalNet isn't running; execute `algokit localnet start` to start it")
+    if not sandbox.is_algod_dev_mode():
+        raise click.ClickException(
+            "Advancing rounds is only supported in DevMode, otherwise rounds advance on their own; "
+            "execute `algokit localnet start --dev` to enable it"
+        )
+    report = advance_rounds(
+        get_algorand_client_for_sandbox(sandbox), rounds, timestamp_offset=timestamp_offset, keep_offset=keep_offset
+    )
+    logger.info(
+        f"Advanced {report.rounds} rounds from round {report.start_round} to {report.end_round} "
+        f"in {report.duration:.1f}s ({report.rounds_per_second:.1f} rounds/sec)"
+    )
+
+
+@localnet_group.command("accounts", short_help="Export the prefunded accounts of an AlgoKit LocalNet instance.")
+@click.argument("name", required=False, default=None)
+@click.option(
+    "--config-dir",
+    "-P",
+    "config_path",
+    type=click.Path(exists=True, readable=True, file_okay=False, resolve_path=True, path_type=Path),
+    default=lambda: os.environ.get("ALGOKIT_LOCALNET_CONFIG_DIR", None),
+    required=False,
+    help="Specify the custom localnet configuration directory.",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True, path_type=Path),
+    default=None,
+    help="Write the accounts to this JSON file instead of printing them.",
+)
+def localnet_accounts(*, name: str | None, config_path: Path | None, output_path: Path | None) -> None:
+    """
+    Export the addresses and mnemonics of the prefunded accounts of a LocalNet instance as JSON,
+    defaulting to the running instance.
+
+    The accounts are derived from the instance's accounts seed, so they're the same every time the instance is reset.
+    """
+    sandbox = ComposeSandbox.from_environment(name)
+    if sandbox is None:
+        sandbox = ComposeSandbox(name or SANDBOX_BASE_NAME, config_path)
+    if not sandbox.settings.prefunded_accounts:
+        raise click.ClickException(
+            f"LocalNet instance {sandbox.name} has no prefunded accounts; "
+            "execute `algokit localnet start --prefunded-accounts <count>` to add them"
+        )
+    accounts = export_accounts(derive_accounts(sandbox.settings.accounts_seed, sandbox.settings.prefunded_accounts))
+    accounts_json = json.dumps(accounts, indent=2)
+    if output_path is None:
+        click.echo(accounts_json)
+    else:
+        output_path.write_text(accounts_json, encoding="utf-8")
+        logger.info(f"Exported {len(accounts)} prefunded accounts to {output_path}")
+
+
+@localnet_group.group("images", short_help="Export and import the AlgoKit LocalNet images for offline use.")
+def localnet_images_group() -> None:
+    """
+    Export the AlgoKit LocalNet images to an image bundle and import them from it,
+    e.g. to start LocalNet on machines without access to Docker Hub.
+    """
+
+
+@localnet_images_group.command("export", short_help="Export the AlgoKit LocalNet images to an image bundle.")
+@click.argument(
+    "bundle_path", type=click.Path(dir_okay=False, writable=True, resolve_path=True, path_type=Path), metavar="BUNDLE"
+)
+def localnet_images_export(*, bundle_path: Path) -> None:
+    """
+    Export the images used by AlgoKit LocalNet (algod, conduit, indexer and postgres) to an image bundle,
+    along with their digests. Images that aren't available locally are pulled first.
+
+    The bundle is gzip compressed if its name ends in .gz or .tgz.
+    """
+    image_digests = export_image_bundle(bundle_path)
+    logger.info(f"Exported {len(image_digests)} images to {bundle_path}")
+
+
+@localnet_images_group.command("import", short_help="Import the AlgoKit LocalNet images from an image bundle.")
+@click.argument(
+    "bundle_path",
+    type=click.Path(exists=True, dir_okay=False, readable=True, resolve_path=True, path_type=Path),
+    metavar="BUNDLE",
+)
+def localnet_images_import(*, bundle_path: Path) -> None:
+    """
+    Import the AlgoKit LocalNet images from an image bundle created by `algokit localnet images export`,
+    so LocalNet can start without pulling them.
+    """
+    image_digests = import_image_bundle(bundle_path)
+    logger.info(f"Imported {len(image_digests)} images from {bundle_path}")
+
+
+@localnet_group.command("env", short_help="Print the connection config of an AlgoKit LocalNet instance.")
+@click.argument("name", required=False, default=None)
+@click.option(
+    "--config-dir",
+    "-P",
+    "config_path",
+    type=click.Path(exists=True, readable=True, file_okay=False, resolve_path=True, path_type=Path),
+    default=lambda: os.environ.get("ALGOKIT_LOCALNET_CONFIG_DIR", None),
+    required=False,
+    help="Specify the custom localnet configuration directory.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Output the connection config as a JSON object instead of environment variable assignments.",
+)
+def localnet_env(*, name: str | None, config_path: Path | None, as_json: bool) -> None:
+    """
+    Print the connection config (algod, indexer and kmd) of a LocalNet instance, defaulting to the running instance.
+
+    The output uses the environment variable names read by AlgoKit Utils, e.g. `eval $(algokit localnet env test)`.
+    """
+    sandbox = ComposeSandbox.from_environment(name)
+    if sandbox is None:
+        sandbox = ComposeSandbox(name or SANDBOX_BASE_NAME, config_path)
+    connection_env = sandbox.connection_env()
+    if as_json:
+        click.echo(json.dumps(connection_env, indent=2))
+    else:
+        for key, value in connection_env.items():
+            click.echo(f"{key}={value}")
+
+
 @localnet_group.command(
     "console",
     short_help="Run the Algorand goal CLI against the AlgoKit LocalNet via a Bash console"
@@ -353,9 +889,12 @@ def localnet_explore(context: click.Context) -> None:
     help="Number of lines to show from the end of the logs for each container.",
     show_default=True,
 )
+@name_option
 @click.pass_context
-def localnet_logs(ctx: click.Context, *, follow: bool, tail: str) -> None:
-    sandbox = ComposeSandbox()
+def localnet_logs(ctx: click.Context, *, name: str | None, follow: bool, tail: str) -> None:
+    sandbox = ComposeSandbox.from_environment(name)
+    if sandbox is None:
+        sandbox = ComposeSandbox(name or SANDBOX_BASE_NAME)
     sandbox.logs(follow=follow, no_color=ctx.color is False, tail=tail)
 
 
@@ -1,37 +1,105 @@
+import dataclasses
+import json
 import logging
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 
 import click
+from algokit_utils import SigningAccount
 from algosdk import error
-from algosdk.v2client.algod import AlgodClient
+from algosdk.transaction import SignedTransaction, Transaction
 
 from algokit.cli.common.constants import AlgorandNetwork, ExplorerEntityType
 from algokit.cli.common.utils import get_explorer_url
 from algokit.cli.tasks.utils import (
-    get_account_info,
     get_account_with_private_key,
     load_algod_client,
     validate_account_balance_to_opt_in,
     validate_address,
 )
+from algokit.core.tasks.assets import (
+    MAX_UNPIPELINED_ASSETS,
+    build_opt_in_groups,
+    build_opt_out_groups,
+    get_opt_out_holdings,
+    iter_zero_balance_holdings,
+)
+from algokit.core.tasks.send import DEFAULT_SEND_CONCURRENCY, DEFAULT_SUBMIT_RETRIES, PipelinedSender, SendResult
 from algokit.core.utils import get_algorand_client_for_network
 
 logger = logging.getLogger(__name__)
 
+# how many assets to process between progress updates when sending opt-ins or opt-outs in groups
+PROGRESS_INTERVAL = 100
+
+
+def _send_asset_groups(  # noqa: C901, PLR0913
+    *,
+    account: SigningAccount,
+    groups: Iterable[list[Transaction]],
+    action: str,
+    network: AlgorandNetwork,
+    concurrency: int,
+    results_path: Path | None,
+) -> None:
+    """
+    Sends opt-in or opt-out groups with several groups in flight at once, reporting progress as they're confirmed.
+
+    Groups are signed as they're consumed, so assets found while paging through an account's holdings are sent
+    without waiting for the rest. A group that fails doesn't stop the others being sent.
+
+    Args:
+        account (SigningAccount): The account opting in or out.
+        groups (Iterable[list[Transaction]]): The atomic groups of opt-in or opt-out transactions.
+        action (str): The action being performed, for reporting, i.e. `opt-in` or `opt-out`.
+        network (AlgorandNetwork): The network to send the transactions to.
+        concurrency (int): The number of groups to have in flight at once.
+        results_path (Optional[Path]): A file to write the result for each asset to, as JSON lines.
+
+    Raises:
+        click.ClickException: If there were no assets, or any of the transactions failed.
+    """
+    asset_ids: list[int] = []
+    counts = {"succeeded": 0, "failed": 0}
+
+    def sign(groups: Iterable[list[Transaction]]) -> Iterator[SignedTransaction]:
+        for group in groups:
+            for txn in group:
+                asset_ids.append(txn.index)  # type: ignore[attr-defined]
+                yield txn.sign(account.private_key)  # type: ignore[no-untyped-call]
 
-def _get_zero_balanced_assets(
-    *, provided_asset_ids: tuple[int], address: str, algod_client: AlgodClient, all_assets: bool = False
-) -> list[int]:
-    asset_ids_list = []
-    if all_assets:
-        account_info = get_account_info(algod_client, address)
-        for asset in account_info.get("assets", []):
-            if asset.get("amount", 0) == 0:
-                asset_ids_list.append(int(asset["asset-id"]))
-    else:
-        for asset_id in provided_asset_ids:
-            asset_ids_list.append(asset_id)
+    results_file = results_path.open("w", encoding="utf-8") if results_path else None
 
-    return asset_ids_list
+    def on_result(result: SendResult) -> None:
+        asset_id = asset_ids[result.index]
+        counts["failed" if result.error else "succeeded"] += 1
+        if result.error:
+            logger.warning(f"Asset {asset_id} {action} failed: {result.error}")
+        if results_file:
+            results_file.write(json.dumps({"asset_id": asset_id, **dataclasses.asdict(result)}) + "\n")
+        processed = counts["succeeded"] + counts["failed"]
+        if processed % PROGRESS_INTERVAL == 0:
+            click.echo(f"Processed {processed} assets, {counts['failed']} failed...")
+
+    click.echo(f"Performing {action} in groups. This may take a while for many assets...")
+    try:
+        PipelinedSender(
+            load_algod_client(network), on_result=on_result, concurrency=concurrency, retries=DEFAULT_SUBMIT_RETRIES
+        ).send(sign(groups))
+    finally:
+        if results_file:
+            results_file.close()
+
+    total = counts["succeeded"] + counts["failed"]
+    if not total:
+        raise click.ClickException(f"No assets found to {action}.")
+    click.echo(f"Successfully performed {action} for {counts['succeeded']}/{total} assets.")
+    if results_path:
+        click.echo(f"Results written to {results_path}")
+    account_url = get_explorer_url(account.address, network, ExplorerEntityType.ADDRESS)
+    click.echo(f"Check latest transactions on your account at: {account_url}")
+    if counts["failed"]:
+        raise click.ClickException(f"{counts['failed']} asset {action}s failed")
 
 
 @click.command(
@@ -49,15 +117,50 @@ def _get_zero_balanced_assets(
     required=False,
     help=f"Network to use. Refers to `{AlgorandNetwork.LOCALNET}` by default.",
 )
-def opt_in_command(asset_ids: tuple[int], account: str, network: AlgorandNetwork) -> None:
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SEND_CONCURRENCY,
+    show_default=True,
+    help="Number of atomic groups of opt-ins to have in flight at once, when there are more than 16 assets.",
+)
+@click.option(
+    "--results",
+    "results_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True, path_type=Path),
+    default=None,
+    help="File to write the result for each asset to as JSON lines, when there are more than 16 assets.",
+)
+def opt_in_command(
+    asset_ids: tuple[int], account: str, network: AlgorandNetwork, concurrency: int, results_path: Path | None
+) -> None:
     asset_ids_list = list(asset_ids)
 
     opt_in_account = get_account_with_private_key(account)
     validate_address(opt_in_account.address)
     algod_client = load_algod_client(network)
-    algorand = get_algorand_client_for_network(network)
 
     validate_account_balance_to_opt_in(algod_client, opt_in_account, len(asset_ids_list))
+    if len(asset_ids_list) > MAX_UNPIPELINED_ASSETS:
+        try:
+            _send_asset_groups(
+                account=opt_in_account,
+                groups=build_opt_in_groups(opt_in_account.address, asset_ids_list, algod_client.suggested_params()),
+                action="opt-in",
+                network=network,
+                concurrency=concurrency,
+                results_path=results_path,
+            )
+        except click.ClickException:
+            raise
+        except error.AlgodHTTPError as err:
+            raise click.ClickException(str(err)) from err
+        except Exception as err:
+            logger.debug(err, exc_info=True)
+            raise click.ClickException("Failed to perform opt-in") from err
+        return
+
+    algorand = get_algorand_client_for_network(network)
     try:
         click.echo("Performing opt-in. This may take a few seconds...")
         response = algorand.asset.bulk_opt_in(
@@ -105,25 +208,55 @@ def opt_in_command(asset_ids: tuple[int], account: str, network: AlgorandNetwork
     required=False,
     help=f"Network to use. Refers to `{AlgorandNetwork.LOCALNET}` by default.",
 )
-def opt_out_command(*, asset_ids: tuple[int], account: str, network: AlgorandNetwork, all_assets: bool) -> None:
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SEND_CONCURRENCY,
+    show_default=True,
+    help="Number of atomic groups of opt-outs to have in flight at once, when using --all or more than 16 assets.",
+)
+@click.option(
+    "--results",
+    "results_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True, path_type=Path),
+    default=None,
+    help="File to write the result for each asset to as JSON lines, when using --all or more than 16 assets.",
+)
+def opt_out_command(  # noqa: PLR0913
+    *,
+    asset_ids: tuple[int],
+    account: str,
+    network: AlgorandNetwork,
+    all_assets: bool,
+    concurrency: int,
+    results_path: Path | None,
+) -> None:
     if not (all_assets or asset_ids):
         raise click.UsageError("asset_ids or --all must be specified")
     opt_out_account = get_account_with_private_key(account)
     validate_address(opt_out_account.address)
     algod_client = load_algod_client(network)
-    algorand = get_algorand_client_for_network(network)
-    asset_ids_list = []
     try:
-        asset_ids_list = _get_zero_balanced_assets(
-            provided_asset_ids=asset_ids,
-            address=opt_out_account.address,
-            algod_client=algod_client,
-            all_assets=all_assets,
-        )
-
-        if not asset_ids_list:
-            raise click.ClickException("No assets to opt-out of.")
+        if all_assets or len(asset_ids) > MAX_UNPIPELINED_ASSETS:
+            # page through the account's holdings rather than loading them all at once; with --all, opt-outs are
+            # sent as the zero balance holdings are found
+            holdings = (
+                iter_zero_balance_holdings(algod_client, opt_out_account.address)
+                if all_assets
+                else get_opt_out_holdings(algod_client, opt_out_account.address, asset_ids)
+            )
+            _send_asset_groups(
+                account=opt_out_account,
+                groups=build_opt_out_groups(opt_out_account.address, holdings, algod_client.suggested_params()),
+                action="opt-out",
+                network=network,
+                concurrency=concurrency,
+                results_path=results_path,
+            )
+            return
 
+        algorand = get_algorand_client_for_network(network)
+        asset_ids_list = list(asset_ids)
         click.echo("Performing opt-out. This may take a few seconds...")
         response = algorand.asset.bulk_opt_out(
             account=opt_out_account.address,
@@ -140,6 +273,8 @@ def opt_out_command(*, asset_ids: tuple[int], account: str, network: AlgorandNet
                 asset_opt_out_result.transaction_id, network, ExplorerEntityType.TRANSACTION
             )
             click.echo(f"Check opt-in status for asset {asset_opt_out_result.asset_id} at: {transaction_url}")
+    except click.ClickException:
+        raise
     except error.AlgodHTTPError as err:
         raise click.ClickException(str(err)) from err
     except ConnectionRefusedError as err:
@@ -10,9 +10,10 @@ from algokit.core.tasks.ipfs import (
     PinataHttpError,
     PinataInternalServerError,
     PinataUnauthorizedError,
+    PinataUpload,
     get_pinata_jwt,
     set_pinata_jwt,
-    upload_to_pinata,
+    upload_file_to_pinata,
 )
 from algokit.core.utils import run_with_animation
 
@@ -69,7 +70,14 @@ def logout_command() -> None:
     type=click.STRING,
     help="Human readable name for this upload, for use in file listings.",
 )
-def upload(file_path: Path, name: str | None) -> None:
+@click.option(
+    "--verify",
+    is_flag=True,
+    default=False,
+    help="Check with Piñata whether the file's content is already pinned, rather than relying on the local cache of "
+    "previous uploads.",
+)
+def upload(file_path: Path, name: str | None, *, verify: bool) -> None:
     pinata_jwt = get_pinata_jwt()
     if not pinata_jwt:
         raise click.ClickException("You are not logged in! Please login using `algokit task ipfs login`.")
@@ -79,14 +87,17 @@ def upload(file_path: Path, name: str | None) -> None:
         if total > MAX_FILE_SIZE:
             raise click.ClickException("File size exceeds 100MB limit!")
 
-        def upload() -> str:
-            return upload_to_pinata(file_path, pinata_jwt, name)
+        def upload() -> PinataUpload:
+            return upload_file_to_pinata(file_path, pinata_jwt, name, verify=verify)
 
-        cid = run_with_animation(
+        pinata_upload = run_with_animation(
             target_function=upload,
             animation_text="Uploading",
         )
-        logger.info(f"File uploaded successfully!\n CID: {cid}")
+        if pinata_upload.already_pinned:
+            logger.info(f"File is already pinned, skipped uploading it.\n CID: {pinata_upload.cid}")
+        else:
+            logger.info(f"File uploaded successfully!\n CID: {pinata_upload.cid}")
 
     except click.ClickException as ex:
         raise ex
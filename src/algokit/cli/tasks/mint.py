@@ -1,12 +1,16 @@
 import json
 import logging
 import math
+from collections.abc import Iterable, Iterator
 from decimal import Decimal
 from pathlib import Path
+from typing import Any, TextIO
 
 import click
 from algokit_utils import AlgoAmount, SigningAccount
 from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SignedTransaction, Transaction
+from algosdk.v2client.algod import AlgodClient
 
 from algokit.cli.common.constants import AlgorandNetwork, ExplorerEntityType
 from algokit.cli.common.utils import get_explorer_url
@@ -24,14 +28,53 @@ from algokit.core.tasks.ipfs import (
     PinataUnauthorizedError,
     get_pinata_jwt,
 )
-from algokit.core.tasks.mint.mint import mint_token
+from algokit.core.tasks.mint.collection import (
+    DEFAULT_UPLOAD_CONCURRENCY,
+    MANIFEST_FILE_NAME,
+    CollectionToken,
+    TokenUpload,
+    find_minted_tokens,
+    read_collection_manifest,
+    read_mint_results,
+    upload_tokens,
+)
+from algokit.core.tasks.mint.mint import build_asset_config_txn, mint_token
 from algokit.core.tasks.mint.models import TokenMetadata
+from algokit.core.tasks.send import (
+    DEFAULT_SEND_CONCURRENCY,
+    DEFAULT_SUBMIT_RETRIES,
+    PipelinedSender,
+    SendResult,
+    iter_atomic_groups,
+)
 
 logger = logging.getLogger(__name__)
 
 MAX_UNIT_NAME_BYTE_LENGTH = 8
 MAX_ASSET_NAME_BYTE_LENGTH = 32
 ASSET_MINTING_MBR = Decimal("0.2")  # Algos, 0.1 for base account, 0.1 for asset creation
+ASSET_CREATION_MBR = Decimal("0.1")  # Algos, for each asset created by an account
+# how many tokens of a collection to mint between progress updates
+PROGRESS_INTERVAL = 100
+COLLECTION_RESULTS_FILE_NAME = "mint-results.jsonl"
+
+
+class _SingleTokenOption(click.Option):
+    """An option describing the one token to mint, which isn't prompted for or validated when minting a collection."""
+
+    def prompt_for_value(self, ctx: click.Context) -> Any:  # noqa: ANN401
+        if ctx.params.get("collection_path") is not None:
+            return None
+        return super().prompt_for_value(ctx)
+
+    def process_value(self, ctx: click.Context, value: Any) -> Any:  # noqa: ANN401
+        if ctx.params.get("collection_path") is not None:
+            if ctx.get_parameter_source(self.name or "") == click.core.ParameterSource.COMMANDLINE:
+                raise click.UsageError(
+                    f"{self.opts[-1]} can't be used with --collection, set it in the manifest instead"
+                )
+            return value
+        return super().process_value(ctx, value)
 
 
 def _validate_supply(total: int, decimals: int) -> None:
@@ -184,6 +227,149 @@ def _validate_supply_for_nft(context: click.Context, _: click.Parameter, value:
     return value
 
 
+def _validate_collection_token(token: CollectionToken, *, non_fungible: bool) -> None:
+    if len(token.unit_name.encode("utf-8")) > MAX_UNIT_NAME_BYTE_LENGTH:
+        raise click.ClickException(f"Token {token.index}: unit name must be {MAX_UNIT_NAME_BYTE_LENGTH} bytes or less.")
+    if len(token.name.encode("utf-8")) > MAX_ASSET_NAME_BYTE_LENGTH:
+        raise click.ClickException(
+            f"Token {token.index}: asset name must be {MAX_ASSET_NAME_BYTE_LENGTH} bytes or less."
+        )
+    if non_fungible:
+        try:
+            _validate_supply(token.total, token.decimals)
+        except click.ClickException as ex:
+            raise click.ClickException(f"Token {token.index}: {ex.message}") from ex
+
+
+def _record_result(results_file: TextIO, token: CollectionToken, **fields: Any) -> None:
+    results_file.write(json.dumps({"index": token.index, "name": token.name, **fields}) + "\n")
+    results_file.flush()
+
+
+def _get_unminted_tokens(  # noqa: PLR0913
+    client: AlgodClient,
+    creator: SigningAccount,
+    tokens: list[CollectionToken],
+    results_file: TextIO,
+    previous_results: dict[int, dict[str, Any]],
+    *,
+    mutable: bool,
+) -> list[CollectionToken]:
+    # a previous run may have minted tokens without recording it, so look for them before minting them again
+    unrecorded = {
+        index: result["metadata_cid"]
+        for index, result in previous_results.items()
+        if index < len(tokens) and result.get("metadata_cid") and not result.get("asset_id")
+    }
+    for index, asset_id in find_minted_tokens(client, creator.address, unrecorded, mutable=mutable).items():
+        previous_results[index]["asset_id"] = asset_id
+        _record_result(results_file, tokens[index], asset_id=asset_id, error=None)
+    return [token for token in tokens if not previous_results.get(token.index, {}).get("asset_id")]
+
+
+def _sign_groups(groups: Iterable[list[Transaction]], private_key: str) -> Iterator[SignedTransaction]:
+    for group in groups:
+        for txn in group:
+            yield txn.sign(private_key)  # type: ignore[no-untyped-call]
+
+
+def _mint_collection(  # noqa: C901, PLR0913
+    *,
+    creator: SigningAccount,
+    collection_path: Path,
+    mutable: bool,
+    non_fungible: bool,
+    network: AlgorandNetwork,
+    jwt: str,
+    upload_concurrency: int,
+    concurrency: int,
+    results_path: Path,
+) -> None:
+    tokens = read_collection_manifest(collection_path)
+    for token in tokens:
+        _validate_collection_token(token, non_fungible=non_fungible)
+
+    client = load_algod_client(network)
+    previous_results = read_mint_results(results_path)
+    with results_path.open("a", encoding="utf-8") as results_file:
+        remaining = _get_unminted_tokens(client, creator, tokens, results_file, previous_results, mutable=mutable)
+        already_minted = len(tokens) - len(remaining)
+        if already_minted:
+            click.echo(f"Resuming from {results_path}, {already_minted}/{len(tokens)} tokens already minted")
+        if not remaining:
+            click.echo(f"All {len(tokens)} tokens are minted")
+            return
+
+        validate_balance(
+            client,
+            creator,
+            0,
+            AlgoAmount.from_algo(ASSET_CREATION_MBR * (len(remaining) + 1)).micro_algo,
+        )
+
+        click.echo(f"Uploading and minting {len(remaining)} tokens...")
+        # the token each transaction mints, in the order they're sent
+        sent_tokens: list[CollectionToken] = []
+        minted = failed = 0
+
+        def build_txns(uploads: Iterable[TokenUpload]) -> Iterator[Transaction]:
+            nonlocal failed
+            for upload in uploads:
+                if upload.error or not upload.metadata or not upload.metadata_cid:
+                    failed += 1
+                    logger.warning(f"Failed to upload token {upload.token.index}: {upload.error}")
+                    _record_result(results_file, upload.token, error=upload.error)
+                    continue
+                _record_result(
+                    results_file,
+                    upload.token,
+                    image_cid=upload.image_cid,
+                    metadata_cid=upload.metadata_cid,
+                    error=None,
+                )
+                sent_tokens.append(upload.token)
+                yield build_asset_config_txn(
+                    # suggested params are fetched as each token is built, so none expire while uploads are slow
+                    suggested_params=client.suggested_params(),
+                    creator_address=creator.address,
+                    unit_name=upload.token.unit_name,
+                    total=upload.token.total,
+                    token_metadata=upload.metadata,
+                    metadata_cid=upload.metadata_cid,
+                    mutable=mutable,
+                )
+
+        def on_result(result: SendResult) -> None:
+            nonlocal minted, failed
+            token = sent_tokens[result.index]
+            if result.error:
+                failed += 1
+                logger.warning(f"Failed to mint token {token.index}: {result.error}")
+            else:
+                minted += 1
+            _record_result(
+                results_file,
+                token,
+                txid=result.txid,
+                asset_id=result.asset_index,
+                confirmed_round=result.confirmed_round,
+                error=result.error,
+            )
+            if (minted + failed) % PROGRESS_INTERVAL == 0:
+                click.echo(f"Minted {minted}/{len(remaining)} tokens...")
+
+        uploads = upload_tokens(remaining, jwt, concurrency=upload_concurrency, previous_results=previous_results)
+        PipelinedSender(client, on_result=on_result, concurrency=concurrency, retries=DEFAULT_SUBMIT_RETRIES).send(
+            _sign_groups(iter_atomic_groups(build_txns(uploads)), creator.private_key)
+        )
+
+    click.echo(f"Minted {already_minted + minted}/{len(tokens)} tokens")
+    click.echo(f"Browse the collection at: {get_explorer_url(creator.address, network, ExplorerEntityType.ADDRESS)}")
+    click.echo(f"Mint results written to {results_path}")
+    if failed:
+        raise click.ClickException(f"{failed} tokens failed to mint, run the same command again to retry them")
+
+
 @click.command(
     name="mint",
     help="Mint new fungible or non-fungible assets on Algorand.",
@@ -197,9 +383,19 @@ def _validate_supply_for_nft(context: click.Context, _: click.Parameter, value:
     callback=run_callback_once(_get_creator_account),
     is_eager=True,
 )
+@click.option(
+    "--collection",
+    "collection_path",
+    type=click.Path(exists=True, dir_okay=True, file_okay=False, resolve_path=True, path_type=Path),
+    help=f"""Path to a directory with a `{MANIFEST_FILE_NAME}` file listing many tokens to mint, rather than the single
+    token described by the other options. Images and metadata are uploaded several at a time, and the tokens are minted
+    in atomic groups of up to 16. Progress is recorded in a results file, so re-running the command resumes it.""",
+    is_eager=True,
+)
 @click.option(
     "--name",
     "asset_name",
+    cls=_SingleTokenOption,
     type=click.STRING,
     required=False,
     callback=_get_and_validate_asset_name,
@@ -210,6 +406,7 @@ def _validate_supply_for_nft(context: click.Context, _: click.Parameter, value:
     "-u",
     "--unit",
     "unit_name",
+    cls=_SingleTokenOption,
     type=click.STRING,
     required=True,
     callback=run_callback_once(_validate_unit_name),
@@ -220,6 +417,7 @@ def _validate_supply_for_nft(context: click.Context, _: click.Parameter, value:
 @click.option(
     "-t",
     "--total",
+    cls=_SingleTokenOption,
     type=click.INT,
     required=False,
     default=1,
@@ -230,6 +428,7 @@ def _validate_supply_for_nft(context: click.Context, _: click.Parameter, value:
 @click.option(
     "-d",
     "--decimals",
+    cls=_SingleTokenOption,
     type=click.INT,
     required=False,
     callback=_get_and_validate_decimals,
@@ -250,6 +449,7 @@ def _validate_supply_for_nft(context: click.Context, _: click.Parameter, value:
     "-i",
     "--image",
     "image_path",
+    cls=_SingleTokenOption,
     type=click.Path(exists=True, dir_okay=False, file_okay=True, resolve_path=True, path_type=Path),
     prompt="Provide the path to the asset image file",
     help="Path to the asset image file to be uploaded to IPFS.",
@@ -259,6 +459,7 @@ def _validate_supply_for_nft(context: click.Context, _: click.Parameter, value:
     "-m",
     "--metadata",
     "token_metadata_path",
+    cls=_SingleTokenOption,
     type=click.Path(exists=True, dir_okay=False, file_okay=True, resolve_path=True, path_type=Path),
     help="""Path to the ARC19 compliant asset metadata file to be uploaded to IPFS. If not provided,
         a default metadata object will be generated automatically based on asset-name, decimals and image.
@@ -282,9 +483,32 @@ def _validate_supply_for_nft(context: click.Context, _: click.Parameter, value:
     required=False,
     help=f"Network to use. Refers to `{AlgorandNetwork.LOCALNET}` by default.",
 )
+@click.option(
+    "--results",
+    "results_path",
+    type=click.Path(dir_okay=False, file_okay=True, resolve_path=True, path_type=Path),
+    help=f"JSON lines file to record the progress of minting a `--collection` in, and resume it from. "
+    f"Defaults to `{COLLECTION_RESULTS_FILE_NAME}` in the collection directory.",
+    required=False,
+)
+@click.option(
+    "--upload-concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_UPLOAD_CONCURRENCY,
+    show_default=True,
+    help="Maximum number of tokens of a `--collection` to upload to IPFS at once.",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SEND_CONCURRENCY,
+    show_default=True,
+    help="Maximum number of atomic groups of a `--collection` to have submitted but unconfirmed at once.",
+)
 def mint(  # noqa: PLR0913
     *,
     creator: SigningAccount,
+    collection_path: Path | None,
     asset_name: str,
     unit_name: str,
     total: int,
@@ -293,12 +517,29 @@ def mint(  # noqa: PLR0913
     token_metadata_path: Path | None,
     mutable: bool,
     network: AlgorandNetwork,
-    non_fungible: bool,  # noqa: ARG001
+    non_fungible: bool,
+    results_path: Path | None,
+    upload_concurrency: int,
+    concurrency: int,
 ) -> None:
     pinata_jwt = get_pinata_jwt()
     if not pinata_jwt:
         raise click.ClickException("You are not logged in! Please login using `algokit task ipfs login`.")
 
+    if collection_path is not None:
+        _mint_collection(
+            creator=creator,
+            collection_path=collection_path,
+            mutable=mutable,
+            non_fungible=non_fungible,
+            network=network,
+            jwt=pinata_jwt,
+            upload_concurrency=upload_concurrency,
+            concurrency=concurrency,
+            results_path=results_path or collection_path / COLLECTION_RESULTS_FILE_NAME,
+        )
+        return
+
     client = load_algod_client(network)
     validate_balance(
         client,
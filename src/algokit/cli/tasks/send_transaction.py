@@ -1,7 +1,9 @@
+import dataclasses
 import json
 import logging
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import cast
 
 import click
 from algosdk import encoding, error
@@ -13,9 +15,8 @@ from algokit.cli.tasks.utils import (
     load_algod_client,
     stdin_has_content,
 )
-
-if TYPE_CHECKING:
-    from io import TextIOWrapper
+from algokit.core.tasks.send import DEFAULT_SEND_CONCURRENCY, PipelinedSender, SendResult
+from algokit.core.tasks.transaction_stream import STREAM_MAGIC, decode_signed_transaction, iter_transaction_stream
 
 logger = logging.getLogger(__name__)
 
@@ -34,19 +35,26 @@ def _is_sign_task_output_txn(item: dict) -> bool:
     return isinstance(item, dict) and all(key in item for key in ["transaction_id", "content"])
 
 
-def _load_from_stdin() -> list[SignedTransaction]:
+def _load_from_stdin() -> list[SignedTransaction] | Iterator[SignedTransaction]:
     """
-    Load transaction data from standard input and convert it into a list of SignedTransaction objects.
+    Load transaction data from standard input and convert it into SignedTransaction objects.
+
+    The output of `algokit task sign` is either a JSON array, which is read in full before any transactions are
+    returned, or a binary transaction stream, whose transactions are decoded lazily as they arrive.
 
     Returns:
-        A list of SignedTransaction objects representing the loaded transactions from the standard input.
+        The SignedTransaction objects representing the loaded transactions from the standard input.
 
     Raises:
         click.ClickException: If the piped transaction content is invalid.
     """
-    # Read the raw file content from the standard input
+    stdin = click.get_binary_stream("stdin")
+    prefix = stdin.read(len(STREAM_MAGIC))
+    if prefix == STREAM_MAGIC:
+        return (decode_signed_transaction(encoded_txn) for encoded_txn in iter_transaction_stream(stdin))
 
-    raw_file_content = cast("TextIOWrapper", click.get_text_stream("stdin")).read()
+    # Read the raw file content from the standard input
+    raw_file_content = (prefix + stdin.read()).decode("utf-8")
 
     try:
         # Parse the raw file content as JSON
@@ -62,16 +70,19 @@ def _load_from_stdin() -> list[SignedTransaction]:
     return [encoding.msgpack_decode(item["content"]) for item in file_content]  # type: ignore[no-untyped-call]
 
 
-def _get_signed_transactions(file: Path | None = None, transaction: str | None = None) -> list[SignedTransaction]:
+def _get_signed_transactions(
+    file: Path | None = None, transaction: str | None = None
+) -> list[SignedTransaction] | Iterator[SignedTransaction]:
     """
-    Retrieves a list of signed transactions.
+    Retrieves the signed transactions to send.
 
     Args:
         file (Optional[Path]): A `Path` object representing the file path from which to retrieve the transactions.
         transaction (Optional[str]): A base64 encoded string representing a single signed transaction.
 
     Returns:
-        list[SignedTransaction]: A list of `SignedTransaction` objects representing the retrieved signed transactions.
+        list[SignedTransaction] | Iterator[SignedTransaction]: The retrieved signed transactions, as an iterator that
+        decodes them as they're read when they're piped in as a binary transaction stream.
 
     Raises:
         click.ClickException: If the supplied transaction is not of type `SignedTransaction`.
@@ -85,6 +96,8 @@ def _get_signed_transactions(file: Path | None = None, transaction: str | None =
             txns = [encoding.msgpack_decode(transaction)]  # type: ignore[no-untyped-call]
         else:
             txns = _load_from_stdin()
+            if not isinstance(txns, list):
+                return txns
 
         for txn in txns:
             if not isinstance(txn, SignedTransaction):
@@ -128,6 +141,56 @@ def _send_transactions(network: AlgorandNetwork, txns: list[SignedTransaction])
             )
 
 
+def _send_transactions_pipelined(
+    network: AlgorandNetwork,
+    txns: Iterable[SignedTransaction],
+    *,
+    concurrency: int,
+    confirm: bool,
+    results_path: Path | None,
+) -> None:
+    """
+    Sends signed transactions with several submissions in flight at once, optionally waiting for them to be confirmed.
+
+    Args:
+        network (AlgorandNetwork): The network to which the transactions will be sent.
+        txns (Iterable[SignedTransaction]): The signed transactions to be sent, which are consumed as they're sent.
+        concurrency (int): The number of submissions to have in flight at once.
+        confirm (bool): Whether to wait for the transactions to be confirmed.
+        results_path (Optional[Path]): A file to write the result of each transaction to, as JSON lines.
+
+    Raises:
+        click.ClickException: If there were no transactions to send, or any of the transactions failed.
+    """
+    results_file = results_path.open("w", encoding="utf-8") if results_path else None
+    counts = {"sent": 0, "failed": 0}
+
+    def on_result(result: SendResult) -> None:
+        counts["failed" if result.error else "sent"] += 1
+        if result.error:
+            logger.warning(f"Transaction {result.index + 1} ({result.txid}) failed: {result.error}")
+        if results_file:
+            results_file.write(json.dumps(dataclasses.asdict(result)) + "\n")
+
+    try:
+        sender = PipelinedSender(
+            load_algod_client(network), on_result=on_result, concurrency=concurrency, confirm=confirm
+        )
+        sender.send(txns)
+    finally:
+        if results_file:
+            results_file.close()
+
+    total = counts["sent"] + counts["failed"]
+    if not total:
+        raise click.ClickException("No valid transactions found!")
+    click.echo(f"{counts['sent']}/{total} transactions {'confirmed' if confirm else 'sent'}")
+    if results_path:
+        click.echo(f"Transaction results written to {results_path}")
+    if counts["failed"]:
+        raise click.ClickException(f"{counts['failed']} transactions failed")
+
+
 @click.command(name="send", help="Send a signed transaction to the given network.")
 @click.option(
     "--file",
@@ -155,7 +218,38 @@ def _send_transactions(network: AlgorandNetwork, txns: list[SignedTransaction])
     required=False,
     help=f"Network to use. Refers to `{AlgorandNetwork.LOCALNET}` by default.",
 )
-def send(*, file: Path | None, transaction: str | None, network: AlgorandNetwork) -> None:
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of transactions (or atomic groups) to have in flight at once. "
+    f"Enables pipelined sending, defaults to {DEFAULT_SEND_CONCURRENCY} when pipelined sending is enabled "
+    "by `--confirm` or `--results`.",
+)
+@click.option(
+    "--confirm",
+    is_flag=True,
+    default=False,
+    help="Wait for the transactions to be confirmed, checking the pending transactions together in batches while "
+    "sending and once per round after that. Enables pipelined sending.",
+)
+@click.option(
+    "--results",
+    "results_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True, path_type=Path),
+    default=None,
+    help="Write the result of each transaction (txid, confirmed round and error) to this file as JSON lines. "
+    "Enables pipelined sending.",
+)
+def send(  # noqa: PLR0913
+    *,
+    file: Path | None,
+    transaction: str | None,
+    network: AlgorandNetwork,
+    concurrency: int | None,
+    confirm: bool,
+    results_path: Path | None,
+) -> None:
     if not file and not transaction and not stdin_has_content():
         raise click.ClickException(
             "Please provide a file path via `--file` or a base64 encoded signed transaction via `--transaction`. "
@@ -164,11 +258,23 @@ def send(*, file: Path | None, transaction: str | None, network: AlgorandNetwork
 
     txns = _get_signed_transactions(file, transaction)
 
-    if not txns:
+    if isinstance(txns, list) and not txns:
         raise click.ClickException("No valid transactions found!")
 
     try:
-        _send_transactions(network, txns)
+        # transaction streams are sent as they arrive, which needs the pipelined sender
+        if concurrency is not None or confirm or results_path is not None or not isinstance(txns, list):
+            _send_transactions_pipelined(
+                network,
+                txns,
+                concurrency=concurrency or DEFAULT_SEND_CONCURRENCY,
+                confirm=confirm,
+                results_path=results_path,
+            )
+        else:
+            _send_transactions(network, txns)
+    except click.ClickException:
+        raise
     except error.AlgodHTTPError as ex:
         raise click.ClickException(str(ex)) from ex
     except Exception as ex:
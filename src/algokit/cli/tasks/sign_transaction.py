@@ -1,15 +1,19 @@
 import base64
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, cast
 
 import click
+from algokit_utils import AlgoAmount
 from algosdk import encoding
 from algosdk.transaction import SignedTransaction, Transaction, retrieve_from_file, write_to_file
 
 from algokit.cli.common.utils import MutuallyExclusiveOption
 from algokit.cli.tasks.utils import get_account_with_private_key
+from algokit.core.tasks.sign import iter_transaction_records, sign_transactions_file, summarise_transactions
+from algokit.core.tasks.transaction_stream import TransactionStreamWriter
 
 logger = logging.getLogger(__name__)
 
@@ -64,12 +68,18 @@ def _confirm_transaction(txns: list[Transaction]) -> bool:
     return bool(response == "y")
 
 
-def _sign_and_output_transaction(txns: list[Transaction], private_key: str, output: Path | None) -> None:
+def _sign_and_output_transaction(
+    txns: list[Transaction], private_key: str, output: Path | None, output_format: str = "json"
+) -> None:
     signed_txns = [txn.sign(private_key) for txn in txns]  # type: ignore[no-untyped-call]
 
     if output:
         write_to_file(signed_txns, str(output))  # type: ignore[no-untyped-call]
         click.echo(f"Signed transaction written to {output}")
+    elif output_format == "binary":
+        writer = TransactionStreamWriter(click.get_binary_stream("stdout"))
+        for txn in signed_txns:
+            writer.write(base64.b64decode(encoding.msgpack_encode(txn)))  # type: ignore[no-untyped-call]
     else:
         encoded_signed_txns = [
             {"transaction_id": txn.get_txid(), "content": encoding.msgpack_encode(txn)}  # type: ignore[no-untyped-call]
@@ -78,6 +88,66 @@ def _sign_and_output_transaction(txns: list[Transaction], private_key: str, outp
         click.echo(json.dumps(encoded_signed_txns, indent=2))
 
 
+# how many addresses to list in the summary of a streamed batch before eliding the rest
+MAX_SUMMARY_ADDRESSES = 5
+
+
+def _format_addresses(addresses: set[str]) -> str:
+    listed = ", ".join(sorted(addresses)[:MAX_SUMMARY_ADDRESSES])
+    if len(addresses) > MAX_SUMMARY_ADDRESSES:
+        return f"{listed} and {len(addresses) - MAX_SUMMARY_ADDRESSES} more"
+    return listed
+
+
+def _confirm_transactions_summary(file: Path) -> bool:
+    summary = summarise_transactions(iter_transaction_records(file))
+    if not summary.count:
+        raise click.ClickException("No valid transactions found!")
+    types = ", ".join(f"{txn_type}: {count}" for txn_type, count in sorted(summary.types.items()))
+    click.echo(f"Transactions: {summary.count} ({types})")
+    click.echo(f"Senders: {_format_addresses(summary.senders)}")
+    click.echo(f"Total fees: {AlgoAmount.from_micro_algo(summary.fees).algo} Algos")
+    if summary.types["pay"]:
+        click.echo(f"Total payments: {AlgoAmount.from_micro_algo(summary.algos).algo} Algos")
+    for asset_id, amount in sorted(summary.assets.items()):
+        click.echo(f"Total transfers of asset {asset_id}: {amount} (in base units)")
+    if summary.receivers:
+        click.echo(f"Receivers ({len(summary.receivers)}): {_format_addresses(summary.receivers)}")
+    response = click.prompt(
+        "Would you like to proceed with signing the above?", type=click.Choice(["y", "n"]), default="n"
+    )
+    return bool(response == "y")
+
+
+def _stream_sign_and_output_transactions(
+    file: Path, private_key: str, output: Path | None, output_format: str, workers: int
+) -> None:
+    signed_txns = sign_transactions_file(file, private_key, workers=workers)
+    count = 0
+    if output:
+        with output.open("wb") as output_file:
+            for _, signed_txn in signed_txns:
+                output_file.write(signed_txn)
+                count += 1
+        click.echo(f"{count} signed transactions written to {output}")
+    elif output_format == "binary":
+        stdout_bytes = click.get_binary_stream("stdout")
+        writer = TransactionStreamWriter(stdout_bytes)
+        for _, signed_txn in signed_txns:
+            writer.write(signed_txn)
+        stdout_bytes.flush()
+    else:
+        # written as a JSON array one transaction at a time, in the same format as when not streaming
+        stdout = click.get_text_stream("stdout")
+        stdout.write("[")
+        for txid, signed_txn in signed_txns:
+            content = base64.b64encode(signed_txn).decode()
+            stdout.write(("," if count else "") + "\n  " + json.dumps({"transaction_id": txid, "content": content}))
+            count += 1
+        stdout.write("\n]\n")
+        stdout.flush()
+
+
 @click.command(name="sign", help="Sign goal clerk compatible Algorand transaction(s).")
 @click.option("--account", "-a", type=click.STRING, required=True, help="Address or alias of the signer account.")
 @click.option(
@@ -104,14 +174,54 @@ def _sign_and_output_transaction(txns: list[Transaction], private_key: str, outp
     required=False,
 )
 @click.option("--force", is_flag=True, help="Force signing without confirmation.", required=False, type=click.BOOL)
-def sign(*, account: str, file: Path | None, transaction: str | None, output: Path | None, force: bool) -> None:
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Read and sign the transactions in `--file` incrementally across worker processes, writing them out as "
+    "they're signed. The confirmation shows a summary of the transactions rather than each transaction.",
+)
+@click.option(
+    "--output-format",
+    type=click.Choice(["json", "binary"]),
+    default="json",
+    show_default=True,
+    help="Format of the signed transactions written to stdout when `--output` isn't given: a JSON array, or a "
+    "binary transaction stream that `algokit task send` can start sending before it has been written in full.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=lambda: os.cpu_count() or 1,
+    show_default="number of CPUs",
+    help="Number of worker processes to sign with when using `--stream`.",
+)
+def sign(  # noqa: PLR0913
+    *,
+    account: str,
+    file: Path | None,
+    transaction: str | None,
+    output: Path | None,
+    force: bool,
+    stream: bool,
+    output_format: str,
+    workers: int,
+) -> None:
     if not file and not transaction:
         raise click.ClickException(
             "Please provide a file path via `--file` or a base64 encoded unsigned transaction via `--transaction`."
         )
+    if stream and not file:
+        raise click.ClickException("`--stream` can only be used with `--file`.")
 
     signer_account = get_account_with_private_key(account)
 
+    if stream and file:
+        if not force and not _confirm_transactions_summary(file):
+            return
+        _stream_sign_and_output_transactions(file, signer_account.private_key, output, output_format, workers)
+        return
+
     txns = _get_transactions(file, transaction)
 
     if not txns:
@@ -122,4 +232,4 @@ def sign(*, account: str, file: Path | None, transaction: str | None, output: Pa
     if not force and not _confirm_transaction(txns):
         return
 
-    _sign_and_output_transaction(txns, signer_account.private_key, output)
+    _sign_and_output_transaction(txns, signer_account.private_key, output, output_format)
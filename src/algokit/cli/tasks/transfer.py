@@ -1,10 +1,19 @@
+import csv
+import functools
 import logging
+from pathlib import Path
 
 import click
-from algokit_utils import AlgoAmount, AssetTransferParams, PaymentParams, SendAtomicTransactionComposerResults
+from algokit_utils import (
+    AlgoAmount,
+    AssetTransferParams,
+    PaymentParams,
+    SendAtomicTransactionComposerResults,
+    SigningAccount,
+)
 
 from algokit.cli.common.constants import AlgorandNetwork, ExplorerEntityType
-from algokit.cli.common.utils import get_explorer_url
+from algokit.cli.common.utils import MutuallyExclusiveOption, get_explorer_url
 from algokit.cli.tasks.utils import (
     get_account_with_private_key,
     get_address,
@@ -13,6 +22,15 @@ from algokit.cli.tasks.utils import (
     validate_address,
     validate_balance,
 )
+from algokit.core.tasks.batch_transfer import (
+    RESULTS_COLUMNS,
+    build_transfer_groups,
+    read_batch_transfers,
+    sign_transfer_groups,
+    validate_batch_balance,
+    validate_receivers_opted_in,
+)
+from algokit.core.tasks.send import DEFAULT_SEND_CONCURRENCY, PipelinedSender, SendResult
 from algokit.core.utils import get_algorand_client_for_network
 
 logger = logging.getLogger(__name__)
@@ -20,6 +38,61 @@ logger = logging.getLogger(__name__)
 # TODO: upon algokit nfd lookup being implemented receiver will also allow nfd lookups
 
 
+def _transfer_batch(  # noqa: PLR0913
+    *,
+    sender_account: SigningAccount,
+    batch_path: Path,
+    asset_id: int,
+    whole_units: bool,
+    network: AlgorandNetwork,
+    concurrency: int,
+    results_path: Path,
+) -> None:
+    algod_client = load_algod_client(network)
+    get_decimals = functools.cache(lambda asset_id: get_asset_decimals(asset_id, algod_client))
+    transfers = read_batch_transfers(
+        batch_path, default_asset_id=asset_id, get_decimals=get_decimals if whole_units else None
+    )
+
+    # Validate the whole batch up front, so it either fails before anything is sent or is expected to succeed
+    groups = build_transfer_groups(sender_account.address, transfers, algod_client.suggested_params())
+    validate_batch_balance(algod_client, sender_account.address, transfers, groups)
+    validate_receivers_opted_in(algod_client, transfers, concurrency=concurrency)
+
+    click.echo(f"Sending {len(transfers)} transfers in {len(groups)} atomic groups...")
+    failed = 0
+    with results_path.open("w", newline="", encoding="utf-8") as results_file:
+        results = csv.DictWriter(results_file, fieldnames=RESULTS_COLUMNS)
+        results.writeheader()
+
+        def on_result(result: SendResult) -> None:
+            nonlocal failed
+            transfer = transfers[result.index]
+            if result.error:
+                failed += 1
+                logger.warning(f"Transfer on line {transfer.line} failed: {result.error}")
+            results.writerow(
+                {
+                    "line": transfer.line,
+                    "receiver": transfer.receiver,
+                    "asset_id": transfer.asset_id,
+                    "amount": transfer.amount,
+                    "txid": result.txid,
+                    "confirmed_round": result.confirmed_round,
+                    "error": result.error,
+                }
+            )
+
+        PipelinedSender(algod_client, on_result=on_result, concurrency=concurrency).send(
+            sign_transfer_groups(groups, sender_account.private_key)
+        )
+
+    click.echo(f"{len(transfers) - failed}/{len(transfers)} transfers confirmed")
+    click.echo(f"Transfer results written to {results_path}")
+    if failed:
+        raise click.ClickException(f"{failed} transfers failed")
+
+
 @click.command(name="transfer", help="""Transfer algos or assets from one account to another.""")
 @click.option("--sender", "-s", type=click.STRING, help="Address or alias of the sender account.", required=True)
 @click.option(
@@ -27,7 +100,7 @@ logger = logging.getLogger(__name__)
     "-r",
     type=click.STRING,
     help="Address or alias to an account that will receive the asset(s).",
-    required=True,
+    required=False,
 )
 @click.option(
     "--asset",
@@ -38,7 +111,7 @@ logger = logging.getLogger(__name__)
     default=0,
     required=False,
 )
-@click.option("--amount", "-a", type=click.INT, help="Amount to transfer.", required=True)
+@click.option("--amount", "-a", type=click.INT, help="Amount to transfer.", required=False)
 @click.option(
     "--whole-units",
     "whole_units",
@@ -59,17 +132,67 @@ logger = logging.getLogger(__name__)
     required=False,
     help=f"Network to use. Refers to `{AlgorandNetwork.LOCALNET}` by default.",
 )
+@click.option(
+    "--batch",
+    "batch_path",
+    type=click.Path(exists=True, dir_okay=False, file_okay=True, resolve_path=True, path_type=Path),
+    help="CSV file of transfers to send, with a header row and `receiver` and `amount` columns, plus an optional "
+    "`asset_id` column that defaults to `--asset`. The transfers are sent in atomic groups of up to 16.",
+    cls=MutuallyExclusiveOption,
+    not_required_if=["receiver", "amount"],
+    required=False,
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SEND_CONCURRENCY,
+    show_default=True,
+    help="Number of atomic groups to have in flight at once when using `--batch`.",
+)
+@click.option(
+    "--results",
+    "results_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True, path_type=Path),
+    default=None,
+    help="CSV file to write the result of each transfer to when using `--batch`. "
+    "Defaults to the batch file name with a `.results.csv` suffix.",
+)
+@click.pass_context
 def transfer(  # noqa: PLR0913
+    ctx: click.Context,
     *,
     sender: str,
-    receiver: str,
+    receiver: str | None,
     asset_id: int,
-    amount: int,
+    amount: int | None,
     whole_units: bool,
     network: AlgorandNetwork,
+    batch_path: Path | None,
+    concurrency: int,
+    results_path: Path | None,
 ) -> None:
+    if batch_path is None:
+        for name, value in (("receiver", receiver), ("amount", amount)):
+            if value is None:
+                raise click.MissingParameter(ctx=ctx, param=next(p for p in ctx.command.params if p.name == name))
+
     # Load addresses and accounts from mnemonics or aliases
     sender_account = get_account_with_private_key(sender)
+
+    if batch_path is not None:
+        _transfer_batch(
+            sender_account=sender_account,
+            batch_path=batch_path,
+            asset_id=asset_id,
+            whole_units=whole_units,
+            network=network,
+            concurrency=concurrency,
+            results_path=results_path or batch_path.with_suffix(".results.csv"),
+        )
+        return
+    assert receiver is not None
+    assert amount is not None
+
     receiver_address = get_address(receiver)
 
     # Get algod client
@@ -1,5 +1,6 @@
 # AlgoKit Tasks related utility functions
 
+import json
 import logging
 import os
 import stat
@@ -7,18 +8,83 @@ import sys
 from collections.abc import Callable
 from decimal import Decimal
 from functools import wraps
+from pathlib import Path
 from typing import Any
 
 import algosdk
 import algosdk.encoding
 import click
-from algokit_utils import AlgoAmount, ClientManager, SigningAccount
+from algokit_utils import AlgoAmount, SigningAccount
 
 from algokit.cli.common.constants import AlgorandNetwork
+from algokit.core.algod_clients import get_network_algod_client
+from algokit.core.conf import get_app_state_dir
 from algokit.core.tasks.wallet import get_alias
 
 logger = logging.getLogger(__name__)
 
+# the asset params that can never change once an asset is created, and so can be cached indefinitely
+IMMUTABLE_ASSET_PARAMS = ("decimals", "unit-name")
+
+
+def _get_asset_params_cache_path() -> Path:
+    return get_app_state_dir() / "asset-params-cache.json"
+
+
+def _read_asset_params_cache() -> dict[str, dict[str, dict[str, Any]]]:
+    try:
+        cache = json.loads(_get_asset_params_cache_path().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_asset_params_cache(cache: dict[str, dict[str, dict[str, Any]]]) -> None:
+    cache_path = _get_asset_params_cache_path()
+    try:
+        # write then rename, so concurrent commands never read a partially written cache
+        temp_path = cache_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(cache), encoding="utf-8")
+        temp_path.replace(cache_path)
+    except OSError as ex:
+        logger.debug(f"Failed to update asset params cache: {ex}")
+
+
+def get_immutable_asset_params(asset_id: int, algod_client: algosdk.v2client.algod.AlgodClient) -> dict[str, Any]:
+    """
+    Retrieves the params of an asset that can't change once it's created, see `IMMUTABLE_ASSET_PARAMS`.
+
+    They're cached on disk, keyed by the genesis hash of the network so a reset LocalNet doesn't reuse them.
+
+    Args:
+        asset_id (int): The ID of the asset.
+        algod_client (algosdk.v2client.algod.AlgodClient): An instance of the AlgodClient class.
+
+    Returns:
+        dict[str, Any]: The immutable params of the asset, by their algod names.
+
+    Raises:
+        click.ClickException: If the versions or asset info response is invalid.
+    """
+    versions = algod_client.versions()
+    if not isinstance(versions, dict) or "genesis_hash_b64" not in versions:
+        raise click.ClickException("Invalid versions response")
+    genesis_hash = str(versions["genesis_hash_b64"])
+    cache = _read_asset_params_cache()
+    cached_params = cache.get(genesis_hash, {}).get(str(asset_id))
+    if isinstance(cached_params, dict):
+        logger.debug(f"Using cached params for asset {asset_id}")
+        return cached_params
+
+    asset_info = algod_client.asset_info(asset_id)
+    if not isinstance(asset_info, dict) or "params" not in asset_info or "decimals" not in asset_info["params"]:
+        raise click.ClickException("Invalid asset info response")
+
+    params = {name: asset_info["params"][name] for name in IMMUTABLE_ASSET_PARAMS if name in asset_info["params"]}
+    cache.setdefault(genesis_hash, {})[str(asset_id)] = params
+    _write_asset_params_cache(cache)
+    return params
+
 
 def _validate_asset_balance(account_info: dict, asset_id: int, decimals: int, amount: int = 0) -> None:
     asset_record = next((asset for asset in account_info.get("assets", []) if asset["asset-id"] == asset_id), None)
@@ -78,6 +144,8 @@ def load_algod_client(network: AlgorandNetwork) -> algosdk.v2client.algod.AlgodC
     """
     Returns an instance of the `algosdk.v2client.algod.AlgodClient` class for the specified network.
 
+    The client is shared with everything else that talks to the network, see `get_network_algod_client`.
+
     Args:
         network (str): The network for which the `AlgodClient` instance needs to be loaded.
 
@@ -88,14 +156,9 @@ def load_algod_client(network: AlgorandNetwork) -> algosdk.v2client.algod.AlgodC
         click.ClickException: If the specified network is invalid.
     """
 
-    config_mapping = {
-        AlgorandNetwork.LOCALNET: ClientManager.get_default_localnet_config("algod"),
-        AlgorandNetwork.TESTNET: ClientManager.get_algonode_config("testnet", "algod"),
-        AlgorandNetwork.MAINNET: ClientManager.get_algonode_config("mainnet", "algod"),
-    }
     try:
-        return ClientManager.get_algod_client(config_mapping[network])
-    except KeyError as err:
+        return get_network_algod_client(network)
+    except ValueError as err:
         raise click.ClickException("Invalid network") from err
 
 
@@ -123,12 +186,7 @@ def get_asset_decimals(asset_id: int, algod_client: algosdk.v2client.algod.Algod
     if asset_id == 0:
         return 6
 
-    asset_info = algod_client.asset_info(asset_id)
-
-    if not isinstance(asset_info, dict) or "params" not in asset_info or "decimals" not in asset_info["params"]:
-        raise click.ClickException("Invalid asset info response")
-
-    return int(asset_info["params"]["decimals"])
+    return int(get_immutable_asset_params(asset_id, algod_client)["decimals"])
 
 
 def validate_balance(
@@ -148,10 +206,7 @@ def validate_balance(
         click.ClickException: If any validation check fails.
     """
     address = account.address if isinstance(account, SigningAccount) else account
-    account_info = algod_client.account_info(address)
-
-    if not isinstance(account_info, dict):
-        raise click.ClickException("Invalid account info response")
+    account_info = get_account_info(algod_client, address)
 
     if asset_id == 0:
         _validate_algo_balance(account_info, amount)
@@ -275,7 +330,7 @@ def validate_account_balance_to_opt_in(
     """
 
     address = account.address if isinstance(account, SigningAccount) else account
-    account_info = algod_client.account_info(address)
+    account_info = algod_client.account_info(address, exclude="all")
 
     if not isinstance(account_info, dict):
         raise click.ClickException("Invalid account info response")
@@ -293,7 +348,8 @@ def validate_account_balance_to_opt_in(
 
 def get_account_info(algod_client: algosdk.v2client.algod.AlgodClient, account_address: str) -> dict:
     account_info = algod_client.account_info(account_address)
-    assert isinstance(account_info, dict)
+    if not isinstance(account_info, dict):
+        raise click.ClickException("Invalid account info response")
     return account_info
 
 
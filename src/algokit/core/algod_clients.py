@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import copy
+import importlib.util
+import json
+import logging
+import time
+from functools import cache
+from typing import TYPE_CHECKING, Any
+from urllib import parse
+
+import algosdk
+import httpx
+from algokit_utils import AlgoClientConfigs, ClientManager
+from algosdk import constants, error
+from algosdk.v2client.algod import api_version_path_prefix
+
+if TYPE_CHECKING:
+    from algosdk.transaction import SuggestedParams
+
+    from algokit.cli.common.constants import AlgorandNetwork
+
+logger = logging.getLogger(__name__)
+
+# Algorand produces a block roughly every 2.8 seconds, suggested params fetched more recently than that are current
+ROUND_DURATION = 2.8
+# idle connections kept open per network, enough for every submission `PipelinedSender` has in flight by default
+MAX_KEEPALIVE_CONNECTIONS = 16
+
+
+def _http2_available() -> bool:
+    # HTTP/2 is only used if the optional `h2` package is installed, e.g. via `pip install httpx[http2]`
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client() -> httpx.Client:
+    """Create an HTTP client that keeps connections to a node alive between requests, for `PooledAlgodClient`."""
+    return httpx.Client(
+        http2=_http2_available(),
+        limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+    )
+
+
+class PooledAlgodClient(algosdk.v2client.algod.AlgodClient):
+    """
+    An `AlgodClient` that sends requests over a pool of keep-alive connections, rather than a new connection each time.
+
+    How long each request took, and whether it had to open a new connection, is logged at debug level.
+    """
+
+    def __init__(
+        self, algod_token: str, algod_address: str, headers: dict[str, str] | None = None, *, http: httpx.Client
+    ) -> None:
+        super().__init__(algod_token, algod_address, headers)
+        self._http = http
+
+    def algod_request(  # noqa: PLR0913
+        self,
+        method: str,
+        requrl: str,
+        params: Any = None,  # noqa: ANN401
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> Any:  # noqa: ANN401
+        # mirrors AlgodClient.algod_request, which opens a new connection for every request
+        request_headers = {"User-Agent": "py-algorand-sdk", **(self.headers or {}), **(headers or {})}
+        if requrl not in constants.no_auth:
+            request_headers[constants.algod_auth_header] = self.algod_token
+        path = requrl if requrl in constants.unversioned_paths else api_version_path_prefix + requrl
+        if params:
+            path = path + "?" + parse.urlencode(params)
+
+        trace_events: dict[str, float] = {}
+        started = time.perf_counter()
+        response = self._http.request(
+            method,
+            self.algod_address + path,
+            headers=request_headers,
+            content=data,
+            timeout=timeout,
+            extensions={"trace": lambda event, _info: trace_events.setdefault(event, time.perf_counter())},
+        )
+        _log_request_metrics(method, requrl, response, time.perf_counter() - started, trace_events)
+
+        if response.is_error:
+            try:
+                body = response.json()
+                message = body["message"]
+            except (ValueError, KeyError, TypeError):
+                body, message = {}, response.text
+            raise error.AlgodHTTPError(message, response.status_code, body.get("data"))  # type: ignore[no-untyped-call]
+        if response_format != "json":
+            return response.content
+        if not response.content:
+            # some algod responses are a 200 OK with an empty body
+            return {}
+        try:
+            return response.json()
+        except json.JSONDecodeError as ex:
+            raise error.AlgodResponseError("Failed to parse JSON response from algod") from ex  # type: ignore[no-untyped-call]
+
+
+def _log_request_metrics(
+    method: str, requrl: str, response: httpx.Response, elapsed: float, trace_events: dict[str, float]
+) -> None:
+    connect_started = trace_events.get("connection.connect_tcp.started")
+    connected = trace_events.get("connection.start_tls.complete") or trace_events.get("connection.connect_tcp.complete")
+    connection = (
+        f"new connection in {(connected - connect_started) * 1000:.1f}ms"
+        if connect_started and connected
+        else "reused connection"
+    )
+    logger.debug(
+        f"algod {method} {requrl} {response.status_code} in {elapsed * 1000:.1f}ms "
+        f"({connection}, {response.http_version})"
+    )
+
+
+class CachingAlgodClient(PooledAlgodClient):
+    """
+    A `PooledAlgodClient` that reuses responses that can't have changed since they were fetched.
+
+    Suggested params are reused until the next round is due, a later round is seen or a transaction is submitted
+    through this client (which creates a block on a DevMode LocalNet), and every caller gets its own copy to modify.
+    Account information is reused until a transaction is submitted, as that may have changed any account's balances.
+    The node's versions, which include the genesis hash of its network, are only fetched once.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._suggested_params: tuple[float, SuggestedParams] | None = None
+        self._account_info: dict[tuple[str, str | None], Any] = {}
+        self._versions: Any = None
+
+    def versions(self, **kwargs: Any) -> Any:  # noqa: ANN401
+        if kwargs:
+            return super().versions(**kwargs)
+        if self._versions is None:
+            self._versions = super().versions()
+        else:
+            logger.debug("Using cached versions")
+        return self._versions
+
+    def suggested_params(self, **kwargs: Any) -> SuggestedParams:
+        cached = self._suggested_params
+        if not kwargs and cached and time.monotonic() - cached[0] < ROUND_DURATION:
+            logger.debug(f"Using cached suggested params for round {cached[1].first}")
+            return copy.copy(cached[1])
+        params = super().suggested_params(**kwargs)
+        self._suggested_params = (time.monotonic(), params)
+        return copy.copy(params)
+
+    def account_info(self, address: str, exclude: str | None = None, **kwargs: Any) -> Any:  # noqa: ANN401
+        key = (address, exclude)
+        if kwargs or key not in self._account_info:
+            self._account_info[key] = super().account_info(address, exclude, **kwargs)
+        else:
+            logger.debug(f"Using cached account info for {address}")
+        return self._account_info[key]
+
+    def send_raw_transaction(self, txn: bytes | str, **kwargs: Any) -> Any:  # noqa: ANN401
+        # send_transaction and send_transactions both submit through here
+        self._account_info.clear()
+        self._suggested_params = None
+        return super().send_raw_transaction(txn, **kwargs)
+
+    def status(self, **kwargs: Any) -> Any:  # noqa: ANN401
+        return self._observe_round(super().status(**kwargs))
+
+    def status_after_block(self, block_num: int | None = None, round_num: int | None = None, **kwargs: Any) -> Any:  # noqa: ANN401
+        return self._observe_round(super().status_after_block(block_num, round_num, **kwargs))
+
+    def _observe_round(self, status: Any) -> Any:  # noqa: ANN401
+        cached = self._suggested_params
+        if cached and isinstance(status, dict) and status.get("last-round", 0) > cached[1].first:
+            self._suggested_params = None
+        return status
+
+
+def get_network_client_configs(network: AlgorandNetwork) -> AlgoClientConfigs:
+    from algokit.cli.common.constants import AlgorandNetwork
+
+    match network:
+        case AlgorandNetwork.LOCALNET:
+            return AlgoClientConfigs(
+                algod_config=ClientManager.get_default_localnet_config("algod"),
+                indexer_config=ClientManager.get_default_localnet_config("indexer"),
+                kmd_config=ClientManager.get_default_localnet_config("kmd"),
+            )
+        case AlgorandNetwork.TESTNET:
+            return AlgoClientConfigs(
+                algod_config=ClientManager.get_algonode_config("testnet", "algod"),
+                indexer_config=ClientManager.get_algonode_config("testnet", "indexer"),
+                kmd_config=None,
+            )
+        case AlgorandNetwork.MAINNET:
+            return AlgoClientConfigs(
+                algod_config=ClientManager.get_algonode_config("mainnet", "algod"),
+                indexer_config=ClientManager.get_algonode_config("mainnet", "indexer"),
+                kmd_config=None,
+            )
+        case _:
+            raise ValueError(f"Unsupported network: {network}")
+
+
+@cache
+def get_network_algod_client(network: AlgorandNetwork) -> CachingAlgodClient:
+    """
+    Get the algod client for a network, shared by everything in this process that talks to it, so they share its
+    keep-alive connections and cached responses.
+
+    Raises:
+        ValueError: If the network is not supported.
+    """
+    config = get_network_client_configs(network).algod_config
+    token = config.token or ""
+    return CachingAlgodClient(token, config.full_url(), {"X-Algo-API-Token": token}, http=create_http_client())
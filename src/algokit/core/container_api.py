@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from algokit.core.config_commands.container_engine import ContainerEngine, get_container_engine
+
+logger = logging.getLogger(__name__)
+
+CONTAINER_API_TIMEOUT = 5
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
+COMPOSE_SERVICE_LABEL = "com.docker.compose.service"
+COMPOSE_CONFIG_FILES_LABEL = "com.docker.compose.project.config_files"
+
+_clients: dict[str, ContainerApiClient] = {}
+
+
+class ContainerApiError(Exception):
+    pass
+
+
+def find_container_api_socket(engine: str) -> Path | None:
+    """Find the unix socket of the Docker (or Docker compatible Podman) Engine API, if there is one."""
+    if platform.system() == "Windows":
+        # Docker Desktop exposes a named pipe on Windows, which httpx can't connect to
+        return None
+    host_variable = "CONTAINER_HOST" if engine == ContainerEngine.PODMAN else "DOCKER_HOST"
+    host = os.environ.get(host_variable)
+    if host:
+        # a remote (tcp or ssh) engine is left to the CLI
+        candidates = [Path(host.removeprefix("unix://"))] if host.startswith("unix://") else []
+    elif engine == ContainerEngine.PODMAN:
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        candidates = [
+            *([Path(runtime_dir) / "podman" / "podman.sock"] if runtime_dir else []),
+            Path("/run/podman/podman.sock"),
+        ]
+    else:
+        candidates = [Path("/var/run/docker.sock"), Path.home() / ".docker" / "run" / "docker.sock"]
+    return next((candidate for candidate in candidates if candidate.is_socket()), None)
+
+
+class ContainerApiClient:
+    """Minimal client for the Docker Engine API over a unix socket, with a pooled connection.
+
+    Podman serves the same API, so this works for both container engines.
+    """
+
+    def __init__(self, socket_path: Path) -> None:
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(uds=str(socket_path)),
+            base_url="http://localhost",
+            timeout=CONTAINER_API_TIMEOUT,
+        )
+
+    def _get(self, path: str, params: dict[str, str] | None = None, *, not_found: Any = None) -> Any:  # noqa: ANN401
+        try:
+            response = self._client.get(path, params=params)
+            if response.status_code == httpx.codes.NOT_FOUND and not_found is not None:
+                return not_found
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as ex:
+            raise ContainerApiError(f"Container engine API request to {path} failed: {ex}") from ex
+
+    def ping(self) -> bool:
+        try:
+            return self._client.get("/_ping").is_success
+        except httpx.HTTPError:
+            logger.debug("Container engine API ping failed", exc_info=True)
+            return False
+
+    def _list_containers(self, labels: list[str], *, include_stopped: bool) -> list[dict[str, Any]]:
+        containers = self._get(
+            "/containers/json",
+            params={"all": str(include_stopped).lower(), "filters": json.dumps({"label": labels})},
+        )
+        if not isinstance(containers, list):
+            raise ContainerApiError(f"Unexpected container list response: {containers}")
+        return containers
+
+    def list_compose_projects(self, name_prefix: str) -> list[dict[str, Any]]:
+        """List the running compose projects whose name starts with `name_prefix`, like `compose ls --format json`."""
+        projects: dict[str, dict[str, Any]] = {}
+        for container in self._list_containers([COMPOSE_PROJECT_LABEL], include_stopped=False):
+            labels = container.get("Labels") or {}
+            project = labels[COMPOSE_PROJECT_LABEL]
+            if not project.startswith(name_prefix) or COMPOSE_CONFIG_FILES_LABEL not in labels:
+                continue
+            projects.setdefault(project, {"Name": project, "Status": "running", "ConfigFiles": ""})
+            projects[project]["ConfigFiles"] = labels[COMPOSE_CONFIG_FILES_LABEL]
+        return list(projects.values())
+
+    def compose_ps(self, project: str, service_name: str | None = None) -> list[dict[str, Any]]:
+        """List the containers of a compose project, in the shape of `compose ps --format json`."""
+        labels = [f"{COMPOSE_PROJECT_LABEL}={project}"]
+        if service_name is not None:
+            labels.append(f"{COMPOSE_SERVICE_LABEL}={service_name}")
+        return [
+            {
+                "Name": (container.get("Names") or [""])[0].lstrip("/"),
+                "Service": (container.get("Labels") or {}).get(COMPOSE_SERVICE_LABEL),
+                "State": container.get("State"),
+                "Status": container.get("Status"),
+                "Publishers": [
+                    {
+                        "URL": port.get("IP", ""),
+                        "TargetPort": port.get("PrivatePort"),
+                        "PublishedPort": port.get("PublicPort", 0),
+                        "Protocol": port.get("Type"),
+                    }
+                    for port in container.get("Ports") or []
+                ],
+            }
+            for container in self._list_containers(labels, include_stopped=True)
+        ]
+
+    def image_repo_digests(self, image_name: str) -> list[str]:
+        # an image that hasn't been pulled yet has no local versions
+        image = self._get(f"/images/{image_name}/json", not_found={})
+        return list(image.get("RepoDigests") or [])
+
+
+def get_container_api_client() -> ContainerApiClient | None:
+    """Get a (cached) Engine API client for the active container engine, or None if its API socket isn't available."""
+    socket_path = find_container_api_socket(get_container_engine())
+    if socket_path is None:
+        return None
+    key = str(socket_path)
+    if key not in _clients:
+        _clients[key] = ContainerApiClient(socket_path)
+    return _clients[key]
@@ -1,8 +1,14 @@
+import dataclasses
 import logging
+import os
 import re
+import shlex
 import shutil
+import sys
 from pathlib import Path, PurePath
 
+import click
+
 from algokit.core.conf import get_app_config_dir
 from algokit.core.config_commands.container_engine import get_container_engine
 from algokit.core.sandbox import ContainerEngine
@@ -37,22 +43,84 @@ def delete_files_from_volume_mount(filename: str, volume_mount_path_docker: Path
         logger.error(e)
 
 
-def list_files_in_volume(volume_path: Path) -> list[str]:
-    file_paths = []
-    if volume_path.exists() and volume_path.is_dir():
-        for file in volume_path.rglob("*"):
-            if file.is_file():
-                file_paths.append(str(file))
+# the identity and modification state of each file in the volume mount, used to find the files a command wrote
+VolumeSnapshot = dict[str, tuple[int, int, int]]
+
+
+def snapshot_volume_mount(volume_path: Path) -> VolumeSnapshot:
+    """Snapshot the files in the volume mount; arguments are only ever mapped to its top level."""
+    snapshot: VolumeSnapshot = {}
+    try:
+        with os.scandir(volume_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    return snapshot
+
+
+def _reflink(source: Path, destination: Path) -> bool:
+    if sys.platform != "linux":
+        return False
+    import fcntl
+
+    ficlone = 0x40049409  # FICLONE from linux/fs.h
+    try:
+        with source.open("rb") as source_file, destination.open("xb") as destination_file:
+            fcntl.ioctl(destination_file.fileno(), ficlone, source_file.fileno())
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def stage_file(source: Path, volume_mount_path_local: Path) -> Path:
+    """Make a file available in the volume mount without copying its contents where possible.
+
+    A hard link is used when the volume mount is on the same filesystem, then a reflink (copy on write clone), and
+    only when neither is supported is the file copied. goal only reads its input files, so sharing them is safe.
+    A file that is already linked into the volume mount is reused.
+    """
+    destination = volume_mount_path_local / source.name
+    if destination.exists():
+        if destination.samefile(source):
+            return destination
+        destination.unlink()
+    try:
+        os.link(source, destination)
+    except OSError:
+        if not _reflink(source, destination):
+            shutil.copy(source, destination)
+    return destination
+
+
+def _move_from_volume_mount(source: Path, destination: Path) -> None:
+    owned_by_user = not hasattr(os, "getuid") or source.stat().st_uid == os.getuid()
+    if owned_by_user:
+        # a rename on the same filesystem doesn't copy anything; shutil.move copies across filesystems
+        shutil.move(source, destination)
     else:
-        logger.error(f"{volume_path} does not exist or is not a directory.")
-    return file_paths
+        # files written by a rootful container engine are owned by root, so copy them to give the user ownership
+        shutil.copyfile(source, destination)
+        source.unlink()
 
 
 def preprocess_command_args(
-    command: list[str], volume_mount_path_local: Path, docker_mount_path_local: Path
+    command: list[str],
+    volume_mount_path_local: Path,
+    docker_mount_path_local: Path,
+    staged_files: dict[str, Path] | None = None,
 ) -> tuple[list[Path], list[Path], list[str]]:
+    """Stage the input files of a goal command in the volume mount and map its file arguments to the container.
+
+    `staged_files` tracks the files staged by name, pass the same dict for every command of a batch so a file
+    used by several commands is only staged once. Only newly staged files are returned as inputs.
+    """
     input_files = []
     output_files = []
+    staged_files = {} if staged_files is None else staged_files
     try:
         for i, arg in enumerate(command):
             if is_path_or_filename(arg):
@@ -70,23 +138,51 @@ def preprocess_command_args(
                     "--lsig-out",
                 ]
                 if file_exists and not is_output_arg:
+                    staged_file = staged_files.get(absolute_arg_path.name)
+                    if staged_file == absolute_arg_path:
+                        continue
+                    if staged_file is not None:
+                        # files are staged by name, so goal would read one of them in place of the other
+                        raise click.ClickException(
+                            f"{arg} has the same file name as {staged_file}, rename one of them to use both"
+                        )
+                    stage_file(absolute_arg_path, volume_mount_path_local)
+                    staged_files[absolute_arg_path.name] = absolute_arg_path
                     input_files.append(absolute_arg_path)
-                    shutil.copy(absolute_arg_path, volume_mount_path_local)
                 elif is_output_arg:  # it is an output file that doesn't exist yet
                     output_files.append(absolute_arg_path)
                 else:
                     raise FileNotFoundError(f"{arg} does not exist.")
     except Exception as e:
-        logger.error(e)
+        if not isinstance(e, click.ClickException):
+            logger.error(e)
+        # don't leave the files staged so far behind
+        for input_file in input_files:
+            volume_mount_path_local.joinpath(input_file.name).unlink(missing_ok=True)
         raise e
     return input_files, output_files, command
 
 
-def post_process(input_files: list[Path], output_files: list[Path], volume_mount_path_local: Path) -> None:
+def post_process(
+    input_files: list[Path],
+    output_files: list[Path],
+    volume_mount_path_local: Path,
+    snapshot: VolumeSnapshot | None = None,
+) -> None:
+    """Remove the staged input files from the volume mount and move the output files back to where they belong.
+
+    If a snapshot of the volume mount taken before the command ran is given, only files the command created or
+    changed are considered outputs, otherwise every file in the volume mount is.
+    """
     for input_file in input_files:
         delete_files_from_volume_mount(input_file.name, volume_mount_path_local)
+    if not output_files:
+        return
 
-    files_in_volume_mount = {Path(file) for file in list_files_in_volume(volume_mount_path_local)}
+    previous = snapshot or {}
+    written_files = [
+        name for name, state in snapshot_volume_mount(volume_mount_path_local).items() if previous.get(name) != state
+    ]
     for output_file in output_files:
         stem = output_file.stem
         ext = output_file.suffix
@@ -95,11 +191,73 @@ def post_process(input_files: list[Path], output_files: list[Path], volume_mount
         # will produce a file (output-0.txn etc) for each transaction in the group being split.
         r = re.compile(rf"^(?:{stem})(?:-[0-9]+)?(?:\{ext})$") if ext else re.compile(rf"^(?:{stem})(?:-[0-9]+)?$")
 
-        matched_files_in_volume_mount = filter(lambda f: (r.match(f.name)), files_in_volume_mount)
+        for name in filter(r.match, written_files):
+            try:
+                _move_from_volume_mount(volume_mount_path_local / name, output_file.parent / name)
+            except Exception as e:
+                logger.error(e)
+
+
+# printed after each command of a batch, followed by the index of the command and its exit code
+BATCH_EXIT_MARKER = "##algokit-goal-batch-exit##"
+
+
+@dataclasses.dataclass
+class GoalBatchResult:
+    command: str
+    exit_code: int | None
+    output: str
+
+
+def parse_batch_commands(batch: str) -> list[list[str]]:
+    """Parse a batch of goal commands, one per line, with or without the leading `goal`. Comments are ignored.
+
+    Raises:
+        click.ClickException: If a line can't be parsed, e.g. because its quotes aren't balanced.
+    """
+    commands = []
+    for line_number, line in enumerate(batch.splitlines(), start=1):
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as ex:
+            raise click.ClickException(f"Invalid goal command on line {line_number} of the batch: {ex}") from ex
+        if args and args[0] == "goal":
+            args = args[1:]
+        if args:
+            commands.append(args)
+    return commands
+
+
+def build_batch_script(commands: list[list[str]]) -> str:
+    """Build a shell script that runs each goal command in turn, printing a marker with its exit code after it."""
+    lines = []
+    for index, args in enumerate(commands):
+        # commands mustn't read from stdin, as that's where the rest of the script comes from
+        lines.append(f"{shlex.join(['goal', *args])} < /dev/null 2>&1")
+        lines.append(f'echo "{BATCH_EXIT_MARKER} {index} $?"')
+    lines.append("exit 0")
+    return "\n".join(lines) + "\n"
+
+
+def parse_batch_output(commands: list[list[str]], output: str) -> list[GoalBatchResult]:
+    """Split the output of a batch script into the output and exit code of each command.
 
-        for matched_file_in_volume_mount in matched_files_in_volume_mount:
-            shutil.copy(
-                volume_mount_path_local.joinpath(matched_file_in_volume_mount.name),
-                output_file.parent.joinpath(matched_file_in_volume_mount.name),
-            )
-            delete_files_from_volume_mount(matched_file_in_volume_mount.name, volume_mount_path_local)
+    Commands that didn't report an exit code (e.g. because the session ended early) have an exit code of None.
+    """
+    results = [GoalBatchResult(command=shlex.join(args), exit_code=None, output="") for args in commands]
+    command_output: list[str] = []
+    for line in output.splitlines(keepends=True):
+        # the marker follows the output of the command directly, so it's mid line if that didn't end with a newline
+        before_marker, marker, after_marker = line.partition(BATCH_EXIT_MARKER)
+        if marker:
+            index, exit_code = after_marker.split()
+            result = results[int(index)]
+            result.exit_code = int(exit_code)
+            result.output = "".join([*command_output, before_marker])
+            command_output = []
+        else:
+            command_output.append(line)
+    unfinished = next((result for result in results if result.exit_code is None), None)
+    if unfinished is not None:
+        unfinished.output = "".join(command_output)
+    return results
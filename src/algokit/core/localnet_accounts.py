@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import base64
+import dataclasses
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from algokit_utils import AlgoAmount
+from algosdk import account, encoding, mnemonic, transaction
+
+from algokit.core.conf import get_app_state_dir
+from algokit.core.localnet_loadtest import MAX_GROUP_SIZE
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from algokit_utils import AlgorandClient
+
+logger = logging.getLogger(__name__)
+
+PREFUNDED_ACCOUNT_BALANCE = AlgoAmount.from_algo(1_000)
+FUNDING_CONFIRMATION_ROUNDS = 10
+# each group creates a block on a DevMode LocalNet, so fresh params are fetched every so many groups to keep the
+# payments within their validity window
+FUNDING_PARAMS_REFRESH_GROUPS = 64
+BALANCE_CHECK_CONCURRENCY = 16
+# how many LocalNet networks to remember the funded accounts of, a new network is created by every reset
+MAX_FUNDED_ACCOUNTS_RECORDS = 32
+
+
+@dataclasses.dataclass(frozen=True)
+class PrefundedAccount:
+    address: str
+    private_key: str
+
+    @property
+    def mnemonic(self) -> str:
+        return str(mnemonic.from_private_key(self.private_key))  # type: ignore[no-untyped-call]
+
+
+def derive_accounts(seed: str, count: int) -> list[PrefundedAccount]:
+    """Derive `count` accounts deterministically from `seed`, so the same seed always yields the same accounts."""
+    accounts = []
+    for index in range(count):
+        key_seed = hashlib.sha256(f"{seed}:{index}".encode()).digest()
+        private_key = mnemonic.to_private_key(  # type: ignore[no-untyped-call]
+            mnemonic.from_master_derivation_key(base64.b64encode(key_seed).decode())  # type: ignore[no-untyped-call]
+        )
+        address = account.address_from_private_key(private_key)  # type: ignore[no-untyped-call]
+        accounts.append(PrefundedAccount(address=address, private_key=private_key))
+    return accounts
+
+
+def _is_funded(algorand: AlgorandClient, address: str) -> bool:
+    return algorand.account.get_information(address).amount.micro_algo > 0
+
+
+def _get_funded_accounts_path() -> Path:
+    return get_app_state_dir() / "localnet-funded-accounts.json"
+
+
+def _read_funded_accounts() -> dict[str, str]:
+    try:
+        records = json.loads(_get_funded_accounts_path().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return records if isinstance(records, dict) else {}
+
+
+def _record_funded_accounts(genesis_hash: str, accounts_key: str) -> None:
+    records = _read_funded_accounts()
+    records.pop(genesis_hash, None)
+    records[genesis_hash] = accounts_key
+    records_path = _get_funded_accounts_path()
+    try:
+        # write then rename, so concurrent commands never read a partially written record
+        temp_path = records_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(dict(list(records.items())[-MAX_FUNDED_ACCOUNTS_RECORDS:])), encoding="utf-8")
+        temp_path.replace(records_path)
+    except OSError as ex:
+        logger.debug(f"Failed to record the funded LocalNet accounts: {ex}")
+
+
+def fund_accounts(
+    algorand: AlgorandClient, accounts: list[PrefundedAccount], amount: AlgoAmount = PREFUNDED_ACCOUNT_BALANCE
+) -> int:
+    """Fund the given accounts from the LocalNet dispenser, skipping any that have already been funded.
+
+    The payments are sent as atomic groups of up to 16 transactions, signed locally and submitted back to back
+    without waiting for each group to be confirmed, then only the last group is waited on.
+
+    Once every account has a balance that's recorded in the AlgoKit state directory against the genesis hash of the
+    network, so later calls only check the balance of the last account rather than of every one.
+
+    Args:
+        algorand (AlgorandClient): Client for the LocalNet instance.
+        accounts (list[PrefundedAccount]): The accounts to fund.
+        amount (AlgoAmount): The amount to fund each account with.
+
+    Returns:
+        int: The number of accounts funded, 0 if they were already funded.
+    """
+    if not accounts:
+        return 0
+    algod = algorand.client.algod
+    params = algod.suggested_params()
+    genesis_hash = params.gh
+    # the last account depends on both the seed and the count, so changing either funds the accounts again
+    accounts_key = f"{len(accounts)}:{accounts[-1].address}"
+    if _read_funded_accounts().get(genesis_hash) == accounts_key and _is_funded(algorand, accounts[-1].address):
+        logger.debug(f"The {len(accounts)} prefunded accounts have already been funded")
+        return 0
+
+    with ThreadPoolExecutor(max_workers=BALANCE_CHECK_CONCURRENCY) as executor:
+        funded_flags = list(executor.map(lambda prefunded: _is_funded(algorand, prefunded.address), accounts))
+    unfunded = [prefunded for prefunded, is_funded in zip(accounts, funded_flags, strict=True) if not is_funded]
+    if not unfunded:
+        _record_funded_accounts(genesis_hash, accounts_key)
+        return 0
+    dispenser = algorand.account.localnet_dispenser()
+    last_txid = ""
+    for group_index, offset in enumerate(range(0, len(unfunded), MAX_GROUP_SIZE)):
+        if group_index and group_index % FUNDING_PARAMS_REFRESH_GROUPS == 0:
+            params = algod.suggested_params()
+        payments = [
+            transaction.PaymentTxn(dispenser.address, params, prefunded.address, amount.micro_algo)  # type: ignore[no-untyped-call]
+            for prefunded in unfunded[offset : offset + MAX_GROUP_SIZE]
+        ]
+        if len(payments) > 1:
+            payments = transaction.assign_group_id(payments)  # type: ignore[no-untyped-call]
+        signed = [payment.sign(dispenser.private_key) for payment in payments]  # type: ignore[no-untyped-call]
+        payload = b"".join(base64.b64decode(encoding.msgpack_encode(stxn)) for stxn in signed)  # type: ignore[no-untyped-call]
+        last_txid = algod.send_raw_transaction(base64.b64encode(payload).decode())
+    transaction.wait_for_confirmation(algod, last_txid, FUNDING_CONFIRMATION_ROUNDS)
+    _record_funded_accounts(genesis_hash, accounts_key)
+    logger.debug(f"Funded {len(unfunded)} accounts with {amount} each")
+    return len(unfunded)
+
+
+def export_accounts(accounts: list[PrefundedAccount]) -> list[dict[str, str]]:
+    return [{"address": prefunded.address, "mnemonic": prefunded.mnemonic} for prefunded in accounts]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import click
+from algosdk import transaction
+
+from algokit.core.localnet_loadtest import VALIDITY_WINDOW
+from algokit.core.tasks.send import DEFAULT_SEND_CONCURRENCY, PipelinedSender, SendResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from algokit_utils import AlgorandClient, SigningAccount
+    from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class AdvanceReport:
+    start_round: int
+    end_round: int
+    duration: float
+
+    @property
+    def rounds(self) -> int:
+        return self.end_round - self.start_round
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.rounds / self.duration if self.duration > 0 else 0.0
+
+
+def _get_last_round(algod: AlgodClient, after_round: int | None = None) -> int:
+    status = algod.status() if after_round is None else algod.status_after_block(after_round)
+    assert isinstance(status, dict)
+    return int(status["last-round"])
+
+
+def _iter_payments(
+    algod: AlgodClient, dispenser: SigningAccount, start_round: int, rounds: int
+) -> Iterator[transaction.SignedTransaction]:
+    sent = 0
+    while sent < rounds:
+        # transactions are only valid for a limited number of rounds, so sign them in batches
+        params = algod.suggested_params()
+        params.last = params.first + VALIDITY_WINDOW
+        for _ in range(min(rounds - sent, VALIDITY_WINDOW)):
+            # the note makes every payment unique, so they aren't rejected as duplicates
+            payment = transaction.PaymentTxn(  # type: ignore[no-untyped-call]
+                dispenser.address, params, dispenser.address, 0, note=f"advance:{start_round}:{sent}".encode()
+            )
+            yield payment.sign(dispenser.private_key)  # type: ignore[no-untyped-call]
+            sent += 1
+
+
+def advance_rounds(
+    algorand: AlgorandClient, rounds: int, *, timestamp_offset: int | None = None, keep_offset: bool = False
+) -> AdvanceReport:
+    """Advance a DevMode LocalNet by the given number of rounds.
+
+    In DevMode algod creates a block for every submitted transaction, so locally signed zero value self-payments from
+    the dispenser are submitted several at a time, then the target round is waited for rather than each payment.
+
+    Args:
+        algorand (AlgorandClient): Client for the LocalNet instance.
+        rounds (int): The number of rounds to advance by.
+        timestamp_offset (int | None): If set, the number of seconds each new block's timestamp is offset from the
+            previous block's timestamp, so time advances by `rounds * timestamp_offset` seconds.
+        keep_offset (bool): Keep the timestamp offset in effect for later blocks, rather than resetting it to 0 once
+            the rounds have been advanced.
+
+    Returns:
+        AdvanceReport: The start and end rounds and how long advancing took.
+
+    Raises:
+        click.ClickException: If any of the payments are rejected.
+    """
+    algod = algorand.client.algod
+    if timestamp_offset is not None:
+        algod.set_timestamp_offset(timestamp_offset)
+    try:
+        dispenser = algorand.account.localnet_dispenser()
+        start = time.monotonic()
+        start_round = _get_last_round(algod)
+        target_round = start_round + rounds
+        errors: list[str] = []
+
+        def on_result(result: SendResult) -> None:
+            if result.error is not None:
+                errors.append(result.error)
+
+        PipelinedSender(algod, on_result=on_result, concurrency=DEFAULT_SEND_CONCURRENCY, confirm=False).send(
+            _iter_payments(algod, dispenser, start_round, rounds)
+        )
+        if errors:
+            raise click.ClickException(f"Failed to send {len(errors)} of the {rounds} payments: {errors[0]}")
+        last_round = _get_last_round(algod)
+        while last_round < target_round:
+            last_round = _get_last_round(algod, last_round)
+    finally:
+        if timestamp_offset and not keep_offset:
+            algod.set_timestamp_offset(0)
+    report = AdvanceReport(start_round=start_round, end_round=last_round, duration=time.monotonic() - start)
+    logger.debug(f"Advanced from round {report.start_round} to {report.end_round} in {report.duration:.2f}s")
+    return report
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import tarfile
+from typing import IO, TYPE_CHECKING
+
+import click
+
+from algokit.core import proc
+from algokit.core.config_commands.container_engine import get_container_engine
+from algokit.core.sandbox import LOCALNET_IMAGES, record_imported_image_digests
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _typeshed import WriteableBuffer
+
+logger = logging.getLogger(__name__)
+
+# an image bundle is a tar file holding a manifest of the bundled images and their repo digests,
+# and the images themselves as saved by the container engine
+BUNDLE_MANIFEST_NAME = "algokit-localnet-images.json"
+BUNDLE_IMAGES_NAME = "images.tar"
+BUNDLE_FORMAT_VERSION = 2
+# the size of a tar member has to be known before it's written, so the saved images are streamed into the bundle as
+# consecutive parts of up to this size, named `images.tar.00000` onwards, which are concatenated again on import
+BUNDLE_IMAGES_PART_SIZE = 64 * 1024 * 1024
+
+
+def _get_repo_digests(image_name: str) -> list[str] | None:
+    """Get the repo digests of a local image, or None if the image isn't available locally."""
+    arg = "{{range .RepoDigests}}{{println .}}{{end}}"
+    result = proc.run([get_container_engine(), "image", "inspect", image_name, "--format", arg])
+    if result.exit_code != 0:
+        return None
+    return [line.split("@")[-1] for line in result.output.splitlines() if line.strip()]
+
+
+def _open_bundle(bundle_path: Path, mode: str) -> tarfile.TarFile:
+    compressed = bundle_path.suffix in (".gz", ".tgz")
+    if mode == "w":
+        return tarfile.open(bundle_path, "w:gz" if compressed else "w")
+    return tarfile.open(bundle_path, "r:*")
+
+
+def export_image_bundle(bundle_path: Path) -> dict[str, list[str]]:
+    """Save the LocalNet images, along with their repo digests, to an image bundle.
+
+    Images that aren't available locally are pulled first. The bundle is gzip compressed if its name ends in
+    `.gz` or `.tgz`.
+
+    Returns:
+        dict[str, list[str]]: The repo digests of each bundled image, keyed by image name.
+    """
+    container_engine = get_container_engine()
+    image_digests = {}
+    for image_name in LOCALNET_IMAGES.values():
+        digests = _get_repo_digests(image_name)
+        if digests is None:
+            logger.info(f"Pulling {image_name}...")
+            proc.run(
+                [container_engine, "pull", image_name],
+                bad_return_code_error_message=f"Failed to pull {image_name}",
+            )
+            digests = _get_repo_digests(image_name) or []
+        image_digests[image_name] = digests
+
+    manifest = json.dumps({"format": BUNDLE_FORMAT_VERSION, "images": image_digests}, indent=2).encode()
+    logger.info(f"Saving {len(image_digests)} images...")
+    try:
+        with (
+            _open_bundle(bundle_path, "w") as bundle,
+            proc.stream_output(
+                [container_engine, "image", "save", *image_digests],
+                bad_return_code_error_message="Failed to save the LocalNet images",
+            ) as images,
+        ):
+            manifest_info = tarfile.TarInfo(BUNDLE_MANIFEST_NAME)
+            manifest_info.size = len(manifest)
+            bundle.addfile(manifest_info, io.BytesIO(manifest))
+            for index, part in enumerate(iter(lambda: images.read(BUNDLE_IMAGES_PART_SIZE), b"")):
+                part_info = tarfile.TarInfo(f"{BUNDLE_IMAGES_NAME}.{index:05d}")
+                part_info.size = len(part)
+                bundle.addfile(part_info, io.BytesIO(part))
+    except Exception:
+        # don't leave a partial bundle behind
+        bundle_path.unlink(missing_ok=True)
+        raise
+    return image_digests
+
+
+class _BundleImagesReader(io.RawIOBase):
+    """Reads the parts of the saved images in a bundle as a single stream, see `BUNDLE_IMAGES_PART_SIZE`."""
+
+    def __init__(self, bundle: tarfile.TarFile, parts: list[tarfile.TarInfo]) -> None:
+        super().__init__()
+        self._bundle = bundle
+        self._parts = iter(parts)
+        self._part: IO[bytes] | None = None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: WriteableBuffer) -> int:
+        while True:
+            if self._part is None:
+                part = next(self._parts, None)
+                if part is None:
+                    return 0
+                self._part = self._bundle.extractfile(part)
+                if self._part is None:
+                    continue
+            read = self._part.readinto(buffer)  # type: ignore[attr-defined]
+            if read:
+                return int(read)
+            self._part.close()
+            self._part = None
+
+
+def _read_manifest(bundle: tarfile.TarFile, bundle_path: Path) -> dict[str, list[str]]:
+    try:
+        manifest_file = bundle.extractfile(BUNDLE_MANIFEST_NAME)
+        manifest = json.load(manifest_file) if manifest_file is not None else None
+    except (KeyError, json.JSONDecodeError):
+        manifest = None
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("images"), dict):
+        raise click.ClickException(f"{bundle_path} isn't an AlgoKit LocalNet image bundle")
+    if manifest.get("format") != BUNDLE_FORMAT_VERSION:
+        raise click.ClickException(
+            f"{bundle_path} has an unsupported image bundle format {manifest.get('format')}; "
+            "export it again with this version of AlgoKit"
+        )
+    return dict(manifest["images"])
+
+
+def import_image_bundle(bundle_path: Path) -> dict[str, list[str]]:
+    """Load the images in an image bundle into the container engine, and record their repo digests.
+
+    The container engine doesn't keep the repo digests of loaded images, so they're recorded for the image version
+    checks, which can then tell whether the loaded images are current without pulling them.
+
+    Returns:
+        dict[str, list[str]]: The repo digests of each loaded image, keyed by image name.
+    """
+    try:
+        bundle = _open_bundle(bundle_path, "r")
+    except tarfile.TarError as ex:
+        raise click.ClickException(f"{bundle_path} isn't an AlgoKit LocalNet image bundle") from ex
+    with bundle:
+        image_digests = _read_manifest(bundle, bundle_path)
+        parts = sorted(
+            (member for member in bundle.getmembers() if member.name.startswith(f"{BUNDLE_IMAGES_NAME}.")),
+            key=lambda member: member.name,
+        )
+        if not parts:
+            raise click.ClickException(f"{bundle_path} doesn't contain any images")
+        logger.info(f"Loading {len(image_digests)} images...")
+        with io.BufferedReader(_BundleImagesReader(bundle, parts)) as images_file:
+            # the images are streamed straight out of the bundle, rather than extracted to disk first
+            proc.run(
+                [get_container_engine(), "load"],
+                input_file=images_file,
+                bad_return_code_error_message="Failed to load the LocalNet images",
+            )
+    record_imported_image_digests(image_digests)
+    return image_digests
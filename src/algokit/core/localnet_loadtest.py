@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import base64
+import dataclasses
+import enum
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from algokit_utils import AlgoAmount, AppCreateParams, AssetCreateParams, PaymentParams
+from algosdk import account, encoding, transaction
+from algosdk.error import AlgodHTTPError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from algokit_utils import AlgorandClient
+    from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+ACCOUNT_FUNDING = AlgoAmount.from_algo(1_000)
+LOADTEST_ASSET_TOTAL = 10**15
+LOADTEST_APP_PROGRAM = "#pragma version 10\nint 1\nreturn\n"
+# a transaction is valid for at most 1000 rounds, leave some slack for the setup transactions
+VALIDITY_WINDOW = 990
+CONFIRMATION_POLL_INTERVAL = 0.2
+DEFAULT_CONFIRMATION_TIMEOUT = 30.0
+SIGNING_CHUNK_SIZE = 500
+# in DevMode every submitted group creates a block, so the groups signed with one set of params are limited to half
+# of the validity window: the next window is signed while they are submitted and must still be valid after them
+SIGNING_WINDOW_GROUPS = VALIDITY_WINDOW // 2
+
+
+class LoadTestTransactionType(str, enum.Enum):
+    PAYMENT = "pay"
+    ASSET_TRANSFER = "axfer"
+    APP_CALL = "appl"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclasses.dataclass
+class LoadTestConfig:
+    tps: float
+    duration: float
+    transaction_types: Sequence[LoadTestTransactionType] = tuple(LoadTestTransactionType)
+    group_size: int = 1
+    in_flight: int = 64
+    accounts: int = 8
+    workers: int | None = None
+    confirmation_timeout: float = DEFAULT_CONFIRMATION_TIMEOUT
+
+    @property
+    def group_count(self) -> int:
+        return max(1, math.ceil(self.tps * self.duration / self.group_size))
+
+
+@dataclasses.dataclass(frozen=True)
+class SigningContext:
+    """Everything a worker process needs to build and sign transactions, kept picklable."""
+
+    private_keys: tuple[str, ...]
+    asset_ids: tuple[int, ...]
+    app_id: int
+    genesis_id: str
+    genesis_hash: str
+    first_valid: int
+    last_valid: int
+    fee: int
+
+
+@dataclasses.dataclass(frozen=True)
+class SignedGroup:
+    txids: tuple[str, ...]
+    payload: str
+    """Base64 encoded, concatenated signed transactions, ready for `send_raw_transaction`"""
+
+
+@dataclasses.dataclass
+class LoadTestReport:
+    groups: int
+    transactions: int
+    submitted: int = 0
+    confirmed: int = 0
+    duration: float = 0.0
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    rejections: Counter[str] = dataclasses.field(default_factory=Counter)
+
+    @property
+    def confirmed_tps(self) -> float:
+        return self.confirmed / self.duration if self.duration > 0 else 0.0
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Nearest-rank percentile of the confirmation latencies in seconds."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+
+def normalise_rejection_reason(message: str) -> str:
+    """Strip transaction specific details from an algod error, so the same rejection reasons can be counted."""
+    reason = message.split("TransactionPool.Remember: ")[-1]
+    # transaction ids, addresses and numbers differ per rejected transaction
+    reason = re.sub(r"\b[A-Z2-7]{52,58}\b", "<id>", reason)
+    reason = re.sub(r"\d+", "<n>", reason)
+    return reason.strip()
+
+
+def prepare_signing_context(algorand: AlgorandClient, config: LoadTestConfig) -> SigningContext:
+    """Create and fund the load test accounts from the LocalNet dispenser and create the assets and app they use.
+
+    Args:
+        algorand (AlgorandClient): Client for the LocalNet instance.
+        config (LoadTestConfig): The load test configuration.
+
+    Returns:
+        SigningContext: The accounts, asset ids and app id to build the load test transactions with.
+    """
+    dispenser = algorand.account.localnet_dispenser()
+    senders = [algorand.account.random() for _ in range(config.accounts)]
+    for offset in range(0, len(senders), MAX_GROUP_SIZE):
+        group = algorand.new_group()
+        for sender in senders[offset : offset + MAX_GROUP_SIZE]:
+            group.add_payment(PaymentParams(sender=dispenser.address, receiver=sender.address, amount=ACCOUNT_FUNDING))
+        group.send()
+    logger.debug(f"Funded {len(senders)} load test accounts")
+
+    asset_ids: tuple[int, ...] = ()
+    if LoadTestTransactionType.ASSET_TRANSFER in config.transaction_types:
+        asset_ids = tuple(
+            algorand.send.asset_create(
+                AssetCreateParams(sender=sender.address, total=LOADTEST_ASSET_TOTAL, unit_name="LOAD")
+            ).asset_id
+            for sender in senders
+        )
+    app_id = 0
+    if LoadTestTransactionType.APP_CALL in config.transaction_types:
+        app_id = algorand.send.app_create(
+            AppCreateParams(
+                sender=senders[0].address,
+                approval_program=LOADTEST_APP_PROGRAM,
+                clear_state_program=LOADTEST_APP_PROGRAM,
+            )
+        ).app_id
+
+    params = algorand.client.algod.suggested_params()
+    return SigningContext(
+        private_keys=tuple(sender.private_key for sender in senders),
+        asset_ids=asset_ids,
+        app_id=app_id,
+        genesis_id=params.gen,
+        genesis_hash=params.gh,
+        first_valid=params.first,
+        last_valid=params.first + VALIDITY_WINDOW,
+        fee=params.min_fee,
+    )
+
+
+def _refresh_validity(algod: AlgodClient, context: SigningContext) -> SigningContext:
+    params = algod.suggested_params()
+    return dataclasses.replace(context, first_valid=params.first, last_valid=params.first + VALIDITY_WINDOW)
+
+
+def _build_transaction(
+    context: SigningContext, sender_index: int, transaction_type: LoadTestTransactionType, sequence: int
+) -> transaction.Transaction:
+    params = transaction.SuggestedParams(  # type: ignore[no-untyped-call]
+        fee=context.fee,
+        first=context.first_valid,
+        last=context.last_valid,
+        gh=context.genesis_hash,
+        gen=context.genesis_id,
+        flat_fee=True,
+    )
+    sender = account.address_from_private_key(context.private_keys[sender_index])  # type: ignore[no-untyped-call]
+    # the note makes every transaction unique, so identical transactions aren't rejected as duplicates
+    note = f"loadtest:{sequence}".encode()
+    match transaction_type:
+        case LoadTestTransactionType.PAYMENT:
+            return transaction.PaymentTxn(sender, params, sender, 0, note=note)  # type: ignore[no-untyped-call]
+        case LoadTestTransactionType.ASSET_TRANSFER:
+            asset_id = context.asset_ids[sender_index]
+            return transaction.AssetTransferTxn(sender, params, sender, 1, asset_id, note=note)  # type: ignore[no-untyped-call]
+        case LoadTestTransactionType.APP_CALL:
+            return transaction.ApplicationNoOpTxn(sender, params, context.app_id, note=note)  # type: ignore[no-untyped-call]
+
+
+def sign_groups(
+    context: SigningContext,
+    transaction_types: Sequence[LoadTestTransactionType],
+    group_size: int,
+    first_group: int,
+    group_count: int,
+) -> list[SignedGroup]:
+    """Build and sign a contiguous range of load test groups, rotating through the senders and transaction types.
+
+    This runs in worker processes, so it only depends on its (picklable) arguments.
+    """
+    signed_groups = []
+    for group_index in range(first_group, first_group + group_count):
+        sender_index = group_index % len(context.private_keys)
+        transactions = [
+            _build_transaction(
+                context,
+                sender_index,
+                transaction_types[(group_index * group_size + position) % len(transaction_types)],
+                group_index * group_size + position,
+            )
+            for position in range(group_size)
+        ]
+        if group_size > 1:
+            transactions = transaction.assign_group_id(transactions)  # type: ignore[no-untyped-call]
+        private_key = context.private_keys[sender_index]
+        signed = [txn.sign(private_key) for txn in transactions]  # type: ignore[no-untyped-call]
+        payload = b"".join(base64.b64decode(encoding.msgpack_encode(stxn)) for stxn in signed)  # type: ignore[no-untyped-call]
+        txids = tuple(txn.get_txid() for txn in transactions)  # type: ignore[no-untyped-call]
+        signed_groups.append(SignedGroup(txids=txids, payload=base64.b64encode(payload).decode()))
+    return signed_groups
+
+
+def presign_groups(algod: AlgodClient, context: SigningContext, config: LoadTestConfig) -> Iterator[SignedGroup]:
+    """Pre-build and pre-sign the load test groups, spreading the signing over worker processes.
+
+    Groups are signed one window of at most `SIGNING_WINDOW_GROUPS` at a time, each with freshly suggested params,
+    and the next window is signed while the current one is consumed, so long runs against a DevMode LocalNet
+    don't outlive the validity of their transactions.
+    """
+    transaction_types = tuple(config.transaction_types)
+    with ProcessPoolExecutor(max_workers=config.workers) as executor:
+
+        def sign_window(first_group: int) -> list[Future[list[SignedGroup]]]:
+            window_context = _refresh_validity(algod, context)
+            last_group = min(first_group + SIGNING_WINDOW_GROUPS, config.group_count)
+            return [
+                executor.submit(
+                    sign_groups,
+                    window_context,
+                    transaction_types,
+                    config.group_size,
+                    offset,
+                    min(SIGNING_CHUNK_SIZE, last_group - offset),
+                )
+                for offset in range(first_group, last_group, SIGNING_CHUNK_SIZE)
+            ]
+
+        window = sign_window(0)
+        for first_group in range(
+            SIGNING_WINDOW_GROUPS, config.group_count + SIGNING_WINDOW_GROUPS, SIGNING_WINDOW_GROUPS
+        ):
+            signed = [group for future in window for group in future.result()]
+            window = sign_window(first_group) if first_group < config.group_count else []
+            yield from signed
+
+
+def _get_last_round(algod: AlgodClient) -> int:
+    status = algod.status()
+    assert isinstance(status, dict)
+    return int(status["last-round"])
+
+
+def _get_block_txids(algod: AlgodClient, round_number: int) -> list[str]:
+    response = algod.get_block_txids(round_number)
+    assert isinstance(response, dict)
+    return list(response.get("blockTxids") or [])
+
+
+class _LoadTestRun:
+    def __init__(self, algod: AlgodClient, config: LoadTestConfig, report: LoadTestReport) -> None:
+        self.algod = algod
+        self.config = config
+        self.report = report
+        self.lock = threading.Lock()
+        self.in_flight = threading.BoundedSemaphore(config.in_flight)
+        self.submitted_at: dict[str, float] = {}
+        self.submission_done = threading.Event()
+
+    def _reject(self, group: SignedGroup, reason: str) -> None:
+        with self.lock:
+            self.report.rejections[reason] += len(group.txids)
+            for txid in group.txids:
+                self.submitted_at.pop(txid, None)
+
+    def submit(self, group: SignedGroup) -> None:
+        # track the group before sending it, as it may be confirmed before algod responds
+        with self.lock:
+            submitted_at = time.monotonic()
+            for txid in group.txids:
+                self.submitted_at[txid] = submitted_at
+        try:
+            self.algod.send_raw_transaction(group.payload)
+        except AlgodHTTPError as ex:
+            self._reject(group, normalise_rejection_reason(str(ex)))
+        except Exception as ex:
+            logger.debug(f"Failed to submit group {group.txids[0]}", exc_info=True)
+            self._reject(group, type(ex).__name__)
+        else:
+            with self.lock:
+                self.report.submitted += len(group.txids)
+        finally:
+            self.in_flight.release()
+
+    def _unconfirmed(self) -> int:
+        with self.lock:
+            return len(self.submitted_at)
+
+    def confirm(self, start_round: int) -> None:
+        try:
+            self._follow_blocks(start_round)
+        except Exception:
+            logger.warning("Failed to track load test confirmations", exc_info=True)
+
+    def _follow_blocks(self, start_round: int) -> None:
+        last_checked_round = start_round
+        deadline: float | None = None
+        while True:
+            if self.submission_done.is_set():
+                unconfirmed = self._unconfirmed()
+                if not unconfirmed:
+                    return
+                deadline = deadline or time.monotonic() + self.config.confirmation_timeout
+                if time.monotonic() > deadline:
+                    logger.warning(f"{unconfirmed} transactions weren't confirmed in time")
+                    return
+            last_round = _get_last_round(self.algod)
+            for round_number in range(last_checked_round + 1, last_round + 1):
+                txids = _get_block_txids(self.algod, round_number)
+                confirmed_at = time.monotonic()
+                with self.lock:
+                    for txid in txids:
+                        submitted_at = self.submitted_at.pop(txid, None)
+                        if submitted_at is not None:
+                            self.report.confirmed += 1
+                            self.report.latencies.append(confirmed_at - submitted_at)
+            if last_round == last_checked_round:
+                time.sleep(CONFIRMATION_POLL_INTERVAL)
+            last_checked_round = last_round
+
+
+def run_load_test(algod: AlgodClient, groups: Iterable[SignedGroup], config: LoadTestConfig) -> LoadTestReport:
+    """Submit pre-signed groups at the target rate with a bounded number of in-flight requests.
+
+    Confirmations are tracked by following the block transaction ids from the round the load test started at.
+
+    Args:
+        algod (AlgodClient): Client for the algod node to submit to.
+        groups (Iterable[SignedGroup]): The pre-signed groups to submit, in order.
+        config (LoadTestConfig): The load test configuration.
+
+    Returns:
+        LoadTestReport: Submission, confirmation, latency and rejection statistics.
+    """
+    report = LoadTestReport(groups=0, transactions=0)
+    run = _LoadTestRun(algod, config, report)
+    interval = config.group_size / config.tps
+    start_round = _get_last_round(algod)
+    confirmer = threading.Thread(target=run.confirm, args=(start_round,), daemon=True)
+    start: float | None = None
+    confirmer.start()
+    with ThreadPoolExecutor(max_workers=config.in_flight) as executor:
+        for index, group in enumerate(groups):
+            # the first groups may still be signing when the load test starts, so start the clock once they're ready
+            start = start or time.monotonic()
+            delay = start + index * interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            report.groups += 1
+            report.transactions += len(group.txids)
+            run.in_flight.acquire()
+            executor.submit(run.submit, group)
+    run.submission_done.set()
+    confirmer.join()
+    report.duration = time.monotonic() - (start or time.monotonic())
+    return report
+
+
+def format_load_test_report(report: LoadTestReport) -> dict[str, Any]:
+    def _ms(value: float | None) -> str:
+        return "n/a" if value is None else f"{value * 1000:.0f}ms"
+
+    return {
+        "Groups": report.groups,
+        "Transactions": report.transactions,
+        "Submitted": report.submitted,
+        "Confirmed": report.confirmed,
+        "Rejected": sum(report.rejections.values()),
+        "Duration": f"{report.duration:.1f}s",
+        "Confirmed TPS": f"{report.confirmed_tps:.1f}",
+        "Latency p50": _ms(report.latency_percentile(50)),
+        "Latency p90": _ms(report.latency_percentile(90)),
+        "Latency p99": _ms(report.latency_percentile(99)),
+    }
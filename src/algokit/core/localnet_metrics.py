@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import re
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+
+from algokit.core.sandbox import DEFAULT_ALGOD_SERVER, DEFAULT_ALGOD_TOKEN
+
+if TYPE_CHECKING:
+    from algokit.core.sandbox import ComposeSandbox
+
+logger = logging.getLogger(__name__)
+
+METRICS_TIMEOUT = 3
+# <name>{<labels>} <value> [<timestamp>]
+_SAMPLE_PATTERN = re.compile(r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{.*\})?\s+(?P<value>\S+)")
+
+ALGOD_ROUND_METRIC = "algod_ledger_round"
+ALGOD_TRANSACTIONS_METRIC = "algod_ledger_transactions_total"
+CONDUIT_ROUND_METRIC = "conduit_imported_round"
+CONDUIT_TRANSACTIONS_METRIC = "conduit_imported_tx_per_block_sum"
+CONDUIT_RETRIES_METRIC = "conduit_pipeline_retry_count"
+# summaries reported by each conduit pipeline stage
+CONDUIT_STAGE_METRICS = {
+    "Avg importer time": "conduit_importer_time_sec",
+    "Avg processor time": "conduit_processor_time_sec",
+    "Avg exporter (DB write) time": "conduit_exporter_time_sec",
+    "Avg block import time": "conduit_import_time_sec",
+}
+
+
+def parse_prometheus_metrics(text: str) -> dict[str, float]:
+    """Parse the Prometheus text exposition format, summing the samples of each metric across all label sets."""
+    metrics: dict[str, float] = {}
+    for line in text.splitlines():
+        match = _SAMPLE_PATTERN.match(line.strip())
+        if match is None:
+            continue
+        try:
+            value = float(match.group("value"))
+        except ValueError:
+            continue
+        name = match.group("name")
+        metrics[name] = metrics.get(name, 0.0) + value
+    return metrics
+
+
+def scrape_metrics(url: str, headers: dict[str, str] | None = None) -> dict[str, float] | None:
+    try:
+        response = httpx.get(url, headers=headers, timeout=METRICS_TIMEOUT)
+    except httpx.RequestError as ex:
+        logger.debug(f"Failed to scrape metrics from {url}: {ex}", exc_info=True)
+        return None
+    if not response.is_success:
+        logger.debug(f"Scraping metrics from {url} returned {response.status_code}")
+        return None
+    return parse_prometheus_metrics(response.text)
+
+
+@dataclasses.dataclass
+class MetricsSnapshot:
+    timestamp: float
+    algod: dict[str, float] | None
+    conduit: dict[str, float] | None
+
+
+def take_metrics_snapshot(sandbox: ComposeSandbox) -> MetricsSnapshot:
+    algod = scrape_metrics(
+        f"{DEFAULT_ALGOD_SERVER}:{sandbox.ports.algod}/metrics", headers={"X-Algo-API-Token": DEFAULT_ALGOD_TOKEN}
+    )
+    conduit = (
+        scrape_metrics(f"{DEFAULT_ALGOD_SERVER}:{sandbox.ports.conduit_metrics}/metrics")
+        if sandbox.has_indexer and sandbox.settings.metrics
+        else None
+    )
+    return MetricsSnapshot(timestamp=time.monotonic(), algod=algod, conduit=conduit)
+
+
+def _rate(previous: dict[str, float], current: dict[str, float], name: str, elapsed: float) -> str:
+    if name not in current or name not in previous or elapsed <= 0:
+        return "n/a"
+    return f"{(current[name] - previous[name]) / elapsed:.1f}"
+
+
+def _average_ms(previous: dict[str, float], current: dict[str, float], name: str) -> str:
+    count = current.get(f"{name}_count", 0.0) - previous.get(f"{name}_count", 0.0)
+    if count <= 0:
+        return "n/a"
+    total = current.get(f"{name}_sum", 0.0) - previous.get(f"{name}_sum", 0.0)
+    return f"{total / count * 1000:.1f}ms"
+
+
+def summarise_metrics(previous: MetricsSnapshot, current: MetricsSnapshot) -> dict[str, dict[str, str]]:
+    """Summarise the change between two snapshots, grouped by service."""
+    elapsed = current.timestamp - previous.timestamp
+    summary: dict[str, dict[str, str]] = {}
+    if current.algod is None or previous.algod is None:
+        summary["algod"] = {"Status": "Metrics unavailable"}
+    else:
+        summary["algod"] = {
+            "Last round": f"{current.algod.get(ALGOD_ROUND_METRIC, 0):.0f}",
+            "Blocks/sec": _rate(previous.algod, current.algod, ALGOD_ROUND_METRIC, elapsed),
+            "Transactions/sec": _rate(previous.algod, current.algod, ALGOD_TRANSACTIONS_METRIC, elapsed),
+        }
+    if current.conduit is None or previous.conduit is None:
+        summary["conduit"] = {"Status": "Metrics unavailable"}
+        return summary
+    conduit_summary = {
+        "Imported round": f"{current.conduit.get(CONDUIT_ROUND_METRIC, 0):.0f}",
+        "Blocks/sec imported": _rate(previous.conduit, current.conduit, CONDUIT_ROUND_METRIC, elapsed),
+        "Transactions/sec imported": _rate(previous.conduit, current.conduit, CONDUIT_TRANSACTIONS_METRIC, elapsed),
+    }
+    if current.algod is not None and ALGOD_ROUND_METRIC in current.algod and CONDUIT_ROUND_METRIC in current.conduit:
+        lag = current.algod[ALGOD_ROUND_METRIC] - current.conduit[CONDUIT_ROUND_METRIC]
+        conduit_summary["Rounds behind algod"] = f"{max(lag, 0):.0f}"
+    for label, name in CONDUIT_STAGE_METRICS.items():
+        conduit_summary[label] = _average_ms(previous.conduit, current.conduit, name)
+    conduit_summary["Pipeline retries"] = f"{current.conduit.get(CONDUIT_RETRIES_METRIC, 0):.0f}"
+    summary["conduit"] = conduit_summary
+    return summary
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from algokit.core.conf import get_app_state_dir, get_current_package_version
+
+logger = logging.getLogger(__name__)
+
+# cached state is only used while it's younger than this, was written by the same AlgoKit version and the
+# configuration files of the instances it belongs to haven't changed; commands that change the containers invalidate it
+LOCALNET_STATE_CACHE_TTL = 30
+# the files a LocalNet instance is defined by, any change to them invalidates its cached state
+INSTANCE_FILE_NAMES = (
+    "docker-compose.yml",
+    "algod_config.json",
+    "algod_network_template.json",
+    "conduit.yml",
+    "settings.json",
+)
+
+
+def _get_cache_path() -> Path:
+    return get_app_state_dir() / "localnet-state.json"
+
+
+def _fingerprint(directory: Path) -> list[int | None]:
+    fingerprint: list[int | None] = []
+    for file_name in INSTANCE_FILE_NAMES:
+        try:
+            fingerprint.append((directory / file_name).stat().st_mtime_ns)
+        except OSError:
+            fingerprint.append(None)
+    return fingerprint
+
+
+def _read_cache() -> dict[str, Any]:
+    try:
+        cache = json.loads(_get_cache_path().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != get_current_package_version():
+        return {}
+    return cache
+
+
+def _write_cache(cache: dict[str, Any]) -> None:
+    cache_path = _get_cache_path()
+    try:
+        # write then rename, so concurrent commands never read a partially written cache
+        temp_path = cache_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(cache), encoding="utf-8")
+        temp_path.replace(cache_path)
+    except OSError as ex:
+        logger.debug(f"Failed to update LocalNet state cache: {ex}")
+
+
+def _is_valid(entry: Any) -> bool:  # noqa: ANN401
+    if not isinstance(entry, dict) or time.time() - entry.get("cached_at", 0) >= LOCALNET_STATE_CACHE_TTL:
+        return False
+    fingerprints = entry.get("fingerprints", {})
+    return all(_fingerprint(Path(directory)) == fingerprint for directory, fingerprint in fingerprints.items())
+
+
+def get_cached_state(key: str) -> Any | None:  # noqa: ANN401
+    """Get a cached value, if it's still valid."""
+    entry = _read_cache().get("entries", {}).get(key)
+    if not _is_valid(entry):
+        return None
+    logger.debug(f"Using cached LocalNet state for {key}")
+    return entry["value"]
+
+
+def cache_state(key: str, directories: list[Path], value: Any) -> None:  # noqa: ANN401
+    """Cache a value, valid until the configuration files of the given instance directories change."""
+    cache = _read_cache()
+    entries = cache.get("entries", {})
+    entries[key] = {
+        "cached_at": time.time(),
+        "fingerprints": {str(directory): _fingerprint(directory) for directory in directories},
+        "value": value,
+    }
+    _write_cache({"version": get_current_package_version(), "entries": entries})
+
+
+def invalidate_localnet_state_cache() -> None:
+    try:
+        _get_cache_path().unlink(missing_ok=True)
+    except OSError as ex:
+        logger.debug(f"Failed to invalidate LocalNet state cache: {ex}")
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import logging
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+import click
+
+from algokit.core.conf import get_app_state_dir, get_current_package_version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class TimedPhase:
+    name: str
+    depth: int
+    duration: float = 0.0
+
+
+@dataclasses.dataclass
+class TimingsReport:
+    """How long each phase of a LocalNet command took, with phases nested in the phase they ran in."""
+
+    command: str
+    instance: str | None = None
+    phases: list[TimedPhase] = dataclasses.field(default_factory=list)
+    total: float = 0.0
+    succeeded: bool = False
+    _depth: int = dataclasses.field(default=0, repr=False)
+
+
+_active_report: ContextVar[TimingsReport | None] = ContextVar("_active_report", default=None)
+
+
+@contextlib.contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """Time a phase of the LocalNet command being recorded, if any. Can also be used as a decorator."""
+    report = _active_report.get()
+    if report is None:
+        yield
+        return
+    phase = TimedPhase(name=name, depth=report._depth)  # noqa: SLF001
+    report.phases.append(phase)
+    report._depth += 1  # noqa: SLF001
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phase.duration = time.perf_counter() - start
+        report._depth -= 1  # noqa: SLF001
+
+
+def set_timed_instance(name: str) -> None:
+    """Record which LocalNet instance the command being recorded, if any, acts on."""
+    report = _active_report.get()
+    if report is not None:
+        report.instance = name
+
+
+def get_timings_file_path() -> Path:
+    return get_app_state_dir() / "localnet-timings.jsonl"
+
+
+def _log_timings(report: TimingsReport) -> None:
+    logger.info(click.style(f"# localnet {report.command} timings", bold=True))
+    width = max((len(phase.name) + 2 * phase.depth for phase in report.phases), default=0)
+    for phase in report.phases:
+        indent = "  " * phase.depth
+        logger.info(f"{indent}{phase.name:<{width - len(indent)}}  {phase.duration:7.2f}s")
+    logger.info(click.style(f"{'total':<{width}}  {report.total:7.2f}s", bold=True))
+
+
+def _append_timings(report: TimingsReport) -> None:
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "version": get_current_package_version(),
+        "command": report.command,
+        "instance": report.instance,
+        "succeeded": report.succeeded,
+        "total": round(report.total, 3),
+        "phases": [
+            {"name": phase.name, "depth": phase.depth, "duration": round(phase.duration, 3)} for phase in report.phases
+        ],
+    }
+    try:
+        with get_timings_file_path().open("a", encoding="utf-8") as timings_file:
+            timings_file.write(json.dumps(record) + "\n")
+    except OSError as ex:
+        logger.debug(f"Failed to record LocalNet timings: {ex}")
+
+
+@contextlib.contextmanager
+def record_timings(command: str, *, enabled: bool) -> Iterator[None]:
+    """Record how long the phases of a LocalNet command take.
+
+    Once the command completes (or fails), the timings are logged and appended as a JSON line to
+    `localnet-timings.jsonl` in the AlgoKit state directory, so they can be compared over time.
+    Nothing is recorded unless `enabled` is set.
+    """
+    if not enabled:
+        yield
+        return
+    report = TimingsReport(command=command)
+    token = _active_report.set(report)
+    start = time.perf_counter()
+    try:
+        yield
+        report.succeeded = True
+    finally:
+        report.total = time.perf_counter() - start
+        _active_report.reset(token)
+        _log_timings(report)
+        _append_timings(report)
@@ -1,10 +1,15 @@
+import contextlib
 import dataclasses
 import logging
+import shutil
 import subprocess
 import sys
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 from subprocess import Popen
 from subprocess import run as subprocess_run
+from typing import IO
 
 import click
 
@@ -29,9 +34,13 @@ def run(  # noqa: PLR0913
     prefix_process: bool = True,
     stdout_log_level: int = logging.DEBUG,
     pass_stdin: bool = False,
+    input_text: str | None = None,
+    input_file: IO[bytes] | None = None,
 ) -> RunResult:
     """Wraps subprocess.Popen() similarly to subprocess.run() but adds: logging and streaming (unicode) I/O capture
 
+    The process input can be given as text with `input_text`, or streamed from a binary file with `input_file`.
+
     Note that not all options or usage scenarios here are covered, just some common use cases
     """
     command_str = " ".join(command)
@@ -43,7 +52,11 @@ def run(  # noqa: PLR0913
         command,
         stdout=subprocess.PIPE,  # capture stdout
         stderr=subprocess.STDOUT,  # redirect stderr to stdout, so they're interleaved in the correct ordering
-        stdin=sys.stdin if pass_stdin else None,
+        stdin=subprocess.PIPE
+        if input_text is not None or input_file is not None
+        else sys.stdin
+        if pass_stdin
+        else None,
         text=True,  # make all I/O in unicode/text
         cwd=cwd,
         env=env,
@@ -51,6 +64,13 @@ def run(  # noqa: PLR0913
         encoding="utf-8",
     ) as proc:
         assert proc.stdout  # type narrowing
+        writer = None
+        if input_text is not None or input_file is not None:
+            assert proc.stdin  # type narrowing
+            # write from another thread, so a process that fills its output pipe before consuming all its input
+            # doesn't deadlock
+            writer = threading.Thread(target=_write_input, args=(proc.stdin, input_text, input_file), daemon=True)
+            writer.start()
         while exit_code is None:
             line = proc.stdout.readline()
             if not line:
@@ -62,6 +82,9 @@ def run(  # noqa: PLR0913
                     level=stdout_log_level,
                     msg=(click.style(f"{command[0]}:", bold=True) if prefix_process else "") + f" {line.strip()}",
                 )
+        if writer is not None:
+            # the input file may be closed once this returns, so don't leave the writer reading from it
+            writer.join()
     if exit_code == 0:
         logger.debug(f"'{command_str}' completed successfully", extra=EXTRA_EXCLUDE_FROM_CONSOLE)
     else:
@@ -72,6 +95,55 @@ def run(  # noqa: PLR0913
     return RunResult(command=command_str, exit_code=exit_code, output=output)
 
 
+@contextlib.contextmanager
+def stream_output(
+    command: list[str],
+    *,
+    cwd: Path | None = None,
+    bad_return_code_error_message: str | None = None,
+) -> Iterator[IO[bytes]]:
+    """Run a command that writes binary output, yielding its stdout to be read as it's written.
+
+    Its stderr is logged rather than captured. The exit code is checked once the output has been read to the end.
+    """
+    command_str = " ".join(command)
+    logger.debug(f"Running '{command_str}' in '{cwd or Path.cwd()}'")
+
+    with Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd) as proc:
+        assert proc.stdout  # type narrowing
+        assert proc.stderr  # type narrowing
+        # log from another thread, so a process that fills its error pipe while its output is read doesn't deadlock
+        error_logger = threading.Thread(target=_log_errors, args=(proc.stderr, command[0]), daemon=True)
+        error_logger.start()
+        yield proc.stdout
+        exit_code = proc.wait()
+        error_logger.join()
+    if exit_code == 0:
+        logger.debug(f"'{command_str}' completed successfully", extra=EXTRA_EXCLUDE_FROM_CONSOLE)
+    else:
+        logger.debug(f"'{command_str}' failed, exited with code = {exit_code}", extra=EXTRA_EXCLUDE_FROM_CONSOLE)
+        if bad_return_code_error_message:
+            raise click.ClickException(bad_return_code_error_message)
+
+
+def _log_errors(stderr: IO[bytes], process_name: str) -> None:
+    for line in stderr:
+        logger.debug(click.style(f"{process_name}:", bold=True) + f" {line.decode(errors='replace').strip()}")
+
+
+def _write_input(stdin: IO[str], input_text: str | None, input_file: IO[bytes] | None) -> None:
+    try:
+        if input_file is not None:
+            # the pipe is opened in text mode for the output, binary input is written to its underlying buffer
+            shutil.copyfileobj(input_file, stdin.buffer)  # type: ignore[attr-defined]
+        if input_text is not None:
+            stdin.write(input_text)
+        stdin.close()
+    except OSError as ex:
+        # the process exited before consuming all of its input
+        logger.debug(f"Failed to write process input: {ex}")
+
+
 def run_interactive(
     command: list[str],
     *,
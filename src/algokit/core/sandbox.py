@@ -1,20 +1,33 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import enum
+import hashlib
 import json
 import logging
+import os
 import re
+import socket
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
+import click
 import httpx
 
 from algokit.core.conf import get_app_config_dir, get_app_state_dir
 from algokit.core.config_commands.container_engine import get_container_engine
+from algokit.core.container_api import ContainerApiError, get_container_api_client
+from algokit.core.localnet_state import cache_state, get_cached_state, invalidate_localnet_state_cache
+from algokit.core.localnet_timings import timed_phase
 from algokit.core.proc import RunResult, run, run_interactive
+from algokit.core.utils import with_click_context
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +36,7 @@ PODMAN_COMPOSE_MINIMUM_VERSION = "1.0.6"
 
 
 SANDBOX_BASE_NAME = "sandbox"
+RUNNING_INSTANCES_STATE_KEY = "running_instances"
 CONTAINER_ENGINE_CONFIG_FILE = get_app_config_dir() / "active-container-engine"
 
 
@@ -34,6 +48,31 @@ class ContainerEngine(str, enum.Enum):
         return self.value
 
 
+class SandboxServices(str, enum.Enum):
+    ALL = "all"
+    ALGOD = "algod"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class SandboxStorage(str, enum.Enum):
+    DISK = "disk"
+    TMPFS = "tmpfs"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class SandboxProfile(str, enum.Enum):
+    DEFAULT = "default"
+    THROUGHPUT = "throughput"
+    LOW_MEMORY = "low-memory"
+
+    def __str__(self) -> str:
+        return self.value
+
+
 class ComposeFileStatus(enum.Enum):
     MISSING = enum.auto()
     UP_TO_DATE = enum.auto()
@@ -47,17 +86,76 @@ def get_min_compose_version() -> str:
     )
 
 
+def get_sandbox_full_name(name: str) -> str:
+    return SANDBOX_BASE_NAME if name == SANDBOX_BASE_NAME else f"{SANDBOX_BASE_NAME}_{name}"
+
+
 class ComposeSandbox:
-    def __init__(self, name: str = SANDBOX_BASE_NAME, config_path: Path | None = None) -> None:
-        self.name = SANDBOX_BASE_NAME if name == SANDBOX_BASE_NAME else f"{SANDBOX_BASE_NAME}_{name}"
+    def __init__(
+        self,
+        name: str = SANDBOX_BASE_NAME,
+        config_path: Path | None = None,
+        settings: SandboxSettings | None = None,
+    ) -> None:
+        self.name = get_sandbox_full_name(name)
         self.directory = (config_path or get_app_config_dir()) / self.name
         if not self.directory.exists():
             logger.debug(f"The {self.name} directory does not exist yet; creating it")
             self.directory.mkdir()
-        self._conduit_yaml = get_conduit_yaml()
-        self._latest_yaml = get_docker_compose_yml(name=f"algokit_{self.name}")
+        self.settings = settings or SandboxSettings.load(self.settings_file_path) or SandboxSettings()
+        self._conduit_yaml = get_conduit_yaml(self.settings.profile, metrics=self.settings.metrics)
+        self._latest_yaml = get_docker_compose_yml(
+            name=f"algokit_{self.name}",
+            algod_port=self.settings.ports.algod,
+            kmd_port=self.settings.ports.kmd,
+            tealdbg_port=self.settings.ports.tealdbg,
+            indexer_port=self.settings.ports.indexer,
+            postgres_port=self.settings.ports.postgres,
+            conduit_metrics_port=self.settings.ports.conduit_metrics if self.settings.metrics else None,
+            services=self.settings.services,
+            storage=self.settings.storage,
+            algod_tmpfs_size=self.settings.algod_tmpfs_size,
+            postgres_tmpfs_size=self.settings.postgres_tmpfs_size,
+            profile=self.settings.profile,
+        )
         self._latest_config_json = get_config_json()
-        self._latest_algod_network_template = get_algod_network_template()
+        self._latest_algod_network_template = get_algod_network_template(self.settings.profile)
+
+    @property
+    def ports(self) -> SandboxPorts:
+        return self.settings.ports
+
+    @property
+    def has_indexer(self) -> bool:
+        return self.settings.services is SandboxServices.ALL
+
+    @property
+    def service_names(self) -> tuple[str, ...]:
+        return SERVICE_NAMES if self.has_indexer else ("algod",)
+
+    def connection_env(self) -> dict[str, str]:
+        """Get the connection config of this instance, using the environment variable names AlgoKit Utils reads."""
+        env = {
+            "ALGOD_SERVER": DEFAULT_ALGOD_SERVER,
+            "ALGOD_PORT": str(self.ports.algod),
+            "ALGOD_TOKEN": DEFAULT_ALGOD_TOKEN,
+        }
+        if self.has_indexer:
+            env.update(
+                {
+                    "INDEXER_SERVER": DEFAULT_INDEXER_SERVER,
+                    "INDEXER_PORT": str(self.ports.indexer),
+                    "INDEXER_TOKEN": DEFAULT_INDEXER_TOKEN,
+                }
+            )
+        env.update(
+            {
+                "KMD_SERVER": DEFAULT_ALGOD_SERVER,
+                "KMD_PORT": str(self.ports.kmd),
+                "KMD_TOKEN": DEFAULT_ALGOD_TOKEN,
+            }
+        )
+        return env
 
     @property
     def compose_file_path(self) -> Path:
@@ -75,8 +173,41 @@ class ComposeSandbox:
     def algod_network_template_file_path(self) -> Path:
         return self.directory / "algod_network_template.json"
 
+    @property
+    def settings_file_path(self) -> Path:
+        return self.directory / "settings.json"
+
     @classmethod
-    def from_environment(cls) -> ComposeSandbox | None:
+    def from_environment(cls, name: str | None = None, *, cached: bool = True) -> ComposeSandbox | None:
+        """Get the running LocalNet instance, or the running instance with the given name if one is specified.
+
+        Pass `cached=False` to probe the container engine rather than use recently cached state.
+        """
+        full_name = None if name is None else get_sandbox_full_name(name)
+        for sandbox in cls.list_from_environment(cached=cached):
+            if full_name is None or sandbox.name == full_name:
+                return sandbox
+        return None
+
+    @classmethod
+    def list_from_environment(cls, *, cached: bool = True) -> list[ComposeSandbox]:
+        """Get all running LocalNet instances, see `from_environment`."""
+        data = get_cached_state(RUNNING_INSTANCES_STATE_KEY) if cached else None
+        if data is None:
+            data = cls._list_running_projects()
+            if data is None:
+                return []
+            cache_state(RUNNING_INSTANCES_STATE_KEY, [cls._get_config_file_path(item).parent for item in data], data)
+        return cls._create_instances_from_data(data)
+
+    @classmethod
+    def _list_running_projects(cls) -> list[dict[str, Any]] | None:
+        api = get_container_api_client()
+        if api is not None:
+            try:
+                return api.list_compose_projects(f"algokit_{SANDBOX_BASE_NAME}")
+            except ContainerApiError as err:
+                logger.debug(f"Falling back to the container engine CLI: {err}", exc_info=True)
         try:
             run_results = run(
                 [get_container_engine(), "compose", "ls", "--format", "json", "--filter", "name=algokit_sandbox*"],
@@ -90,14 +221,14 @@ class ComposeSandbox:
 
         try:
             json_lines = cls._extract_json_lines(run_results.output)
-            if not json_lines:
-                return None
-
-            data = json.loads(json_lines[0])
-            return cls._create_instance_from_data(data)
-        except (json.JSONDecodeError, KeyError, IndexError) as err:
+            data = json.loads(json_lines[0]) if json_lines else []
+        except json.JSONDecodeError as err:
             logger.info(f"Error checking config file: {err}", exc_info=True)
             return None
+        if not isinstance(data, list):
+            logger.info(f"Unexpected output listing running LocalNet: {data}")
+            return None
+        return cast("list[dict[str, Any]]", data)
 
     @staticmethod
     def _extract_json_lines(output: str) -> list[str]:
@@ -112,11 +243,15 @@ class ComposeSandbox:
                 continue
         return valid_json_lines
 
+    @staticmethod
+    def _get_config_file_path(item: dict[str, Any]) -> Path:
+        return Path(item.get("ConfigFiles", "").split(",")[0])
+
     @classmethod
-    def _create_instance_from_data(cls, data: list[dict[str, Any]]) -> ComposeSandbox | None:
+    def _create_instances_from_data(cls, data: list[dict[str, Any]]) -> list[ComposeSandbox]:
+        instances = []
         for item in data:
-            config_file = item.get("ConfigFiles", "").split(",")[0]
-            config_file_path = Path(config_file)
+            config_file_path = cls._get_config_file_path(item)
             full_name = config_file_path.parent.name
             name = (
                 full_name.replace(f"{SANDBOX_BASE_NAME}_", "")
@@ -124,8 +259,8 @@ class ComposeSandbox:
                 else full_name
             )
             config_path = config_file_path.parent.parent
-            return cls(name, config_path)
-        return None
+            instances.append(cls(name, config_path))
+        return instances
 
     def set_algod_dev_mode(self, *, dev_mode: bool) -> None:
         content = self.algod_network_template_file_path.read_text()
@@ -138,7 +273,20 @@ class ComposeSandbox:
         search = re.search(r'"DevMode":\s*(true|false)', content)
         return search is not None and search.group(1) == "true"
 
+    @timed_phase("compose file status")
     def compose_file_status(self) -> ComposeFileStatus:
+        latest_files_hash = hashlib.sha256(
+            (self._latest_yaml + self._latest_config_json + self._latest_algod_network_template).encode()
+        ).hexdigest()
+        state_key = f"compose_file_status:{self.directory}:{latest_files_hash}"
+        cached_status = get_cached_state(state_key)
+        if cached_status is not None:
+            return ComposeFileStatus[cached_status]
+        status = self._get_compose_file_status()
+        cache_state(state_key, [self.directory], status.name)
+        return status
+
+    def _get_compose_file_status(self) -> ComposeFileStatus:
         try:
             compose_content = self.compose_file_path.read_text()
             config_content = self.algod_config_file_path.read_text()
@@ -178,11 +326,15 @@ class ComposeSandbox:
                 # If config files are corrupted or malformed, treat as out of date
                 return ComposeFileStatus.OUT_OF_DATE
 
+    @timed_phase("write compose file")
     def write_compose_file(self) -> None:
+        invalidate_localnet_state_cache()
         self.conduit_file_path.write_text(self._conduit_yaml)
         self.compose_file_path.write_text(self._latest_yaml)
         self.algod_config_file_path.write_text(self._latest_config_json)
         self.algod_network_template_file_path.write_text(self._latest_algod_network_template)
+        if self.settings != SandboxSettings() or self.settings_file_path.exists():
+            self.settings.save(self.settings_file_path)
 
     def _run_compose_command(
         self,
@@ -197,27 +349,41 @@ class ComposeSandbox:
             bad_return_code_error_message=bad_return_code_error_message,
         )
 
+    @timed_phase("up")
     def up(self) -> None:
+        invalidate_localnet_state_cache()
         logger.info("Starting AlgoKit LocalNet now...")
-        self._run_compose_command(
-            f"up --detach --quiet-pull{' --wait' if get_container_engine() == ContainerEngine.DOCKER else ''}",
-            bad_return_code_error_message="Failed to start LocalNet",
-        )
+        with timed_phase("compose up"):
+            self._run_compose_command(
+                f"up --detach --quiet-pull{' --wait' if get_container_engine() == ContainerEngine.DOCKER else ''}",
+                bad_return_code_error_message="Failed to start LocalNet",
+            )
         logger.debug("AlgoKit LocalNet started, waiting for health check")
-        if _wait_for_algod() and _wait_for_indexer():
+        with timed_phase("algod health check"):
+            algod_healthy = _wait_for_algod(self.ports.algod)
+        if algod_healthy and self.has_indexer:
+            with timed_phase("indexer health check"):
+                healthy = _wait_for_indexer(self.ports.indexer)
+        else:
+            healthy = algod_healthy
+        if healthy:
             logger.info("Started; execute `algokit explore` to explore LocalNet in a web user interface.")
         else:
             logger.warning("AlgoKit LocalNet failed to return a successful health check")
 
     def stop(self) -> None:
+        invalidate_localnet_state_cache()
         logger.info("Stopping AlgoKit LocalNet now...")
         self._run_compose_command("stop", bad_return_code_error_message="Failed to stop LocalNet")
         logger.info("LocalNet Stopped; execute `algokit localnet start` to start it again.")
 
+    @timed_phase("down")
     def down(self) -> None:
+        invalidate_localnet_state_cache()
         logger.info("Cleaning up the running AlgoKit LocalNet...")
         self._run_compose_command("down", stdout_log_level=logging.DEBUG)
 
+    @timed_phase("pull")
     def pull(self) -> None:
         logger.info("Fetching any container updates from DockerHub...")
         self._run_compose_command("pull --ignore-pull-failures --quiet")
@@ -238,12 +404,29 @@ class ComposeSandbox:
             bad_return_code_error_message="Failed to get logs, are the containers running?",
         )
 
-    def ps(self, service_name: str | None = None) -> list[dict[str, Any]]:
+    def ps(self, service_name: str | None = None, *, cached: bool = True) -> list[dict[str, Any]]:
+        state_key = f"ps:{self.directory}:{service_name or ''}"
+        cached_ps = get_cached_state(state_key) if cached else None
+        if cached_ps is not None:
+            return cast("list[dict[str, Any]]", cached_ps)
+        ps = self._ps(service_name)
+        if ps is None:
+            return []
+        cache_state(state_key, [self.directory], ps)
+        return ps
+
+    def _ps(self, service_name: str | None) -> list[dict[str, Any]] | None:
+        api = get_container_api_client()
+        if api is not None:
+            try:
+                return api.compose_ps(f"algokit_{self.name}", service_name)
+            except ContainerApiError as err:
+                logger.debug(f"Falling back to the container engine CLI: {err}", exc_info=True)
         run_results = self._run_compose_command(
             f"ps {service_name or ''} --format json", stdout_log_level=logging.DEBUG
         )
         if run_results.exit_code != 0:
-            return []
+            return None
 
         # `docker compose ps --format json` on version < 2.21.0 outputs a JSON arary
         if run_results.output.startswith("["):
@@ -259,7 +442,17 @@ class ComposeSandbox:
     def _get_local_image_versions(self, image_name: str) -> list[str]:
         """
         Get the local versions of a Docker image. Note that a single image may be pulled from multiple repo digests.
+        Images loaded from an image bundle have no repo digests, so the digests recorded in the bundle are included.
         """
+        return [*self._get_image_repo_digests(image_name), *get_imported_image_digests().get(image_name, [])]
+
+    def _get_image_repo_digests(self, image_name: str) -> list[str]:
+        api = get_container_api_client()
+        if api is not None:
+            try:
+                return [digest.split("@")[-1] for digest in api.image_repo_digests(image_name)]
+            except ContainerApiError as err:
+                logger.debug(f"Falling back to the container engine CLI: {err}", exc_info=True)
         try:
             arg = "{{range .RepoDigests}}{{println .}}{{end}}"
             local_versions_output = run([get_container_engine(), "image", "inspect", image_name, "--format", arg])
@@ -268,51 +461,121 @@ class ComposeSandbox:
             logger.debug(f"Failed to get local image versions: {e}", exc_info=True)
             return []
 
-    def _get_latest_image_version(self, image_name: str) -> str | None:
+    def _get_latest_image_version(
+        self, image_name: str, client: httpx.Client | None = None, cached: RegistryDigest | None = None
+    ) -> RegistryDigest | None:
         """
-        Get the latest version of a Docker image from Docker Hub
+        Get the latest version of a Docker image from Docker Hub, revalidating the cached version with its ETag
         """
         args = image_name.split(":")
-        name = args[0]
+        name = args[0] if "/" in args[0] else f"library/{args[0]}"  # official images live in the library namespace
         tag = args[1] if len(args) > 1 else "latest"
         url = f"https://registry.hub.docker.com/v2/repositories/{name}/tags/{tag}"
+        headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else {}
         try:
-            data = httpx.get(url=url)
-            return str(data.json()["digest"])
+            if client is None:
+                response = httpx.get(url=url, headers=headers, timeout=IMAGE_VERSION_CHECK_DEADLINE)
+            else:
+                response = client.get(url, headers=headers)
+            if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+                return cached
+            return RegistryDigest(digest=str(response.json()["digest"]), etag=response.headers.get("etag"))
         except Exception as err:
             logger.debug(f"Error checking image status: {err}", exc_info=True)
             return None
 
-    def is_image_up_to_date(self, image_name: str) -> bool:
+    def _check_image(
+        self, image_name: str, client: httpx.Client, cached: RegistryDigest | None
+    ) -> tuple[bool, RegistryDigest | None]:
         local_versions = self._get_local_image_versions(image_name)
-        latest_version = self._get_latest_image_version(image_name)
-        return latest_version is None or latest_version in local_versions
+        latest_version = self._get_latest_image_version(image_name, client, cached)
+        return latest_version is None or latest_version.digest in local_versions, latest_version
+
+    def check_images_up_to_date(
+        self, image_names: list[str], registry_digests: dict[str, RegistryDigest] | None = None
+    ) -> dict[str, bool]:
+        """Check whether the local versions of the given images are the latest ones in the registry.
+
+        The images are checked concurrently over a shared HTTP client. Images that can't be checked, including those
+        whose check doesn't finish within IMAGE_VERSION_CHECK_DEADLINE seconds, are considered up to date, so the check
+        never holds up a command for longer than that.
+
+        Args:
+            image_names (list[str]): The images to check.
+            registry_digests (dict[str, RegistryDigest] | None): The registry digests seen by a previous check, keyed
+                by image name. They're revalidated with their ETag and updated with the digests seen by this check.
+
+        Returns:
+            dict[str, bool]: Whether each image is up to date, keyed by image name.
+        """
+        registry_digests = {} if registry_digests is None else registry_digests
+        up_to_date = dict.fromkeys(image_names, True)
+        executor = ThreadPoolExecutor(max_workers=IMAGE_VERSION_CHECK_WORKERS, thread_name_prefix="image-check")
+        check_image = with_click_context(self._check_image)
+        with httpx.Client(timeout=IMAGE_VERSION_CHECK_DEADLINE) as client:
+            futures = {
+                executor.submit(check_image, image_name, client, registry_digests.get(image_name)): image_name
+                for image_name in image_names
+            }
+            done, not_done = wait(futures, timeout=IMAGE_VERSION_CHECK_DEADLINE)
+            # don't wait for checks that missed the deadline, closing the client aborts their requests
+            executor.shutdown(wait=False, cancel_futures=True)
+        for future in done:
+            image_name = futures[future]
+            try:
+                up_to_date[image_name], latest_version = future.result()
+            except Exception as err:
+                logger.debug(f"Error checking image status: {err}", exc_info=True)
+                continue
+            if latest_version is not None:
+                registry_digests[image_name] = latest_version
+        if not_done:
+            logger.debug(f"Image version check timed out for {', '.join(futures[future] for future in not_done)}")
+        return up_to_date
+
+    def is_image_up_to_date(self, image_name: str) -> bool:
+        return self.check_images_up_to_date([image_name])[image_name]
+
+    @property
+    def checked_images(self) -> dict[str, str]:
+        """The images of this instance that are checked for new versions, keyed by the name used in messages."""
+        return LOCALNET_IMAGES if self.has_indexer else {"algod": ALGORAND_IMAGE}
 
+    @timed_phase("image version check")
     def check_docker_compose_for_new_image_versions(self, *, force: bool = False) -> None:
         should_check_registry = force or _should_check_image_versions()
+        cached_state = _get_image_version_cache()
 
         if should_check_registry:
             # Check Docker registry for new versions
-            is_indexer_outdated = not self.is_image_up_to_date(INDEXER_IMAGE)
-            is_algod_outdated = not self.is_image_up_to_date(ALGORAND_IMAGE)
-            _update_image_version_cache(indexer_outdated=is_indexer_outdated, algod_outdated=is_algod_outdated)
+            registry_digests = cached_state.registry_digests if cached_state is not None else {}
+            up_to_date = self.check_images_up_to_date(list(self.checked_images.values()), registry_digests)
+            outdated = {name: not up_to_date[image] for name, image in self.checked_images.items()}
+            _update_image_version_cache(
+                indexer_outdated=outdated.get("indexer", False),
+                algod_outdated=outdated["algod"],
+                conduit_outdated=outdated.get("conduit", False),
+                postgres_outdated=outdated.get("postgres", False),
+                registry_digests=registry_digests,
+            )
         else:
             # Use cached state
-            cached_state = _get_image_version_cache()
             if cached_state is None:
                 return
-            is_indexer_outdated = cached_state.indexer_outdated
-            is_algod_outdated = cached_state.algod_outdated
-
-        if is_indexer_outdated:
-            logger.warning(
-                "indexer has a new version available, run `algokit localnet reset --update` to get the latest version"
-            )
-
-        if is_algod_outdated:
-            logger.warning(
-                "algod has a new version available, run `algokit localnet reset --update` to get the latest version"
-            )
+            outdated = {
+                "algod": cached_state.algod_outdated,
+                "conduit": cached_state.conduit_outdated,
+                "postgres": cached_state.postgres_outdated,
+                "indexer": cached_state.indexer_outdated,
+            }
+            outdated = {name: outdated[name] for name in self.checked_images}
+
+        for name, is_outdated in outdated.items():
+            if is_outdated:
+                logger.warning(
+                    f"{name} has a new version available, run `algokit localnet reset --update` to get the latest "
+                    "version"
+                )
 
 
 DEFAULT_ALGOD_SERVER = "http://localhost"
@@ -320,7 +583,11 @@ DEFAULT_INDEXER_SERVER = "http://localhost"
 DEFAULT_ALGOD_TOKEN = "a" * 64
 DEFAULT_INDEXER_TOKEN = "a" * 64
 DEFAULT_ALGOD_PORT = 4001
+DEFAULT_KMD_PORT = 4002
+DEFAULT_TEALDBG_PORT = 9392
 DEFAULT_INDEXER_PORT = 8980
+DEFAULT_POSTGRES_PORT = 5443
+DEFAULT_CONDUIT_METRICS_PORT = 9999
 DEFAULT_WAIT_FOR_ALGOD = 60
 DEFAULT_WAIT_FOR_INDEXER = 60
 DEFAULT_HEALTH_TIMEOUT = 1
@@ -329,7 +596,193 @@ INDEXER_HEALTH_URL = f"{DEFAULT_INDEXER_SERVER}:{DEFAULT_INDEXER_PORT}/health"
 INDEXER_IMAGE = "algorand/indexer:latest"
 ALGORAND_IMAGE = "algorand/algod:latest"
 CONDUIT_IMAGE = "algorandfoundation/conduit-localnet:latest"
+POSTGRES_IMAGE = "postgres:16-alpine"
+# the images referenced by the compose template, keyed by the name used in messages
+LOCALNET_IMAGES = {
+    "algod": ALGORAND_IMAGE,
+    "conduit": CONDUIT_IMAGE,
+    "postgres": POSTGRES_IMAGE,
+    "indexer": INDEXER_IMAGE,
+}
+SERVICE_NAMES = ("algod", "conduit", "indexer-db", "indexer")
 IMAGE_VERSION_CHECK_INTERVAL = timedelta(weeks=1).total_seconds()
+# the most time (in seconds) checking for new image versions can add to a command, and how many are checked at once
+IMAGE_VERSION_CHECK_DEADLINE = 3
+IMAGE_VERSION_CHECK_WORKERS = 4
+# Allocated port blocks are offset from the defaults in steps that never overlap another service's default port
+PORT_ALLOCATION_STEP = 100
+PORT_ALLOCATION_MAX_INSTANCES = 50
+# concurrent `--auto-ports` starts serialize on a lock file, one left behind by a killed process is taken over
+PORT_ALLOCATION_LOCK_FILE_NAME = ".port-allocation.lock"
+PORT_ALLOCATION_LOCK_TIMEOUT = 30
+PORT_ALLOCATION_LOCK_STALE_AFTER = 60
+DEFAULT_ALGOD_TMPFS_SIZE = "2g"
+DEFAULT_POSTGRES_TMPFS_SIZE = "1g"
+TMPFS_SIZE_PATTERN = re.compile(r"^\d+[kmg]?$")
+DEFAULT_ACCOUNTS_SEED = "algokit"
+
+
+@dataclasses.dataclass(frozen=True)
+class SandboxTuning:
+    """Performance knobs of the algod follower node, conduit and postgres, selected by a `SandboxProfile`."""
+
+    catchup_parallel_blocks: int
+    conduit_max_conn: int
+    conduit_retry_delay: str
+    postgres_shared_buffers: str | None = None
+    postgres_work_mem: str | None = None
+
+
+SANDBOX_PROFILE_TUNING = {
+    SandboxProfile.DEFAULT: SandboxTuning(
+        catchup_parallel_blocks=64,
+        conduit_max_conn=20,
+        conduit_retry_delay="5s",
+    ),
+    SandboxProfile.THROUGHPUT: SandboxTuning(
+        catchup_parallel_blocks=256,
+        conduit_max_conn=64,
+        conduit_retry_delay="1s",
+        postgres_shared_buffers="512MB",
+        postgres_work_mem="16MB",
+    ),
+    SandboxProfile.LOW_MEMORY: SandboxTuning(
+        catchup_parallel_blocks=16,
+        conduit_max_conn=4,
+        conduit_retry_delay="5s",
+        postgres_shared_buffers="32MB",
+        postgres_work_mem="1MB",
+    ),
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class SandboxPorts:
+    """Host ports published by a LocalNet instance."""
+
+    algod: int = DEFAULT_ALGOD_PORT
+    kmd: int = DEFAULT_KMD_PORT
+    tealdbg: int = DEFAULT_TEALDBG_PORT
+    indexer: int = DEFAULT_INDEXER_PORT
+    postgres: int = DEFAULT_POSTGRES_PORT
+    conduit_metrics: int = DEFAULT_CONDUIT_METRICS_PORT
+
+    def offset(self, offset: int) -> SandboxPorts:
+        return SandboxPorts(**{key: value + offset for key, value in dataclasses.asdict(self).items()})
+
+    def values(self) -> set[int]:
+        return set(dataclasses.asdict(self).values())
+
+
+@dataclasses.dataclass
+class SandboxSettings:
+    """Per instance LocalNet settings, persisted alongside the compose file of non default instances."""
+
+    ports: SandboxPorts = dataclasses.field(default_factory=SandboxPorts)
+    services: SandboxServices = SandboxServices.ALL
+    storage: SandboxStorage = SandboxStorage.DISK
+    algod_tmpfs_size: str = DEFAULT_ALGOD_TMPFS_SIZE
+    postgres_tmpfs_size: str = DEFAULT_POSTGRES_TMPFS_SIZE
+    profile: SandboxProfile = SandboxProfile.DEFAULT
+    metrics: bool = False
+    prefunded_accounts: int = 0
+    accounts_seed: str = DEFAULT_ACCOUNTS_SEED
+
+    @classmethod
+    def load(cls, path: Path) -> SandboxSettings | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(
+                ports=SandboxPorts(**data.get("ports", {})),
+                services=SandboxServices(data.get("services", SandboxServices.ALL)),
+                storage=SandboxStorage(data.get("storage", SandboxStorage.DISK)),
+                algod_tmpfs_size=data.get("algod_tmpfs_size", DEFAULT_ALGOD_TMPFS_SIZE),
+                postgres_tmpfs_size=data.get("postgres_tmpfs_size", DEFAULT_POSTGRES_TMPFS_SIZE),
+                profile=SandboxProfile(data.get("profile", SandboxProfile.DEFAULT)),
+                metrics=bool(data.get("metrics", False)),
+                prefunded_accounts=int(data.get("prefunded_accounts", 0)),
+                accounts_seed=str(data.get("accounts_seed", DEFAULT_ACCOUNTS_SEED)),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as ex:
+            logger.warning(f"Ignoring invalid LocalNet settings file {path}: {ex}")
+            return None
+
+    def save(self, path: Path) -> None:
+        path.write_text(json.dumps(dataclasses.asdict(self), indent=2), encoding="utf-8")
+
+
+def _is_port_free(port: int) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind(("", port))
+        except OSError:
+            return False
+        return True
+
+
+@contextlib.contextmanager
+def _port_allocation_lock(config_path: Path) -> Iterator[None]:
+    lock_path = config_path / PORT_ALLOCATION_LOCK_FILE_NAME
+    deadline = time.monotonic() + PORT_ALLOCATION_LOCK_TIMEOUT
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > PORT_ALLOCATION_LOCK_STALE_AFTER:
+                    logger.debug(f"Taking over stale LocalNet port allocation lock {lock_path}")
+                    lock_path.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() > deadline:
+                raise click.ClickException(
+                    f"Timed out waiting for another LocalNet instance to allocate its ports, "
+                    f"if no other instance is starting remove {lock_path} and try again"
+                ) from None
+            time.sleep(0.1)
+    try:
+        yield
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+
+def allocate_sandbox_ports(settings_path: Path, settings: SandboxSettings) -> SandboxSettings:
+    """Reserve a block of free host ports that isn't reserved by any other LocalNet instance in the config directory.
+
+    Ports are allocated in blocks offset from the defaults, so the default instance can always keep its ports.
+    The allocation is saved to `settings_path` before the lock is released, so concurrent allocations never
+    pick the same block.
+    """
+    config_path = settings_path.parent.parent
+    with _port_allocation_lock(config_path):
+        reserved = SandboxPorts().values()
+        for settings_file in config_path.glob(f"{SANDBOX_BASE_NAME}*/settings.json"):
+            other_settings = SandboxSettings.load(settings_file)
+            if settings_file != settings_path and other_settings is not None:
+                reserved |= other_settings.ports.values()
+
+        for index in range(1, PORT_ALLOCATION_MAX_INSTANCES + 1):
+            candidate = SandboxPorts().offset(index * PORT_ALLOCATION_STEP)
+            if candidate.values().isdisjoint(reserved) and all(_is_port_free(port) for port in candidate.values()):
+                logger.debug(f"Allocated LocalNet ports {candidate}")
+                settings = dataclasses.replace(settings, ports=candidate)
+                settings.save(settings_path)
+                return settings
+    raise click.ClickException(
+        f"Unable to allocate ports for another LocalNet instance, {PORT_ALLOCATION_MAX_INSTANCES} instances reserved"
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class RegistryDigest:
+    """The digest of an image tag in the registry, with the ETag used to revalidate it."""
+
+    digest: str
+    etag: str | None = None
 
 
 @dataclasses.dataclass
@@ -338,6 +791,9 @@ class ImageVersionCache:
 
     indexer_outdated: bool
     algod_outdated: bool
+    conduit_outdated: bool = False
+    postgres_outdated: bool = False
+    registry_digests: dict[str, RegistryDigest] = dataclasses.field(default_factory=dict)
 
 
 def _get_image_version_cache_path() -> Path:
@@ -357,8 +813,14 @@ def _get_image_version_cache() -> ImageVersionCache | None:
         return ImageVersionCache(
             indexer_outdated=data.get("indexer_outdated", False),
             algod_outdated=data.get("algod_outdated", False),
+            conduit_outdated=data.get("conduit_outdated", False),
+            postgres_outdated=data.get("postgres_outdated", False),
+            registry_digests={
+                image_name: RegistryDigest(**registry_digest)
+                for image_name, registry_digest in data.get("registry_digests", {}).items()
+            },
         )
-    except (OSError, json.JSONDecodeError):
+    except (OSError, json.JSONDecodeError, TypeError):
         return None
 
 
@@ -380,16 +842,62 @@ def _should_check_image_versions() -> bool:
     return False
 
 
-def _update_image_version_cache(*, indexer_outdated: bool, algod_outdated: bool) -> None:
-    """Update the image version check cache with current state."""
+def _update_image_version_cache(
+    *,
+    indexer_outdated: bool,
+    algod_outdated: bool,
+    conduit_outdated: bool = False,
+    postgres_outdated: bool = False,
+    registry_digests: dict[str, RegistryDigest] | None = None,
+) -> None:
+    """Update the image version check cache with current state, keeping the cached registry digests if not given."""
     cache_path = _get_image_version_cache_path()
+    if registry_digests is None:
+        cached_state = _get_image_version_cache()
+        registry_digests = cached_state.registry_digests if cached_state is not None else {}
     try:
-        cache_data = {"indexer_outdated": indexer_outdated, "algod_outdated": algod_outdated}
+        cache_data = {
+            "indexer_outdated": indexer_outdated,
+            "algod_outdated": algod_outdated,
+            "conduit_outdated": conduit_outdated,
+            "postgres_outdated": postgres_outdated,
+            "registry_digests": {
+                image_name: dataclasses.asdict(registry_digest)
+                for image_name, registry_digest in registry_digests.items()
+            },
+        }
         cache_path.write_text(json.dumps(cache_data), encoding="utf-8")
     except OSError as ex:
         logger.debug(f"Failed to update image version cache: {ex}")
 
 
+def _get_imported_image_digests_path() -> Path:
+    return get_app_state_dir() / "localnet-imported-images.json"
+
+
+def get_imported_image_digests() -> dict[str, list[str]]:
+    """Get the repo digests recorded for the images loaded from image bundles, keyed by image name."""
+    try:
+        data = json.loads(_get_imported_image_digests_path().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def record_imported_image_digests(image_digests: dict[str, list[str]]) -> None:
+    """Record the repo digests of images loaded from an image bundle, replacing those recorded for the same images.
+
+    The loaded images are considered up to date until the next image version check is due.
+    """
+    try:
+        _get_imported_image_digests_path().write_text(
+            json.dumps(get_imported_image_digests() | image_digests), encoding="utf-8"
+        )
+    except OSError as ex:
+        logger.debug(f"Failed to record imported image digests: {ex}")
+    _update_image_version_cache(indexer_outdated=False, algod_outdated=False)
+
+
 def _wait_for_service(
     url: str,
     token: str,
@@ -416,10 +924,10 @@ def _wait_for_service(
     return False
 
 
-def _wait_for_algod() -> bool:
+def _wait_for_algod(port: int = DEFAULT_ALGOD_PORT) -> bool:
     """Wait for algod service to become ready."""
     return _wait_for_service(
-        ALGOD_HEALTH_URL,
+        f"{DEFAULT_ALGOD_SERVER}:{port}/v2/status",
         DEFAULT_ALGOD_TOKEN,
         "X-Algo-API-Token",
         "algod",
@@ -427,10 +935,10 @@ def _wait_for_algod() -> bool:
     )
 
 
-def _wait_for_indexer() -> bool:
+def _wait_for_indexer(port: int = DEFAULT_INDEXER_PORT) -> bool:
     """Wait for indexer service to become ready."""
     return _wait_for_service(
-        INDEXER_HEALTH_URL,
+        f"{DEFAULT_INDEXER_SERVER}:{port}/health",
         DEFAULT_INDEXER_TOKEN,
         "X-Indexer-API-Token",
         "indexer",
@@ -446,7 +954,8 @@ def get_config_json() -> str:
     )
 
 
-def get_algod_network_template() -> str:
+def get_algod_network_template(profile: SandboxProfile = SandboxProfile.DEFAULT) -> str:
+    catchup_parallel_blocks = SANDBOX_PROFILE_TUNING[profile].catchup_parallel_blocks
     return """{
     "Genesis": {
       "NetworkName": "followermodenet",
@@ -495,15 +1004,16 @@ def get_algod_network_template() -> str:
         "Name": "follower",
         "IsRelay": false,
         "ConfigJSONOverride":
-        "{\\"EnableFollowMode\\":true,\\"EndpointAddress\\":\\"0.0.0.0:8081\\",\\"MaxAcctLookback\\":64,\\"CatchupParallelBlocks\\":64,\\"CatchupBlockValidateMode\\":3}"
+        "{\\"EnableFollowMode\\":true,\\"EndpointAddress\\":\\"0.0.0.0:8081\\",\\"MaxAcctLookback\\":64,\\"CatchupParallelBlocks\\":CATCHUP_PARALLEL_BLOCKS,\\"CatchupBlockValidateMode\\":3}"
       }
     ]
   }
-"""
+""".replace("CATCHUP_PARALLEL_BLOCKS", str(catchup_parallel_blocks))
 
 
-def get_conduit_yaml() -> str:
-    return """# Log verbosity: PANIC, FATAL, ERROR, WARN, INFO, DEBUG, TRACE
+def get_conduit_yaml(profile: SandboxProfile = SandboxProfile.DEFAULT, *, metrics: bool = False) -> str:
+    tuning = SANDBOX_PROFILE_TUNING[profile]
+    return f"""# Log verbosity: PANIC, FATAL, ERROR, WARN, INFO, DEBUG, TRACE
 log-level: INFO
 
 # If no log file is provided logs are written to stdout.
@@ -513,7 +1023,7 @@ log-level: INFO
 retry-count: 10
 
 # Time duration to wait between retry attempts.
-retry-delay: "5s"
+retry-delay: "{tuning.conduit_retry_delay}"
 
 # Optional filepath to use for pidfile.
 #pid-filepath: /path/to/pidfile
@@ -523,7 +1033,7 @@ hide-banner: false
 
 # When enabled prometheus metrics are available on '/metrics'
 metrics:
-  mode: OFF
+  mode: {"ON" if metrics else "OFF"}
   addr: ":9999"
   prefix: "conduit"
 
@@ -550,17 +1060,58 @@ exporter:
     # Maximum connection number for connection pool
     # This means the total number of active queries that can be running
     # concurrently can never be more than this
-    max-conn: 20
+    max-conn: {tuning.conduit_max_conn}
 """
 
 
-def get_docker_compose_yml(
+def get_docker_compose_yml(  # noqa: PLR0913
     name: str = "algokit_sandbox",
     algod_port: int = DEFAULT_ALGOD_PORT,
-    kmd_port: int = 4002,
-    tealdbg_port: int = 9392,
+    kmd_port: int = DEFAULT_KMD_PORT,
+    tealdbg_port: int = DEFAULT_TEALDBG_PORT,
+    indexer_port: int = DEFAULT_INDEXER_PORT,
+    postgres_port: int = DEFAULT_POSTGRES_PORT,
+    conduit_metrics_port: int | None = None,
+    services: SandboxServices = SandboxServices.ALL,
+    storage: SandboxStorage = SandboxStorage.DISK,
+    algod_tmpfs_size: str = DEFAULT_ALGOD_TMPFS_SIZE,
+    postgres_tmpfs_size: str = DEFAULT_POSTGRES_TMPFS_SIZE,
+    profile: SandboxProfile = SandboxProfile.DEFAULT,
 ) -> str:
-    return f"""name: "{name}"
+    tuning = SANDBOX_PROFILE_TUNING[profile]
+    algod_tmpfs = ""
+    postgres_tmpfs = ""
+    postgres_settings: list[str] = []
+    if storage is SandboxStorage.TMPFS:
+        # keep the ledgers of both algod nodes in memory
+        algod_tmpfs = f"""
+    tmpfs:
+      - /algod/data:size={algod_tmpfs_size}
+      - /algod/follower:size={algod_tmpfs_size}"""
+        # postgres can't initialise a root owned mount point, so point PGDATA at a directory inside the tmpfs
+        # and trade durability for write throughput as the data is thrown away with the container anyway
+        postgres_tmpfs = f"""
+      PGDATA: /var/lib/postgresql/tmpfs/data
+    tmpfs:
+      - /var/lib/postgresql/tmpfs:size={postgres_tmpfs_size}"""
+        postgres_settings += ["fsync=off", "synchronous_commit=off", "full_page_writes=off"]
+    if tuning.postgres_shared_buffers is not None:
+        postgres_settings.append(f"shared_buffers={tuning.postgres_shared_buffers}")
+    if tuning.postgres_work_mem is not None:
+        postgres_settings.append(f"work_mem={tuning.postgres_work_mem}")
+    postgres_command = (
+        f"\n    command: postgres {' '.join(f'-c {setting}' for setting in postgres_settings)}"
+        if postgres_settings
+        else ""
+    )
+    conduit_ports = (
+        ""
+        if conduit_metrics_port is None
+        else f"""
+    ports:
+      - {conduit_metrics_port}:9999"""
+    )
+    algod_service = f"""name: "{name}"
 
 services:
   algod:
@@ -584,11 +1135,16 @@ services:
       - type: bind
         source: ./algod_network_template.json
         target: /etc/algorand/template.json
-      - ./goal_mount:/root/goal_mount
-
+      - ./goal_mount:/root/goal_mount{algod_tmpfs}
+"""
+    if services is SandboxServices.ALGOD:
+        return algod_service
+    return (
+        algod_service
+        + f"""
   conduit:
     container_name: "{name}_conduit"
-    image: {CONDUIT_IMAGE}
+    image: {CONDUIT_IMAGE}{conduit_ports}
     restart: unless-stopped
     volumes:
       - type: bind
@@ -600,20 +1156,20 @@ services:
 
   indexer-db:
     container_name: "{name}_postgres"
-    image: postgres:16-alpine
+    image: {POSTGRES_IMAGE}
     ports:
-      - 5443:5432
+      - {postgres_port}:5432
     user: postgres
     environment:
       POSTGRES_USER: algorand
       POSTGRES_PASSWORD: algorand
-      POSTGRES_DB: indexerdb
+      POSTGRES_DB: indexerdb{postgres_tmpfs}{postgres_command}
 
   indexer:
     container_name: "{name}_indexer"
     image: {INDEXER_IMAGE}
     ports:
-      - 8980:8980
+      - {indexer_port}:8980
     restart: unless-stopped
     command: daemon --enable-all-parameters
     environment:
@@ -621,25 +1177,26 @@ services:
     depends_on:
       - conduit
 """  # noqa: E501
+    )
 
 
-def fetch_algod_status_data(service_info: dict[str, Any]) -> dict[str, Any]:
+def fetch_algod_status_data(service_info: dict[str, Any], port: int = DEFAULT_ALGOD_PORT) -> dict[str, Any]:
     results: dict[str, Any] = {}
     try:
         # Docker image response
-        # Search for DEFAULT_ALGOD_PORT in ports, if found use it, if not found this is an error
-        if not any(item["PublishedPort"] == DEFAULT_ALGOD_PORT for item in service_info["Publishers"]):
+        # Search for the expected port in ports, if found use it, if not found this is an error
+        if not any(item["PublishedPort"] == port for item in service_info["Publishers"]):
             return {"Status": "Error"}
 
-        results["Port"] = DEFAULT_ALGOD_PORT
+        results["Port"] = port
         # container specific response
         with httpx.Client() as client:
             algod_headers = {"X-Algo-API-Token": DEFAULT_ALGOD_TOKEN}
             http_status_response = client.get(
-                f"{DEFAULT_ALGOD_SERVER}:{DEFAULT_ALGOD_PORT}/v2/status", headers=algod_headers, timeout=3
+                f"{DEFAULT_ALGOD_SERVER}:{port}/v2/status", headers=algod_headers, timeout=3
             )
             http_versions_response = client.get(
-                f"{DEFAULT_ALGOD_SERVER}:{DEFAULT_ALGOD_PORT}/versions", headers=algod_headers, timeout=3
+                f"{DEFAULT_ALGOD_SERVER}:{port}/versions", headers=algod_headers, timeout=3
             )
             if (
                 http_status_response.status_code != httpx.codes.OK
@@ -665,16 +1222,16 @@ def fetch_algod_status_data(service_info: dict[str, Any]) -> dict[str, Any]:
         return {"Status": "Error"}
 
 
-def fetch_indexer_status_data(service_info: dict[str, Any]) -> dict[str, Any]:
+def fetch_indexer_status_data(service_info: dict[str, Any], port: int = DEFAULT_INDEXER_PORT) -> dict[str, Any]:
     results: dict[str, Any] = {}
     try:
         # Docker image response
-        if not any(item["PublishedPort"] == DEFAULT_INDEXER_PORT for item in service_info["Publishers"]):
+        if not any(item["PublishedPort"] == port for item in service_info["Publishers"]):
             return {"Status": "Error"}
 
-        results["Port"] = DEFAULT_INDEXER_PORT
+        results["Port"] = port
         # container specific response
-        health_url = f"{DEFAULT_ALGOD_SERVER}:{DEFAULT_INDEXER_PORT}/health"
+        health_url = f"{DEFAULT_INDEXER_SERVER}:{port}/health"
         http_response = httpx.get(health_url, timeout=5)
 
         if http_response.status_code != httpx.codes.OK:
@@ -0,0 +1,122 @@
+import dataclasses
+import logging
+from collections.abc import Collection, Iterable, Iterator
+
+import algosdk
+import click
+from algosdk import transaction
+from algosdk.transaction import SuggestedParams, Transaction
+
+from algokit.core.tasks.send import iter_atomic_groups
+
+logger = logging.getLogger(__name__)
+
+# how many holdings to request per page of an account's assets
+ASSETS_PAGE_SIZE = 1000
+# opt-ins and opt-outs of more assets than fit in one atomic group are sent with `PipelinedSender`
+MAX_UNPIPELINED_ASSETS = algosdk.constants.TX_GROUP_LIMIT
+# how many problem assets to list in an error before eliding the rest
+MAX_REPORTED_ASSETS = 5
+
+
+@dataclasses.dataclass
+class AssetHolding:
+    """An asset held by an account, and the creator an opt-out closes its remaining balance to."""
+
+    asset_id: int
+    amount: int
+    # None if the asset has been destroyed
+    creator: str | None
+
+
+def iter_asset_holdings(
+    algod_client: algosdk.v2client.algod.AlgodClient, address: str, *, page_size: int = ASSETS_PAGE_SIZE
+) -> Iterator[AssetHolding]:
+    """Read the assets held by an account a page at a time, rather than all at once in its account information.
+
+    Raises:
+        click.ClickException: If algod returns an invalid response.
+    """
+    next_page = None
+    while True:
+        page = algod_client.account_assets_info(address, limit=page_size, next_page=next_page)
+        if not isinstance(page, dict):
+            raise click.ClickException("Invalid account assets response")
+        for holding in page.get("asset-holdings", []):
+            yield AssetHolding(
+                asset_id=int(holding["asset-holding"]["asset-id"]),
+                amount=int(holding["asset-holding"].get("amount", 0)),
+                creator=holding.get("asset-params", {}).get("creator"),
+            )
+        next_page = page.get("next-token")
+        if not next_page:
+            return
+
+
+def iter_zero_balance_holdings(
+    algod_client: algosdk.v2client.algod.AlgodClient, address: str
+) -> Iterator[AssetHolding]:
+    """Read the assets an account holds none of, and so can opt out of, a page at a time."""
+    return (holding for holding in iter_asset_holdings(algod_client, address) if holding.amount == 0)
+
+
+def _format_asset_ids(asset_ids: list[int]) -> str:
+    listed = ", ".join(str(asset_id) for asset_id in asset_ids[:MAX_REPORTED_ASSETS])
+    elided = f" and {len(asset_ids) - MAX_REPORTED_ASSETS} more" if len(asset_ids) > MAX_REPORTED_ASSETS else ""
+    return f"{listed}{elided}"
+
+
+def get_opt_out_holdings(
+    algod_client: algosdk.v2client.algod.AlgodClient, address: str, asset_ids: Collection[int]
+) -> list[AssetHolding]:
+    """Find the account's holdings of the given assets, checking it can opt out of all of them before any are sent.
+
+    Raises:
+        click.ClickException: If the account isn't opted into any of the assets, or holds a balance of any of them.
+    """
+    requested = set(asset_ids)
+    holdings = {
+        holding.asset_id: holding
+        for holding in iter_asset_holdings(algod_client, address)
+        if holding.asset_id in requested
+    }
+    not_opted_in = sorted(requested - holdings.keys())
+    if not_opted_in:
+        raise click.ClickException(f"Account is not opted into assets {_format_asset_ids(not_opted_in)}")
+    with_balance = sorted(asset_id for asset_id, holding in holdings.items() if holding.amount)
+    if with_balance:
+        raise click.ClickException(
+            f"Account has a non-zero balance of assets {_format_asset_ids(with_balance)}, transfer it before opting out"
+        )
+    return [holdings[asset_id] for asset_id in dict.fromkeys(asset_ids)]
+
+
+def build_opt_out_groups(
+    address: str, holdings: Iterable[AssetHolding], suggested_params: SuggestedParams
+) -> Iterator[list[Transaction]]:
+    """Build opt-outs of the holdings as atomic groups of up to `algosdk.constants.TX_GROUP_LIMIT` transactions.
+
+    Groups are built as `holdings` is consumed, so it can be a lazy iterable.
+    """
+    return iter_atomic_groups(
+        transaction.AssetTransferTxn(  # type: ignore[no-untyped-call]
+            address,
+            suggested_params,
+            # the balance of a destroyed asset can't be closed to its creator, but as it's zero it can close anywhere
+            holding.creator or address,
+            0,
+            holding.asset_id,
+            close_assets_to=holding.creator or address,
+        )
+        for holding in holdings
+    )
+
+
+def build_opt_in_groups(
+    address: str, asset_ids: Iterable[int], suggested_params: SuggestedParams
+) -> Iterator[list[Transaction]]:
+    """Build opt-ins to the assets as atomic groups of up to `algosdk.constants.TX_GROUP_LIMIT` transactions."""
+    return iter_atomic_groups(
+        transaction.AssetOptInTxn(address, suggested_params, asset_id)  # type: ignore[no-untyped-call]
+        for asset_id in dict.fromkeys(asset_ids)
+    )
@@ -0,0 +1,186 @@
+import csv
+import dataclasses
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+import algosdk
+import click
+from algokit_utils import AlgoAmount
+from algosdk import error, transaction
+from algosdk.transaction import SignedTransaction, SuggestedParams, Transaction
+
+from algokit.core.tasks.wallet import get_alias
+
+logger = logging.getLogger(__name__)
+
+BATCH_COLUMNS = ("receiver", "amount")
+RESULTS_COLUMNS = ("line", "receiver", "asset_id", "amount", "txid", "confirmed_round", "error")
+# how many problem rows to list in an error before eliding the rest
+MAX_REPORTED_ROWS = 5
+
+
+@dataclasses.dataclass
+class BatchTransfer:
+    """A transfer read from a batch file, with its amount in the smallest divisible units of the asset."""
+
+    line: int
+    receiver: str
+    asset_id: int
+    amount: int
+
+
+def _resolve_receiver(receiver: str, line: int) -> str:
+    if algosdk.encoding.is_valid_address(receiver):  # type: ignore[no-untyped-call]
+        return receiver
+    alias_data = get_alias(receiver) if len(receiver) != algosdk.constants.address_len else None
+    if not alias_data:
+        raise click.ClickException(f"Line {line}: `{receiver}` is neither a valid account address nor an alias")
+    return alias_data.address
+
+
+def _parse_amount(amount: str, decimals: int | None, line: int) -> int:
+    try:
+        value = Decimal(amount.strip())
+    except InvalidOperation as ex:
+        raise click.ClickException(f"Line {line}: `{amount}` is not a valid amount") from ex
+    if decimals is not None:
+        value = value.scaleb(decimals)
+    if value <= 0 or value != value.to_integral_value():
+        raise click.ClickException(f"Line {line}: `{amount}` is not a valid amount")
+    return int(value)
+
+
+def read_batch_transfers(
+    path: Path, *, default_asset_id: int, get_decimals: Callable[[int], int] | None = None
+) -> list[BatchTransfer]:
+    """Read the transfers in a batch CSV file.
+
+    The file has a header row and a `receiver` (address or alias) and `amount` column, plus an optional `asset_id`
+    column that defaults to `default_asset_id`. Amounts are in the smallest divisible units of the asset, unless
+    `get_decimals` is given, in which case they're in whole units and converted using the decimals it returns.
+
+    Raises:
+        click.ClickException: If the file or any of its rows is invalid.
+    """
+    transfers = []
+    with path.open(newline="", encoding="utf-8") as batch_file:
+        reader = csv.DictReader(batch_file)
+        missing_columns = [column for column in BATCH_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing_columns:
+            raise click.ClickException(f"{path} doesn't have a {' or '.join(missing_columns)} column")
+        for row in reader:
+            line = reader.line_num
+            try:
+                asset_id = int(row.get("asset_id") or default_asset_id)
+            except ValueError as ex:
+                raise click.ClickException(f"Line {line}: `{row['asset_id']}` is not a valid asset ID") from ex
+            transfers.append(
+                BatchTransfer(
+                    line=line,
+                    receiver=_resolve_receiver((row["receiver"] or "").strip(), line),
+                    asset_id=asset_id,
+                    amount=_parse_amount(row["amount"] or "", get_decimals(asset_id) if get_decimals else None, line),
+                )
+            )
+    if not transfers:
+        raise click.ClickException(f"{path} doesn't contain any transfers")
+    return transfers
+
+
+def build_transfer_groups(
+    sender: str, transfers: list[BatchTransfer], suggested_params: SuggestedParams
+) -> list[list[Transaction]]:
+    """Build the transfers as atomic groups of up to `algosdk.constants.TX_GROUP_LIMIT` transactions."""
+    groups = []
+    for offset in range(0, len(transfers), algosdk.constants.TX_GROUP_LIMIT):
+        txns: list[Transaction] = [
+            transaction.PaymentTxn(sender, suggested_params, transfer.receiver, transfer.amount)  # type: ignore[no-untyped-call]
+            if transfer.asset_id == 0
+            else transaction.AssetTransferTxn(  # type: ignore[no-untyped-call]
+                sender, suggested_params, transfer.receiver, transfer.amount, transfer.asset_id
+            )
+            for transfer in transfers[offset : offset + algosdk.constants.TX_GROUP_LIMIT]
+        ]
+        groups.append(transaction.assign_group_id(txns) if len(txns) > 1 else txns)  # type: ignore[no-untyped-call]
+    return groups
+
+
+def sign_transfer_groups(groups: list[list[Transaction]], private_key: str) -> Iterator[SignedTransaction]:
+    for group in groups:
+        for txn in group:
+            yield txn.sign(private_key)  # type: ignore[no-untyped-call]
+
+
+def validate_batch_balance(
+    algod_client: algosdk.v2client.algod.AlgodClient,
+    sender: str,
+    transfers: list[BatchTransfer],
+    groups: list[list[Transaction]],
+) -> None:
+    """Check the sender holds enough of each asset for all the transfers, and enough Algos for them and their fees.
+
+    Raises:
+        click.ClickException: If the sender's balance of any asset is insufficient.
+    """
+    account_info = algod_client.account_info(sender)
+    if not isinstance(account_info, dict):
+        raise click.ClickException("Invalid account info response")
+
+    totals: Counter[int] = Counter()
+    for transfer in transfers:
+        totals[transfer.asset_id] += transfer.amount
+    required_microalgos = totals.pop(0, 0) + sum(txn.fee for group in groups for txn in group)
+    available_microalgos = account_info.get("amount", 0)
+    if available_microalgos < required_microalgos:
+        required = AlgoAmount.from_micro_algo(required_microalgos)
+        available = AlgoAmount.from_micro_algo(available_microalgos)
+        raise click.ClickException(
+            f"Insufficient Algos balance in account for the batch including fees, required: {required.algo} Algos, "
+            f"available: {available.algo} Algos"
+        )
+
+    holdings = {asset["asset-id"]: asset["amount"] for asset in account_info.get("assets", [])}
+    for asset_id, required_amount in sorted(totals.items()):
+        if asset_id not in holdings:
+            raise click.ClickException(f"Sender account is not opted into asset {asset_id}")
+        if holdings[asset_id] < required_amount:
+            raise click.ClickException(
+                f"Insufficient balance of asset {asset_id} in account for the batch, "
+                f"required: {required_amount}, available: {holdings[asset_id]} (in base units)"
+            )
+
+
+def _is_opted_in(algod_client: algosdk.v2client.algod.AlgodClient, address: str, asset_id: int) -> bool:
+    try:
+        algod_client.account_asset_info(address, asset_id)
+    except error.AlgodHTTPError as ex:
+        if ex.code == 404:  # noqa: PLR2004
+            return False
+        raise
+    return True
+
+
+def validate_receivers_opted_in(
+    algod_client: algosdk.v2client.algod.AlgodClient, transfers: list[BatchTransfer], *, concurrency: int
+) -> None:
+    """Check every receiver of an asset transfer is opted into the asset, checking several receivers at once.
+
+    Raises:
+        click.ClickException: If any receivers aren't opted in.
+    """
+    holdings = sorted({(transfer.receiver, transfer.asset_id) for transfer in transfers if transfer.asset_id})
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        opted_in = dict(
+            zip(holdings, executor.map(lambda holding: _is_opted_in(algod_client, *holding), holdings), strict=True)
+        )
+    not_opted_in = [
+        transfer for transfer in transfers if transfer.asset_id and not opted_in[(transfer.receiver, transfer.asset_id)]
+    ]
+    if not_opted_in:
+        lines = ", ".join(str(transfer.line) for transfer in not_opted_in[:MAX_REPORTED_ROWS])
+        elided = f" and {len(not_opted_in) - MAX_REPORTED_ROWS} more" if len(not_opted_in) > MAX_REPORTED_ROWS else ""
+        raise click.ClickException(f"Receivers aren't opted into the asset on lines {lines}{elided}")
@@ -1,9 +1,20 @@
+import dataclasses
+import hashlib
+import io
 import json
 import logging
+import threading
+import time
+from collections.abc import Iterable
+from functools import cache
 from pathlib import Path
+from typing import BinaryIO
 
 import httpx
 import keyring
+from multiformats import CID, multihash, varint
+
+from algokit.core.conf import get_app_state_dir
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +23,14 @@ ALGOKIT_PINATA_TOKEN_KEY = "algokit_pinata_access_token"
 
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 DEFAULT_TIMEOUT = 90
+# files are hashed this many bytes at a time, rather than read into memory all at once
+FILE_CHUNK_SIZE = 1024 * 1024  # 1MB
+# how Piñata splits files into a UnixFS DAG for CIDv1, the same as `ipfs add --cid-version 1`
+UNIXFS_CHUNK_SIZE = 256 * 1024  # 256KiB
+UNIXFS_MAX_LINKS = 174
+_RAW_CODEC = 0x55
+_DAG_PB_CODEC = 0x70
+_UNIXFS_FILE_TYPE = 2
 
 
 class PinataError(Exception):
@@ -45,6 +64,248 @@ class PinataHttpError(PinataError):
     pass
 
 
+@dataclasses.dataclass
+class PinataUpload:
+    """A file pinned on Piñata, with the SHA-256 digest and size of its content."""
+
+    cid: str
+    sha256: str
+    size: int
+    # whether the content was already pinned, so it wasn't uploaded again
+    already_pinned: bool = False
+
+
+@dataclasses.dataclass
+class FileHashes:
+    """The SHA-256 digest, IPFS CIDv1 and size of a file's content."""
+
+    sha256: str
+    cid: str
+    size: int
+
+
+@dataclasses.dataclass
+class _DagNode:
+    cid: bytes
+    # the size of the file content under this node
+    file_size: int
+    # the size of this node's block and all the blocks under it
+    tree_size: int
+
+
+def _protobuf_field(field_number: int, value: bytes | int) -> bytes:
+    if isinstance(value, int):
+        return varint.encode(field_number << 3) + varint.encode(value)
+    return varint.encode(field_number << 3 | 2) + varint.encode(len(value)) + value
+
+
+def _cid_bytes(codec: int, block: bytes) -> bytes:
+    return varint.encode(1) + varint.encode(codec) + bytes(multihash.wrap(hashlib.sha256(block).digest(), "sha2-256"))
+
+
+def _build_parent_node(children: list[_DagNode]) -> _DagNode:
+    # a dag-pb node with UnixFS file data, encoded as go-ipfs does: links before data, and each link with an empty name
+    file_size = sum(child.file_size for child in children)
+    unixfs_data = _protobuf_field(1, _UNIXFS_FILE_TYPE) + _protobuf_field(3, file_size)
+    unixfs_data += b"".join(_protobuf_field(4, child.file_size) for child in children)
+    block = b"".join(
+        _protobuf_field(
+            2, _protobuf_field(1, child.cid) + _protobuf_field(2, b"") + _protobuf_field(3, child.tree_size)
+        )
+        for child in children
+    )
+    block += _protobuf_field(1, unixfs_data)
+    return _DagNode(
+        cid=_cid_bytes(_DAG_PB_CODEC, block),
+        file_size=file_size,
+        tree_size=len(block) + sum(child.tree_size for child in children),
+    )
+
+
+def _build_balanced_dag(leaves: list[_DagNode]) -> _DagNode:
+    # equivalent to the balanced layout of go-ipfs, which fills each level of the tree from the left
+    nodes = leaves
+    while len(nodes) > 1:
+        nodes = [
+            _build_parent_node(nodes[start : start + UNIXFS_MAX_LINKS])
+            for start in range(0, len(nodes), UNIXFS_MAX_LINKS)
+        ]
+    return nodes[0]
+
+
+def _iter_chunks(file_path: Path, chunk_size: int) -> Iterable[bytes]:
+    with file_path.open("rb") as file:
+        chunk = file.read(chunk_size)
+        # an empty file is a single empty chunk
+        yield chunk
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def hash_file(file_path: Path) -> FileHashes:
+    """
+    Calculate the SHA-256 digest of a file and the CIDv1 Piñata will give it, reading the file once a chunk at a time.
+
+    The CID is of the UnixFS DAG that `ipfs add --cid-version 1` builds, with 256KiB raw leaves in a balanced tree.
+
+    Args:
+        file_path (Path): The path to the file.
+
+    Returns:
+        FileHashes: The hex encoded SHA-256 digest, base32 encoded CID and size of the file.
+    """
+    sha256 = hashlib.sha256()
+    leaves = []
+    for chunk in _iter_chunks(file_path, UNIXFS_CHUNK_SIZE):
+        sha256.update(chunk)
+        leaves.append(_DagNode(cid=_cid_bytes(_RAW_CODEC, chunk), file_size=len(chunk), tree_size=len(chunk)))
+    root = _build_balanced_dag(leaves)
+    return FileHashes(sha256=sha256.hexdigest(), cid=str(CID.decode(root.cid).encode("base32")), size=root.file_size)
+
+
+def file_sha256(file_path: Path) -> str:
+    """
+    Calculate the SHA-256 digest of a file, reading it a chunk at a time.
+
+    Args:
+        file_path (Path): The path to the file.
+
+    Returns:
+        str: The hex encoded digest of the file.
+    """
+    sha256 = hashlib.sha256()
+    with file_path.open("rb") as file:
+        while chunk := file.read(FILE_CHUNK_SIZE):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _log_upload_throughput(name: str, size: int, elapsed: float) -> None:
+    megabytes = size / (1024 * 1024)
+    logger.debug(f"Uploaded {name} ({megabytes:.2f}MB) in {elapsed:.2f}s, {megabytes / max(elapsed, 1e-6):.2f}MB/s")
+
+
+def get_pin_cache_path() -> Path:
+    return get_app_state_dir() / "ipfs-pin-cache.jsonl"
+
+
+def _get_jwt_key(jwt: str) -> str:
+    # uploads are cached per Piñata account, identified by a digest of its JWT rather than the JWT itself
+    return hashlib.sha256(jwt.encode("utf-8")).hexdigest()[:16]
+
+
+class _HashingFileReader:
+    """Reads a file as it's streamed into an upload, hashing the content on the way so the file is only read once."""
+
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def fileno(self) -> int:
+        # lets httpx find the length of the file, so the upload is sent with a Content-Length
+        return self._file.fileno()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        position = self._file.seek(offset, whence)
+        if position == 0:
+            # the upload is being sent again from the start
+            self.sha256 = hashlib.sha256()
+            self.size = 0
+        return position
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        self.sha256.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+
+@dataclasses.dataclass
+class _PinCache:
+    # from the JWT key and SHA-256 digest of content to its CID
+    cids: dict[tuple[str, str], str] = dataclasses.field(default_factory=dict)
+    # the JWT keys and content sizes with cached CIDs, a size of None is a record cached without its size
+    sizes: set[tuple[str, int | None]] = dataclasses.field(default_factory=set)
+
+    def may_contain(self, jwt_key: str, size: int) -> bool:
+        return (jwt_key, size) in self.sizes or (jwt_key, None) in self.sizes
+
+
+_pin_cache_lock = threading.Lock()
+
+
+@cache
+def _read_pin_cache(cache_path: Path) -> _PinCache:
+    pins = _PinCache()
+    try:
+        with cache_path.open(encoding="utf-8") as cache_file:
+            for line in cache_file:
+                try:
+                    record = json.loads(line)
+                    pins.cids[(record["jwt_key"], record["sha256"])] = record["cid"]
+                    pins.sizes.add((record["jwt_key"], record.get("size")))
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+    except OSError:
+        pass
+    return pins
+
+
+def _get_pin_cache() -> _PinCache:
+    """Get the cache of pinned content, read from the AlgoKit state directory once per process."""
+    return _read_pin_cache(get_pin_cache_path())
+
+
+def invalidate_pin_cache() -> None:
+    """Discard the pinned content read from the cache, so it's read again, e.g. after another process updated it."""
+    _read_pin_cache.cache_clear()
+
+
+def _cache_pin(jwt: str, sha256: str, size: int, cid: str) -> None:
+    key = (_get_jwt_key(jwt), sha256)
+    with _pin_cache_lock:
+        pins = _get_pin_cache()
+        if pins.cids.get(key) == cid:
+            return
+        pins.cids[key] = cid
+        pins.sizes.add((key[0], size))
+        try:
+            with get_pin_cache_path().open("a", encoding="utf-8") as cache_file:
+                cache_file.write(json.dumps({"jwt_key": key[0], "sha256": sha256, "size": size, "cid": cid}) + "\n")
+        except OSError as ex:
+            logger.debug(f"Failed to update IPFS pin cache: {ex}")
+
+
+def _is_pinned(cid: str, jwt: str) -> bool:
+    response = httpx.get(
+        url="https://api.pinata.cloud/data/pinList",
+        params={"cid": cid, "status": "pinned", "pageLimit": 1},
+        headers={"accept": "application/json", "Authorization": f"Bearer {jwt}"},
+        timeout=DEFAULT_TIMEOUT,
+    )
+    if response.is_error:
+        logger.debug(f"Failed to check whether {cid} is pinned: {response.status_code} {response.text}")
+        return False
+    try:
+        rows = response.json().get("rows", [])
+    except (ValueError, AttributeError):
+        logger.debug(f"Failed to check whether {cid} is pinned, unexpected response: {response.text}")
+        return False
+    return any(row.get("ipfs_pin_hash") == cid for row in rows)
+
+
+def _find_pinned_cid(file_hashes: FileHashes, jwt: str, *, verify: bool) -> str | None:
+    cached_cid = _get_pin_cache().cids.get((_get_jwt_key(jwt), file_hashes.sha256))
+    if not verify:
+        return cached_cid
+    candidates = dict.fromkeys(cid for cid in (cached_cid, file_hashes.cid) if cid)
+    return next((cid for cid in candidates if _is_pinned(cid, jwt)), None)
+
+
 def get_pinata_jwt() -> str | None:
     """
     Retrieves a password from the keyring library using the
@@ -81,11 +342,12 @@ def set_pinata_jwt(jwt: str | None) -> None:
         keyring.set_password(ALGOKIT_PINATA_NAMESPACE, ALGOKIT_PINATA_TOKEN_KEY, jwt)
     else:
         keyring.delete_password(ALGOKIT_PINATA_NAMESPACE, ALGOKIT_PINATA_TOKEN_KEY)
+    invalidate_pin_cache()
 
 
-def upload_to_pinata(file_path: Path, jwt: str, name: str | None = None) -> str:
+def upload_to_pinata(file_path: Path, jwt: str, name: str | None = None, *, verify: bool = False) -> str:
     """
-    Uploads a file to the Piñata API.
+    Uploads a file to the Piñata API, unless its content has already been pinned. See `upload_file_to_pinata`.
 
     Args:
         file_path (Path): The path to the file that needs to be uploaded.
@@ -93,6 +355,8 @@ def upload_to_pinata(file_path: Path, jwt: str, name: str | None = None) -> str:
         name (str | None, optional): The name to be assigned to the uploaded file. If not provided,
         the name of the file at `file_path` will be used. Defaults to None.
         If not provided, the content will be read from the file at `file_path`. Defaults to None.
+        verify (bool, optional): Whether to check with Piñata that content is pinned, rather than trusting the local
+        cache of uploads. Defaults to False.
 
     Returns:
         str: The CID (Content Identifier) of the uploaded file.
@@ -114,8 +378,51 @@ def upload_to_pinata(file_path: Path, jwt: str, name: str | None = None) -> str:
         print(cid) # e.g. "bafybeih6z7z2z3z4z5z6z7z8z9z0"
     """
 
-    with file_path.open("rb") as file:
-        file_content = file.read()
+    return upload_file_to_pinata(file_path, jwt, name, verify=verify).cid
+
+
+def upload_file_to_pinata(file_path: Path, jwt: str, name: str | None = None, *, verify: bool = False) -> PinataUpload:
+    """
+    Uploads a file to the Piñata API, streaming it from disk rather than reading it into memory.
+
+    Content that has been uploaded before with the same JWT, according to a cache of uploads in the AlgoKit state
+    directory, isn't uploaded again. With `verify`, Piñata is asked whether the content is pinned instead, by the CID
+    calculated from the file, so content that was unpinned since it was cached is uploaded again, and content pinned
+    from elsewhere isn't.
+
+    Checking for already pinned content means hashing the file before uploading it, so it's only done with `verify`
+    or when content of the same size has been cached for the JWT. Otherwise the file is hashed as it's uploaded, and
+    only read once.
+
+    Args:
+        file_path (Path): The path to the file that needs to be uploaded.
+        jwt (str): The JWT for accessing the Piñata API.
+        name (str | None, optional): The name to be assigned to the uploaded file. If not provided,
+        the name of the file at `file_path` will be used. Defaults to None.
+        verify (bool, optional): Whether to check with Piñata that content is pinned, rather than trusting the local
+        cache of uploads. Defaults to False.
+
+    Returns:
+        PinataUpload: The CID (Content Identifier) of the file, the SHA-256 digest and size of its content, and
+        whether it was already pinned.
+
+    Raises:
+        ValueError: If the CID is not a string.
+        PinataBadRequestError: If there is a bad request error.
+        PinataUnauthorizedError: If there is an unauthorized error.
+        PinataForbiddenError: If there is a forbidden error.
+        PinataInternalServerError: If there is an internal server error.
+        PinataHttpError: If there is an HTTP error.
+    """
+    name = name or file_path.name
+    file_hashes = None
+    if verify or _get_pin_cache().may_contain(_get_jwt_key(jwt), file_path.stat().st_size):
+        file_hashes = hash_file(file_path)
+        pinned_cid = _find_pinned_cid(file_hashes, jwt, verify=verify)
+        if pinned_cid:
+            logger.debug(f"Skipped uploading {name}, its content is already pinned as {pinned_cid}")
+            _cache_pin(jwt, file_hashes.sha256, file_hashes.size, pinned_cid)
+            return PinataUpload(cid=pinned_cid, sha256=file_hashes.sha256, size=file_hashes.size, already_pinned=True)
 
     headers = {
         "accept": "application/json",
@@ -124,21 +431,29 @@ def upload_to_pinata(file_path: Path, jwt: str, name: str | None = None) -> str:
 
     pinata_options = {"cidVersion": "1"}
     data = {"pinataOptions": json.dumps(pinata_options)}
-    files = {"file": (name or file_path.name, file_content)}
     try:
-        response = httpx.post(
-            url="https://api.pinata.cloud/pinning/pinFileToIPFS",
-            data=data,
-            files=files,
-            headers=headers,
-            timeout=DEFAULT_TIMEOUT,
-        )
+        with file_path.open("rb") as file:
+            reader = _HashingFileReader(file)
+            files = {"file": (name, reader)}
+            started = time.perf_counter()
+            response = httpx.post(
+                url="https://api.pinata.cloud/pinning/pinFileToIPFS",
+                data=data,
+                files=files,  # type: ignore[arg-type]
+                headers=headers,
+                timeout=DEFAULT_TIMEOUT,
+            )
+            _log_upload_throughput(name, reader.size, time.perf_counter() - started)
 
         response.raise_for_status()
         cid = response.json().get("IpfsHash")
         if not isinstance(cid, str):
             raise ValueError("IpfsHash is not a string.")
-        return cid
+        if file_hashes is not None and cid != file_hashes.cid:
+            logger.debug(f"Piñata pinned {name} as {cid}, rather than the calculated {file_hashes.cid}")
+        sha256 = reader.sha256.hexdigest()
+        _cache_pin(jwt, sha256, reader.size, cid)
+        return PinataUpload(cid=cid, sha256=sha256, size=reader.size)
     except httpx.HTTPStatusError as ex:
         if ex.response.status_code == httpx.codes.BAD_REQUEST:
             raise PinataBadRequestError(ex.response) from ex
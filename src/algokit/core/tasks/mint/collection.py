@@ -0,0 +1,225 @@
+import dataclasses
+import json
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+import click
+import httpx
+from algosdk.v2client import algod
+
+from algokit.core.tasks.ipfs import PinataError, PinataUpload, upload_file_to_pinata
+from algokit.core.tasks.mint.mint import _file_integrity, _file_mimetype, get_token_url_and_reserve
+from algokit.core.tasks.mint.models import TokenMetadata
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "manifest.json"
+DEFAULT_UPLOAD_CONCURRENCY = 4
+# how many times to retry an upload that failed with a transient error
+UPLOAD_RETRIES = 3
+# seconds to wait before the first retry of a failed upload, doubling for each retry after that
+UPLOAD_RETRY_DELAY = 1.0
+
+
+@dataclasses.dataclass
+class CollectionToken:
+    """A token to mint, read from a collection manifest."""
+
+    index: int
+    name: str
+    unit_name: str
+    total: int
+    decimals: int
+    image_path: Path | None
+    metadata_path: Path | None
+
+
+@dataclasses.dataclass
+class TokenUpload:
+    """The outcome of uploading a token's image and metadata to IPFS."""
+
+    token: CollectionToken
+    metadata: TokenMetadata | None = None
+    image_cid: str | None = None
+    metadata_cid: str | None = None
+    error: str | None = None
+
+
+def _resolve_file(collection_dir: Path, index: int, value: Any) -> Path | None:  # noqa: ANN401
+    if value is None:
+        return None
+    path = collection_dir / str(value)
+    if not path.is_file():
+        raise click.ClickException(f"Token {index} in {MANIFEST_FILE_NAME}: file `{value}` doesn't exist")
+    return path
+
+
+def read_collection_manifest(collection_dir: Path) -> list[CollectionToken]:
+    """Read the tokens of a collection from the `manifest.json` file in its directory.
+
+    The manifest is a JSON array with an object per token, which has a `name` and `unit_name`, and optionally a
+    `total` (defaults to 1), `decimals` (defaults to 0), an `image` file and an ARC3 `metadata` file. File paths are
+    relative to the collection directory.
+
+    Raises:
+        click.ClickException: If the manifest is missing or any of its tokens are invalid.
+    """
+    manifest_path = collection_dir / MANIFEST_FILE_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except FileNotFoundError as ex:
+        raise click.ClickException(f"{collection_dir} doesn't contain a {MANIFEST_FILE_NAME} file") from ex
+    except json.JSONDecodeError as ex:
+        raise click.ClickException(f"Failed to decode {manifest_path}: {ex}") from ex
+    if not isinstance(manifest, list) or not manifest:
+        raise click.ClickException(f"{MANIFEST_FILE_NAME} must be a non-empty array of tokens")
+
+    tokens = []
+    for index, entry in enumerate(manifest):
+        if not isinstance(entry, dict) or not entry.get("name") or not entry.get("unit_name"):
+            raise click.ClickException(f"Token {index} in {MANIFEST_FILE_NAME} must have a `name` and `unit_name`")
+        try:
+            total, decimals = int(entry.get("total", 1)), int(entry.get("decimals", 0))
+        except (TypeError, ValueError) as ex:
+            raise click.ClickException(
+                f"Token {index} in {MANIFEST_FILE_NAME} has an invalid total or decimals"
+            ) from ex
+        tokens.append(
+            CollectionToken(
+                index=index,
+                name=str(entry["name"]),
+                unit_name=str(entry["unit_name"]),
+                total=total,
+                decimals=decimals,
+                image_path=_resolve_file(collection_dir, index, entry.get("image")),
+                metadata_path=_resolve_file(collection_dir, index, entry.get("metadata")),
+            )
+        )
+    return tokens
+
+
+def read_mint_results(results_path: Path) -> dict[int, dict[str, Any]]:
+    """Read the results of a previous run, merging the records written for each token as it progressed."""
+    results: dict[int, dict[str, Any]] = {}
+    if not results_path.exists():
+        return results
+    with results_path.open(encoding="utf-8") as results_file:
+        for line in results_file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # the last line may be incomplete if the previous run was interrupted
+                continue
+            if isinstance(record, dict) and isinstance(record.get("index"), int):
+                results.setdefault(record["index"], {}).update(record)
+    return results
+
+
+def find_minted_tokens(
+    client: algod.AlgodClient, creator_address: str, metadata_cids: dict[int, str], *, mutable: bool
+) -> dict[int, int]:
+    """Find which tokens were minted by a previous run that stopped before recording it, by their URL and reserve.
+
+    Args:
+        client (algod.AlgodClient): The algod client.
+        creator_address (str): The address of the collection's creator.
+        metadata_cids (dict[int, str]): The metadata CID of each token that was uploaded but not known to be minted.
+        mutable (bool): Whether the tokens are mutable.
+
+    Returns:
+        dict[int, int]: The asset ID of each token that was minted.
+    """
+    if not metadata_cids:
+        return {}
+    account_info = client.account_info(creator_address)
+    if not isinstance(account_info, dict):
+        raise click.ClickException("Invalid account info response")
+    created = {
+        (asset["params"].get("url", ""), asset["params"].get("reserve", "")): int(asset["index"])
+        for asset in account_info.get("created-assets", [])
+    }
+    minted = {}
+    for index, metadata_cid in metadata_cids.items():
+        asset_id = created.get(get_token_url_and_reserve(metadata_cid, mutable=mutable))
+        if asset_id is not None:
+            minted[index] = asset_id
+    return minted
+
+
+def _is_retryable(ex: Exception) -> bool:
+    if isinstance(ex, PinataError):
+        status_code = ex.response.status_code
+        return status_code == httpx.codes.TOO_MANY_REQUESTS or status_code >= httpx.codes.INTERNAL_SERVER_ERROR
+    return isinstance(ex, httpx.TransportError)
+
+
+def _upload_with_retries(file_path: Path, jwt: str, name: str) -> PinataUpload:
+    attempt = 0
+    while True:
+        try:
+            return upload_file_to_pinata(file_path, jwt=jwt, name=name)
+        except Exception as ex:
+            if attempt == UPLOAD_RETRIES or not _is_retryable(ex):
+                raise
+            logger.debug(f"Retrying upload of {name} after error: {ex}")
+            time.sleep(UPLOAD_RETRY_DELAY * 2**attempt)
+            attempt += 1
+
+
+def _load_token_metadata(token: CollectionToken, image_cid: str | None, image_integrity: str | None) -> TokenMetadata:
+    token_metadata = TokenMetadata.from_json_file(token.metadata_path, token.name, token.decimals)
+    if token.image_path and image_cid:
+        token_metadata.image = "ipfs://" + image_cid
+        token_metadata.image_integrity = image_integrity or _file_integrity(token.image_path)
+        token_metadata.image_mimetype = _file_mimetype(token.image_path)
+    return token_metadata
+
+
+def _upload_token(token: CollectionToken, jwt: str, previous: dict[str, Any]) -> TokenUpload:
+    upload = TokenUpload(token=token, image_cid=previous.get("image_cid"), metadata_cid=previous.get("metadata_cid"))
+    try:
+        image_integrity = None
+        if token.image_path and not upload.image_cid:
+            image_upload = _upload_with_retries(token.image_path, jwt, token.image_path.name)
+            upload.image_cid, image_integrity = image_upload.cid, "sha-256" + image_upload.sha256
+        upload.metadata = _load_token_metadata(token, upload.image_cid, image_integrity)
+        if not upload.metadata_cid:
+            metadata_path = upload.metadata.to_file_path()
+            try:
+                upload.metadata_cid = _upload_with_retries(metadata_path, jwt, f"{token.index}.json").cid
+            finally:
+                metadata_path.unlink(missing_ok=True)
+    except Exception as ex:
+        logger.debug(f"Failed to upload token {token.index}", exc_info=True)
+        upload.error = str(ex)
+    return upload
+
+
+def upload_tokens(
+    tokens: Iterable[CollectionToken],
+    jwt: str,
+    *,
+    concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    previous_results: dict[int, dict[str, Any]] | None = None,
+) -> Iterator[TokenUpload]:
+    """Upload the images and metadata of tokens to Piñata, several tokens at a time, yielding each as it completes.
+
+    Files that a previous run already uploaded, according to `previous_results`, aren't uploaded again. Uploads that
+    fail with a transient error are retried, and failures are reported in the `TokenUpload` rather than raised.
+    """
+    previous_results = previous_results or {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(_upload_token, token, jwt, previous_results.get(token.index, {})) for token in tokens
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # don't start the remaining uploads if the caller stopped consuming them
+            for future in futures:
+                future.cancel()
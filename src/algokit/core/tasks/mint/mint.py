@@ -13,7 +13,7 @@ from algosdk.transaction import wait_for_confirmation
 from algosdk.v2client import algod
 from multiformats import CID
 
-from algokit.core.tasks.ipfs import upload_to_pinata
+from algokit.core.tasks.ipfs import file_sha256, upload_file_to_pinata, upload_to_pinata
 from algokit.core.tasks.mint.models import AssetConfigTxnParams, TokenMetadata
 
 logger = logging.getLogger(__name__)
@@ -75,10 +75,7 @@ def _file_integrity(filename: pathlib.Path) -> str:
     Returns:
         str: The integrity of the file in the format "sha-256<hash>".
     """
-    with filename.open("rb") as f:
-        file_bytes = f.read()  # read entire file as bytes
-        readable_hash = hashlib.sha256(file_bytes).hexdigest()
-        return "sha-256" + readable_hash
+    return "sha-256" + file_sha256(filename)
 
 
 def _file_mimetype(filename: pathlib.Path) -> str:
@@ -141,6 +138,71 @@ def _create_asset_txn(
     return transaction.AssetConfigTxn(**asdict(asset_config_params))  # type: ignore[no-untyped-call]
 
 
+def get_token_url_and_reserve(metadata_cid: str, *, mutable: bool) -> tuple[str, str]:
+    """
+    Returns the URL and reserve address of a token with the given metadata CID.
+
+    Mutable tokens are ARC19 tokens, which share a template URL and point at their metadata with the reserve address.
+    Immutable tokens are ARC3 tokens, which point at their metadata with the URL and have no reserve address.
+
+    Args:
+        metadata_cid (str): The CID of the token's metadata.
+        mutable (bool): Whether the token is mutable.
+
+    Returns:
+        tuple[str, str]: The URL and the reserve address of the token.
+    """
+    if mutable:
+        return _create_url_from_cid(metadata_cid) + "#arc3", _reserve_address_from_cid(metadata_cid)
+    return "ipfs://" + metadata_cid + "#arc3", ""
+
+
+def build_asset_config_txn(  # noqa: PLR0913
+    *,
+    suggested_params: transaction.SuggestedParams,
+    creator_address: str,
+    unit_name: str,
+    total: int,
+    token_metadata: TokenMetadata,
+    metadata_cid: str,
+    mutable: bool,
+) -> transaction.AssetConfigTxn:
+    """
+    Build the asset creation transaction of a token whose metadata has been uploaded to IPFS.
+
+    Args:
+        suggested_params (SuggestedParams): The suggested params to build the transaction with.
+        creator_address (str): The address of the account that will create the token.
+        unit_name (str): A string representing the unit name of the token.
+        total (int): An integer representing the total supply of the token.
+        token_metadata (TokenMetadata): The metadata of the token, as uploaded.
+        metadata_cid (str): The CID of the uploaded metadata.
+        mutable (bool): A boolean indicating whether the token is mutable or not.
+
+    Returns:
+        AssetConfigTxn: The asset creation transaction.
+    """
+    url, reserve = get_token_url_and_reserve(metadata_cid, mutable=mutable)
+    asset_config_params = AssetConfigTxnParams(
+        sender=creator_address,
+        sp=suggested_params,
+        reserve=reserve,
+        unit_name=unit_name,
+        asset_name=token_metadata.name,
+        url=url,
+        manager=creator_address if mutable else "",
+        total=total,
+        decimals=token_metadata.decimals,
+    )
+
+    logger.debug(f"Asset config params: {asset_config_params.to_json()}")
+    return _create_asset_txn(
+        asset_config_params=asset_config_params,
+        token_metadata=token_metadata,
+        use_metadata_hash=not mutable,
+    )
+
+
 def mint_token(  # noqa: PLR0913
     *,
     client: algod.AlgodClient,
@@ -179,10 +241,12 @@ def mint_token(  # noqa: PLR0913
     """
 
     if image_path:
-        token_metadata.image_integrity = _file_integrity(image_path)
         token_metadata.image_mimetype = _file_mimetype(image_path)
         logger.info("Uploading image to pinata...")
-        token_metadata.image = "ipfs://" + upload_to_pinata(image_path, jwt=jwt)
+        # the image is hashed as it's uploaded, rather than read once to hash it and again to upload it
+        image_upload = upload_file_to_pinata(image_path, jwt=jwt)
+        token_metadata.image = "ipfs://" + image_upload.cid
+        token_metadata.image_integrity = "sha-256" + image_upload.sha256
         logger.info(f"Image uploaded to pinata: {token_metadata.image}")
 
     logger.info("Uploading metadata to pinata...")
@@ -192,23 +256,14 @@ def mint_token(  # noqa: PLR0913
     )
     logger.info(f"Metadata uploaded to pinata: {metadata_cid}")
 
-    asset_config_params = AssetConfigTxnParams(
-        sender=creator_account.address,
-        sp=client.suggested_params(),
-        reserve=_reserve_address_from_cid(metadata_cid) if mutable else "",
+    asset_config_txn = build_asset_config_txn(
+        suggested_params=client.suggested_params(),
+        creator_address=creator_account.address,
         unit_name=unit_name,
-        asset_name=token_metadata.name,
-        url=_create_url_from_cid(metadata_cid) + "#arc3" if mutable else "ipfs://" + metadata_cid + "#arc3",
-        manager=creator_account.address if mutable else "",
         total=total,
-        decimals=token_metadata.decimals,
-    )
-
-    logger.debug(f"Asset config params: {asset_config_params.to_json()}")
-    asset_config_txn = _create_asset_txn(
-        asset_config_params=asset_config_params,
         token_metadata=token_metadata,
-        use_metadata_hash=not mutable,
+        metadata_cid=metadata_cid,
+        mutable=mutable,
     )
     signed_asset_config_txn = asset_config_txn.sign(creator_account.private_key)  # type: ignore[no-untyped-call]
     asset_config_txn_id = client.send_transaction(signed_asset_config_txn)
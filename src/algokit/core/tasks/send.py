@@ -0,0 +1,231 @@
+import dataclasses
+import logging
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+import algosdk
+from algosdk import transaction
+from algosdk.transaction import SignedTransaction, Transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEND_CONCURRENCY = 8
+# how many rounds to keep polling for confirmation after submitting, before giving up on a transaction
+DEFAULT_CONFIRMATION_ROUNDS = 10
+# while submitting, the pending transactions are checked once this many have been submitted since the last check,
+# or a round has probably passed, so they're confirmed while algod still reports them as recently confirmed
+CONFIRMATION_BATCH_SIZE = 256
+CONFIRMATION_CHECK_INTERVAL = 2.8
+# how many times commands that send many groups retry submitting a group that failed with a transient error
+DEFAULT_SUBMIT_RETRIES = 3
+# seconds to wait before the first retry of a failed submission, doubling for each retry after that
+SUBMIT_RETRY_DELAY = 1.0
+
+
+@dataclasses.dataclass
+class SendResult:
+    """The outcome of sending a single transaction."""
+
+    index: int
+    txid: str
+    confirmed_round: int | None = None
+    # the ID of the asset the transaction created, if it was an asset creation
+    asset_index: int | None = None
+    error: str | None = None
+
+
+@dataclasses.dataclass
+class _PendingTransaction:
+    result: SendResult
+    last_valid_round: int
+    submitted_round: int
+
+
+@dataclasses.dataclass
+class _Unit:
+    """Transactions that are submitted together: a single ungrouped transaction, or an atomic group."""
+
+    index: int
+    txns: list[SignedTransaction]
+
+
+def iter_atomic_groups(txns: Iterable[Transaction]) -> Iterator[list[Transaction]]:
+    """Group transactions into atomic groups of up to `algosdk.constants.TX_GROUP_LIMIT`, as they're consumed."""
+    group: list[Transaction] = []
+    for txn in txns:
+        group.append(txn)
+        if len(group) == algosdk.constants.TX_GROUP_LIMIT:
+            yield transaction.assign_group_id(group)  # type: ignore[no-untyped-call]
+            group = []
+    if group:
+        yield transaction.assign_group_id(group) if len(group) > 1 else group  # type: ignore[no-untyped-call]
+
+
+def _iter_units(txns: Iterable[SignedTransaction]) -> Iterator[_Unit]:
+    group: _Unit | None = None
+    for index, txn in enumerate(txns):
+        group_id = txn.transaction.group
+        if group is not None and group_id != group.txns[0].transaction.group:
+            yield group
+            group = None
+        if group_id is None:
+            # ungrouped transactions are submitted as soon as they're read, rather than when the next one is
+            yield _Unit(index=index, txns=[txn])
+        elif group is None:
+            group = _Unit(index=index, txns=[txn])
+        else:
+            group.txns.append(txn)
+    if group is not None:
+        yield group
+
+
+def _submit(algod_client: algosdk.v2client.algod.AlgodClient, unit: _Unit) -> None:
+    if len(unit.txns) == 1:
+        algod_client.send_transaction(unit.txns[0])
+    else:
+        algod_client.send_transactions(unit.txns)
+
+
+def _is_retryable(ex: Exception) -> bool:
+    # algod rejecting a transaction is final, anything else (timeouts, dropped connections, 5xx) may be transient
+    return not isinstance(ex, algosdk.error.AlgodHTTPError) or ex.code is None or ex.code >= 500  # noqa: PLR2004
+
+
+def _submit_with_retries(algod_client: algosdk.v2client.algod.AlgodClient, unit: _Unit, retries: int) -> None:
+    for attempt in range(retries + 1):
+        try:
+            _submit(algod_client, unit)
+        except Exception as ex:
+            if attempt and "already in ledger" in str(ex):
+                # an earlier attempt that appeared to fail got through after all
+                return
+            if attempt == retries or not _is_retryable(ex):
+                raise
+            logger.debug(f"Retrying submission of transaction {unit.index + 1} after error: {ex}")
+            time.sleep(SUBMIT_RETRY_DELAY * 2**attempt)
+        else:
+            return
+
+
+def _get_pending_info(algod_client: algosdk.v2client.algod.AlgodClient, txid: str) -> dict | Exception:
+    try:
+        info = algod_client.pending_transaction_info(txid)
+    except Exception as ex:
+        return ex
+    return info if isinstance(info, dict) else {}
+
+
+class PipelinedSender:
+    """Sends signed transactions with several submissions in flight at once, and confirms them in batches.
+
+    Atomic groups are submitted together, everything else is submitted a transaction at a time. Submissions that
+    fail with a transient error are retried up to `retries` times. Once submitted, the pending transactions are
+    polled together in batches while the rest are submitted, then once per round until they're all confirmed, rather
+    than waiting for each in turn. A transaction is given up on `confirmation_rounds` after the round it was
+    submitted in.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        on_result: Callable[[SendResult], None],
+        concurrency: int = DEFAULT_SEND_CONCURRENCY,
+        confirm: bool = True,
+        confirmation_rounds: int = DEFAULT_CONFIRMATION_ROUNDS,
+        retries: int = 0,
+    ) -> None:
+        self._algod_client = algod_client
+        self._on_result = on_result
+        self._concurrency = concurrency
+        self._confirm = confirm
+        self._confirmation_rounds = confirmation_rounds
+        self._retries = retries
+        self._pending: dict[str, _PendingTransaction] = {}
+        self._current_round = 0
+        self._unchecked = 0
+        self._last_checked = 0.0
+
+    def send(self, txns: Iterable[SignedTransaction]) -> None:
+        """Send the transactions, reporting the result of each transaction to `on_result` once it's known.
+
+        Transactions are consumed from `txns` as submission slots become free, so it can be a lazy iterable.
+        """
+        if self._confirm:
+            self._observe_round(self._algod_client.status())
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            in_flight: dict[Future[None], _Unit] = {}
+            try:
+                for unit in _iter_units(txns):
+                    if len(in_flight) >= self._concurrency:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self._handle_submission(future, in_flight.pop(future))
+                    if self._pending and (
+                        self._unchecked >= CONFIRMATION_BATCH_SIZE
+                        or time.monotonic() - self._last_checked >= CONFIRMATION_CHECK_INTERVAL
+                    ):
+                        self._observe_round(self._algod_client.status())
+                        self._check_pending(executor)
+                    in_flight[executor.submit(_submit_with_retries, self._algod_client, unit, self._retries)] = unit
+            finally:
+                # report what was submitted even if reading the transactions failed part way through
+                for future in list(in_flight):
+                    self._handle_submission(future, in_flight.pop(future))
+            if self._pending:
+                self._wait_for_confirmations(executor)
+
+    def _handle_submission(self, future: Future[None], unit: _Unit) -> None:
+        error = future.exception()
+        for index, txn in enumerate(unit.txns, start=unit.index):
+            result = SendResult(index=index, txid=txn.get_txid())  # type: ignore[no-untyped-call]
+            if error is not None:
+                logger.debug(f"Failed to send transaction {result.txid}: {error}")
+                result.error = str(error)
+                self._on_result(result)
+            elif self._confirm:
+                self._pending[result.txid] = _PendingTransaction(
+                    result, txn.transaction.last_valid_round, self._current_round
+                )
+                self._unchecked += 1
+            else:
+                self._on_result(result)
+
+    def _observe_round(self, status: Any) -> None:  # noqa: ANN401
+        self._current_round = int(status["last-round"])
+        self._last_checked = time.monotonic()
+
+    def _check_pending(self, executor: ThreadPoolExecutor) -> None:
+        txids = list(self._pending)
+        logger.debug(f"Checking {len(txids)} pending transactions in round {self._current_round}")
+        self._unchecked = 0
+        for txid, info in zip(
+            txids, executor.map(lambda txid: _get_pending_info(self._algod_client, txid), txids), strict=True
+        ):
+            pending = self._pending[txid]
+            result = pending.result
+            if isinstance(info, Exception):
+                result.error = str(info)
+            elif info.get("confirmed-round"):
+                result.confirmed_round = int(info["confirmed-round"])
+                result.asset_index = info.get("asset-index")
+            elif info.get("pool-error"):
+                result.error = str(info["pool-error"])
+            elif pending.last_valid_round < self._current_round:
+                result.error = f"Transaction expired in round {pending.last_valid_round} without being confirmed"
+            elif self._current_round >= pending.submitted_round + self._confirmation_rounds:
+                result.error = f"Transaction not confirmed after {self._confirmation_rounds} rounds"
+            else:
+                continue
+            del self._pending[txid]
+            self._on_result(result)
+
+    def _wait_for_confirmations(self, executor: ThreadPoolExecutor) -> None:
+        self._observe_round(self._algod_client.status())
+        while True:
+            self._check_pending(executor)
+            if not self._pending:
+                return
+            self._observe_round(self._algod_client.status_after_block(self._current_round))
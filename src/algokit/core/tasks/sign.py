@@ -0,0 +1,114 @@
+import base64
+import dataclasses
+import logging
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import click
+import msgpack  # type: ignore[import-untyped]
+from algosdk import encoding
+from algosdk.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# transactions are handed to the signing processes in chunks of this size, to amortise the cost of sending them over
+SIGNING_CHUNK_SIZE = 1000
+# keys a goal clerk compatible file record has when it holds an already signed transaction
+SIGNED_RECORD_KEYS = ("sig", "msig", "lsig")
+
+
+@dataclasses.dataclass
+class TransactionsSummary:
+    """Totals of a batch of transactions, shown instead of the transactions themselves before signing them."""
+
+    count: int = 0
+    types: Counter[str] = dataclasses.field(default_factory=Counter)
+    fees: int = 0
+    algos: int = 0
+    assets: Counter[int] = dataclasses.field(default_factory=Counter)
+    senders: set[str] = dataclasses.field(default_factory=set)
+    receivers: set[str] = dataclasses.field(default_factory=set)
+
+
+def iter_transaction_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Read the unsigned transactions in a goal clerk compatible file one at a time, as msgpack dicts.
+
+    Raises:
+        click.ClickException: If the file holds signed transactions, or records that aren't transactions.
+    """
+    with path.open("rb") as file:
+        for index, record in enumerate(msgpack.Unpacker(file, raw=False), start=1):
+            if not isinstance(record, dict):
+                raise click.ClickException(f"Transaction {index} in {path} isn't a valid transaction")
+            if any(key in record for key in SIGNED_RECORD_KEYS):
+                raise click.ClickException(f"Transaction {index} in {path} is already signed!")
+            if "txn" in record:
+                record = record["txn"]  # noqa: PLW2901
+            if not isinstance(record, dict) or "type" not in record:
+                raise click.ClickException(f"Transaction {index} in {path} isn't a valid transaction")
+            yield record
+
+
+def summarise_transactions(records: Iterable[dict[str, Any]]) -> TransactionsSummary:
+    summary = TransactionsSummary()
+    for record in records:
+        summary.count += 1
+        summary.types[record["type"]] += 1
+        summary.fees += record.get("fee", 0)
+        summary.senders.add(encoding.encode_address(record.get("snd")))  # type: ignore[no-untyped-call]
+        if record["type"] == "pay":
+            summary.algos += record.get("amt", 0)
+            receiver = record.get("rcv")
+        elif record["type"] == "axfer":
+            summary.assets[record.get("xaid", 0)] += record.get("aamt", 0)
+            receiver = record.get("arcv")
+        else:
+            continue
+        if receiver:
+            summary.receivers.add(encoding.encode_address(receiver))  # type: ignore[no-untyped-call]
+    return summary
+
+
+def sign_records(records: list[dict[str, Any]], private_key: str) -> list[tuple[str, bytes]]:
+    """Sign a chunk of transactions, returning the id and msgpack encoding of each signed transaction in turn."""
+    signed = []
+    for record in records:
+        signed_txn = Transaction.undictify(record).sign(private_key)  # type: ignore[no-untyped-call]
+        # msgpack_encode sorts the keys, as the canonical encoding the network expects requires
+        signed.append((signed_txn.get_txid(), base64.b64decode(encoding.msgpack_encode(signed_txn))))  # type: ignore[no-untyped-call]
+    return signed
+
+
+def _iter_chunks(records: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def sign_transactions_file(
+    path: Path, private_key: str, *, workers: int, chunk_size: int = SIGNING_CHUNK_SIZE
+) -> Iterator[tuple[str, bytes]]:
+    """Sign the transactions in a goal clerk compatible file across worker processes, in the order they're in the file.
+
+    The file is read incrementally and only a few chunks per worker are in flight at once, so signing takes constant
+    memory however many transactions the file holds.
+
+    Yields:
+        tuple[str, bytes]: The id and msgpack encoding of each signed transaction.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight: deque[Future[list[tuple[str, bytes]]]] = deque()
+        for chunk in _iter_chunks(iter_transaction_records(path), chunk_size):
+            if len(in_flight) >= 2 * workers:
+                yield from in_flight.popleft().result()
+            in_flight.append(executor.submit(sign_records, chunk, private_key))
+        while in_flight:
+            yield from in_flight.popleft().result()
@@ -0,0 +1,71 @@
+import struct
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import click
+import msgpack  # type: ignore[import-untyped]
+from algosdk.transaction import SignedTransaction
+
+# a transaction stream is this header followed by a frame per transaction: the length of the transaction as a 4 byte
+# big-endian unsigned integer, then the msgpack encoded transaction itself
+STREAM_MAGIC = b"ALGOKIT-TXNS\x01"
+FRAME_LENGTH = struct.Struct(">I")
+# far larger than any valid transaction, so corrupt lengths are reported rather than allocated
+MAX_FRAME_SIZE = 1024 * 1024
+
+
+class TransactionStreamWriter:
+    """Writes msgpack encoded transactions to a binary stream as they become available."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self._stream.write(STREAM_MAGIC)
+
+    def write(self, encoded_txn: bytes) -> None:
+        self._stream.write(FRAME_LENGTH.pack(len(encoded_txn)))
+        self._stream.write(encoded_txn)
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def iter_transaction_stream(stream: BinaryIO) -> Iterator[bytes]:
+    """Read the msgpack encoded transactions from a binary stream one at a time, as they arrive.
+
+    Expects the stream header to have been read already, see `STREAM_MAGIC`.
+
+    Raises:
+        click.ClickException: If the stream is truncated or corrupt.
+    """
+    while header := _read_exactly(stream, FRAME_LENGTH.size):
+        if len(header) < FRAME_LENGTH.size:
+            raise click.ClickException("Transaction stream ended part way through a transaction!")
+        (size,) = FRAME_LENGTH.unpack(header)
+        if size > MAX_FRAME_SIZE:
+            raise click.ClickException("Invalid transaction stream content!")
+        encoded_txn = _read_exactly(stream, size)
+        if len(encoded_txn) < size:
+            raise click.ClickException("Transaction stream ended part way through a transaction!")
+        yield encoded_txn
+
+
+def decode_signed_transaction(encoded_txn: bytes) -> SignedTransaction:
+    """Decode a msgpack encoded signed transaction.
+
+    Raises:
+        click.ClickException: If it isn't a signed transaction.
+    """
+    try:
+        txn = msgpack.unpackb(encoded_txn, raw=False)
+    except ValueError as ex:
+        raise click.ClickException("Invalid transaction stream content!") from ex
+    if not isinstance(txn, dict) or "sig" not in txn:
+        raise click.ClickException("Supplied transaction is not signed!")
+    return SignedTransaction.undictify(txn)  # type: ignore[no-untyped-call,no-any-return]
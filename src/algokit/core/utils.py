@@ -13,11 +13,11 @@ from itertools import cycle
 from os import environ
 from pathlib import Path
 from shutil import which
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import click
 import dotenv
-from algokit_utils import AlgorandClient
+from algokit_utils import AlgoClientNetworkConfig, AlgorandClient, ClientManager
 
 from algokit.core import proc
 
@@ -25,6 +25,9 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
 
     from algokit.cli.common.constants import AlgorandNetwork
+    from algokit.core.sandbox import ComposeSandbox
+
+T = TypeVar("T")
 
 CLEAR_LINE = "\033[K"
 SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
@@ -103,6 +106,22 @@ def run_with_animation(
     return result
 
 
+def with_click_context(func: Callable[..., T]) -> Callable[..., T]:
+    """Wrap a function so it runs in the current click context, even on another thread.
+
+    Console logging depends on the click context (e.g. `--no-color`), which is otherwise only set on the main thread.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return func
+
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with ctx.scope(cleanup=False):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
 def find_valid_pipx_command(error_message: str) -> list[str]:
     for pipx_command in get_candidate_pipx_commands():
         try:
@@ -291,14 +310,32 @@ def alphanumeric_sort_key(s: str) -> list[int | str]:
 
 @cache
 def get_algorand_client_for_network(network: AlgorandNetwork) -> AlgorandClient:
-    from algokit.cli.common.constants import AlgorandNetwork
+    """Get a client for a network, that shares its algod client with `get_network_algod_client`."""
+    from algokit.core.algod_clients import get_network_algod_client, get_network_client_configs
+
+    configs = get_network_client_configs(network)
+    return AlgorandClient.from_clients(
+        algod=get_network_algod_client(network),
+        indexer=ClientManager.get_indexer_client(configs.indexer_config) if configs.indexer_config else None,
+        kmd=ClientManager.get_kmd_client(configs.kmd_config) if configs.kmd_config else None,
+    )
 
-    match network:
-        case AlgorandNetwork.MAINNET:
-            return AlgorandClient.mainnet()
-        case AlgorandNetwork.TESTNET:
-            return AlgorandClient.testnet()
-        case AlgorandNetwork.LOCALNET:
-            return AlgorandClient.default_localnet()
-        case _:
-            raise ValueError(f"Unsupported network: {network}")
+
+def get_algorand_client_for_sandbox(sandbox: ComposeSandbox) -> AlgorandClient:
+    """Get a client for a LocalNet instance, which may have been started with non default ports."""
+    from algokit.cli.common.constants import AlgorandNetwork
+    from algokit.core.sandbox import SandboxPorts
+
+    if sandbox.ports == SandboxPorts() and sandbox.has_indexer:
+        return get_algorand_client_for_network(AlgorandNetwork.LOCALNET)
+
+    env = sandbox.connection_env()
+    return AlgorandClient.from_config(
+        algod_config=AlgoClientNetworkConfig(env["ALGOD_SERVER"], env["ALGOD_TOKEN"], env["ALGOD_PORT"]),
+        indexer_config=(
+            AlgoClientNetworkConfig(env["INDEXER_SERVER"], env["INDEXER_TOKEN"], env["INDEXER_PORT"])
+            if sandbox.has_indexer
+            else None
+        ),
+        kmd_config=AlgoClientNetworkConfig(env["KMD_SERVER"], env["KMD_TOKEN"], env["KMD_PORT"]),
+    )
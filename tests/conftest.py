@@ -18,7 +18,9 @@ from prompt_toolkit.output import DummyOutput
 from pytest_mock import MockerFixture
 
 from algokit.core import questionary_extensions
+from algokit.core.algod_clients import get_network_algod_client
 from algokit.core.project import get_project_configs, get_project_dir_names_from_workspace
+from algokit.core.utils import get_algorand_client_for_network
 from tests.utils.app_dir_mock import AppDirs, tmp_app_dir
 from tests.utils.proc_mock import ProcMock
 
@@ -228,6 +230,8 @@ def dummy_algokit_template_with_python_task(tmp_path_factory: pytest.TempPathFac
 def _clear_caches(mocker: MockerFixture) -> None:
     get_project_dir_names_from_workspace.cache_clear()
     get_project_configs.cache_clear()
+    get_network_algod_client.cache_clear()
+    get_algorand_client_for_network.cache_clear()
     mocker.patch("algokit.core.config_commands.container_engine.get_container_engine", return_value="docker")
 
 
@@ -240,4 +244,31 @@ def _always_check_image_versions(mocker: MockerFixture, request: pytest.FixtureR
     if "use_real_image_version_cache" in [marker.name for marker in request.node.iter_markers()]:
         return
     mocker.patch("algokit.core.sandbox._should_check_image_versions", return_value=True)
+    mocker.patch("algokit.core.sandbox._get_image_version_cache", return_value=None)
     mocker.patch("algokit.core.sandbox._update_image_version_cache")
+    # check one image at a time, so the logged commands and requests are in a deterministic order
+    mocker.patch("algokit.core.sandbox.IMAGE_VERSION_CHECK_WORKERS", 1)
+
+
+@pytest.fixture(autouse=True)
+def _disable_container_api(mocker: MockerFixture, request: pytest.FixtureRequest) -> None:
+    """Ensure the container engine CLI is used in tests, rather than a real container engine API socket.
+
+    Tests can opt-out of this by using @pytest.mark.use_container_api
+    """
+    if "use_container_api" in [marker.name for marker in request.node.iter_markers()]:
+        return
+    mocker.patch("algokit.core.container_api.find_container_api_socket", return_value=None)
+
+
+@pytest.fixture(autouse=True)
+def _disable_localnet_state_cache(mocker: MockerFixture, request: pytest.FixtureRequest) -> None:
+    """Ensure LocalNet state is always probed in tests, rather than read from the LocalNet state cache.
+
+    Tests can opt-out of this by using @pytest.mark.use_localnet_state_cache
+    """
+    if "use_localnet_state_cache" in [marker.name for marker in request.node.iter_markers()]:
+        return
+    mocker.patch("algokit.core.sandbox.get_cached_state", return_value=None)
+    mocker.patch("algokit.core.sandbox.cache_state")
+    mocker.patch("algokit.core.sandbox.invalidate_localnet_state_cache")
@@ -1,11 +1,24 @@
 import json
+import os
+import shutil
 from pathlib import Path
 from subprocess import CompletedProcess
 
+import click
 import pytest
 from pytest_httpx import HTTPXMock
 from pytest_mock import MockerFixture
 
+from algokit.core.goal import (
+    BATCH_EXIT_MARKER,
+    build_batch_script,
+    parse_batch_commands,
+    parse_batch_output,
+    post_process,
+    preprocess_command_args,
+    snapshot_volume_mount,
+    stage_file,
+)
 from algokit.core.sandbox import (
     ALGOD_HEALTH_URL,
     INDEXER_HEALTH_URL,
@@ -601,3 +614,223 @@ def test_goal_simple_args_with_input_output_files_with_dot_convention_name(
     verify(
         _normalize_output(result.output.replace("\\\\", "\\").replace(str(app_dir_mock.app_config_dir), "{app_config}"))
     )
+
+
+def test_goal_batch_script_round_trip() -> None:
+    commands = parse_batch_commands(
+        "# fund the account\ngoal clerk send -a 1 -f A -t B\n\n"
+        "account list  # no leading goal\nclerk inspect 'a b.tx'\n"
+    )
+
+    assert commands == [
+        ["clerk", "send", "-a", "1", "-f", "A", "-t", "B"],
+        ["account", "list"],
+        ["clerk", "inspect", "a b.tx"],
+    ]
+    assert "goal clerk inspect 'a b.tx' < /dev/null 2>&1" in build_batch_script(commands)
+
+    results = parse_batch_output(
+        commands,
+        f"Sent\n{BATCH_EXIT_MARKER} 0 0\nNo accounts\nfound\n{BATCH_EXIT_MARKER} 1 1\npartial output\n",
+    )
+
+    assert [(result.exit_code, result.output) for result in results] == [
+        (0, "Sent\n"),
+        (1, "No accounts\nfound\n"),
+        (None, "partial output\n"),
+    ]
+
+
+def test_goal_batch_unbalanced_quotes() -> None:
+    with pytest.raises(click.ClickException, match="line 2 of the batch: No closing quotation"):
+        parse_batch_commands("account list\nclerk inspect 'a b.tx\n")
+
+
+def test_goal_batch_output_without_trailing_newline() -> None:
+    commands = [["account", "new"], ["account", "list"]]
+
+    results = parse_batch_output(
+        commands, f"Created account{BATCH_EXIT_MARKER} 0 0\nNo accounts{BATCH_EXIT_MARKER} 1 1\n"
+    )
+
+    assert [(result.exit_code, result.output) for result in results] == [
+        (0, "Created account"),
+        (1, "No accounts"),
+    ]
+
+
+@pytest.mark.usefixtures(
+    "_setup_input_files",
+    "_setup_latest_dummy_compose",
+    "_mock_proc_with_running_localnet",
+    "_mock_proc_with_algod_running_state",
+)
+@pytest.mark.parametrize(
+    "_setup_input_files", [[{"name": "approval.teal", "content": DUMMY_CONTRACT_TEAL}]], indirect=True
+)
+def test_goal_batch(proc_mock: ProcMock, cwd: Path, app_dir_mock: AppDirs, mocked_goal_mount_path: Path) -> None:
+    (cwd / "batch.txt").write_text(
+        "clerk compile approval.teal -o approval.compiled\naccount list\nclerk send -a 1 -f A -t B\n", encoding="utf-8"
+    )
+    proc_mock.set_output(
+        ["docker", "exec", "--interactive", "--workdir", "/root", "algokit_sandbox_algod", "sh"],
+        output=[
+            f"{BATCH_EXIT_MARKER} 0 0",
+            "[online] ACCOUNT 0 microAlgos",
+            f"{BATCH_EXIT_MARKER} 1 0",
+            "Couldn't send transaction: invalid address",
+            f"{BATCH_EXIT_MARKER} 2 1",
+        ],
+        side_effect=dump_file,
+        side_effect_args={"cwd": mocked_goal_mount_path},
+    )
+
+    result = invoke("goal --batch batch.txt", cwd=cwd)
+
+    assert result.exit_code == 1
+    # a single goal session is used for the whole batch
+    assert [call.command[:2] for call in proc_mock.called].count(["docker", "exec"]) == 1
+    assert (cwd / "approval.compiled").exists()
+    assert not (mocked_goal_mount_path / "approval.teal").exists()
+    verify(
+        _normalize_output(result.output.replace("\\\\", "\\").replace(str(app_dir_mock.app_config_dir), "{app_config}"))
+    )
+
+
+def test_goal_batch_with_goal_args() -> None:
+    result = invoke("goal --batch - account list")
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--batch can't be combined" in result.output
+
+
+def test_stage_file_falls_back_to_copy(tmp_path: Path, mocker: MockerFixture) -> None:
+    mocker.patch("algokit.core.goal.os.link", side_effect=OSError("Invalid cross-device link"))
+    mocker.patch("algokit.core.goal._reflink", return_value=False)
+    volume_mount = tmp_path / "goal_mount"
+    volume_mount.mkdir()
+    (tmp_path / "approval.teal").write_text(DUMMY_CONTRACT_TEAL, encoding="utf-8")
+
+    staged = stage_file(tmp_path / "approval.teal", volume_mount)
+
+    assert staged.read_text(encoding="utf-8") == DUMMY_CONTRACT_TEAL
+    assert not staged.samefile(tmp_path / "approval.teal")
+
+
+def test_preprocess_command_args_reuses_staged_file(tmp_path: Path) -> None:
+    volume_mount = tmp_path / "goal_mount"
+    volume_mount.mkdir()
+    input_file = tmp_path / "approval.teal"
+    input_file.write_text(DUMMY_CONTRACT_TEAL, encoding="utf-8")
+    staged_files: dict[str, Path] = {}
+
+    first_inputs, _, first_args = preprocess_command_args(
+        ["clerk", "compile", str(input_file)], volume_mount, Path("/root/goal_mount"), staged_files
+    )
+    second_inputs, _, second_args = preprocess_command_args(
+        ["clerk", "compile", str(input_file)], volume_mount, Path("/root/goal_mount"), staged_files
+    )
+    # staged without tracking, e.g. by a previous command that wasn't cleaned up
+    third_inputs, _, _ = preprocess_command_args(
+        ["clerk", "compile", str(input_file)], volume_mount, Path("/root/goal_mount")
+    )
+
+    assert first_inputs == third_inputs == [input_file]
+    assert second_inputs == []
+    assert first_args == second_args
+    assert (volume_mount / "approval.teal").read_text(encoding="utf-8") == DUMMY_CONTRACT_TEAL
+
+
+def test_preprocess_command_args_rejects_different_files_with_the_same_name(tmp_path: Path) -> None:
+    volume_mount = tmp_path / "goal_mount"
+    volume_mount.mkdir()
+    for directory in ("first", "second"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "group.txn").write_text(directory, encoding="utf-8")
+    staged_files: dict[str, Path] = {}
+    preprocess_command_args(
+        ["clerk", "inspect", str(tmp_path / "first" / "group.txn")],
+        volume_mount,
+        Path("/root/goal_mount"),
+        staged_files,
+    )
+
+    with pytest.raises(click.ClickException, match="same file name"):
+        preprocess_command_args(
+            ["clerk", "inspect", str(tmp_path / "second" / "group.txn")],
+            volume_mount,
+            Path("/root/goal_mount"),
+            staged_files,
+        )
+
+    assert (volume_mount / "group.txn").read_text(encoding="utf-8") == "first"
+
+
+def test_post_process_only_moves_files_written_by_the_command(tmp_path: Path) -> None:
+    volume_mount = tmp_path / "goal_mount"
+    volume_mount.mkdir()
+    (volume_mount / "group.txn").write_text("left over from an earlier command", encoding="utf-8")
+    snapshot = snapshot_volume_mount(volume_mount)
+    (volume_mount / "group-0.txn").write_text("txn", encoding="utf-8")
+    (tmp_path / "out").mkdir()
+
+    post_process([], [tmp_path / "out" / "group.txn"], volume_mount, snapshot)
+
+    assert (tmp_path / "out" / "group-0.txn").read_text(encoding="utf-8") == "txn"
+    assert not (tmp_path / "out" / "group.txn").exists()
+    assert sorted(path.name for path in volume_mount.iterdir()) == ["group.txn"]
+
+
+@pytest.mark.usefixtures(
+    "_setup_latest_dummy_compose",
+    "_mock_proc_with_running_localnet",
+    "_mock_proc_with_algod_running_state",
+)
+def test_goal_stages_large_transaction_group_without_copying(
+    proc_mock: ProcMock, cwd: Path, mocked_goal_mount_path: Path, mocker: MockerFixture
+) -> None:
+    # large enough that copying it in and out of the volume mount would dominate the time taken by the command
+    (cwd / "group.gtxn").write_bytes(os.urandom(32 * 1024 * 1024))
+    copy = mocker.spy(shutil, "copy")
+
+    def split(volume_mount: Path) -> None:
+        assert (volume_mount / "group.gtxn").samefile(cwd / "group.gtxn")
+        for index in range(16):
+            (volume_mount / f"group-{index}.txn").write_bytes(b"txn")
+
+    proc_mock.set_output(
+        ["docker", "exec", "--interactive", "--workdir", "/root", "algokit_sandbox_algod", "goal", "clerk", "split"],
+        output=["Wrote transactions"],
+        side_effect=split,
+        side_effect_args={"volume_mount": mocked_goal_mount_path},
+    )
+
+    result = invoke("goal clerk split -i group.gtxn -o group.txn", cwd=cwd)
+
+    assert result.exit_code == 0
+    copy.assert_not_called()
+    assert all((cwd / f"group-{index}.txn").exists() for index in range(16))
+    assert list(mocked_goal_mount_path.iterdir()) == []
+
+
+@pytest.mark.usefixtures(
+    "_setup_input_files",
+    "_setup_latest_dummy_compose",
+    "_mock_proc_with_running_localnet",
+    "_mock_proc_with_algod_running_state",
+)
+@pytest.mark.parametrize(
+    "_setup_input_files", [[{"name": "approval.teal", "content": DUMMY_CONTRACT_TEAL}]], indirect=True
+)
+def test_goal_cleans_up_staged_files_when_goal_fails_to_run(
+    proc_mock: ProcMock, cwd: Path, mocked_goal_mount_path: Path
+) -> None:
+    proc_mock.should_fail_on(
+        ["docker", "exec", "--interactive", "--workdir", "/root", "algokit_sandbox_algod", "goal", "clerk", "compile"]
+    )
+
+    result = invoke("goal clerk compile approval.teal -o approval.compiled", cwd=cwd)
+
+    assert result.exit_code != 0
+    assert list(mocked_goal_mount_path.iterdir()) == []
+    assert (cwd / "approval.teal").exists()
@@ -4,7 +4,14 @@ import pytest
 from pytest_httpx import HTTPXMock
 from pytest_mock import MockerFixture
 
-from algokit.core.sandbox import ALGOD_HEALTH_URL, ALGORAND_IMAGE, INDEXER_HEALTH_URL, INDEXER_IMAGE
+from algokit.core.sandbox import (
+    ALGOD_HEALTH_URL,
+    ALGORAND_IMAGE,
+    CONDUIT_IMAGE,
+    INDEXER_HEALTH_URL,
+    INDEXER_IMAGE,
+    POSTGRES_IMAGE,
+)
 from tests.utils.app_dir_mock import AppDirs
 from tests.utils.proc_mock import ProcMock
 
@@ -23,7 +30,7 @@ def _health_success(httpx_mock: HTTPXMock) -> None:
 
 
 @pytest.fixture
-def _localnet_up_to_date(proc_mock: ProcMock, httpx_mock: HTTPXMock) -> None:
+def _algod_up_to_date(proc_mock: ProcMock, httpx_mock: HTTPXMock) -> None:
     arg = "{{range .RepoDigests}}{{println .}}{{end}}"
 
     proc_mock.set_output(
@@ -31,22 +38,58 @@ def _localnet_up_to_date(proc_mock: ProcMock, httpx_mock: HTTPXMock) -> None:
         ["tag@sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa\n"],
     )
 
+    httpx_mock.add_response(
+        url="https://registry.hub.docker.com/v2/repositories/algorand/algod/tags/latest",
+        json={
+            "digest": "sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        },
+    )
+
+
+@pytest.fixture
+def _indexer_dependencies_up_to_date(proc_mock: ProcMock, httpx_mock: HTTPXMock) -> None:
+    arg = "{{range .RepoDigests}}{{println .}}{{end}}"
+
     proc_mock.set_output(
-        ["docker", "image", "inspect", INDEXER_IMAGE, "--format", arg],
-        ["tag@sha256:bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb\n"],
+        ["docker", "image", "inspect", CONDUIT_IMAGE, "--format", arg],
+        ["tag@sha256:cccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccc\n"],
     )
 
     httpx_mock.add_response(
-        url="https://registry.hub.docker.com/v2/repositories/algorand/indexer/tags/latest",
+        url="https://registry.hub.docker.com/v2/repositories/algorandfoundation/conduit-localnet/tags/latest",
         json={
-            "digest": "sha256:bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb",
+            "digest": "sha256:cccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccc",
+        },
+    )
+
+    proc_mock.set_output(
+        ["docker", "image", "inspect", POSTGRES_IMAGE, "--format", arg],
+        ["tag@sha256:dddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddd\n"],
+    )
+
+    httpx_mock.add_response(
+        url="https://registry.hub.docker.com/v2/repositories/library/postgres/tags/16-alpine",
+        json={
+            "digest": "sha256:dddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddd",
         },
     )
 
+
+@pytest.fixture
+def _localnet_up_to_date(
+    proc_mock: ProcMock, httpx_mock: HTTPXMock, _algod_up_to_date: None, _indexer_dependencies_up_to_date: None
+) -> None:
+    arg = "{{range .RepoDigests}}{{println .}}{{end}}"
+
+    proc_mock.set_output(
+        ["docker", "image", "inspect", INDEXER_IMAGE, "--format", arg],
+        ["tag@sha256:bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb\n"],
+    )
+
     httpx_mock.add_response(
-        url="https://registry.hub.docker.com/v2/repositories/algorand/algod/tags/latest",
+        url="https://registry.hub.docker.com/v2/repositories/algorand/indexer/tags/latest",
         json={
-            "digest": "sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+            "digest": "sha256:bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb",
         },
     )
 
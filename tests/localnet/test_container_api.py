@@ -0,0 +1,113 @@
+import json
+import re
+from pathlib import Path
+
+import pytest
+from pytest_httpx import HTTPXMock
+from pytest_mock import MockerFixture
+
+from algokit.core.container_api import ContainerApiClient, find_container_api_socket
+from algokit.core.sandbox import ComposeSandbox
+from tests.utils.app_dir_mock import AppDirs
+from tests.utils.proc_mock import ProcMock
+
+CONTAINERS_URL = re.compile(r"http://localhost/containers/json\?.*")
+
+
+def _container(app_config_dir: Path, service: str, state: str = "running") -> dict[str, object]:
+    return {
+        "Names": [f"/algokit_sandbox_{service}"],
+        "State": state,
+        "Status": "Up 2 minutes",
+        "Labels": {
+            "com.docker.compose.project": "algokit_sandbox",
+            "com.docker.compose.service": service,
+            "com.docker.compose.project.config_files": str(app_config_dir / "sandbox" / "docker-compose.yml"),
+        },
+        "Ports": [{"IP": "0.0.0.0", "PrivatePort": 8080, "PublicPort": 4001, "Type": "tcp"}],
+    }
+
+
+@pytest.fixture
+def _container_api_socket(mocker: MockerFixture, tmp_path: Path) -> None:
+    mocker.patch("algokit.core.container_api.find_container_api_socket", return_value=tmp_path / "docker.sock")
+
+
+@pytest.mark.mock_platform_system("Linux")
+def test_find_container_api_socket_ignores_remote_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DOCKER_HOST", "tcp://remote:2375")
+
+    assert find_container_api_socket("docker") is None
+
+
+@pytest.mark.mock_platform_system("Windows")
+def test_find_container_api_socket_windows() -> None:
+    assert find_container_api_socket("docker") is None
+
+
+@pytest.mark.use_container_api
+@pytest.mark.usefixtures("proc_mock", "_container_api_socket")
+def test_list_from_environment_uses_container_api(app_dir_mock: AppDirs, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=CONTAINERS_URL,
+        json=[
+            _container(app_dir_mock.app_config_dir, "algod"),
+            _container(app_dir_mock.app_config_dir, "indexer"),
+        ],
+    )
+
+    sandboxes = ComposeSandbox.list_from_environment()
+
+    assert [sandbox.name for sandbox in sandboxes] == ["sandbox"]
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert json.loads(request.url.params["filters"]) == {"label": ["com.docker.compose.project"]}
+
+
+@pytest.mark.use_container_api
+@pytest.mark.usefixtures("proc_mock", "_container_api_socket")
+def test_ps_uses_container_api(app_dir_mock: AppDirs, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=CONTAINERS_URL, json=[_container(app_dir_mock.app_config_dir, "algod", "exited")])
+
+    ps = ComposeSandbox().ps("algod")
+
+    assert ps == [
+        {
+            "Name": "algokit_sandbox_algod",
+            "Service": "algod",
+            "State": "exited",
+            "Status": "Up 2 minutes",
+            "Publishers": [{"URL": "0.0.0.0", "TargetPort": 8080, "PublishedPort": 4001, "Protocol": "tcp"}],
+        }
+    ]
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert json.loads(request.url.params["filters"]) == {
+        "label": ["com.docker.compose.project=algokit_sandbox", "com.docker.compose.service=algod"]
+    }
+
+
+@pytest.mark.use_container_api
+@pytest.mark.usefixtures("_container_api_socket")
+def test_ps_falls_back_to_cli(app_dir_mock: AppDirs, proc_mock: ProcMock, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=CONTAINERS_URL, status_code=500)
+    proc_mock.set_output(
+        "docker compose ps algod --format json", [json.dumps([{"Service": "algod", "State": "running"}])]
+    )
+
+    ps = ComposeSandbox().ps("algod")
+
+    assert ps == [{"Service": "algod", "State": "running"}]
+    assert (app_dir_mock.app_config_dir / "sandbox").exists()
+
+
+def test_image_repo_digests(httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+    httpx_mock.add_response(
+        url="http://localhost/images/algorand/algod:latest/json",
+        json={"RepoDigests": ["algorand/algod@sha256:aaaa"]},
+    )
+    httpx_mock.add_response(url="http://localhost/images/algorand/indexer:latest/json", status_code=404)
+    client = ContainerApiClient(tmp_path / "docker.sock")
+
+    assert client.image_repo_digests("algorand/algod:latest") == ["algorand/algod@sha256:aaaa"]
+    assert client.image_repo_digests("algorand/indexer:latest") == []
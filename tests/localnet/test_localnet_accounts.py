@@ -0,0 +1,135 @@
+from collections.abc import Collection
+from unittest.mock import MagicMock
+
+import pytest
+from algokit_utils import AlgoAmount
+from algosdk import account, mnemonic, transaction
+from pytest_mock import MockerFixture
+
+from algokit.core.localnet_accounts import derive_accounts, fund_accounts
+from algokit.core.sandbox import SandboxSettings
+from tests.utils.app_dir_mock import AppDirs
+from tests.utils.approvals import verify
+from tests.utils.click_invoker import invoke
+
+
+def _mock_algorand(*, funded_addresses: Collection[str] = ()) -> MagicMock:
+    algorand = MagicMock()
+    dispenser_key, dispenser_address = account.generate_account()  # type: ignore[no-untyped-call]
+    algorand.account.localnet_dispenser.return_value = MagicMock(private_key=dispenser_key, address=dispenser_address)
+    algorand.account.get_information.side_effect = lambda address: MagicMock(
+        amount=AlgoAmount.from_micro_algo(1 if address in funded_addresses else 0)
+    )
+    algorand.client.algod.suggested_params.return_value = transaction.SuggestedParams(  # type: ignore[no-untyped-call]
+        fee=1000,
+        first=1,
+        last=1001,
+        gh="AQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQE=",
+        gen="dockernet-v1",
+        flat_fee=True,
+    )
+    algorand.client.algod.send_raw_transaction.side_effect = lambda payload: f"txid-{len(payload)}"
+    return algorand
+
+
+def test_derive_accounts_is_deterministic() -> None:
+    accounts = derive_accounts("seed", 3)
+
+    assert accounts == derive_accounts("seed", 3)
+    assert accounts[:2] == derive_accounts("seed", 2)
+    assert accounts != derive_accounts("another seed", 3)
+    assert len({funded.address for funded in accounts}) == 3  # noqa: PLR2004
+    assert mnemonic.to_private_key(accounts[0].mnemonic) == accounts[0].private_key  # type: ignore[no-untyped-call]
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_fund_accounts_sends_grouped_payments(mocker: MockerFixture) -> None:
+    wait_for_confirmation = mocker.patch("algokit.core.localnet_accounts.transaction.wait_for_confirmation")
+    algorand = _mock_algorand()
+
+    funded = fund_accounts(algorand, derive_accounts("seed", 20))
+
+    assert funded == 20  # noqa: PLR2004
+    assert algorand.client.algod.send_raw_transaction.call_count == 2  # noqa: PLR2004
+    wait_for_confirmation.assert_called_once()
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_fund_accounts_skips_funded_accounts(mocker: MockerFixture) -> None:
+    mocker.patch("algokit.core.localnet_accounts.transaction.wait_for_confirmation")
+    accounts = derive_accounts("seed", 20)
+    algorand = _mock_algorand(funded_addresses={funded.address for funded in accounts})
+
+    assert fund_accounts(algorand, accounts) == 0
+    algorand.client.algod.send_raw_transaction.assert_not_called()
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_fund_accounts_funds_every_unfunded_account(mocker: MockerFixture) -> None:
+    mocker.patch("algokit.core.localnet_accounts.transaction.wait_for_confirmation")
+    accounts = derive_accounts("seed", 20)
+    # the last account is funded, e.g. after a failed group, but earlier ones aren't
+    algorand = _mock_algorand(funded_addresses={funded.address for funded in accounts[:10] + accounts[-1:]})
+
+    assert fund_accounts(algorand, accounts) == 9  # noqa: PLR2004
+    algorand.client.algod.send_raw_transaction.assert_called_once()
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_fund_accounts_refreshes_params_per_chunk(mocker: MockerFixture) -> None:
+    mocker.patch("algokit.core.localnet_accounts.transaction.wait_for_confirmation")
+    mocker.patch("algokit.core.localnet_accounts.FUNDING_PARAMS_REFRESH_GROUPS", 2)
+    algorand = _mock_algorand()
+
+    assert fund_accounts(algorand, derive_accounts("seed", 80)) == 80  # noqa: PLR2004
+    assert algorand.client.algod.send_raw_transaction.call_count == 5  # noqa: PLR2004
+    assert algorand.client.algod.suggested_params.call_count == 3  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_fund_accounts_only_checks_last_account_once_funded(mocker: MockerFixture) -> None:
+    mocker.patch("algokit.core.localnet_accounts.transaction.wait_for_confirmation")
+    accounts = derive_accounts("seed", 20)
+    algorand = _mock_algorand()
+    assert fund_accounts(algorand, accounts) == 20  # noqa: PLR2004
+    algorand.account.get_information.reset_mock()
+    algorand.account.get_information.side_effect = lambda _address: MagicMock(amount=AlgoAmount.from_micro_algo(1))
+
+    assert fund_accounts(algorand, accounts) == 0
+    algorand.account.get_information.assert_called_once_with(accounts[-1].address)
+
+    # more accounts are checked in full
+    assert fund_accounts(algorand, derive_accounts("seed", 30)) == 0
+    assert algorand.account.get_information.call_count == 31  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_fund_accounts_checks_every_account_once_last_account_is_emptied(mocker: MockerFixture) -> None:
+    mocker.patch("algokit.core.localnet_accounts.transaction.wait_for_confirmation")
+    accounts = derive_accounts("seed", 20)
+    assert fund_accounts(_mock_algorand(), accounts) == 20  # noqa: PLR2004
+
+    # e.g. a reset network with the same genesis hash
+    algorand = _mock_algorand()
+    assert fund_accounts(algorand, accounts) == 20  # noqa: PLR2004
+    assert algorand.account.get_information.call_count == 21  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("proc_mock", "_mock_proc_with_running_localnet")
+def test_localnet_accounts(app_dir_mock: AppDirs) -> None:
+    sandbox_dir = app_dir_mock.app_config_dir / "sandbox"
+    sandbox_dir.mkdir()
+    SandboxSettings(prefunded_accounts=2, accounts_seed="test").save(sandbox_dir / "settings.json")
+
+    result = invoke("localnet accounts")
+
+    assert result.exit_code == 0
+    verify(result.output.replace(str(app_dir_mock.app_config_dir), "{app_config}").replace("\\", "/"))
+
+
+@pytest.mark.usefixtures("proc_mock", "_mock_proc_with_running_localnet")
+def test_localnet_accounts_none_prefunded() -> None:
+    result = invoke("localnet accounts")
+
+    assert result.exit_code == 1
+    assert "has no prefunded accounts" in result.output
@@ -0,0 +1,92 @@
+from unittest.mock import MagicMock
+
+import click
+import pytest
+from algokit_utils import SigningAccount
+from algosdk import account, error, transaction
+from pytest_mock import MockerFixture
+
+from algokit.core.localnet_advance import advance_rounds
+from algokit.core.localnet_loadtest import VALIDITY_WINDOW
+from algokit.core.sandbox import get_algod_network_template
+from tests.utils.app_dir_mock import AppDirs
+from tests.utils.click_invoker import invoke
+
+
+def _mock_algorand(start_round: int, rounds: int) -> MagicMock:
+    algorand = MagicMock()
+    algorand.account.localnet_dispenser.return_value = SigningAccount(
+        private_key=account.generate_account()[0]  # type: ignore[no-untyped-call]
+    )
+    algod = algorand.client.algod
+    algod.suggested_params.side_effect = lambda: transaction.SuggestedParams(  # type: ignore[no-untyped-call]
+        fee=1000,
+        first=start_round,
+        last=start_round + 1000,
+        gh="AQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQE=",
+        gen="dockernet-v1",
+        flat_fee=True,
+    )
+    algod.status.side_effect = [{"last-round": start_round}, {"last-round": start_round + rounds - 1}]
+    algod.status_after_block.return_value = {"last-round": start_round + rounds}
+    return algorand
+
+
+def test_advance_rounds(mocker: MockerFixture) -> None:
+    mocker.patch("algokit.core.localnet_advance.time.monotonic", side_effect=[0.0, 2.0])
+    rounds = VALIDITY_WINDOW + 10
+    algorand = _mock_algorand(start_round=5, rounds=rounds)
+
+    report = advance_rounds(algorand, rounds, timestamp_offset=60)
+
+    algod = algorand.client.algod
+    # the offset is reset once the rounds have been advanced
+    assert [call.args for call in algod.set_timestamp_offset.call_args_list] == [(60,), (0,)]
+    assert algod.send_transaction.call_count == rounds
+    # a fresh validity window is used for each batch of transactions
+    assert algod.suggested_params.call_count == 2  # noqa: PLR2004
+    assert len({call.args[0].get_txid() for call in algod.send_transaction.call_args_list}) == rounds
+    assert report.rounds == rounds
+    assert report.rounds_per_second == rounds / 2
+
+
+def test_advance_rounds_keep_offset() -> None:
+    algorand = _mock_algorand(start_round=5, rounds=3)
+
+    advance_rounds(algorand, 3, timestamp_offset=60, keep_offset=True)
+
+    algorand.client.algod.set_timestamp_offset.assert_called_once_with(60)
+
+
+def test_advance_rounds_rejected_payment() -> None:
+    algorand = _mock_algorand(start_round=5, rounds=3)
+    algod = algorand.client.algod
+    algod.send_transaction.side_effect = [None, error.AlgodHTTPError("overspend", 400), None]  # type: ignore[no-untyped-call]
+
+    with pytest.raises(click.ClickException, match="Failed to send 1 of the 3 payments: overspend"):
+        advance_rounds(algorand, 3, timestamp_offset=60)
+
+    algod.status_after_block.assert_not_called()
+    assert [call.args for call in algod.set_timestamp_offset.call_args_list] == [(60,), (0,)]
+
+
+@pytest.mark.usefixtures("proc_mock")
+def test_localnet_advance_not_running() -> None:
+    result = invoke("localnet advance --rounds 10")
+
+    assert result.exit_code == 1
+    assert "LocalNet isn't running" in result.output
+
+
+@pytest.mark.usefixtures("proc_mock", "_mock_proc_with_running_localnet")
+def test_localnet_advance_not_dev_mode(app_dir_mock: AppDirs) -> None:
+    sandbox_dir = app_dir_mock.app_config_dir / "sandbox"
+    sandbox_dir.mkdir()
+    (sandbox_dir / "algod_network_template.json").write_text(
+        get_algod_network_template().replace('"DevMode": true', '"DevMode": false')
+    )
+
+    result = invoke("localnet advance --rounds 10")
+
+    assert result.exit_code == 1
+    assert "only supported in DevMode" in result.output
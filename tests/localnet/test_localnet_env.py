@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from algokit.core.sandbox import SandboxPorts, SandboxSettings
+from tests.utils.app_dir_mock import AppDirs
+from tests.utils.approvals import verify
+from tests.utils.click_invoker import invoke
+from tests.utils.proc_mock import ProcMock
+
+
+@pytest.mark.usefixtures("proc_mock", "_mock_proc_with_running_localnet")
+def test_localnet_env(app_dir_mock: AppDirs) -> None:
+    result = invoke("localnet env")
+
+    assert result.exit_code == 0
+    verify(result.output.replace(str(app_dir_mock.app_config_dir), "{app_config}").replace("\\", "/"))
+
+
+@pytest.mark.usefixtures("proc_mock")
+def test_localnet_env_named_instance_json(app_dir_mock: AppDirs, proc_mock: ProcMock) -> None:
+    sandbox_dir = app_dir_mock.app_config_dir / "sandbox_test"
+    sandbox_dir.mkdir()
+    SandboxSettings(ports=SandboxPorts().offset(100)).save(sandbox_dir / "settings.json")
+    proc_mock.set_output(
+        "docker compose ls --format json --filter name=algokit_sandbox*",
+        [
+            json.dumps(
+                [
+                    {
+                        "Name": "algokit_sandbox",
+                        "Status": "running",
+                        "ConfigFiles": str(app_dir_mock.app_config_dir / "sandbox" / "docker-compose.yml"),
+                    },
+                    {
+                        "Name": "algokit_sandbox_test",
+                        "Status": "running",
+                        "ConfigFiles": str(sandbox_dir / "docker-compose.yml"),
+                    },
+                ]
+            )
+        ],
+    )
+
+    result = invoke("localnet env test --json")
+
+    assert result.exit_code == 0
+    verify(result.output.replace(str(app_dir_mock.app_config_dir), "{app_config}").replace("\\", "/"))
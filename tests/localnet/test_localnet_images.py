@@ -0,0 +1,104 @@
+import io
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from algokit.core.localnet_images import BUNDLE_IMAGES_NAME, BUNDLE_MANIFEST_NAME
+from algokit.core.sandbox import ALGORAND_IMAGE, LOCALNET_IMAGES, POSTGRES_IMAGE, ComposeSandbox
+from tests.utils.approvals import verify
+from tests.utils.click_invoker import invoke
+from tests.utils.proc_mock import ProcMock
+
+INSPECT_FORMAT = "{{range .RepoDigests}}{{println .}}{{end}}"
+DIGEST = "sha256:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+
+
+def _write_bundle(
+    bundle_path: Path, manifest: dict[str, object], image_parts: tuple[bytes, ...] = (b"images",)
+) -> None:
+    with tarfile.open(bundle_path, "w") as bundle:
+        members = [
+            (BUNDLE_MANIFEST_NAME, json.dumps(manifest).encode()),
+            *((f"{BUNDLE_IMAGES_NAME}.{index:05d}", part) for index, part in enumerate(image_parts)),
+        ]
+        for name, content in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            bundle.addfile(info, io.BytesIO(content))
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_localnet_images_export(proc_mock: ProcMock, tmp_path: Path, mocker: MockerFixture) -> None:
+    for image_name in LOCALNET_IMAGES.values():
+        proc_mock.set_output(["docker", "image", "inspect", image_name, "--format", INSPECT_FORMAT], [f"repo@{DIGEST}"])
+    proc_mock.set_output(["docker", "image", "save"], [], binary_output=b"images")
+    # the saved images are streamed into the bundle in parts
+    mocker.patch("algokit.core.localnet_images.BUNDLE_IMAGES_PART_SIZE", 4)
+
+    result = invoke("localnet images export bundle.tar.gz", cwd=tmp_path)
+
+    assert result.exit_code == 0
+    assert [path.name for path in tmp_path.glob("*bundle*")] == ["bundle.tar.gz"]
+    with tarfile.open(tmp_path / "bundle.tar.gz", "r:gz") as bundle:
+        assert bundle.getnames() == [BUNDLE_MANIFEST_NAME, f"{BUNDLE_IMAGES_NAME}.00000", f"{BUNDLE_IMAGES_NAME}.00001"]
+        manifest_file = bundle.extractfile(BUNDLE_MANIFEST_NAME)
+        assert manifest_file is not None
+        assert json.load(manifest_file) == {
+            "format": 2,
+            "images": {image_name: [DIGEST] for image_name in LOCALNET_IMAGES.values()},
+        }
+        assert [bundle.extractfile(name).read() for name in bundle.getnames()[1:]] == [b"imag", b"es"]  # type: ignore[union-attr]
+    verify(result.output)
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_localnet_images_export_pulls_missing_images(proc_mock: ProcMock, tmp_path: Path) -> None:
+    proc_mock.should_bad_exit_on(["docker", "image", "inspect", POSTGRES_IMAGE], output=["No such image"])
+    proc_mock.set_output(["docker", "image", "save"], [], binary_output=b"images")
+
+    result = invoke("localnet images export bundle.tar", cwd=tmp_path)
+
+    assert result.exit_code == 0
+    assert ["docker", "pull", POSTGRES_IMAGE] in [call.command for call in proc_mock.called]
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_localnet_images_import(proc_mock: ProcMock, tmp_path: Path) -> None:
+    _write_bundle(tmp_path / "bundle.tar", {"format": 2, "images": {ALGORAND_IMAGE: [DIGEST]}}, (b"ima", b"", b"ges"))
+    proc_mock.should_bad_exit_on(["docker", "image", "inspect", ALGORAND_IMAGE], output=[])
+
+    result = invoke("localnet images import bundle.tar", cwd=tmp_path)
+
+    assert result.exit_code == 0
+    load = next(call for call in proc_mock.called if call.command[:2] == ["docker", "load"])
+    # the image parts are streamed into the container engine in turn, rather than extracted to a file first
+    assert load.command == ["docker", "load"]
+    assert load.stdin is not None
+    assert load.stdin.binary_input.getvalue() == b"images"
+    # loaded images have no repo digests, so the recorded ones are used to check for new versions
+    assert DIGEST in ComposeSandbox()._get_local_image_versions(ALGORAND_IMAGE)  # noqa: SLF001
+    assert "Imported 1 images" in result.output
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_localnet_images_export_failure(proc_mock: ProcMock, tmp_path: Path) -> None:
+    proc_mock.should_bad_exit_on(["docker", "image", "save"], output=["Error response from daemon"])
+
+    result = invoke("localnet images export bundle.tar", cwd=tmp_path)
+
+    assert result.exit_code == 1
+    assert "Failed to save the LocalNet images" in result.output
+    assert not (tmp_path / "bundle.tar").exists()
+
+
+@pytest.mark.usefixtures("proc_mock")
+def test_localnet_images_import_invalid_bundle(tmp_path: Path) -> None:
+    (tmp_path / "bundle.tar").write_text("not a bundle", encoding="utf-8")
+
+    result = invoke("localnet images import bundle.tar", cwd=tmp_path)
+
+    assert result.exit_code == 1
+    assert "isn't an AlgoKit LocalNet image bundle" in result.output
@@ -0,0 +1,174 @@
+import base64
+import io
+import threading
+from typing import Any
+
+import msgpack  # type: ignore[import-untyped]
+import pytest
+from algosdk import account
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SignedTransaction, SuggestedParams
+
+from algokit.core.localnet_loadtest import (
+    SIGNING_WINDOW_GROUPS,
+    VALIDITY_WINDOW,
+    LoadTestConfig,
+    LoadTestTransactionType,
+    SignedGroup,
+    SigningContext,
+    normalise_rejection_reason,
+    presign_groups,
+    run_load_test,
+    sign_groups,
+)
+from tests.utils.click_invoker import invoke
+
+REJECTED_PAYLOAD = "rejected"
+
+
+class FakeAlgod:
+    """Confirms every accepted group in its own block, like algod in dev mode."""
+
+    def __init__(self, groups: list[SignedGroup]) -> None:
+        self.txids_by_payload = {group.payload: group.txids for group in groups}
+        self.blocks: list[tuple[str, ...]] = []
+        self.lock = threading.Lock()
+
+    def status(self) -> dict[str, Any]:
+        with self.lock:
+            return {"last-round": len(self.blocks)}
+
+    def get_block_txids(self, round_number: int) -> dict[str, Any]:
+        with self.lock:
+            return {"blockTxids": list(self.blocks[round_number - 1])}
+
+    def send_raw_transaction(self, payload: str) -> str:
+        if payload == REJECTED_PAYLOAD:
+            raise AlgodHTTPError(  # type: ignore[no-untyped-call]
+                "TransactionPool.Remember: transaction ABCDEFGHIJKLMNOPQRSTUVWXYZ234567ABCDEFGHIJKLMNOPQRST: "
+                "overspend (account balance 1000 below min 100000)",
+                400,
+            )
+        with self.lock:
+            self.blocks.append(self.txids_by_payload[payload])
+        return self.txids_by_payload[payload][0]
+
+
+class DevModeAlgod(FakeAlgod):
+    """Like `FakeAlgod`, but decodes the submitted groups and rejects them outside of their validity window."""
+
+    def __init__(self) -> None:
+        super().__init__([])
+
+    def suggested_params(self) -> SuggestedParams:
+        with self.lock:
+            first = len(self.blocks)
+        return SuggestedParams(  # type: ignore[no-untyped-call]
+            fee=1000, first=first, last=first + 1000, gh=base64.b64encode(b"\x01" * 32).decode(), flat_fee=True
+        )
+
+    def send_raw_transaction(self, payload: str) -> str:
+        signed_txns = [
+            SignedTransaction.undictify(txn)  # type: ignore[no-untyped-call]
+            for txn in msgpack.Unpacker(io.BytesIO(base64.b64decode(payload)), raw=False)
+        ]
+        with self.lock:
+            round_number = len(self.blocks) + 1
+            for signed_txn in signed_txns:
+                if (
+                    not signed_txn.transaction.first_valid_round
+                    <= round_number
+                    <= signed_txn.transaction.last_valid_round
+                ):
+                    raise AlgodHTTPError(f"TransactionPool.Remember: txn dead: round {round_number}", 400)  # type: ignore[no-untyped-call]
+            txids: tuple[str, ...] = tuple(signed_txn.transaction.get_txid() for signed_txn in signed_txns)
+            self.blocks.append(txids)
+        return txids[0]
+
+
+def _signing_context(accounts: int = 2) -> SigningContext:
+    return SigningContext(
+        private_keys=tuple(account.generate_account()[0] for _ in range(accounts)),  # type: ignore[no-untyped-call]
+        asset_ids=tuple(range(1000, 1000 + accounts)),
+        app_id=1234,
+        genesis_id="dockernet-v1",
+        genesis_hash=base64.b64encode(b"\x01" * 32).decode(),
+        first_valid=1,
+        last_valid=991,
+        fee=1000,
+    )
+
+
+def test_sign_groups_builds_unique_signed_groups() -> None:
+    context = _signing_context()
+
+    groups = sign_groups(
+        context,
+        (LoadTestTransactionType.PAYMENT, LoadTestTransactionType.ASSET_TRANSFER, LoadTestTransactionType.APP_CALL),
+        group_size=3,
+        first_group=10,
+        group_count=4,
+    )
+
+    assert len(groups) == 4  # noqa: PLR2004
+    assert len({txid for group in groups for txid in group.txids}) == 12  # noqa: PLR2004
+    signed_txns = [
+        SignedTransaction.undictify(txn)  # type: ignore[no-untyped-call]
+        for txn in msgpack.Unpacker(io.BytesIO(base64.b64decode(groups[0].payload)), raw=False)
+    ]
+    assert [txn.transaction.type for txn in signed_txns] == ["pay", "axfer", "appl"]
+    assert len({txn.transaction.group for txn in signed_txns}) == 1
+
+
+def test_normalise_rejection_reason() -> None:
+    assert (
+        normalise_rejection_reason(
+            "TransactionPool.Remember: transaction ABCDEFGHIJKLMNOPQRSTUVWXYZ234567ABCDEFGHIJKLMNOPQRST: "
+            "overspend (account balance 1000 below min 100000)"
+        )
+        == "transaction <id>: overspend (account balance <n> below min <n>)"
+    )
+
+
+def test_run_load_test_reports_confirmations_and_rejections() -> None:
+    groups = sign_groups(_signing_context(), (LoadTestTransactionType.PAYMENT,), 2, 0, 5)
+    groups.append(SignedGroup(txids=("REJECTED1", "REJECTED2"), payload=REJECTED_PAYLOAD))
+    algod = FakeAlgod(groups)
+
+    report = run_load_test(
+        algod,  # type: ignore[arg-type]
+        groups,
+        LoadTestConfig(tps=1000, duration=1, group_size=2, in_flight=4, confirmation_timeout=5),
+    )
+
+    assert report.transactions == 12  # noqa: PLR2004
+    assert report.submitted == 10  # noqa: PLR2004
+    assert report.confirmed == 10  # noqa: PLR2004
+    assert report.rejections == {"transaction <id>: overspend (account balance <n> below min <n>)": 2}
+    assert report.latency_percentile(99) is not None
+
+
+def test_run_load_test_with_more_groups_than_the_validity_window() -> None:
+    algod = DevModeAlgod()
+    config = LoadTestConfig(
+        tps=10_000,
+        duration=0.12,
+        transaction_types=(LoadTestTransactionType.PAYMENT,),
+        workers=2,
+        confirmation_timeout=5,
+    )
+    assert config.group_count > VALIDITY_WINDOW > SIGNING_WINDOW_GROUPS
+
+    report = run_load_test(algod, presign_groups(algod, _signing_context(), config), config)  # type: ignore[arg-type]
+
+    assert report.rejections == {}
+    assert report.groups == config.group_count
+    assert report.confirmed == config.group_count
+
+
+@pytest.mark.usefixtures("proc_mock")
+def test_localnet_loadtest_not_running() -> None:
+    result = invoke("localnet loadtest")
+
+    assert result.exit_code == 1
+    assert "LocalNet isn't running" in result.output
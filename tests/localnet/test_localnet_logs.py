@@ -0,0 +1,42 @@
+import json
+from subprocess import CompletedProcess
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.utils.app_dir_mock import AppDirs
+from tests.utils.click_invoker import invoke
+from tests.utils.proc_mock import ProcMock
+
+
+@pytest.mark.usefixtures("_mock_proc_with_running_localnet")
+def test_localnet_logs(mocker: MockerFixture, app_dir_mock: AppDirs) -> None:
+    run_mock = mocker.patch("algokit.core.proc.subprocess_run")
+    run_mock.return_value = CompletedProcess(["docker", "compose", "logs"], 0)
+
+    result = invoke("localnet logs --tail 10")
+
+    assert result.exit_code == 0
+    run_mock.assert_called_once()
+    assert run_mock.call_args.args[0] == ["docker", "compose", "logs", "--no-color", "--tail", "10"]
+    assert run_mock.call_args.kwargs["cwd"] == app_dir_mock.app_config_dir / "sandbox"
+
+
+def test_localnet_logs_with_name(mocker: MockerFixture, app_dir_mock: AppDirs, proc_mock: ProcMock) -> None:
+    run_mock = mocker.patch("algokit.core.proc.subprocess_run")
+    run_mock.return_value = CompletedProcess(["docker", "compose", "logs"], 0)
+    running = [
+        {
+            "Name": f"algokit_{name}",
+            "Status": "running",
+            "ConfigFiles": str(app_dir_mock.app_config_dir / name / "docker-compose.yml"),
+        }
+        for name in ("sandbox", "sandbox_test")
+    ]
+    proc_mock.set_output("docker compose ls --format json --filter name=algokit_sandbox*", [json.dumps(running)])
+
+    result = invoke("localnet logs --name test")
+
+    assert result.exit_code == 0
+    run_mock.assert_called_once()
+    assert run_mock.call_args.kwargs["cwd"] == app_dir_mock.app_config_dir / "sandbox_test"
@@ -0,0 +1,70 @@
+import pytest
+from pytest_httpx import HTTPXMock
+from pytest_mock import MockerFixture
+
+from algokit.core.localnet_metrics import parse_prometheus_metrics
+from algokit.core.sandbox import SandboxSettings
+from tests.utils.app_dir_mock import AppDirs
+from tests.utils.approvals import verify
+from tests.utils.click_invoker import invoke
+
+
+def _algod_metrics(last_round: int, transactions: int) -> str:
+    return f"""# HELP algod_ledger_round Last round written to ledger
+# TYPE algod_ledger_round gauge
+algod_ledger_round {last_round}
+# TYPE algod_ledger_transactions_total counter
+algod_ledger_transactions_total {transactions}
+"""
+
+
+def _conduit_metrics(imported_round: int, transactions: int, exporter_count: int, exporter_sum: float) -> str:
+    return f"""# TYPE conduit_imported_round gauge
+conduit_imported_round {imported_round}
+conduit_imported_tx_per_block_sum {transactions}
+conduit_imported_tx_per_block_count {imported_round}
+conduit_exporter_time_sec{{exporter_name="postgresql",quantile="0.5"}} 0.01
+conduit_exporter_time_sec_sum{{exporter_name="postgresql"}} {exporter_sum}
+conduit_exporter_time_sec_count{{exporter_name="postgresql"}} {exporter_count}
+conduit_pipeline_retry_count 2
+"""
+
+
+def test_parse_prometheus_metrics_sums_label_sets() -> None:
+    metrics = parse_prometheus_metrics(
+        """# HELP requests_total Requests
+# TYPE requests_total counter
+requests_total{code="200"} 3
+requests_total{code="500"} 1
+latency_seconds_sum 0.5
+invalid_sample NaN_or_not
+"""
+    )
+
+    assert metrics == {"requests_total": 4.0, "latency_seconds_sum": 0.5}
+
+
+@pytest.mark.usefixtures("proc_mock", "_mock_proc_with_running_localnet")
+def test_localnet_metrics(app_dir_mock: AppDirs, httpx_mock: HTTPXMock, mocker: MockerFixture) -> None:
+    sandbox_dir = app_dir_mock.app_config_dir / "sandbox"
+    sandbox_dir.mkdir()
+    SandboxSettings(metrics=True).save(sandbox_dir / "settings.json")
+    mocker.patch("algokit.cli.localnet.time.sleep")
+    mocker.patch("algokit.core.localnet_metrics.time.monotonic", side_effect=[0.0, 5.0])
+    httpx_mock.add_response(url="http://localhost:4001/metrics", text=_algod_metrics(100, 1000))
+    httpx_mock.add_response(url="http://localhost:9999/metrics", text=_conduit_metrics(90, 900, 90, 0.9))
+    httpx_mock.add_response(url="http://localhost:4001/metrics", text=_algod_metrics(110, 1500))
+    httpx_mock.add_response(url="http://localhost:9999/metrics", text=_conduit_metrics(95, 1150, 95, 1.4))
+
+    result = invoke("localnet metrics --interval 5")
+
+    assert result.exit_code == 0
+    verify(result.output.replace(str(app_dir_mock.app_config_dir), "{app_config}").replace("\\", "/"))
+
+
+@pytest.mark.usefixtures("proc_mock")
+def test_localnet_metrics_not_running() -> None:
+    result = invoke("localnet metrics")
+
+    assert result.exit_code == 1
+    assert "LocalNet isn't running" in result.output
@@ -89,6 +89,31 @@ def test_localnet_reset_with_named_sandbox_config(proc_mock: ProcMock, app_dir_m
     )
 
 
+@pytest.mark.usefixtures("_health_success")
+def test_localnet_reset_with_name(proc_mock: ProcMock, app_dir_mock: AppDirs) -> None:
+    running = []
+    for name in ("sandbox", "sandbox_test"):
+        (app_dir_mock.app_config_dir / name).mkdir()
+        (app_dir_mock.app_config_dir / name / "docker-compose.yml").write_text(
+            get_docker_compose_yml(name=f"algokit_{name}")
+        )
+        running.append(
+            {
+                "Name": f"algokit_{name}",
+                "Status": "running",
+                "ConfigFiles": str(app_dir_mock.app_config_dir / name / "docker-compose.yml"),
+            }
+        )
+    proc_mock.set_output("docker compose ls --format json --filter name=algokit_sandbox*", [json.dumps(running)])
+
+    result = invoke("localnet reset --name test")
+
+    assert result.exit_code == 0
+    verify(
+        result.output.replace("\\\\", "\\").replace(str(app_dir_mock.app_config_dir), "{app_config}").replace("\\", "/")
+    )
+
+
 @pytest.mark.usefixtures(
     "proc_mock", "_health_success", "_mock_proc_with_running_localnet", "_mock_proc_with_running_localnet"
 )
@@ -8,7 +8,10 @@ from pytest_mock import MockerFixture
 from algokit.core.sandbox import (
     ALGOD_HEALTH_URL,
     ALGORAND_IMAGE,
+    CONDUIT_IMAGE,
     INDEXER_IMAGE,
+    POSTGRES_IMAGE,
+    SandboxServices,
     get_algod_network_template,
     get_config_json,
     get_docker_compose_yml,
@@ -21,7 +24,7 @@ from tests.utils.proc_mock import ProcMock
 
 
 @pytest.fixture
-def _localnet_out_of_date(proc_mock: ProcMock, httpx_mock: HTTPXMock) -> None:
+def _localnet_out_of_date(proc_mock: ProcMock, httpx_mock: HTTPXMock, _indexer_dependencies_up_to_date: None) -> None:
     arg = "{{range .RepoDigests}}{{println .}}{{end}}"
     proc_mock.set_output(
         ["docker", "image", "inspect", ALGORAND_IMAGE, "--format", arg],
@@ -56,6 +59,8 @@ def _localnet_img_check_cmd_error(
     arg = "{{range .RepoDigests}}{{println .}}{{end}}"
     proc_mock.should_fail_on(["docker", "image", "inspect", ALGORAND_IMAGE, "--format", arg])
     proc_mock.should_fail_on(["docker", "image", "inspect", INDEXER_IMAGE, "--format", arg])
+    proc_mock.should_fail_on(["docker", "image", "inspect", CONDUIT_IMAGE, "--format", arg])
+    proc_mock.should_fail_on(["docker", "image", "inspect", POSTGRES_IMAGE, "--format", arg])
 
     httpx_mock.add_exception(
         httpx.RemoteProtocolError("No response"),
@@ -67,6 +72,16 @@ def _localnet_img_check_cmd_error(
         url="https://registry.hub.docker.com/v2/repositories/algorand/algod/tags/latest",
     )
 
+    httpx_mock.add_exception(
+        httpx.RemoteProtocolError("No response"),
+        url="https://registry.hub.docker.com/v2/repositories/algorandfoundation/conduit-localnet/tags/latest",
+    )
+
+    httpx_mock.add_exception(
+        httpx.RemoteProtocolError("No response"),
+        url="https://registry.hub.docker.com/v2/repositories/library/postgres/tags/16-alpine",
+    )
+
 
 @pytest.mark.usefixtures("_health_success", "_localnet_up_to_date", "_mock_proc_with_running_localnet")
 def test_localnet_start(app_dir_mock: AppDirs) -> None:
@@ -339,3 +354,93 @@ def test_localnet_start_with_no_dev_mode(app_dir_mock: AppDirs) -> None:
         .replace("NUM_ROUNDS", '"NUM_ROUNDS"')
     )
     assert not network_template["Genesis"]["DevMode"]
+
+
+@pytest.mark.usefixtures("_localnet_up_to_date", "_mock_proc_with_running_localnet")
+def test_localnet_start_with_auto_ports_alongside_running_localnet(
+    app_dir_mock: AppDirs, proc_mock: ProcMock, httpx_mock: HTTPXMock, mocker: MockerFixture
+) -> None:
+    mocker.patch("algokit.core.sandbox._is_port_free", return_value=True)
+    httpx_mock.add_response(url="http://localhost:4101/v2/status")
+    httpx_mock.add_response(url="http://localhost:9080/health")
+
+    result = invoke("localnet start --name test --auto-ports")
+
+    assert result.exit_code == 0
+    assert not any(call.command[:3] == ["docker", "compose", "stop"] for call in proc_mock.called)
+    settings = json.loads((app_dir_mock.app_config_dir / "sandbox_test" / "settings.json").read_text())
+    assert settings["ports"]["algod"] == 4101  # noqa: PLR2004
+    compose_yml = (app_dir_mock.app_config_dir / "sandbox_test" / "docker-compose.yml").read_text()
+    assert "- 4101:8080" in compose_yml
+    assert "- 9080:8980" in compose_yml
+
+
+@pytest.mark.usefixtures("app_dir_mock", "proc_mock")
+def test_localnet_start_with_auto_ports_requires_name() -> None:
+    result = invoke("localnet start --auto-ports")
+
+    assert result.exit_code != 0
+    assert "--auto-ports requires --name" in result.output
+
+
+@pytest.mark.usefixtures("_algod_up_to_date", "_mock_proc_with_running_localnet")
+def test_localnet_start_with_algod_services(app_dir_mock: AppDirs, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=ALGOD_HEALTH_URL)
+
+    result = invoke("localnet start --services algod")
+
+    assert result.exit_code == 0
+    settings = json.loads((app_dir_mock.app_config_dir / "sandbox" / "settings.json").read_text())
+    assert settings["services"] == "algod"
+    compose_yml = (app_dir_mock.app_config_dir / "sandbox" / "docker-compose.yml").read_text()
+    assert compose_yml == get_docker_compose_yml(services=SandboxServices.ALGOD)
+    assert "indexer" not in compose_yml
+
+
+@pytest.mark.usefixtures("_health_success", "_localnet_up_to_date", "_mock_proc_with_running_localnet")
+def test_localnet_start_with_tmpfs_storage(app_dir_mock: AppDirs) -> None:
+    result = invoke("localnet start --storage tmpfs --postgres-tmpfs-size 512m")
+
+    assert result.exit_code == 0
+    settings = json.loads((app_dir_mock.app_config_dir / "sandbox" / "settings.json").read_text())
+    assert settings["storage"] == "tmpfs"
+    assert settings["postgres_tmpfs_size"] == "512m"
+    compose_yml = (app_dir_mock.app_config_dir / "sandbox" / "docker-compose.yml").read_text()
+    assert "- /algod/data:size=2g" in compose_yml
+    assert "- /var/lib/postgresql/tmpfs:size=512m" in compose_yml
+    assert "-c fsync=off -c synchronous_commit=off" in compose_yml
+
+
+@pytest.mark.usefixtures("app_dir_mock", "_mock_proc_with_running_localnet")
+def test_localnet_start_with_invalid_tmpfs_size() -> None:
+    result = invoke("localnet start --storage tmpfs --algod-tmpfs-size lots")
+
+    assert result.exit_code != 0
+    assert "'lots' is not a valid size" in result.output
+
+
+@pytest.mark.usefixtures("_health_success", "_localnet_up_to_date", "_mock_proc_with_running_localnet")
+def test_localnet_start_with_profile_from_algokit_toml(
+    app_dir_mock: AppDirs, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    cwd = tmp_path_factory.mktemp("cwd")
+    (cwd / ".algokit.toml").write_text('[localnet]\nprofile = "throughput"\n')
+
+    result = invoke("localnet start", cwd=cwd)
+
+    assert result.exit_code == 0
+    settings = json.loads((app_dir_mock.app_config_dir / "sandbox" / "settings.json").read_text())
+    assert settings["profile"] == "throughput"
+    conduit_yml = (app_dir_mock.app_config_dir / "sandbox" / "conduit.yml").read_text()
+    assert "max-conn: 64" in conduit_yml
+
+
+@pytest.mark.usefixtures("_mock_proc_with_running_localnet")
+def test_localnet_start_with_invalid_profile_in_algokit_toml(tmp_path_factory: pytest.TempPathFactory) -> None:
+    cwd = tmp_path_factory.mktemp("cwd")
+    (cwd / ".algokit.toml").write_text('[localnet]\nprofile = "turbo"\n')
+
+    result = invoke("localnet start", cwd=cwd)
+
+    assert result.exit_code == 1
+    assert "Invalid LocalNet profile 'turbo'" in result.output
@@ -0,0 +1,136 @@
+import json
+import os
+
+import pytest
+from pytest_mock import MockerFixture
+
+from algokit.core.localnet_state import LOCALNET_STATE_CACHE_TTL
+from algokit.core.sandbox import ComposeFileStatus, ComposeSandbox
+from tests.utils.app_dir_mock import AppDirs
+from tests.utils.click_invoker import invoke
+from tests.utils.proc_mock import ProcMock
+
+COMPOSE_LS = ["docker", "compose", "ls", "--format", "json", "--filter", "name=algokit_sandbox*"]
+COMPOSE_PS = ["docker", "compose", "ps", "algod", "--format", "json"]
+
+
+def _count_calls(proc_mock: ProcMock, command: list[str]) -> int:
+    return sum(1 for call in proc_mock.called if call.command == command)
+
+
+@pytest.fixture
+def sandbox(app_dir_mock: AppDirs, proc_mock: ProcMock) -> ComposeSandbox:
+    sandbox = ComposeSandbox()
+    sandbox.write_compose_file()
+    proc_mock.set_output(
+        COMPOSE_LS,
+        [json.dumps([{"Name": "algokit_sandbox", "Status": "running", "ConfigFiles": str(sandbox.compose_file_path)}])],
+    )
+    proc_mock.set_output(COMPOSE_PS, [json.dumps([{"Service": "algod", "State": "running"}])])
+    assert app_dir_mock.app_state_dir.exists()
+    return sandbox
+
+
+@pytest.mark.use_localnet_state_cache
+def test_running_instances_are_cached(sandbox: ComposeSandbox, proc_mock: ProcMock) -> None:
+    first = ComposeSandbox.list_from_environment()
+    second = ComposeSandbox.list_from_environment()
+
+    assert [instance.name for instance in first] == [instance.name for instance in second] == [sandbox.name]
+    assert _count_calls(proc_mock, COMPOSE_LS) == 1
+
+
+@pytest.mark.use_localnet_state_cache
+def test_ps_and_compose_file_status_are_cached(
+    sandbox: ComposeSandbox, proc_mock: ProcMock, mocker: MockerFixture
+) -> None:
+    get_compose_file_status = mocker.spy(sandbox, "_get_compose_file_status")
+
+    assert sandbox.ps("algod") == sandbox.ps("algod") == [{"Service": "algod", "State": "running"}]
+    assert sandbox.compose_file_status() is sandbox.compose_file_status() is ComposeFileStatus.UP_TO_DATE
+
+    assert _count_calls(proc_mock, COMPOSE_PS) == 1
+    assert get_compose_file_status.call_count == 1
+
+
+@pytest.mark.use_localnet_state_cache
+def test_cache_is_invalidated_by_configuration_changes(sandbox: ComposeSandbox, proc_mock: ProcMock) -> None:
+    sandbox.ps("algod")
+    stat = sandbox.algod_config_file_path.stat()
+    os.utime(sandbox.algod_config_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    sandbox.ps("algod")
+
+    assert _count_calls(proc_mock, COMPOSE_PS) == 2  # noqa: PLR2004
+
+
+@pytest.mark.use_localnet_state_cache
+@pytest.mark.usefixtures("sandbox")
+def test_cache_expires(proc_mock: ProcMock, mocker: MockerFixture) -> None:
+    mock_time = mocker.patch("algokit.core.localnet_state.time")
+    mock_time.time.side_effect = [1000.0, 1000.0 + LOCALNET_STATE_CACHE_TTL, 1000.0 + LOCALNET_STATE_CACHE_TTL]
+    ComposeSandbox.list_from_environment()
+    ComposeSandbox.list_from_environment()
+
+    assert _count_calls(proc_mock, COMPOSE_LS) == 2  # noqa: PLR2004
+
+
+@pytest.mark.use_localnet_state_cache
+def test_cache_is_invalidated_by_container_changes(sandbox: ComposeSandbox, proc_mock: ProcMock) -> None:
+    ComposeSandbox.list_from_environment()
+    sandbox.stop()
+    ComposeSandbox.list_from_environment()
+
+    assert _count_calls(proc_mock, COMPOSE_LS) == 2  # noqa: PLR2004
+
+
+@pytest.mark.use_localnet_state_cache
+def test_cache_can_be_bypassed(sandbox: ComposeSandbox, proc_mock: ProcMock) -> None:
+    ComposeSandbox.list_from_environment()
+    sandbox.ps("algod")
+    ComposeSandbox.list_from_environment(cached=False)
+    sandbox.ps("algod", cached=False)
+
+    assert _count_calls(proc_mock, COMPOSE_LS) == 2  # noqa: PLR2004
+    assert _count_calls(proc_mock, COMPOSE_PS) == 2  # noqa: PLR2004
+
+
+@pytest.mark.use_localnet_state_cache
+def test_localnet_status_ignores_cached_state(sandbox: ComposeSandbox, proc_mock: ProcMock) -> None:
+    ComposeSandbox.list_from_environment()
+    sandbox.ps()
+    # the containers are stopped outside of AlgoKit
+    proc_mock.set_output(COMPOSE_LS, [json.dumps([])])
+
+    invoke("localnet status")
+
+    assert _count_calls(proc_mock, COMPOSE_LS) == 2  # noqa: PLR2004
+
+
+@pytest.mark.use_localnet_state_cache
+@pytest.mark.parametrize(
+    "command", ["localnet metrics", "localnet loadtest --duration 1", "localnet advance --rounds 1"]
+)
+@pytest.mark.usefixtures("sandbox")
+def test_commands_sending_requests_ignore_cached_instances(proc_mock: ProcMock, command: str) -> None:
+    ComposeSandbox.list_from_environment()
+    # the containers are stopped outside of AlgoKit
+    proc_mock.set_output(COMPOSE_LS, [json.dumps([])])
+
+    result = invoke(command)
+
+    assert result.exit_code == 1
+    assert "LocalNet isn't running" in result.output
+    assert _count_calls(proc_mock, COMPOSE_LS) == 2  # noqa: PLR2004
+
+
+@pytest.mark.use_localnet_state_cache
+def test_goal_probes_algod_container(sandbox: ComposeSandbox, proc_mock: ProcMock) -> None:
+    sandbox.ps("algod")
+    # the containers are stopped outside of AlgoKit
+    proc_mock.set_output(COMPOSE_PS, [json.dumps([{"Service": "algod", "State": "exited"}])])
+
+    result = invoke("goal --version")
+
+    assert result.exit_code == 0
+    assert _count_calls(proc_mock, COMPOSE_PS) == 2  # noqa: PLR2004
+    assert _count_calls(proc_mock, ["docker", "compose", "up", "--detach", "--quiet-pull", "--wait"]) == 1
@@ -241,6 +241,35 @@ def test_localnet_status_without_docker_engine_running(proc_mock: ProcMock) -> N
     verify(result.output)
 
 
+@pytest.mark.usefixtures("_mock_proc_with_running_localnet", "_algod_up_to_date")
+def test_localnet_status_algod_services(app_dir_mock: AppDirs, proc_mock: ProcMock, httpx_mock: HTTPXMock) -> None:
+    (app_dir_mock.app_config_dir / "sandbox").mkdir()
+    (app_dir_mock.app_config_dir / "sandbox" / "settings.json").write_text(json.dumps({"services": "algod"}))
+
+    httpx_mock.add_response(
+        url="http://localhost:4001/v2/status", json={"last-round": 1, "time-since-last-round": 15.3 * 1e9}
+    )
+    httpx_mock.add_response(
+        url="http://localhost:4001/versions",
+        json={
+            "genesis_id": "{genesis_id}",
+            "genesis_hash_b64": "{genesis_hash_b64}",
+            "build": {"major": 1, "minor": 2, "build_number": 1},
+        },
+    )
+
+    proc_mock.set_output(
+        "docker compose ps --format json",
+        [json.dumps([compose_ps_output[0]])],
+    )
+    result = invoke("localnet status")
+
+    assert result.exit_code == 0
+    verify(
+        result.output.replace("\\\\", "\\").replace(str(app_dir_mock.app_config_dir), "{app_config}").replace("\\", "/")
+    )
+
+
 class DockerServicePublisher(TypedDict):
     URL: str
     TargetPort: int
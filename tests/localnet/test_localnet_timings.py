@@ -0,0 +1,62 @@
+import itertools
+import json
+
+import pytest
+from pytest_mock import MockerFixture
+
+from algokit.core.localnet_timings import get_timings_file_path
+from tests.utils.app_dir_mock import AppDirs
+from tests.utils.approvals import verify
+from tests.utils.click_invoker import invoke
+from tests.utils.proc_mock import ProcMock
+
+
+@pytest.fixture(autouse=True)
+def _perf_counter(mocker: MockerFixture) -> None:
+    mocker.patch("algokit.core.localnet_timings.time").perf_counter.side_effect = itertools.count(0.0, 0.25)
+
+
+@pytest.mark.usefixtures("_health_success", "_localnet_up_to_date", "_mock_proc_with_running_localnet")
+def test_localnet_start_timings(app_dir_mock: AppDirs) -> None:
+    result = invoke("localnet start --timings")
+
+    assert result.exit_code == 0
+    verify(result.output.replace(str(app_dir_mock.app_config_dir), "{app_config}").replace("\\", "/"))
+    (record,) = [json.loads(line) for line in get_timings_file_path().read_text().splitlines()]
+    assert record["command"] == "start"
+    assert record["instance"] == "sandbox"
+    assert record["succeeded"] is True
+    assert [(phase["name"], phase["depth"]) for phase in record["phases"]] == [
+        ("prepare", 0),
+        ("compose file status", 0),
+        ("image version check", 0),
+        ("write compose file", 0),
+        ("up", 0),
+        ("compose up", 1),
+        ("algod health check", 1),
+        ("indexer health check", 1),
+        ("fund accounts", 0),
+    ]
+
+
+@pytest.mark.usefixtures("app_dir_mock", "_mock_proc_with_running_localnet")
+def test_localnet_reset_timings_are_recorded_on_failure(proc_mock: ProcMock) -> None:
+    proc_mock.should_bad_exit_on("docker compose up")
+
+    result = invoke("localnet reset --timings")
+
+    assert result.exit_code == 1
+    assert "# localnet reset timings" in result.output
+    (record,) = [json.loads(line) for line in get_timings_file_path().read_text().splitlines()]
+    assert record["command"] == "reset"
+    assert record["succeeded"] is False
+    assert record["phases"][-1] == {"name": "compose up", "depth": 1, "duration": 0.25}
+
+
+@pytest.mark.usefixtures("_health_success", "_localnet_up_to_date", "_mock_proc_with_running_localnet")
+def test_localnet_start_without_timings(app_dir_mock: AppDirs) -> None:
+    result = invoke("localnet start")
+
+    assert result.exit_code == 0
+    assert "timings" not in result.output
+    assert not (app_dir_mock.app_state_dir / "localnet-timings.jsonl").exists()
@@ -1,23 +1,41 @@
 import json
+import os
+import threading
 import time
+from pathlib import Path
 
 import pytest
+from approvaltests.namer import NamerFactory
 from pytest_httpx import HTTPXMock
 from pytest_mock import MockerFixture
 
 from algokit.core.sandbox import (
     ALGORAND_IMAGE,
+    DEFAULT_ALGOD_PORT,
     IMAGE_VERSION_CHECK_INTERVAL,
     INDEXER_IMAGE,
+    PORT_ALLOCATION_LOCK_FILE_NAME,
+    PORT_ALLOCATION_LOCK_STALE_AFTER,
+    PORT_ALLOCATION_STEP,
+    POSTGRES_IMAGE,
+    ComposeFileStatus,
     ComposeSandbox,
+    RegistryDigest,
+    SandboxPorts,
+    SandboxProfile,
+    SandboxServices,
+    SandboxSettings,
+    SandboxStorage,
     _get_image_version_cache,
     _get_image_version_cache_path,
     _update_image_version_cache,
+    allocate_sandbox_ports,
     get_algod_network_template,
     get_conduit_yaml,
     get_config_json,
     get_docker_compose_yml,
 )
+from tests.utils.app_dir_mock import AppDirs
 from tests.utils.approvals import verify
 from tests.utils.proc_mock import ProcMock
 
@@ -37,13 +55,48 @@ def test_get_docker_compose_yml() -> None:
     verify(docker_compose_yml)
 
 
+def test_get_docker_compose_yml_algod_services() -> None:
+    docker_compose_yml = get_docker_compose_yml(services=SandboxServices.ALGOD)
+    verify(docker_compose_yml)
+
+
+def test_get_docker_compose_yml_tmpfs_storage() -> None:
+    docker_compose_yml = get_docker_compose_yml(
+        storage=SandboxStorage.TMPFS, algod_tmpfs_size="512m", postgres_tmpfs_size="256m"
+    )
+    verify(docker_compose_yml)
+
+
+@pytest.mark.parametrize("profile", [SandboxProfile.THROUGHPUT, SandboxProfile.LOW_MEMORY])
+def test_profile_tuning(profile: SandboxProfile) -> None:
+    verify(
+        "\n".join(
+            [
+                get_algod_network_template(profile),
+                get_conduit_yaml(profile),
+                get_docker_compose_yml(profile=profile, storage=SandboxStorage.TMPFS),
+            ]
+        ),
+        options=NamerFactory.with_parameters(profile.value),
+    )
+
+
+def test_get_docker_compose_yml_publishes_conduit_metrics_port() -> None:
+    docker_compose_yml = get_docker_compose_yml(conduit_metrics_port=10099)
+
+    assert "- 10099:9999" in docker_compose_yml
+    assert "mode: ON" in get_conduit_yaml(metrics=True)
+
+
 def test_algod_network_template_json() -> None:
     algod_network_template_json = get_algod_network_template()
     verify(algod_network_template_json)
 
 
 @pytest.fixture
-def _mock_image_check_responses(proc_mock: ProcMock, httpx_mock: HTTPXMock) -> None:
+def _mock_image_check_responses(
+    proc_mock: ProcMock, httpx_mock: HTTPXMock, _indexer_dependencies_up_to_date: None
+) -> None:
     """Mock the docker and HTTP responses needed for image version checks."""
     arg = "{{range .RepoDigests}}{{println .}}{{end}}"
     proc_mock.set_output(
@@ -156,3 +209,166 @@ def test_check_docker_compose_for_new_image_versions_force_bypasses_cache(proc_m
 
     # Verify check was run despite fresh cache
     assert any("image" in call.command and "inspect" in call.command for call in proc_mock.called)
+
+
+@pytest.mark.use_real_image_version_cache
+@pytest.mark.usefixtures("app_dir_mock", "_mock_image_check_responses")
+def test_check_docker_compose_for_new_image_versions_checks_all_images(caplog: pytest.LogCaptureFixture) -> None:
+    """Should check the conduit and postgres images too, caching the registry digests seen."""
+    sandbox = ComposeSandbox()
+    sandbox.check_docker_compose_for_new_image_versions()
+
+    cached_state = _get_image_version_cache()
+    assert cached_state is not None
+    assert sorted(cached_state.registry_digests) == sorted(sandbox.checked_images.values())
+    assert "has a new version available" not in caplog.text
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_check_images_up_to_date_revalidates_registry_digest(proc_mock: ProcMock, httpx_mock: HTTPXMock) -> None:
+    """Should reuse the cached registry digest when the registry reports it's not modified."""
+    digest = "sha256:dddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddddd"
+    proc_mock.set_output(
+        ["docker", "image", "inspect", POSTGRES_IMAGE, "--format", "{{range .RepoDigests}}{{println .}}{{end}}"],
+        [f"postgres@{digest}\n"],
+    )
+    httpx_mock.add_response(
+        url="https://registry.hub.docker.com/v2/repositories/library/postgres/tags/16-alpine",
+        match_headers={"If-None-Match": '"etag"'},
+        status_code=304,
+    )
+    registry_digests = {POSTGRES_IMAGE: RegistryDigest(digest=digest, etag='"etag"')}
+
+    up_to_date = ComposeSandbox().check_images_up_to_date([POSTGRES_IMAGE], registry_digests)
+
+    assert up_to_date == {POSTGRES_IMAGE: True}
+    assert registry_digests == {POSTGRES_IMAGE: RegistryDigest(digest=digest, etag='"etag"')}
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_check_images_up_to_date_deadline(mocker: MockerFixture) -> None:
+    """Should consider images whose check misses the deadline up to date, rather than waiting for them."""
+    mocker.patch("algokit.core.sandbox.IMAGE_VERSION_CHECK_DEADLINE", 0.1)
+    released = threading.Event()
+    sandbox = ComposeSandbox()
+
+    def check_image(image_name: str, *_args: object) -> tuple[bool, None]:
+        if image_name == INDEXER_IMAGE:
+            released.wait()
+        return False, None
+
+    mocker.patch.object(sandbox, "_check_image", side_effect=check_image)
+    start = time.monotonic()
+    try:
+        up_to_date = sandbox.check_images_up_to_date([ALGORAND_IMAGE, INDEXER_IMAGE])
+    finally:
+        released.set()
+
+    assert up_to_date == {ALGORAND_IMAGE: False, INDEXER_IMAGE: True}
+    assert time.monotonic() - start < 1
+
+
+def test_get_docker_compose_yml_with_custom_ports() -> None:
+    docker_compose_yml = get_docker_compose_yml(
+        name="algokit_sandbox_test",
+        algod_port=4101,
+        kmd_port=4102,
+        tealdbg_port=9492,
+        indexer_port=9080,
+        postgres_port=5543,
+    )
+
+    for published in ("4101:8080", "4102:7833", "9492:9392", "9080:8980", "5543:5432"):
+        assert f"- {published}" in docker_compose_yml
+
+
+def test_allocate_sandbox_ports_skips_reserved_and_busy_ports(app_dir_mock: AppDirs, mocker: MockerFixture) -> None:
+    SandboxSettings(ports=SandboxPorts().offset(PORT_ALLOCATION_STEP)).save(
+        _make_sandbox_dir(app_dir_mock, "sandbox_first") / "settings.json"
+    )
+    busy_port = DEFAULT_ALGOD_PORT + 2 * PORT_ALLOCATION_STEP
+    mocker.patch("algokit.core.sandbox._is_port_free", side_effect=lambda port: port != busy_port)
+
+    settings_path = _make_sandbox_dir(app_dir_mock, "sandbox_second") / "settings.json"
+
+    settings = allocate_sandbox_ports(settings_path, SandboxSettings())
+
+    assert settings.ports == SandboxPorts().offset(3 * PORT_ALLOCATION_STEP)
+    assert SandboxSettings.load(settings_path) == settings
+    assert not (app_dir_mock.app_config_dir / PORT_ALLOCATION_LOCK_FILE_NAME).exists()
+
+
+def test_allocate_sandbox_ports_reserves_ports_for_subsequent_allocations(
+    app_dir_mock: AppDirs, mocker: MockerFixture
+) -> None:
+    mocker.patch("algokit.core.sandbox._is_port_free", return_value=True)
+
+    first = allocate_sandbox_ports(_make_sandbox_dir(app_dir_mock, "sandbox_gw0") / "settings.json", SandboxSettings())
+    second = allocate_sandbox_ports(_make_sandbox_dir(app_dir_mock, "sandbox_gw1") / "settings.json", SandboxSettings())
+
+    assert first.ports == SandboxPorts().offset(PORT_ALLOCATION_STEP)
+    assert second.ports == SandboxPorts().offset(2 * PORT_ALLOCATION_STEP)
+
+
+def test_allocate_sandbox_ports_takes_over_stale_lock(app_dir_mock: AppDirs, mocker: MockerFixture) -> None:
+    mocker.patch("algokit.core.sandbox._is_port_free", return_value=True)
+    lock_path = app_dir_mock.app_config_dir / PORT_ALLOCATION_LOCK_FILE_NAME
+    lock_path.touch()
+    stale_time = time.time() - PORT_ALLOCATION_LOCK_STALE_AFTER - 1
+    os.utime(lock_path, (stale_time, stale_time))
+
+    settings = allocate_sandbox_ports(
+        _make_sandbox_dir(app_dir_mock, "sandbox_gw0") / "settings.json", SandboxSettings()
+    )
+
+    assert settings.ports == SandboxPorts().offset(PORT_ALLOCATION_STEP)
+    assert not lock_path.exists()
+
+
+def test_sandbox_settings_are_persisted_and_reloaded(app_dir_mock: AppDirs) -> None:
+    ports = SandboxPorts().offset(PORT_ALLOCATION_STEP)
+    sandbox = ComposeSandbox("test", settings=SandboxSettings(ports=ports))
+    sandbox.write_compose_file()
+
+    reloaded = ComposeSandbox("test")
+
+    assert (app_dir_mock.app_config_dir / "sandbox_test" / "settings.json").exists()
+    assert reloaded.ports == ports
+    assert reloaded.compose_file_status() == ComposeFileStatus.UP_TO_DATE
+    assert reloaded.connection_env()["ALGOD_PORT"] == str(ports.algod)
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_default_sandbox_does_not_write_settings() -> None:
+    sandbox = ComposeSandbox()
+    sandbox.write_compose_file()
+
+    assert not sandbox.settings_file_path.exists()
+
+
+def _make_sandbox_dir(app_dir_mock: AppDirs, name: str) -> Path:
+    directory = app_dir_mock.app_config_dir / name
+    directory.mkdir()
+    return directory
+
+
+def test_algod_services_sandbox_connection_env_omits_indexer(app_dir_mock: AppDirs) -> None:
+    sandbox = ComposeSandbox("test", settings=SandboxSettings(services=SandboxServices.ALGOD))
+    sandbox.write_compose_file()
+
+    reloaded = ComposeSandbox("test")
+
+    assert reloaded.service_names == ("algod",)
+    assert reloaded.compose_file_status() == ComposeFileStatus.UP_TO_DATE
+    assert "INDEXER_SERVER" not in reloaded.connection_env()
+    assert (app_dir_mock.app_config_dir / "sandbox_test" / "settings.json").exists()
+
+
+@pytest.mark.usefixtures("app_dir_mock")
+def test_profile_change_is_treated_as_up_to_date() -> None:
+    ComposeSandbox("test", settings=SandboxSettings(profile=SandboxProfile.THROUGHPUT)).write_compose_file()
+
+    reloaded = ComposeSandbox("test")
+
+    assert reloaded.settings.profile is SandboxProfile.THROUGHPUT
+    assert reloaded.compose_file_status() == ComposeFileStatus.UP_TO_DATE
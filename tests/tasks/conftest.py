@@ -1,5 +1,10 @@
+import re
+from pathlib import Path
+
+import pytest
 from algokit_utils import SigningAccount
 from algosdk import transaction
+from pytest_mock import MockerFixture
 
 DUMMY_SUGGESTED_PARAMS = transaction.SuggestedParams(  # type: ignore[no-untyped-call]
     fee=0,
@@ -136,3 +141,17 @@ concat
 log
 retsub
 """
+
+
+def scrub_upload_throughput(data: str) -> str:
+    """Scrub the duration and throughput of IPFS uploads from logs, as they vary between runs."""
+    return re.sub(r"in \d+\.\d+s, \d+\.\d+MB/s", "in {elapsed}s, {throughput}MB/s", data)
+
+
+@pytest.fixture(autouse=True)
+def app_state_dir(mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Keep the caches of task commands out of the real application state directory."""
+    state_dir = tmp_path_factory.mktemp("state")
+    mocker.patch("algokit.cli.tasks.utils.get_app_state_dir").return_value = state_dir
+    mocker.patch("algokit.core.tasks.ipfs.get_app_state_dir").return_value = state_dir
+    return state_dir
@@ -1,10 +1,15 @@
 import json
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
 
+import pytest
 from algokit_utils import BulkAssetOptInOutResult
-from algosdk import account, mnemonic
+from algosdk import account, error, mnemonic
 from pytest_mock import MockerFixture
 
 from algokit.core.tasks.wallet import WALLET_ALIASES_KEYRING_USERNAME
+from tests.tasks.conftest import DUMMY_SUGGESTED_PARAMS
 from tests.utils.approvals import verify
 from tests.utils.click_invoker import invoke
 
@@ -18,6 +23,36 @@ def _get_mnemonic_from_private_key(private_key: str) -> str:
     return str(mnemonic.from_private_key(private_key))  # type: ignore[no-untyped-call]
 
 
+def _mock_grouped_algod(mocker: MockerFixture, pages: list[list[tuple[int, int]]] | None = None) -> MagicMock:
+    """Mock algod for opt-ins and opt-outs sent in groups, holding pages of (asset id, amount) holdings."""
+    pages = pages or [[]]
+    algod_mock: MagicMock = mocker.MagicMock()
+    algod_mock.suggested_params.return_value = DUMMY_SUGGESTED_PARAMS
+    algod_mock.account_assets_info.side_effect = [
+        {
+            "asset-holdings": [
+                {
+                    "asset-holding": {"asset-id": asset_id, "amount": amount, "is-frozen": False},
+                    "asset-params": {"creator": _generate_account()[1]},
+                }
+                for asset_id, amount in page
+            ],
+            **({"next-token": f"page-{index + 1}"} if index + 1 < len(pages) else {}),
+        }
+        for index, page in enumerate(pages)
+    ]
+    algod_mock.status.return_value = {"last-round": 100}
+    algod_mock.pending_transaction_info.return_value = {"confirmed-round": 101}
+    mocker.patch("algokit.cli.tasks.assets.load_algod_client", return_value=algod_mock)
+    mocker.patch("algokit.cli.tasks.assets.validate_address")
+    mocker.patch("algokit.core.tasks.send.time")
+    return algod_mock
+
+
+def _read_results(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
 def test_opt_in_no_args() -> None:
     result = invoke("task opt-in")
 
@@ -134,14 +169,7 @@ def test_opt_out_of_assets_from_account_address_successful(mocker: MockerFixture
 
 
 def test_opt_out_of_all_assets_from_account_address_successful(mocker: MockerFixture) -> None:
-    dummy_account_info = {"assets": [{"asset-id": 1, "amount": 0}]}
-    mocker.patch("algokit.cli.tasks.assets.get_account_info", return_value=dummy_account_info)
-    algorand_mock = mocker.MagicMock()
-    algorand_mock.asset.bulk_opt_out.return_value = [
-        BulkAssetOptInOutResult(asset_id=123, transaction_id="dummy_txn_id")
-    ]
-    algorand_mock = mocker.patch("algokit.cli.tasks.assets.get_algorand_client_for_network", return_value=algorand_mock)
-    mocker.patch("algokit.cli.tasks.assets.validate_address")
+    algod_mock = _mock_grouped_algod(mocker, [[(1, 0), (2, 5)], [(3, 0)]])
     dummy_account_pk, dummy_account_address = _generate_account()
     result = invoke(
         f"task opt-out -a {dummy_account_address} --network localnet --all",
@@ -149,7 +177,69 @@ def test_opt_out_of_all_assets_from_account_address_successful(mocker: MockerFix
     )
 
     assert result.exit_code == 0
-    verify(result.output)
+    verify(result.output.replace(dummy_account_address, "{account}"))
+    assert [call.kwargs["next_page"] for call in algod_mock.account_assets_info.call_args_list] == [None, "page-1"]
+    ((group,), _) = algod_mock.send_transactions.call_args
+    assert [(txn.transaction.index, txn.transaction.amount) for txn in group] == [(1, 0), (3, 0)]
+    assert all(txn.transaction.close_assets_to == txn.transaction.receiver for txn in group)
+
+
+def test_opt_out_of_all_assets_records_partial_failures(
+    mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    cwd = tmp_path_factory.mktemp("cwd")
+    algod_mock = _mock_grouped_algod(mocker, [[(asset_id, 0) for asset_id in range(1, 21)]])
+    failures = iter([ConnectionError("connection reset"), error.AlgodHTTPError("overspend", code=400)])  # type: ignore[no-untyped-call]
+    algod_mock.send_transactions.side_effect = lambda txns: _raise_next(failures) if len(txns) == 4 else None  # noqa: PLR2004
+    dummy_account_pk, dummy_account_address = _generate_account()
+    result = invoke(
+        f"task opt-out -a {dummy_account_address} --all --results results.jsonl",
+        input=_get_mnemonic_from_private_key(dummy_account_pk),
+        cwd=cwd,
+    )
+
+    assert result.exit_code == 1
+    assert "Successfully performed opt-out for 16/20 assets." in result.output
+    assert "Error: 4 asset opt-outs failed" in result.output
+    # the transient error is retried, the rejection isn't
+    assert algod_mock.send_transactions.call_count == 3  # noqa: PLR2004
+    results = _read_results(cwd / "results.jsonl")
+    assert sorted(result["asset_id"] for result in results) == list(range(1, 21))
+    assert sorted(result["asset_id"] for result in results if result["error"] == "overspend") == [17, 18, 19, 20]
+
+
+def test_opt_out_of_many_assets_with_balance_failed(mocker: MockerFixture) -> None:
+    algod_mock = _mock_grouped_algod(mocker, [[(asset_id, asset_id % 2) for asset_id in range(1, 21)]])
+    dummy_account_pk, dummy_account_address = _generate_account()
+    asset_ids = " ".join(str(asset_id) for asset_id in range(1, 22))
+    result = invoke(
+        f"task opt-out -a {dummy_account_address} {asset_ids}",
+        input=_get_mnemonic_from_private_key(dummy_account_pk),
+    )
+
+    assert result.exit_code == 1
+    assert "Error: Account is not opted into assets 21" in result.output
+    algod_mock.send_transactions.assert_not_called()
+
+
+def test_opt_in_to_many_assets_successful(mocker: MockerFixture) -> None:
+    algod_mock = _mock_grouped_algod(mocker)
+    mocker.patch("algokit.cli.tasks.assets.validate_account_balance_to_opt_in")
+    dummy_account_pk, dummy_account_address = _generate_account()
+    asset_ids = " ".join(str(asset_id) for asset_id in range(1, 21))
+    result = invoke(
+        f"task opt-in -a {dummy_account_address} {asset_ids}",
+        input=_get_mnemonic_from_private_key(dummy_account_pk),
+    )
+
+    assert result.exit_code == 0
+    assert "Successfully performed opt-in for 20/20 assets." in result.output
+    assert [len(call.args[0]) for call in algod_mock.send_transactions.call_args_list] == [16, 4]
+    algod_mock.account_assets_info.assert_not_called()
+
+
+def _raise_next(errors: Iterator[Exception]) -> None:
+    raise next(errors)
 
 
 def test_opt_out_of_assets_from_account_alias_successful(mocker: MockerFixture, mock_keyring: dict[str, str]) -> None:
@@ -1,12 +1,28 @@
+import hashlib
+import json
+from pathlib import Path
+
 import pytest
 from pytest_httpx import HTTPXMock
 from pytest_mock import MockerFixture
 
-from algokit.core.tasks.ipfs import ALGOKIT_PINATA_TOKEN_KEY
-from tests.utils.approvals import TokenScrubber, verify
+from algokit.core.tasks import ipfs
+from algokit.core.tasks.ipfs import (
+    ALGOKIT_PINATA_TOKEN_KEY,
+    PinataUpload,
+    file_sha256,
+    get_pin_cache_path,
+    hash_file,
+    invalidate_pin_cache,
+    upload_file_to_pinata,
+)
+from tests.tasks.conftest import scrub_upload_throughput
+from tests.utils.approvals import TokenScrubber, combine_scrubbers, verify
 from tests.utils.click_invoker import invoke
 
-scrubber = TokenScrubber({})
+# the CIDv1 of "dummy text to upload"
+DUMMY_TEXT_CID = "bafkreidpjlhjgcdjk6q3bwj2sk3uwsxwugretyl3ihju37rz7mi77ly2vy"
+scrubber = combine_scrubbers(TokenScrubber({}), scrub_upload_throughput)
 
 
 @pytest.fixture(autouse=True)
@@ -53,7 +69,7 @@ class TestIpfsUpload:
         cwd = tmp_path_factory.mktemp("cwd")
         (cwd / "dummy.txt").write_text("dummy text to upload")
 
-        httpx_mock.add_response(status_code=200, json={"ok": True, "IpfsHash": "test"})
+        httpx_mock.add_response(status_code=200, json={"ok": True, "IpfsHash": DUMMY_TEXT_CID})
         result = invoke("task ipfs upload --file dummy.txt", cwd=cwd)
 
         # Assert
@@ -89,3 +105,129 @@ class TestIpfsUpload:
         # Assert
         assert result.exit_code == 1
         verify(result.output, scrubber=scrubber)
+
+
+def test_upload_file_to_pinata_streams_and_hashes(
+    mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory, httpx_mock: HTTPXMock
+) -> None:
+    mocker.patch("algokit.core.tasks.ipfs.FILE_CHUNK_SIZE", 1024)
+    hash_file_spy = mocker.spy(ipfs, "hash_file")
+    content = bytes(range(256)) * 1000
+    file_path = tmp_path_factory.mktemp("cwd") / "large.bin"
+    file_path.write_bytes(content)
+    httpx_mock.add_response(status_code=200, json={"ok": True, "IpfsHash": "test"})
+
+    upload = upload_file_to_pinata(file_path, "test")
+
+    # nothing of the same size has been pinned, so the file is hashed as it's uploaded rather than read twice
+    hash_file_spy.assert_not_called()
+    assert upload == PinataUpload(cid="test", sha256=hashlib.sha256(content).hexdigest(), size=len(content))
+    assert file_sha256(file_path) == upload.sha256
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert content in request.read()
+    assert int(request.headers["Content-Length"]) > len(content)
+
+
+def test_ipfs_upload_skips_already_pinned_content(
+    tmp_path_factory: pytest.TempPathFactory, httpx_mock: HTTPXMock, mock_keyring: dict[str, str | None]
+) -> None:
+    mock_keyring[ALGOKIT_PINATA_TOKEN_KEY] = "test"
+    cwd = tmp_path_factory.mktemp("cwd")
+    (cwd / "dummy.txt").write_text("dummy text to upload")
+    (cwd / "copy.txt").write_text("dummy text to upload")
+    httpx_mock.add_response(status_code=200, json={"ok": True, "IpfsHash": DUMMY_TEXT_CID})
+
+    first = invoke("task ipfs upload --file dummy.txt", cwd=cwd)
+    second = invoke("task ipfs upload --file copy.txt", cwd=cwd)
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert "File is already pinned, skipped uploading it." in second.output
+    assert f"CID: {DUMMY_TEXT_CID}" in second.output
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_ipfs_upload_verify_uploads_unpinned_content(
+    tmp_path_factory: pytest.TempPathFactory, httpx_mock: HTTPXMock, mock_keyring: dict[str, str | None]
+) -> None:
+    mock_keyring[ALGOKIT_PINATA_TOKEN_KEY] = "test"
+    cwd = tmp_path_factory.mktemp("cwd")
+    (cwd / "dummy.txt").write_text("dummy text to upload")
+    upload_url = "https://api.pinata.cloud/pinning/pinFileToIPFS"
+    httpx_mock.add_response(url=upload_url, json={"ok": True, "IpfsHash": DUMMY_TEXT_CID}, is_reusable=True)
+    # the content was unpinned since it was uploaded, then pinned again
+    httpx_mock.add_response(method="GET", json={"count": 0, "rows": []})
+    httpx_mock.add_response(method="GET", json={"count": 1, "rows": [{"ipfs_pin_hash": DUMMY_TEXT_CID}]})
+
+    invoke("task ipfs upload --file dummy.txt", cwd=cwd)
+    unpinned = invoke("task ipfs upload --file dummy.txt --verify", cwd=cwd)
+    pinned = invoke("task ipfs upload --file dummy.txt --verify", cwd=cwd)
+
+    assert unpinned.exit_code == 0
+    assert "File uploaded successfully!" in unpinned.output
+    assert pinned.exit_code == 0
+    assert "File is already pinned, skipped uploading it." in pinned.output
+    assert [request.method for request in httpx_mock.get_requests()] == ["POST", "GET", "POST", "GET"]
+
+
+def test_ipfs_upload_verify_treats_invalid_pin_list_response_as_unpinned(
+    tmp_path_factory: pytest.TempPathFactory, httpx_mock: HTTPXMock, mock_keyring: dict[str, str | None]
+) -> None:
+    mock_keyring[ALGOKIT_PINATA_TOKEN_KEY] = "test"
+    cwd = tmp_path_factory.mktemp("cwd")
+    (cwd / "dummy.txt").write_text("dummy text to upload")
+    httpx_mock.add_response(method="GET", text="<html>Bad gateway</html>")
+    httpx_mock.add_response(method="POST", json={"ok": True, "IpfsHash": DUMMY_TEXT_CID})
+
+    result = invoke("task ipfs upload --file dummy.txt --verify", cwd=cwd)
+
+    assert result.exit_code == 0
+    assert "File uploaded successfully!" in result.output
+
+
+def test_upload_file_to_pinata_reads_pins_cached_by_other_processes_once_invalidated(
+    tmp_path_factory: pytest.TempPathFactory, httpx_mock: HTTPXMock, mocker: MockerFixture
+) -> None:
+    file_path = tmp_path_factory.mktemp("cwd") / "dummy.txt"
+    file_path.write_text("dummy text to upload")
+    hash_file_spy = mocker.spy(ipfs, "hash_file")
+    httpx_mock.add_response(method="POST", json={"ok": True, "IpfsHash": DUMMY_TEXT_CID})
+    upload_file_to_pinata(file_path, "test")
+    hash_file_spy.assert_not_called()
+
+    _append_pin(get_pin_cache_path(), jwt="other", file_path=file_path, cid="other-cid")
+    invalidate_pin_cache()
+    upload = upload_file_to_pinata(file_path, "other")
+
+    assert upload.already_pinned
+    assert upload.cid == "other-cid"
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def _append_pin(cache_path: Path, *, jwt: str, file_path: Path, cid: str) -> None:
+    record = {
+        "jwt_key": hashlib.sha256(jwt.encode()).hexdigest()[:16],
+        "sha256": file_sha256(file_path),
+        "size": file_path.stat().st_size,
+        "cid": cid,
+    }
+    with cache_path.open("a", encoding="utf-8") as cache_file:
+        cache_file.write(json.dumps(record) + "\n")
+
+
+def test_hash_file_calculates_cidv1(tmp_path_factory: pytest.TempPathFactory, mocker: MockerFixture) -> None:
+    cwd = tmp_path_factory.mktemp("cwd")
+    (cwd / "hello.txt").write_text("hello world\n")
+    (cwd / "empty.txt").touch()
+    (cwd / "chunked.bin").write_bytes(bytes(range(256)) * 10)
+    mocker.patch("algokit.core.tasks.ipfs.UNIXFS_CHUNK_SIZE", 256)
+    mocker.patch("algokit.core.tasks.ipfs.UNIXFS_MAX_LINKS", 3)
+
+    assert hash_file(cwd / "hello.txt").cid == "bafkreifjjcie6lypi6ny7amxnfftagclbuxndqonfipmb64f2km2devei4"
+    assert hash_file(cwd / "empty.txt").cid == "bafkreihdwdcefgh4dqkjv67uzcmw7ojee6xedzdetojuzjevtenxquvyku"
+    # a file of more than one chunk is a DAG of raw leaves under dag-pb nodes
+    chunked = hash_file(cwd / "chunked.bin")
+    assert chunked.cid.startswith("bafybei")
+    assert chunked.size == 2560  # noqa: PLR2004
+    assert chunked.sha256 == hashlib.sha256(bytes(range(256)) * 10).hexdigest()
@@ -1,8 +1,12 @@
+import hashlib
+import itertools
 import json
 import re
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import click
+import httpx
 import pytest
 from algosdk.mnemonic import from_private_key
 from approvaltests.namer import NamerFactory
@@ -10,11 +14,15 @@ from pytest_httpx import HTTPXMock
 from pytest_mock import MockerFixture
 
 from algokit.cli.tasks.mint import _get_and_validate_asset_name, _get_and_validate_decimals
+from algokit.core.tasks.ipfs import PinataBadRequestError, PinataInternalServerError, PinataUpload
 from algokit.core.tasks.wallet import WALLET_ALIASES_KEYRING_USERNAME
-from tests.tasks.conftest import DUMMY_ACCOUNT, DUMMY_SUGGESTED_PARAMS
+from tests.tasks.conftest import DUMMY_ACCOUNT, DUMMY_SUGGESTED_PARAMS, scrub_upload_throughput
 from tests.utils.approvals import verify
 from tests.utils.click_invoker import invoke
 
+DUMMY_IMAGE_CID = "bafkreifax6dswcxk4us2am3jxhd3swxew32oreaxzol7dnnqzhieepqg2y"
+DUMMY_METADATA_CID = "bafkreiftmc4on252dnckhv7jdqnhkxjkpvlrekpevjwm3gjszygxkus5oe"
+
 
 @pytest.mark.parametrize(("account_type", "mutability"), [("alias", "mutable"), ("address", "immutable")])
 @pytest.mark.parametrize("network", ["localnet", "testnet", "mainnet"])
@@ -48,12 +56,10 @@ def test_mint_token_successful(
     (cwd / "image.png").touch()
 
     mocker.patch(
-        "algokit.core.tasks.mint.mint.upload_to_pinata",
-        side_effect=[
-            "bafkreifax6dswcxk4us2am3jxhd3swxew32oreaxzol7dnnqzhieepqg2y",
-            "bafkreiftmc4on252dnckhv7jdqnhkxjkpvlrekpevjwm3gjszygxkus5oe",
-        ],
+        "algokit.core.tasks.mint.mint.upload_file_to_pinata",
+        return_value=_pinata_upload(DUMMY_IMAGE_CID),
     )
+    mocker.patch("algokit.core.tasks.mint.mint.upload_to_pinata", return_value=DUMMY_METADATA_CID)
     mocker.patch("algokit.core.tasks.mint.mint.wait_for_confirmation", return_value={"asset-index": 123})
     mocker.patch(
         "algokit.cli.tasks.mint.get_pinata_jwt",
@@ -117,12 +123,10 @@ def test_mint_token_successful_on_decimals(
     (cwd / "image.png").touch()
 
     mocker.patch(
-        "algokit.core.tasks.mint.mint.upload_to_pinata",
-        side_effect=[
-            "bafkreifax6dswcxk4us2am3jxhd3swxew32oreaxzol7dnnqzhieepqg2y",
-            "bafkreiftmc4on252dnckhv7jdqnhkxjkpvlrekpevjwm3gjszygxkus5oe",
-        ],
+        "algokit.core.tasks.mint.mint.upload_file_to_pinata",
+        return_value=_pinata_upload(DUMMY_IMAGE_CID),
     )
+    mocker.patch("algokit.core.tasks.mint.mint.upload_to_pinata", return_value=DUMMY_METADATA_CID)
     mocker.patch("algokit.core.tasks.mint.mint.wait_for_confirmation", return_value={"asset-index": 123})
     mocker.patch(
         "algokit.cli.tasks.mint.get_pinata_jwt",
@@ -205,7 +209,7 @@ def test_mint_token_pinata_error(
 
     # Assert
     assert result.exit_code == 1
-    verify(result.output)
+    verify(result.output, scrubber=scrub_upload_throughput)
 
 
 def test_mint_token_no_pinata_jwt_error(
@@ -296,3 +300,147 @@ def test_mint_token_acfg_token_metadata_mismatch_on_decimals(
         click.BadParameter, match="The value for decimals in the metadata JSON must match the decimals argument"
     ):
         _get_and_validate_decimals(context, param, decimals)
+
+
+def _write_collection(collection_dir: Path, count: int) -> None:
+    manifest = []
+    for index in range(count):
+        (collection_dir / f"{index}.png").write_bytes(b"image %d" % index)
+        manifest.append({"name": f"Token {index}", "unit_name": f"TKN{index}", "image": f"{index}.png"})
+    (collection_dir / "manifest.json").write_text(json.dumps(manifest))
+
+
+def _mock_collection_algod(mocker: MockerFixture) -> MagicMock:
+    algod_mock: MagicMock = mocker.MagicMock()
+    algod_mock.suggested_params.return_value = DUMMY_SUGGESTED_PARAMS
+    algod_mock.account_info.return_value = {"created-assets": []}
+    algod_mock.status.return_value = {"last-round": 100}
+    asset_ids = itertools.count(1000)
+    algod_mock.pending_transaction_info.side_effect = lambda _txid: {
+        "confirmed-round": 101,
+        "asset-index": next(asset_ids),
+    }
+    mocker.patch("algokit.cli.tasks.mint.load_algod_client", return_value=algod_mock)
+    mocker.patch("algokit.cli.tasks.mint.get_pinata_jwt", return_value="dummy_key")
+    mocker.patch("algokit.cli.tasks.mint.validate_balance")
+    mocker.patch("algokit.core.tasks.send.time")
+    mocker.patch("algokit.core.tasks.mint.collection.time")
+    return algod_mock
+
+
+def _pinata_upload(cid: str) -> PinataUpload:
+    return PinataUpload(cid=cid, sha256=hashlib.sha256(b"").hexdigest(), size=0)
+
+
+def _read_results(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_mint_collection_successful(mocker: MockerFixture, tmp_path: Path) -> None:
+    _write_collection(tmp_path, 20)
+    algod_mock = _mock_collection_algod(mocker)
+    upload_mock = mocker.patch(
+        "algokit.core.tasks.mint.collection.upload_file_to_pinata", return_value=_pinata_upload(DUMMY_METADATA_CID)
+    )
+
+    result = invoke(
+        f"task mint --creator {DUMMY_ACCOUNT.address} --collection . --immutable --nft -n localnet",
+        input=from_private_key(DUMMY_ACCOUNT.private_key),  # type: ignore[no-untyped-call]
+        cwd=tmp_path,
+    )
+
+    assert result.exit_code == 0
+    # an image and a metadata file for each token, sent as an atomic group of 16 and another of 4
+    assert upload_mock.call_count == 40  # noqa: PLR2004
+    assert [len(call.args[0]) for call in algod_mock.send_transactions.call_args_list] == [16, 4]
+    minted = [record for record in _read_results(tmp_path / "mint-results.jsonl") if "asset_id" in record]
+    assert sorted(record["asset_id"] for record in minted) == list(range(1000, 1020))
+    assert "Uploading and minting 20 tokens..." in result.output
+    assert "Minted 20/20 tokens" in result.output
+
+
+def test_mint_collection_resumes_from_results(mocker: MockerFixture, tmp_path: Path) -> None:
+    _write_collection(tmp_path, 4)
+    results_path = tmp_path / "mint-results.jsonl"
+    results_path.write_text(
+        "\n".join(
+            [
+                # minted and recorded
+                json.dumps({"index": 0, "metadata_cid": DUMMY_METADATA_CID, "asset_id": 10}),
+                # minted, but the previous run stopped before recording it
+                json.dumps({"index": 1, "metadata_cid": DUMMY_METADATA_CID}),
+                # only the image was uploaded
+                json.dumps({"index": 2, "image_cid": DUMMY_IMAGE_CID, "error": "Pinata error: 500"}),
+                # interrupted while writing the result
+                '{"index": 3, "metadata_',
+            ]
+        )
+        + "\n"
+    )
+    algod_mock = _mock_collection_algod(mocker)
+    algod_mock.account_info.return_value = {
+        "created-assets": [{"index": 11, "params": {"url": f"ipfs://{DUMMY_METADATA_CID}#arc3"}}]
+    }
+    upload_mock = mocker.patch(
+        "algokit.core.tasks.mint.collection.upload_file_to_pinata", return_value=_pinata_upload(DUMMY_METADATA_CID)
+    )
+
+    result = invoke(
+        f"task mint --creator {DUMMY_ACCOUNT.address} --collection . --immutable --nft -n localnet",
+        input=from_private_key(DUMMY_ACCOUNT.private_key),  # type: ignore[no-untyped-call]
+        cwd=tmp_path,
+    )
+
+    assert result.exit_code == 0
+    # the metadata of token 2, and the image and metadata of token 3
+    assert sorted(call.kwargs["name"] for call in upload_mock.call_args_list) == ["2.json", "3.json", "3.png"]
+    assert [len(call.args[0]) for call in algod_mock.send_transactions.call_args_list] == [2]
+    assert "Resuming from" in result.output
+    assert "2/4 tokens already minted" in result.output
+    assert "Minted 4/4 tokens" in result.output
+
+
+def test_mint_collection_upload_failures(mocker: MockerFixture, tmp_path: Path) -> None:
+    _write_collection(tmp_path, 3)
+    _mock_collection_algod(mocker)
+    server_error = PinataInternalServerError(httpx.Response(500))
+    bad_request = PinataBadRequestError(httpx.Response(400, text="invalid file"))
+    attempts: dict[str, int] = {}
+
+    def upload(file_path: Path, *, jwt: str, name: str) -> PinataUpload:  # noqa: ARG001
+        attempts[name] = attempts.get(name, 0) + 1
+        if name == "0.png" and attempts[name] == 1:
+            raise server_error
+        if name == "1.png":
+            raise bad_request
+        return _pinata_upload(DUMMY_METADATA_CID)
+
+    mocker.patch("algokit.core.tasks.mint.collection.upload_file_to_pinata", side_effect=upload)
+
+    result = invoke(
+        f"task mint --creator {DUMMY_ACCOUNT.address} --collection . --immutable --ft -n localnet",
+        input=from_private_key(DUMMY_ACCOUNT.private_key),  # type: ignore[no-untyped-call]
+        cwd=tmp_path,
+    )
+
+    assert result.exit_code == 1
+    # transient errors are retried, while errors that would fail again aren't
+    assert attempts["0.png"] == 2  # noqa: PLR2004
+    assert attempts["1.png"] == 1
+    failed = [record for record in _read_results(tmp_path / "mint-results.jsonl") if record.get("error")]
+    assert failed == [{"index": 1, "name": "Token 1", "error": "Pinata error: 400. invalid file"}]
+    assert "Minted 2/3 tokens" in result.output
+    assert "1 tokens failed to mint, run the same command again to retry them" in result.output
+
+
+def test_mint_collection_rejects_single_token_options(tmp_path: Path) -> None:
+    _write_collection(tmp_path, 1)
+
+    result = invoke(
+        f"task mint --creator {DUMMY_ACCOUNT.address} --collection . --unit tst --immutable --nft -n localnet",
+        input=from_private_key(DUMMY_ACCOUNT.private_key),  # type: ignore[no-untyped-call]
+        cwd=tmp_path,
+    )
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--unit can't be used with --collection" in result.output
@@ -1,10 +1,18 @@
+import base64
+import io
 import json
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
 
 import click
 import pytest
-from algosdk import encoding, transaction
+from algosdk import encoding, error, transaction
 from pytest_mock import MockerFixture
 
+from algokit.core.tasks.send import CONFIRMATION_BATCH_SIZE, DEFAULT_CONFIRMATION_ROUNDS, PipelinedSender, SendResult
+from algokit.core.tasks.transaction_stream import TransactionStreamWriter
 from tests.tasks.conftest import DUMMY_ACCOUNT, DUMMY_SUGGESTED_PARAMS
 from tests.utils.approvals import verify
 from tests.utils.click_invoker import invoke
@@ -158,3 +166,198 @@ def test_decoding_error(tmp_path_factory: pytest.TempPathFactory) -> None:
     # Assert
     assert result.exit_code == 1
     verify(result.output)
+
+
+def _mock_pipelined_algod(mocker: MockerFixture, pending_info: dict | None = None) -> MagicMock:
+    algod_mock: MagicMock = mocker.MagicMock()
+    algod_mock.status.return_value = {"last-round": 100}
+    algod_mock.status_after_block.side_effect = lambda round_number: {"last-round": round_number + 1}
+    algod_mock.pending_transaction_info.return_value = pending_info or {"confirmed-round": 101}
+    mocker.patch("algokit.cli.tasks.send_transaction.load_algod_client", return_value=algod_mock)
+    return algod_mock
+
+
+def _read_results(path: Path) -> list[dict]:
+    return sorted((json.loads(line) for line in path.read_text().splitlines()), key=lambda result: result["index"])
+
+
+def test_send_pipelined_with_confirmation_successful(
+    mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    txns = [_generate_dummy_signed_txn(amount=i) for i in range(20)]
+    transaction.write_to_file(txns, str(cwd / "dummy.txns"))  # type: ignore[no-untyped-call]
+    algod_mock = _mock_pipelined_algod(mocker)
+
+    # Act
+    result = invoke("task send --file dummy.txns --concurrency 4 --confirm --results results.jsonl", cwd=cwd)
+
+    # Assert
+    assert result.exit_code == 0
+    verify(result.output)
+    assert algod_mock.send_transaction.call_count == 20  # noqa: PLR2004
+    assert _read_results(cwd / "results.jsonl") == [
+        {"index": i, "txid": txn.get_txid(), "confirmed_round": 101, "asset_index": None, "error": None}  # type: ignore[union-attr]
+        for i, txn in enumerate(txns)
+    ]
+
+
+def test_send_pipelined_submits_atomic_groups_together(
+    mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    txns = [_generate_dummy_signed_txn(amount=100), *_generate_dummy_signed_txn_group()]
+    transaction.write_to_file(txns, str(cwd / "dummy.txns"))  # type: ignore[no-untyped-call]
+    algod_mock = _mock_pipelined_algod(mocker)
+
+    # Act
+    result = invoke("task send --file dummy.txns --results results.jsonl", cwd=cwd)
+
+    # Assert
+    assert result.exit_code == 0
+    algod_mock.send_transaction.assert_called_once()
+    algod_mock.send_transactions.assert_called_once()
+    assert len(algod_mock.send_transactions.call_args.args[0]) == 3  # noqa: PLR2004
+    algod_mock.pending_transaction_info.assert_not_called()
+    assert [result["confirmed_round"] for result in _read_results(cwd / "results.jsonl")] == [None] * 4
+
+
+def test_send_pipelined_records_failures(mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    txns = [_generate_dummy_signed_txn(amount=i) for i in range(3)]
+    transaction.write_to_file(txns, str(cwd / "dummy.txns"))  # type: ignore[no-untyped-call]
+    algod_mock = _mock_pipelined_algod(mocker)
+    failed_txid = txns[1].get_txid()  # type: ignore[union-attr]
+    algod_mock.send_transaction.side_effect = lambda txn: _raise(
+        error.AlgodHTTPError("overspend")  # type: ignore[no-untyped-call]
+        if txn.get_txid() == failed_txid
+        else None
+    )
+    algod_mock.pending_transaction_info.side_effect = lambda txid: (
+        {"pool-error": "rejected"} if txid == txns[2].get_txid() else {"confirmed-round": 101}  # type: ignore[union-attr]
+    )
+
+    # Act
+    result = invoke("task send --file dummy.txns --confirm --results results.jsonl", cwd=cwd)
+
+    # Assert
+    assert result.exit_code == 1
+    assert "1/3 transactions confirmed" in result.output
+    assert "Error: 2 transactions failed" in result.output
+    assert [(result["confirmed_round"], result["error"]) for result in _read_results(cwd / "results.jsonl")] == [
+        (101, None),
+        (None, "overspend"),
+        (None, "rejected"),
+    ]
+
+
+def test_send_pipelined_gives_up_on_unconfirmed_transactions(
+    mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    transaction.write_to_file([_generate_dummy_signed_txn()], str(cwd / "dummy.txns"))  # type: ignore[no-untyped-call]
+    algod_mock = _mock_pipelined_algod(mocker, pending_info={"confirmed-round": 0, "pool-error": ""})
+
+    # Act
+    result = invoke("task send --file dummy.txns --confirm --results results.jsonl", cwd=cwd)
+
+    # Assert
+    assert result.exit_code == 1
+    assert algod_mock.status_after_block.call_count == DEFAULT_CONFIRMATION_ROUNDS
+    (txn_result,) = _read_results(cwd / "results.jsonl")
+    assert txn_result["error"] == f"Transaction not confirmed after {DEFAULT_CONFIRMATION_ROUNDS} rounds"
+
+
+class DevModeAlgod:
+    """Confirms every transaction in its own block, and only reports recently confirmed transactions as pending."""
+
+    recent_rounds = 300
+
+    def __init__(self) -> None:
+        self.round = 100
+        self.confirmed_rounds: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def send_transaction(self, txn: transaction.SignedTransaction) -> None:
+        with self.lock:
+            self.round += 1
+            self.confirmed_rounds[txn.get_txid()] = self.round  # type: ignore[no-untyped-call]
+
+    def status(self) -> dict:
+        with self.lock:
+            return {"last-round": self.round}
+
+    def status_after_block(self, round_number: int) -> dict:
+        with self.lock:
+            self.round = max(self.round, round_number + 1)
+            return {"last-round": self.round}
+
+    def pending_transaction_info(self, txid: str) -> dict:
+        with self.lock:
+            confirmed_round = self.confirmed_rounds.get(txid)
+            if confirmed_round is None or self.round - confirmed_round > self.recent_rounds:
+                raise error.AlgodHTTPError("txn does not exist", 404)  # type: ignore[no-untyped-call]
+            return {"confirmed-round": confirmed_round}
+
+
+def test_pipelined_sender_confirms_large_streams_while_submitting() -> None:
+    # Arrange
+    txns = [_generate_dummy_signed_txn(amount=i) for i in range(4 * CONFIRMATION_BATCH_SIZE)]
+    algod = DevModeAlgod()
+    assert len(txns) > algod.recent_rounds
+    results: list[SendResult] = []
+
+    # Act
+    PipelinedSender(algod, on_result=results.append, concurrency=4).send(txns)  # type: ignore[arg-type]
+
+    # Assert
+    assert len(results) == len(txns)
+    assert [result.error for result in results if result.error] == []
+    assert all(result.confirmed_round == algod.confirmed_rounds[result.txid] for result in results)
+
+
+def _raise(ex: Exception | None) -> None:
+    if ex is not None:
+        raise ex
+
+
+def _encode_transaction_stream(txns: list[Any]) -> bytes:
+    stream = io.BytesIO()
+    writer = TransactionStreamWriter(stream)
+    for txn in txns:
+        writer.write(base64.b64decode(encoding.msgpack_encode(txn)))  # type: ignore[no-untyped-call]
+    return stream.getvalue()
+
+
+def test_send_from_piped_transaction_stream_successful(mocker: MockerFixture) -> None:
+    # Arrange
+    txns = [_generate_dummy_signed_txn(amount=i) for i in range(20)]
+    algod_mock = _mock_pipelined_algod(mocker)
+    mocker.patch("algokit.cli.tasks.send_transaction.stdin_has_content", return_value=True)
+
+    # Act
+    result = invoke("task send --concurrency 1", input=_encode_transaction_stream(txns))
+
+    # Assert
+    assert result.exit_code == 0
+    verify(result.output)
+    assert [call.args[0] for call in algod_mock.send_transaction.call_args_list] == txns
+
+
+def test_send_from_truncated_transaction_stream_error(mocker: MockerFixture) -> None:
+    # Arrange
+    txns = [_generate_dummy_signed_txn(amount=i) for i in range(2)]
+    algod_mock = _mock_pipelined_algod(mocker)
+    mocker.patch("algokit.cli.tasks.send_transaction.stdin_has_content", return_value=True)
+
+    # Act
+    result = invoke("task send --concurrency 1", input=_encode_transaction_stream(txns)[:-10])
+
+    # Assert
+    assert result.exit_code == 1
+    assert "Error: Transaction stream ended part way through a transaction!" in result.output
+    algod_mock.send_transaction.assert_called_once_with(txns[0])
@@ -1,9 +1,13 @@
+import io
 import json
+from pathlib import Path
 
 import click
 import pytest
 from algosdk import encoding, mnemonic, transaction
 
+from algokit.core.tasks.sign import SIGNING_CHUNK_SIZE
+from algokit.core.tasks.transaction_stream import STREAM_MAGIC, decode_signed_transaction, iter_transaction_stream
 from algokit.core.tasks.wallet import WALLET_ALIASES_KEYRING_USERNAME
 from tests.tasks.conftest import DUMMY_ACCOUNT, DUMMY_SUGGESTED_PARAMS
 from tests.utils.approvals import verify
@@ -186,3 +190,121 @@ def test_transaction_decoding_errors() -> None:
     # Assert
     assert result.exit_code == 1
     verify(result.output)
+
+
+def _write_dummy_txns(path: Path, count: int) -> list[transaction.PaymentTxn]:
+    txns = [_generate_dummy_txn(DUMMY_ACCOUNT.address, amount) for amount in range(1, count + 1)]
+    transaction.write_to_file(txns, str(path))  # type: ignore[no-untyped-call]
+    return txns
+
+
+def test_sign_stream_from_file_to_output_successful(tmp_path_factory: pytest.TempPathFactory) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    txns = _write_dummy_txns(cwd / "dummy.txns", SIGNING_CHUNK_SIZE * 2 + 500)
+
+    # Act
+    result = invoke(
+        f"task sign -a {DUMMY_ACCOUNT.address} --file dummy.txns --stream --workers 2 --output signed.txns",
+        input=f"{_get_mnemonic_from_private_key(DUMMY_ACCOUNT.private_key)}\ny",
+        cwd=cwd,
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    verify(result.output)
+    signed_txns = transaction.retrieve_from_file(str(cwd / "signed.txns"))  # type: ignore[no-untyped-call]
+    assert [signed_txn.get_txid() for signed_txn in signed_txns] == [txn.get_txid() for txn in txns]  # type: ignore[no-untyped-call]
+    assert signed_txns[-1] == txns[-1].sign(DUMMY_ACCOUNT.private_key)  # type: ignore[no-untyped-call]
+
+
+def test_sign_stream_from_file_to_stdout_successful(tmp_path_factory: pytest.TempPathFactory) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    txns = _write_dummy_txns(cwd / "dummy.txns", 3)
+
+    # Act
+    result = invoke(
+        f"task sign -a {DUMMY_ACCOUNT.address} --file dummy.txns --stream --force",
+        input=_get_mnemonic_from_private_key(DUMMY_ACCOUNT.private_key),
+        cwd=cwd,
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    signed_txns = json.loads(result.output[result.output.index("[") :])
+    assert signed_txns == [
+        {
+            "transaction_id": txn.get_txid(),  # type: ignore[no-untyped-call]
+            "content": encoding.msgpack_encode(txn.sign(DUMMY_ACCOUNT.private_key)),  # type: ignore[no-untyped-call]
+        }
+        for txn in txns
+    ]
+
+
+def test_sign_stream_rekeyed_sender_matches_json_output(tmp_path_factory: pytest.TempPathFactory) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    rekeyed_sender = "W6UUUSEAOGLBHT7VFT4H2SDATKKSG6ZBUIJXTZMSLW36YS44FRP5NVAU7U"
+    txns = [_generate_dummy_txn(rekeyed_sender, amount) for amount in range(1, 4)]
+    transaction.write_to_file(txns, str(cwd / "dummy.txns"))  # type: ignore[no-untyped-call]
+    signer_input = _get_mnemonic_from_private_key(DUMMY_ACCOUNT.private_key)
+
+    # Act
+    stream_result = invoke(
+        f"task sign -a {DUMMY_ACCOUNT.address} --file dummy.txns --stream --force", input=signer_input, cwd=cwd
+    )
+    json_result = invoke(f"task sign -a {DUMMY_ACCOUNT.address} --file dummy.txns --force", input=signer_input, cwd=cwd)
+
+    # Assert
+    assert stream_result.exit_code == 0
+    assert json_result.exit_code == 0
+    stream_txns = json.loads(stream_result.output[stream_result.output.index("[") :])
+    json_txns = json.loads(json_result.output[json_result.output.index("[") :])
+    assert stream_txns == json_txns
+    assert all(
+        encoding.msgpack_decode(signed_txn["content"]).authorizing_address == DUMMY_ACCOUNT.address  # type: ignore[no-untyped-call]
+        for signed_txn in stream_txns
+    )
+
+
+def test_sign_stream_already_signed_error(tmp_path_factory: pytest.TempPathFactory) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    signed_txn = _generate_dummy_txn(DUMMY_ACCOUNT.address).sign(DUMMY_ACCOUNT.private_key)  # type: ignore[no-untyped-call]
+    transaction.write_to_file([signed_txn], str(cwd / "dummy.txns"))  # type: ignore[no-untyped-call]
+
+    # Act
+    result = invoke(
+        f"task sign -a {DUMMY_ACCOUNT.address} --file dummy.txns --stream",
+        input=_get_mnemonic_from_private_key(DUMMY_ACCOUNT.private_key),
+        cwd=cwd,
+    )
+
+    # Assert
+    assert result.exit_code == 1
+    assert "Error: Transaction 1 in" in result.output
+    assert "is already signed!" in result.output
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_sign_to_binary_transaction_stream(tmp_path_factory: pytest.TempPathFactory, *, stream: bool) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    txns = _write_dummy_txns(cwd / "dummy.txns", 3)
+
+    # Act
+    result = invoke(
+        f"task sign -a {DUMMY_ACCOUNT.address} --file dummy.txns --output-format binary --force"
+        + (" --stream" if stream else ""),
+        input=_get_mnemonic_from_private_key(DUMMY_ACCOUNT.private_key),
+        cwd=cwd,
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    stdout = io.BytesIO(result.stdout_bytes[result.stdout_bytes.index(STREAM_MAGIC) + len(STREAM_MAGIC) :])
+    assert [decode_signed_transaction(encoded_txn) for encoded_txn in iter_transaction_stream(stdout)] == [
+        txn.sign(DUMMY_ACCOUNT.private_key)  # type: ignore[no-untyped-call]
+        for txn in txns
+    ]
@@ -1,11 +1,15 @@
+import csv
 import json
+from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 from algokit_utils import SendAtomicTransactionComposerResults
-from algosdk import account, mnemonic
+from algosdk import account, error, mnemonic
 from pytest_mock import MockerFixture
 
 from algokit.core.tasks.wallet import WALLET_ALIASES_KEYRING_USERNAME
+from tests.tasks.conftest import DUMMY_SUGGESTED_PARAMS
 from tests.utils.approvals import verify
 from tests.utils.click_invoker import invoke
 
@@ -347,3 +351,118 @@ def test_transfer_on_mainnet(mocker: MockerFixture) -> None:
     # Assert
     assert result.exit_code == 0
     verify(result.output)
+
+
+def _write_batch(path: Path, rows: list[str]) -> None:
+    path.write_text("\n".join(["receiver,amount,asset_id", *rows]) + "\n", encoding="utf-8")
+
+
+def _mock_batch_algod(mocker: MockerFixture, *, microalgos: int = 10**9, asset_amount: int = 10**6) -> MagicMock:
+    algod_mock: MagicMock = mocker.MagicMock()
+    algod_mock.suggested_params.return_value = DUMMY_SUGGESTED_PARAMS
+    algod_mock.account_info.return_value = {"amount": microalgos, "assets": [{"asset-id": 123, "amount": asset_amount}]}
+    algod_mock.status.return_value = {"last-round": 100}
+    algod_mock.pending_transaction_info.return_value = {"confirmed-round": 101}
+    mocker.patch("algokit.cli.tasks.transfer.load_algod_client", return_value=algod_mock)
+    return algod_mock
+
+
+def test_transfer_batch_successful(mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    receivers = [_generate_account()[1] for _ in range(20)]
+    _write_batch(
+        cwd / "recipients.csv",
+        [f"{receiver},{index + 1},{123 if index % 2 else ''}" for index, receiver in enumerate(receivers)],
+    )
+    algod_mock = _mock_batch_algod(mocker)
+    dummy_sender_pk, dummy_sender_address = _generate_account()
+
+    # Act
+    result = invoke(
+        f"task transfer -s {dummy_sender_address} --batch recipients.csv",
+        input=_get_mnemonic_from_private_key(dummy_sender_pk),
+        cwd=cwd,
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    verify(result.output)
+    algod_mock.account_info.assert_called_once_with(dummy_sender_address)
+    assert algod_mock.account_asset_info.call_count == 10  # noqa: PLR2004
+    assert [len(call.args[0]) for call in algod_mock.send_transactions.call_args_list] == [16, 4]
+    with (cwd / "recipients.results.csv").open(newline="") as results_file:
+        results = sorted(csv.DictReader(results_file), key=lambda row: int(row["line"]))
+    assert [(row["receiver"], row["asset_id"], row["amount"]) for row in results] == [
+        (receiver, "123" if index % 2 else "0", str(index + 1)) for index, receiver in enumerate(receivers)
+    ]
+    assert {(row["confirmed_round"], row["error"]) for row in results} == {("101", "")}
+
+
+def test_transfer_batch_insufficient_balance(mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    _write_batch(cwd / "recipients.csv", [f"{_generate_account()[1]},600000,123" for _ in range(2)])
+    algod_mock = _mock_batch_algod(mocker)
+    dummy_sender_pk, dummy_sender_address = _generate_account()
+
+    # Act
+    result = invoke(
+        f"task transfer -s {dummy_sender_address} --batch recipients.csv",
+        input=_get_mnemonic_from_private_key(dummy_sender_pk),
+        cwd=cwd,
+    )
+
+    # Assert
+    assert result.exit_code == 1
+    assert (
+        "Error: Insufficient balance of asset 123 in account for the batch, required: 1200000, available: 1000000"
+        in result.output
+    )
+    algod_mock.send_transactions.assert_not_called()
+
+
+def test_transfer_batch_receivers_not_opted_in(mocker: MockerFixture, tmp_path_factory: pytest.TempPathFactory) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    receivers = [_generate_account()[1] for _ in range(3)]
+    _write_batch(cwd / "recipients.csv", [f"{receiver},1,123" for receiver in receivers])
+    algod_mock = _mock_batch_algod(mocker)
+    algod_mock.account_asset_info.side_effect = lambda address, _: _raise_not_found(address == receivers[1])
+    dummy_sender_pk, dummy_sender_address = _generate_account()
+
+    # Act
+    result = invoke(
+        f"task transfer -s {dummy_sender_address} --batch recipients.csv",
+        input=_get_mnemonic_from_private_key(dummy_sender_pk),
+        cwd=cwd,
+    )
+
+    # Assert
+    assert result.exit_code == 1
+    assert "Error: Receivers aren't opted into the asset on lines 3" in result.output
+    algod_mock.send_transactions.assert_not_called()
+
+
+def test_transfer_batch_invalid_row(tmp_path_factory: pytest.TempPathFactory) -> None:
+    # Arrange
+    cwd = tmp_path_factory.mktemp("cwd")
+    _write_batch(cwd / "recipients.csv", [f"{_generate_account()[1]},1,", "not-an-address,1,"])
+    dummy_sender_pk, dummy_sender_address = _generate_account()
+
+    # Act
+    result = invoke(
+        f"task transfer -s {dummy_sender_address} --batch recipients.csv",
+        input=_get_mnemonic_from_private_key(dummy_sender_pk),
+        cwd=cwd,
+    )
+
+    # Assert
+    assert result.exit_code == 1
+    assert "Error: Line 3: `not-an-address` is neither a valid account address nor an alias" in result.output
+
+
+def _raise_not_found(not_found: bool) -> dict:  # noqa: FBT001
+    if not_found:
+        raise error.AlgodHTTPError("asset info not found", code=404)  # type: ignore[no-untyped-call]
+    return {}
@@ -0,0 +1,166 @@
+import base64
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from algosdk import error
+from pytest_httpx import HTTPXMock
+from pytest_mock import MockerFixture
+
+from algokit.cli.common.constants import AlgorandNetwork
+from algokit.cli.tasks.utils import get_asset_decimals, load_algod_client, validate_balance
+from algokit.core.algod_clients import CachingAlgodClient
+from algokit.core.utils import get_algorand_client_for_network
+from tests.tasks.conftest import DUMMY_ACCOUNT, DUMMY_SUGGESTED_PARAMS
+
+PARAMS_RESPONSE = {
+    "last-round": 100,
+    "genesis-id": "testnet-v1.0",
+    "genesis-hash": "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+    "min-fee": 1000,
+    "fee": 0,
+    "consensus-version": "future",
+}
+
+
+def _algod_responses(path: str) -> dict:
+    if path == "/transactions/params":
+        return PARAMS_RESPONSE
+    if path == "/versions":
+        return {"genesis_hash_b64": PARAMS_RESPONSE["genesis-hash"]}
+    if path.startswith("/status"):
+        return {"last-round": 101}
+    if path.startswith("/assets/"):
+        return {"params": {"decimals": 2}}
+    if path.startswith("/accounts/"):
+        return {"address": DUMMY_ACCOUNT.address, "amount": 10**6, "assets": []}
+    return {"txId": "dummy_txid"}
+
+
+@pytest.fixture
+def algod_request(mocker: MockerFixture) -> tuple[CachingAlgodClient, MagicMock]:
+    algod_client = load_algod_client(AlgorandNetwork.LOCALNET)
+    assert isinstance(algod_client, CachingAlgodClient)
+    request_mock = mocker.patch.object(algod_client, "algod_request")
+    request_mock.side_effect = lambda _method, path, *_args, **_kwargs: _algod_responses(path)
+    return algod_client, request_mock
+
+
+def _requested_paths(request_mock: MagicMock) -> list[str]:
+    return [call.args[1] for call in request_mock.call_args_list]
+
+
+def test_suggested_params_cached_until_round_advances(
+    mocker: MockerFixture, algod_request: tuple[CachingAlgodClient, MagicMock]
+) -> None:
+    algod_client, request_mock = algod_request
+    monotonic_mock = mocker.patch("algokit.core.algod_clients.time.monotonic", return_value=0.0)
+
+    algod_client.suggested_params()
+    monotonic_mock.return_value = 1.0
+    algod_client.suggested_params()
+    monotonic_mock.return_value = 3.0
+    algod_client.suggested_params()
+    algod_client.status()
+    algod_client.suggested_params()
+    algod_client.send_raw_transaction("dummy_txn")
+    algod_client.suggested_params()
+
+    assert _requested_paths(request_mock) == [
+        "/transactions/params",
+        "/transactions/params",
+        "/status",
+        "/transactions/params",
+        "/transactions",
+        "/transactions/params",
+    ]
+
+
+def test_cached_suggested_params_are_copied(algod_request: tuple[CachingAlgodClient, MagicMock]) -> None:
+    algod_client, request_mock = algod_request
+
+    first = algod_client.suggested_params()
+    first.last = first.first + 10
+    second = algod_client.suggested_params()
+
+    assert second is not first
+    assert second.last == 1100  # noqa: PLR2004
+    assert _requested_paths(request_mock) == ["/transactions/params"]
+
+
+def test_account_info_cached_until_submission(algod_request: tuple[CachingAlgodClient, MagicMock]) -> None:
+    algod_client, request_mock = algod_request
+
+    validate_balance(algod_client, DUMMY_ACCOUNT, 0, 1000)
+    validate_balance(algod_client, DUMMY_ACCOUNT, 0, 1000)
+    algod_client.send_raw_transaction("dummy_txn")
+    validate_balance(algod_client, DUMMY_ACCOUNT, 0, 1000)
+
+    assert _requested_paths(request_mock) == [
+        f"/accounts/{DUMMY_ACCOUNT.address}",
+        "/transactions",
+        f"/accounts/{DUMMY_ACCOUNT.address}",
+    ]
+
+
+def test_asset_decimals_cached_on_disk_by_genesis_hash(app_state_dir: Path) -> None:
+    algod_mock = MagicMock()
+    algod_mock.versions.return_value = {"genesis_hash_b64": DUMMY_SUGGESTED_PARAMS.gh}
+    algod_mock.asset_info.return_value = {"params": {"decimals": 2, "unit-name": "DUMMY", "manager": "dummy"}}
+
+    assert get_asset_decimals(123, algod_mock) == 2  # noqa: PLR2004
+    assert get_asset_decimals(123, algod_mock) == 2  # noqa: PLR2004
+
+    algod_mock.asset_info.assert_called_once_with(123)
+    algod_mock.suggested_params.assert_not_called()
+    assert json.loads((app_state_dir / "asset-params-cache.json").read_text()) == {
+        DUMMY_SUGGESTED_PARAMS.gh: {"123": {"decimals": 2, "unit-name": "DUMMY"}}
+    }
+
+    # another network doesn't share the cached params
+    algod_mock.versions.return_value = {"genesis_hash_b64": "other-genesis-hash"}
+    get_asset_decimals(123, algod_mock)
+    assert algod_mock.asset_info.call_count == 2  # noqa: PLR2004
+
+
+def test_genesis_hash_fetched_once_per_client(
+    app_state_dir: Path, algod_request: tuple[CachingAlgodClient, MagicMock]
+) -> None:
+    algod_client, request_mock = algod_request
+
+    get_asset_decimals(123, algod_client)
+    get_asset_decimals(456, algod_client)
+    get_asset_decimals(123, algod_client)
+
+    assert _requested_paths(request_mock) == ["/versions", "/assets/123", "/assets/456"]
+    assert set(
+        json.loads((app_state_dir / "asset-params-cache.json").read_text())[PARAMS_RESPONSE["genesis-hash"]]
+    ) == {
+        "123",
+        "456",
+    }
+
+
+def test_network_algod_client_is_shared() -> None:
+    algod_client = load_algod_client(AlgorandNetwork.LOCALNET)
+
+    assert load_algod_client(AlgorandNetwork.LOCALNET) is algod_client
+    assert get_algorand_client_for_network(AlgorandNetwork.LOCALNET).client.algod is algod_client
+    assert load_algod_client(AlgorandNetwork.TESTNET) is not algod_client
+
+
+def test_pooled_algod_client_requests(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url="http://localhost:4001/v2/status", json={"last-round": 100})
+    httpx_mock.add_response(url="http://localhost:4001/v2/transactions", status_code=400, json={"message": "overspend"})
+    algod_client = load_algod_client(AlgorandNetwork.LOCALNET)
+
+    assert algod_client.status() == {"last-round": 100}
+    with pytest.raises(error.AlgodHTTPError) as ex:
+        algod_client.send_raw_transaction("dummy_txn")
+
+    assert str(ex.value) == "overspend"
+    assert ex.value.code == 400  # noqa: PLR2004
+    status_request, send_request = httpx_mock.get_requests()
+    assert status_request.headers["X-Algo-API-Token"] == "a" * 64
+    assert send_request.content == base64.b64decode("dummy_txn")
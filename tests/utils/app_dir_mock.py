@@ -20,5 +20,8 @@ def tmp_app_dir(mocker: MockerFixture, tmp_path: Path) -> AppDirs:
     app_state_dir = tmp_path / "state"
     app_state_dir.mkdir()
     mocker.patch("algokit.core.sandbox.get_app_state_dir").return_value = app_state_dir
+    mocker.patch("algokit.core.localnet_state.get_app_state_dir").return_value = app_state_dir
+    mocker.patch("algokit.core.localnet_timings.get_app_state_dir").return_value = app_state_dir
+    mocker.patch("algokit.core.localnet_accounts.get_app_state_dir").return_value = app_state_dir
 
     return AppDirs(app_config_dir=app_config_dir, app_state_dir=app_state_dir)
@@ -18,6 +18,7 @@ class ClickInvokeResult:
     exit_code: int
     output: str
     exception: BaseException | None
+    stdout_bytes: bytes = b""
 
 
 def invoke(
@@ -26,7 +27,7 @@ def invoke(
     cwd: Path | None = None,
     skip_version_check: bool = True,
     env: Mapping[str, str | None] | None = None,
-    input: str | None = None,  # noqa: A002
+    input: str | bytes | None = None,  # noqa: A002
 ) -> ClickInvokeResult:
     from algokit.cli import algokit
 
@@ -46,7 +47,9 @@ def invoke(
         if result.exc_info and not isinstance(result.exc_info[1], SystemExit):
             logger.error("Click invocation error", exc_info=result.exc_info)
         output = normalize_path(result.stdout, str(cwd or prior_cwd), "{current_working_directory}")
-        return ClickInvokeResult(exit_code=result.exit_code, output=output, exception=result.exception)
+        return ClickInvokeResult(
+            exit_code=result.exit_code, output=output, exception=result.exception, stdout_bytes=result.stdout_bytes
+        )
     finally:
         if cwd is not None:
             os.chdir(prior_cwd)
@@ -1,13 +1,39 @@
 import dataclasses
 from collections.abc import Callable, Sequence
-from io import StringIO
+from io import BytesIO, StringIO
 from typing import IO, Any, TypeVar
 
 
+class _BufferMock(BytesIO):
+    def close(self) -> None:
+        pass
+
+
+class StdinMock(StringIO):
+    """Keeps the written input readable after the process input is closed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # binary input is written to the buffer of the text mode pipe
+        self.binary_input = _BufferMock()
+
+    @property
+    def buffer(self) -> BytesIO:
+        return self.binary_input
+
+    def close(self) -> None:
+        pass
+
+
 class PopenMock:
-    def __init__(self, stdout: str, returncode: int = 0, min_poll_calls: int = 1):
+    def __init__(
+        self, stdout: str, returncode: int = 0, min_poll_calls: int = 1, *, binary_stdout: bytes | None = None
+    ):
         self._returncode = returncode
-        self._stdout = StringIO(stdout)
+        # a binary mode process has separate output and error streams, as its output isn't text to log
+        self._stdout: IO[str] | IO[bytes] = StringIO(stdout) if binary_stdout is None else BytesIO(binary_stdout)
+        self.stderr = None if binary_stdout is None else BytesIO(stdout.encode())
+        self.stdin = StdinMock()
         self._remaining_poll_calls = min_poll_calls
 
     def __enter__(self) -> "PopenMock":
@@ -23,7 +49,7 @@ class PopenMock:
         return self._returncode or 0
 
     @property
-    def stdout(self) -> IO[str] | None:
+    def stdout(self) -> IO[str] | IO[bytes] | None:
         return self._stdout
 
     def wait(self) -> int:
@@ -44,12 +70,14 @@ class CommandMockData:
     output_lines: list[str] = dataclasses.field(default_factory=lambda: ["STDOUT", "STDERR"])
     side_effect: Any | None = None
     side_effect_args: dict[str, Any] | None = None
+    binary_output: bytes = b""
 
 
 @dataclasses.dataclass(kw_only=True)
 class PopenArgs:
     command: list[str]
     env: dict[str, str] | None
+    stdin: StdinMock | None = None
 
 
 class ProcMock:
@@ -96,6 +124,7 @@ class ProcMock:
         output: list[str],
         side_effect: Callable[[Any], None] | None = None,
         side_effect_args: dict[str, Any] | None = None,
+        binary_output: bytes = b"",
     ) -> None:
         """
         Set the output of a command, and optionally include a side effect to be executed when the command is run. The
@@ -108,14 +137,22 @@ class ProcMock:
             output: The output to return when the command is run
             side_effect: A callable to be called when the command is run
             side_effect_args: Key value paired arguments to pass to the side_effect function (optional)
+            binary_output: The stdout of the command when it's run in binary mode, `output` is then its stderr
         """
 
         self._add_mock_data(
-            cmd, CommandMockData(output_lines=output, side_effect=side_effect, side_effect_args=side_effect_args)
+            cmd,
+            CommandMockData(
+                output_lines=output,
+                side_effect=side_effect,
+                side_effect_args=side_effect_args,
+                binary_output=binary_output,
+            ),
         )
 
-    def popen(self, cmd: list[str], env: dict[str, str] | None = None, *_args: Any, **_kwargs: Any) -> PopenMock:
-        self.called.append(PopenArgs(command=cmd, env=env))
+    def popen(self, cmd: list[str], env: dict[str, str] | None = None, *_args: Any, **kwargs: Any) -> PopenMock:
+        popen_args = PopenArgs(command=cmd, env=env)
+        self.called.append(popen_args)
         for i in reversed(range(len(cmd))):
             prefix = cmd[: i + 1]
             try:
@@ -138,7 +175,9 @@ class ProcMock:
             side_effect_args = mock_data.side_effect_args or {}
             mock_data.side_effect(**side_effect_args)
 
-        return PopenMock(output, exit_code)
+        popen_mock = PopenMock(output, exit_code, binary_stdout=None if kwargs.get("text") else mock_data.binary_output)
+        popen_args.stdin = popen_mock.stdin
+        return popen_mock
 
 
 T = TypeVar("T")